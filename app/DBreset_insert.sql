@@ -1958,1156 +1958,1156 @@ INSERT INTO SHOP (MainURL, SubURL, CID) VALUES ('https://www.gog.com', '/game/st
 
 -- RATING ̺: 1,080  
 -- Content 1001: Harry Potter and the Philosopher's Stone
-INSERT INTO RATING VALUES ('1', 1001, 5, '   ʹ ־!', 45);
-INSERT INTO RATING VALUES ('2', 1001, 4, 'Ŭ Ÿ, ̵鿡 õ', 32);
-INSERT INTO RATING VALUES ('3', 1001, 5, 'ȭŭ å ', 67);
-INSERT INTO RATING VALUES ('4', 1001, 3, '븸ŭ ƴϾ ', 12);
-INSERT INTO RATING VALUES ('5', 1001, 5, 'ظ 迡 ǫ ', 89);
-INSERT INTO RATING VALUES ('6', 1001, 4, 'ȣ׿Ʈ ؿ', 54);
-INSERT INTO RATING VALUES ('7', 1001, 5, '̿  Բ', 76);
-INSERT INTO RATING VALUES ('8', 1001, 4, 'ø ù  Ϻ', 23);
-INSERT INTO RATING VALUES ('9', 1001, 3, ' ġ ', 41);
-INSERT INTO RATING VALUES ('10', 1001, 5, '  ߾', 98);
-INSERT INTO RATING VALUES ('11', 1001, 4, '̿ Բ б ƿ', 65);
-INSERT INTO RATING VALUES ('12', 1001, 5, 'Ÿ  ʵ', 87);
-INSERT INTO RATING VALUES ('13', 1001, 4, '丮 ŷ', 34);
-INSERT INTO RATING VALUES ('14', 1001, 3, 'ȭ  ƿ', 19);
-INSERT INTO RATING VALUES ('15', 1001, 5, ' ', 92);
-INSERT INTO RATING VALUES ('16', 1001, 4, 'ĳ͵ ', 56);
-INSERT INTO RATING VALUES ('17', 1001, 5, '絶 õ', 78);
-INSERT INTO RATING VALUES ('18', 1001, 4, '  Թ', 43);
-INSERT INTO RATING VALUES ('19', 1001, 3, 'ʹ ', 21);
-INSERT INTO RATING VALUES ('20', 1001, 5, 'ظ  Ҵ ', 95);
-INSERT INTO RATING VALUES ('21', 1001, 4, ' ڱ', 62);
-INSERT INTO RATING VALUES ('22', 1001, 5, 'ְ Ÿ', 84);
-INSERT INTO RATING VALUES ('23', 1001, 4, '̵  ', 39);
-INSERT INTO RATING VALUES ('24', 1001, 3, '  丮', 17);
-INSERT INTO RATING VALUES ('25', 1001, 5, '  ̾߱', 91);
-INSERT INTO RATING VALUES ('26', 1001, 4, 'ȣ ', 58);
-INSERT INTO RATING VALUES ('27', 1001, 5, 'ø  ʼ', 80);
-INSERT INTO RATING VALUES ('28', 1001, 4, 'ſ ', 46);
-INSERT INTO RATING VALUES ('29', 1001, 3, 'ȭ   ', 24);
-INSERT INTO RATING VALUES ('30', 1001, 5, '  å', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1001, 5, '   ʹ ־!', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1001, 4, 'Ŭ Ÿ, ̵鿡 õ', 32);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1001, 5, 'ȭŭ å ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1001, 3, '븸ŭ ƴϾ ', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1001, 5, 'ظ 迡 ǫ ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1001, 4, 'ȣ׿Ʈ ؿ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1001, 5, '̿  Բ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1001, 4, 'ø ù  Ϻ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1001, 3, ' ġ ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1001, 5, '  ߾', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1001, 4, '̿ Բ б ƿ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1001, 5, 'Ÿ  ʵ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1001, 4, '丮 ŷ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1001, 3, 'ȭ  ƿ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1001, 5, ' ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1001, 4, 'ĳ͵ ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1001, 5, '絶 õ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1001, 4, '  Թ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1001, 3, 'ʹ ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1001, 5, 'ظ  Ҵ ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1001, 4, ' ڱ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1001, 5, 'ְ Ÿ', 84);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1001, 4, '̵  ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1001, 3, '  丮', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1001, 5, '  ̾߱', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1001, 4, 'ȣ ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1001, 5, 'ø  ʼ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1001, 4, 'ſ ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1001, 3, 'ȭ   ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1001, 5, '  å', 97);
 
 -- Content 1002: Harry Potter and the Chamber of Secrets
-INSERT INTO RATING VALUES ('31', 1002, 5, '  ̽͸ ְ', 52);
-INSERT INTO RATING VALUES ('32', 1002, 4, 'ø ̾ ', 38);
-INSERT INTO RATING VALUES ('33', 1002, 5, '尨 Ŀ', 71);
-INSERT INTO RATING VALUES ('34', 1002, 3, '۸ŭ ƴ', 15);
-INSERT INTO RATING VALUES ('35', 1002, 5, 'ٽǸũ ', 88);
-INSERT INTO RATING VALUES ('36', 1002, 4, 'ĳ ', 55);
-INSERT INTO RATING VALUES ('37', 1002, 5, 'ְ ', 77);
-INSERT INTO RATING VALUES ('38', 1002, 4, 'ȣ׿Ʈ ', 42);
-INSERT INTO RATING VALUES ('39', 1002, 3, '  ', 20);
-INSERT INTO RATING VALUES ('40', 1002, 5, 'ø ʵ', 93);
-INSERT INTO RATING VALUES ('41', 1002, 4, '̽͸  ', 60);
-INSERT INTO RATING VALUES ('42', 1002, 5, 'ظ ', 82);
-INSERT INTO RATING VALUES ('43', 1002, 4, 'ſ Ÿ', 47);
-INSERT INTO RATING VALUES ('44', 1002, 3, 'ȭ  ', 25);
-INSERT INTO RATING VALUES ('45', 1002, 5, 'õ å', 96);
-INSERT INTO RATING VALUES ('46', 1002, 4, ' ǳ', 63);
-INSERT INTO RATING VALUES ('47', 1002, 5, 'ø  ', 85);
-INSERT INTO RATING VALUES ('48', 1002, 4, ' ', 50);
-INSERT INTO RATING VALUES ('49', 1002, 3, 'Ǵ ḻ', 28);
-INSERT INTO RATING VALUES ('50', 1002, 5, '  ŷ', 99);
-INSERT INTO RATING VALUES ('51', 1002, 4, 'ģ б', 66);
-INSERT INTO RATING VALUES ('52', 1002, 5, 'ְ ', 88);
-INSERT INTO RATING VALUES ('53', 1002, 4, 'ĳ ŷ', 53);
-INSERT INTO RATING VALUES ('54', 1002, 3, ' ׸', 31);
-INSERT INTO RATING VALUES ('55', 1002, 5, '絶 ġ ', 94);
-INSERT INTO RATING VALUES ('56', 1002, 4, 'Ÿ  õ', 61);
-INSERT INTO RATING VALUES ('57', 1002, 5, ' ħ', 83);
-INSERT INTO RATING VALUES ('58', 1002, 4, ' ̾߱', 48);
-INSERT INTO RATING VALUES ('59', 1002, 3, ' ġ', 26);
-INSERT INTO RATING VALUES ('60', 1002, 5, ' Ŭ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1002, 5, '  ̽͸ ְ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1002, 4, 'ø ̾ ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1002, 5, '尨 Ŀ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1002, 3, '۸ŭ ƴ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1002, 5, 'ٽǸũ ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1002, 4, 'ĳ ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1002, 5, 'ְ ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1002, 4, 'ȣ׿Ʈ ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1002, 3, '  ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1002, 5, 'ø ʵ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1002, 4, '̽͸  ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1002, 5, 'ظ ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1002, 4, 'ſ Ÿ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1002, 3, 'ȭ  ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1002, 5, 'õ å', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1002, 4, ' ǳ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1002, 5, 'ø  ', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1002, 4, ' ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1002, 3, 'Ǵ ḻ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1002, 5, '  ŷ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1002, 4, 'ģ б', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1002, 5, 'ְ ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1002, 4, 'ĳ ŷ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1002, 3, ' ׸', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1002, 5, '絶 ġ ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1002, 4, 'Ÿ  õ', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1002, 5, ' ħ', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1002, 4, ' ̾߱', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1002, 3, ' ġ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1002, 5, ' Ŭ', 97);
 
 -- Content 1003: Harry Potter and the Prisoner of Azkaban
-INSERT INTO RATING VALUES ('61', 1003, 5, 'ø콺  ŷ', 72);
-INSERT INTO RATING VALUES ('62', 1003, 5, 'ְ ø  ϳ', 90);
-INSERT INTO RATING VALUES ('63', 1003, 4, 'ð  ', 57);
-INSERT INTO RATING VALUES ('64', 1003, 5, ' ḻ', 79);
-INSERT INTO RATING VALUES ('65', 1003, 5, '  ƿ', 44);
-INSERT INTO RATING VALUES ('66', 1003, 4, '̽͸ ', 22);
-INSERT INTO RATING VALUES ('67', 1003, 5, '絶  ', 95);
-INSERT INTO RATING VALUES ('68', 1003, 5, 'ظ  ̾߱', 62);
-INSERT INTO RATING VALUES ('69', 1003, 4, 'ī ', 40);
-INSERT INTO RATING VALUES ('70', 1003, 5, 'ø ȯ', 83);
-INSERT INTO RATING VALUES ('71', 1003, 5, 'ĳ ', 50);
-INSERT INTO RATING VALUES ('72', 1003, 4, 'ð  ŷ', 28);
-INSERT INTO RATING VALUES ('73', 1003, 5, 'ְ å', 91);
-INSERT INTO RATING VALUES ('74', 1003, 5, ' ', 68);
-INSERT INTO RATING VALUES ('75', 1003, 4, 'Ÿ  ', 36);
-INSERT INTO RATING VALUES ('76', 1003, 5, 'õ ʵ', 89);
-INSERT INTO RATING VALUES ('77', 1003, 5, '丮 Ϻ', 56);
-INSERT INTO RATING VALUES ('78', 1003, 4, 'ȭŭ ', 34);
-INSERT INTO RATING VALUES ('79', 1003, 5, 'ظ ', 77);
-INSERT INTO RATING VALUES ('80', 1003, 5, '̽͸ ذ', 94);
-INSERT INTO RATING VALUES ('81', 1003, 4, 'ģ ', 41);
-INSERT INTO RATING VALUES ('82', 1003, 5, '̿ ', 84);
-INSERT INTO RATING VALUES ('83', 1003, 5, 'ø Ʈ', 51);
-INSERT INTO RATING VALUES ('84', 1003, 4, '尨', 29);
-INSERT INTO RATING VALUES ('85', 1003, 5, '  Ȯ', 92);
-INSERT INTO RATING VALUES ('86', 1003, 5, 'ĳ ', 69);
-INSERT INTO RATING VALUES ('87', 1003, 4, 'ð  ż', 37);
-INSERT INTO RATING VALUES ('88', 1003, 5, '', 80);
-INSERT INTO RATING VALUES ('89', 1003, 5, 'ְ', 47);
-INSERT INTO RATING VALUES ('90', 1003, 4, ' å', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1003, 5, 'ø콺  ŷ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1003, 5, 'ְ ø  ϳ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1003, 4, 'ð  ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1003, 5, ' ḻ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1003, 5, '  ƿ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1003, 4, '̽͸ ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1003, 5, '絶  ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1003, 5, 'ظ  ̾߱', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1003, 4, 'ī ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1003, 5, 'ø ȯ', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1003, 5, 'ĳ ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1003, 4, 'ð  ŷ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1003, 5, 'ְ å', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1003, 5, ' ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1003, 4, 'Ÿ  ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1003, 5, 'õ ʵ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1003, 5, '丮 Ϻ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1003, 4, 'ȭŭ ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1003, 5, 'ظ ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1003, 5, '̽͸ ذ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('81', 1003, 4, 'ģ ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('82', 1003, 5, '̿ ', 84);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('83', 1003, 5, 'ø Ʈ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('84', 1003, 4, '尨', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('85', 1003, 5, '  Ȯ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('86', 1003, 5, 'ĳ ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('87', 1003, 4, 'ð  ż', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('88', 1003, 5, '', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('89', 1003, 5, 'ְ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('90', 1003, 4, ' å', 25);
 
 -- Content 1004: Harry Potter and the Goblet of Fire
-INSERT INTO RATING VALUES ('91', 1004, 5, '  ȸ ', 73);
-INSERT INTO RATING VALUES ('92', 1004, 4, 'Ʈ ', 39);
-INSERT INTO RATING VALUES ('93', 1004, 5, '尨 ', 81);
-INSERT INTO RATING VALUES ('94', 1004, 3, ' ǰ', 16);
-INSERT INTO RATING VALUES ('95', 1004, 5, 'ø ο', 89);
-INSERT INTO RATING VALUES ('96', 1004, 4, 'ȸ ̺Ʈ ', 56);
-INSERT INTO RATING VALUES ('97', 1004, 5, 'ظ ', 78);
-INSERT INTO RATING VALUES ('98', 1004, 4, 'ĳ  ', 43);
-INSERT INTO RATING VALUES ('99', 1004, 3, ' ', 21);
-INSERT INTO RATING VALUES ('100', 1004, 5, 'Ÿ ׼', 94);
-INSERT INTO RATING VALUES ('101', 1004, 4, 'Ʈ ', 61);
-INSERT INTO RATING VALUES ('102', 1004, 5, '', 83);
-INSERT INTO RATING VALUES ('103', 1004, 4, 'ø ʼ', 48);
-INSERT INTO RATING VALUES ('104', 1004, 3, 'ȭ  ', 26);
-INSERT INTO RATING VALUES ('105', 1004, 5, 'õ', 97);
-INSERT INTO RATING VALUES ('106', 1004, 4, ' ', 64);
-INSERT INTO RATING VALUES ('107', 1004, 5, 'ο ', 86);
-INSERT INTO RATING VALUES ('108', 1004, 4, 'ĳ ', 51);
-INSERT INTO RATING VALUES ('109', 1004, 3, ' ', 29);
-INSERT INTO RATING VALUES ('110', 1004, 5, 'ȸ ̷ο', 92);
-INSERT INTO RATING VALUES ('111', 1004, 4, 'Ʈ ȯ', 59);
-INSERT INTO RATING VALUES ('112', 1004, 5, 'ְ', 81);
-INSERT INTO RATING VALUES ('113', 1004, 4, '絶 ġ', 46);
-INSERT INTO RATING VALUES ('114', 1004, 3, ' ', 24);
-INSERT INTO RATING VALUES ('115', 1004, 5, 'Ÿ ', 95);
-INSERT INTO RATING VALUES ('116', 1004, 4, '', 62);
-INSERT INTO RATING VALUES ('117', 1004, 5, ' ̾߱', 84);
-INSERT INTO RATING VALUES ('118', 1004, 4, 'ø ߰', 49);
-INSERT INTO RATING VALUES ('119', 1004, 3, ' ', 27);
-INSERT INTO RATING VALUES ('120', 1004, 5, ' ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('91', 1004, 5, '  ȸ ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('92', 1004, 4, 'Ʈ ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 1004, 5, '尨 ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 1004, 3, ' ǰ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 1004, 5, 'ø ο', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('96', 1004, 4, 'ȸ ̺Ʈ ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('97', 1004, 5, 'ظ ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('98', 1004, 4, 'ĳ  ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('99', 1004, 3, ' ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('100', 1004, 5, 'Ÿ ׼', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('101', 1004, 4, 'Ʈ ', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('102', 1004, 5, '', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('103', 1004, 4, 'ø ʼ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('104', 1004, 3, 'ȭ  ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('105', 1004, 5, 'õ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('106', 1004, 4, ' ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('107', 1004, 5, 'ο ', 86);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('108', 1004, 4, 'ĳ ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('109', 1004, 3, ' ', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('110', 1004, 5, 'ȸ ̷ο', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('111', 1004, 4, 'Ʈ ȯ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('112', 1004, 5, 'ְ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('113', 1004, 4, '絶 ġ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('114', 1004, 3, ' ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('115', 1004, 5, 'Ÿ ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('116', 1004, 4, '', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('117', 1004, 5, ' ̾߱', 84);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('118', 1004, 4, 'ø ߰', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('119', 1004, 3, ' ', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('120', 1004, 5, ' ', 98);
 
 -- Content 1005: Harry Potter and the Order of the Phoenix
-INSERT INTO RATING VALUES ('121', 1005, 3, ' κ ', 14);
-INSERT INTO RATING VALUES ('122', 1005, 4, 'һ  ', 37);
-INSERT INTO RATING VALUES ('123', 1005, 3, ' ', 19);
-INSERT INTO RATING VALUES ('124', 1005, 2, '   ', 5);
-INSERT INTO RATING VALUES ('125', 1005, 4, 'ظ  ȭ', 42);
-INSERT INTO RATING VALUES ('126', 1005, 3, '׼ ', 21);
-INSERT INTO RATING VALUES ('127', 1005, 4, 'ø ', 44);
-INSERT INTO RATING VALUES ('128', 1005, 3, '', 23);
-INSERT INTO RATING VALUES ('129', 1005, 2, '־ ø', 8);
-INSERT INTO RATING VALUES ('130', 1005, 4, 'ġ ', 47);
-INSERT INTO RATING VALUES ('131', 1005, 3, ' ', 26);
-INSERT INTO RATING VALUES ('132', 1005, 4, 'ĳ ', 49);
-INSERT INTO RATING VALUES ('133', 1005, 3, ' ', 28);
-INSERT INTO RATING VALUES ('134', 1005, 2, 'б ', 10);
-INSERT INTO RATING VALUES ('135', 1005, 4, ' ̾߱', 52);
-INSERT INTO RATING VALUES ('136', 1005, 3, '߰ ', 31);
-INSERT INTO RATING VALUES ('137', 1005, 4, 'ø ̶ ', 54);
-INSERT INTO RATING VALUES ('138', 1005, 3, 'Ʈ', 33);
-INSERT INTO RATING VALUES ('139', 1005, 2, '', 12);
-INSERT INTO RATING VALUES ('140', 1005, 4, ' ', 57);
-INSERT INTO RATING VALUES ('141', 1005, 3, ' ', 36);
-INSERT INTO RATING VALUES ('142', 1005, 4, ' ŷ', 59);
-INSERT INTO RATING VALUES ('143', 1005, 3, '', 38);
-INSERT INTO RATING VALUES ('144', 1005, 2, 'Ǹ', 14);
-INSERT INTO RATING VALUES ('145', 1005, 4, '̾ ', 62);
-INSERT INTO RATING VALUES ('146', 1005, 3, ' ', 41);
-INSERT INTO RATING VALUES ('147', 1005, 4, 'ظ г', 64);
-INSERT INTO RATING VALUES ('148', 1005, 3, ' ', 43);
-INSERT INTO RATING VALUES ('149', 1005, 2, '', 16);
-INSERT INTO RATING VALUES ('150', 1005, 4, 'ø ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('121', 1005, 3, ' κ ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('122', 1005, 4, 'һ  ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('123', 1005, 3, ' ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('124', 1005, 2, '   ', 5);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('125', 1005, 4, 'ظ  ȭ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('126', 1005, 3, '׼ ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('127', 1005, 4, 'ø ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('128', 1005, 3, '', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('129', 1005, 2, '־ ø', 8);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('130', 1005, 4, 'ġ ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('131', 1005, 3, ' ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('132', 1005, 4, 'ĳ ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('133', 1005, 3, ' ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('134', 1005, 2, 'б ', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('135', 1005, 4, ' ̾߱', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('136', 1005, 3, '߰ ', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('137', 1005, 4, 'ø ̶ ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('138', 1005, 3, 'Ʈ', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('139', 1005, 2, '', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('140', 1005, 4, ' ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('141', 1005, 3, ' ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('142', 1005, 4, ' ŷ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('143', 1005, 3, '', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('144', 1005, 2, 'Ǹ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('145', 1005, 4, '̾ ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('146', 1005, 3, ' ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('147', 1005, 4, 'ظ г', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('148', 1005, 3, ' ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('149', 1005, 2, '', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('150', 1005, 4, 'ø ', 67);
 
 -- Content 1006: Effective Python
-INSERT INTO RATING VALUES ('151', 1006, 5, '̽ ǹ  ', 75);
-INSERT INTO RATING VALUES ('152', 1006, 5, 'ڵ  ', 92);
-INSERT INTO RATING VALUES ('153', 1006, 4, '߱ õ', 59);
-INSERT INTO RATING VALUES ('154', 1006, 5, 'Ʈ Ƽ', 81);
-INSERT INTO RATING VALUES ('155', 1006, 5, 'б ', 46);
-INSERT INTO RATING VALUES ('156', 1006, 4, ' ', 24);
-INSERT INTO RATING VALUES ('157', 1006, 5, '̽ ', 87);
-INSERT INTO RATING VALUES ('158', 1006, 5, ' ', 64);
-INSERT INTO RATING VALUES ('159', 1006, 4, ' ', 42);
-INSERT INTO RATING VALUES ('160', 1006, 5, 'õ å', 85);
-INSERT INTO RATING VALUES ('161', 1006, 5, ' ', 52);
-INSERT INTO RATING VALUES ('162', 1006, 4, ' ', 30);
-INSERT INTO RATING VALUES ('163', 1006, 5, '̽ ', 93);
-INSERT INTO RATING VALUES ('164', 1006, 5, 'ڵ ȭ', 70);
-INSERT INTO RATING VALUES ('165', 1006, 4, 'н ', 38);
-INSERT INTO RATING VALUES ('166', 1006, 5, ' ', 91);
-INSERT INTO RATING VALUES ('167', 1006, 5, '絶 ġ', 68);
-INSERT INTO RATING VALUES ('168', 1006, 4, 'ǹ ߽', 36);
-INSERT INTO RATING VALUES ('169', 1006, 5, ' ̵', 89);
-INSERT INTO RATING VALUES ('170', 1006, 5, '̽ ', 56);
-INSERT INTO RATING VALUES ('171', 1006, 4, ' ', 34);
-INSERT INTO RATING VALUES ('172', 1006, 5, ' ʵ', 97);
-INSERT INTO RATING VALUES ('173', 1006, 5, 'ڵ Ÿ', 74);
-INSERT INTO RATING VALUES ('174', 1006, 4, '', 42);
-INSERT INTO RATING VALUES ('175', 1006, 5, 'ְ å', 95);
-INSERT INTO RATING VALUES ('176', 1006, 5, 'н õ', 72);
-INSERT INTO RATING VALUES ('177', 1006, 4, '߱ ', 40);
-INSERT INTO RATING VALUES ('178', 1006, 5, '̽ ', 93);
-INSERT INTO RATING VALUES ('179', 1006, 5, 'ƿ', 70);
-INSERT INTO RATING VALUES ('180', 1006, 4, 'Ʈ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('151', 1006, 5, '̽ ǹ  ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('152', 1006, 5, 'ڵ  ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('153', 1006, 4, '߱ õ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('154', 1006, 5, 'Ʈ Ƽ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('155', 1006, 5, 'б ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('156', 1006, 4, ' ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('157', 1006, 5, '̽ ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('158', 1006, 5, ' ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('159', 1006, 4, ' ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('160', 1006, 5, 'õ å', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('161', 1006, 5, ' ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('162', 1006, 4, ' ', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('163', 1006, 5, '̽ ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('164', 1006, 5, 'ڵ ȭ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('165', 1006, 4, 'н ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('166', 1006, 5, ' ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('167', 1006, 5, '絶 ġ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('168', 1006, 4, 'ǹ ߽', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('169', 1006, 5, ' ̵', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('170', 1006, 5, '̽ ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('171', 1006, 4, ' ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('172', 1006, 5, ' ʵ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('173', 1006, 5, 'ڵ Ÿ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('174', 1006, 4, '', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('175', 1006, 5, 'ְ å', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('176', 1006, 5, 'н õ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('177', 1006, 4, '߱ ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('178', 1006, 5, '̽ ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('179', 1006, 5, 'ƿ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('180', 1006, 4, 'Ʈ', 38);
 
 -- Content 1007: Introduction to Databases
-INSERT INTO RATING VALUES ('181', 1007, 5, 'ͺ̽  ', 76);
-INSERT INTO RATING VALUES ('182', 1007, 5, ' ', 93);
-INSERT INTO RATING VALUES ('183', 1007, 5, 'Թ õ', 60);
-INSERT INTO RATING VALUES ('184', 1007, 5, '̷ źź', 82);
-INSERT INTO RATING VALUES ('185', 1007, 5, ' ', 47);
-INSERT INTO RATING VALUES ('186', 1007, 5, ' ', 25);
-INSERT INTO RATING VALUES ('187', 1007, 5, 'DB ', 88);
-INSERT INTO RATING VALUES ('188', 1007, 5, 'õ', 65);
-INSERT INTO RATING VALUES ('189', 1007, 5, 'н ', 43);
-INSERT INTO RATING VALUES ('190', 1007, 5, '⺻', 86);
-INSERT INTO RATING VALUES ('191', 1007, 5, 'ƿ', 53);
-INSERT INTO RATING VALUES ('192', 1007, 5, '̷ ', 31);
-INSERT INTO RATING VALUES ('193', 1007, 5, 'Թ ʵ', 94);
-INSERT INTO RATING VALUES ('194', 1007, 5, 'Ȯ', 71);
-INSERT INTO RATING VALUES ('195', 1007, 5, ' å', 39);
-INSERT INTO RATING VALUES ('196', 1007, 5, 'DB ʺ', 92);
-INSERT INTO RATING VALUES ('197', 1007, 5, 'õ ', 69);
-INSERT INTO RATING VALUES ('198', 1007, 5, 'н ', 37);
-INSERT INTO RATING VALUES ('199', 1007, 5, ' ', 90);
-INSERT INTO RATING VALUES ('200', 1007, 5, 'ְ', 57);
-INSERT INTO RATING VALUES ('1', 1007, 5, '̷ Ϻ', 35);
-INSERT INTO RATING VALUES ('2', 1007, 5, 'õ å', 98);
-INSERT INTO RATING VALUES ('3', 1007, 5, 'DB ', 75);
-INSERT INTO RATING VALUES ('4', 1007, 5, ' ̵', 43);
-INSERT INTO RATING VALUES ('5', 1007, 5, 'Թ', 96);
-INSERT INTO RATING VALUES ('6', 1007, 5, '̷ ߽', 73);
-INSERT INTO RATING VALUES ('7', 1007, 5, 'н õ', 41);
-INSERT INTO RATING VALUES ('8', 1007, 5, ' ', 94);
-INSERT INTO RATING VALUES ('9', 1007, 5, 'ְ ', 71);
-INSERT INTO RATING VALUES ('10', 1007, 5, 'õ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('181', 1007, 5, 'ͺ̽  ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('182', 1007, 5, ' ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('183', 1007, 5, 'Թ õ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('184', 1007, 5, '̷ źź', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('185', 1007, 5, ' ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('186', 1007, 5, ' ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('187', 1007, 5, 'DB ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('188', 1007, 5, 'õ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('189', 1007, 5, 'н ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('190', 1007, 5, '⺻', 86);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('191', 1007, 5, 'ƿ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('192', 1007, 5, '̷ ', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('193', 1007, 5, 'Թ ʵ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('194', 1007, 5, 'Ȯ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('195', 1007, 5, ' å', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('196', 1007, 5, 'DB ʺ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('197', 1007, 5, 'õ ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('198', 1007, 5, 'н ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('199', 1007, 5, ' ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('200', 1007, 5, 'ְ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1007, 5, '̷ Ϻ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1007, 5, 'õ å', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1007, 5, 'DB ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1007, 5, ' ̵', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1007, 5, 'Թ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1007, 5, '̷ ߽', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1007, 5, 'н õ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1007, 5, ' ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1007, 5, 'ְ ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1007, 5, 'õ', 39);
 
 -- Content 1008: Basic Principles of Deep Learning
-INSERT INTO RATING VALUES ('11', 1008, 5, '  ', 77);
-INSERT INTO RATING VALUES ('12', 1008, 4, '  ', 44);
-INSERT INTO RATING VALUES ('13', 1008, 5, 'Թ õ', 66);
-INSERT INTO RATING VALUES ('14', 1008, 3, ' ', 22);
-INSERT INTO RATING VALUES ('15', 1008, 5, 'AI н', 89);
-INSERT INTO RATING VALUES ('16', 1008, 4, '⺻ ', 56);
-INSERT INTO RATING VALUES ('17', 1008, 5, ' å', 78);
-INSERT INTO RATING VALUES ('18', 1008, 4, ' Թ', 45);
-INSERT INTO RATING VALUES ('19', 1008, 3, ' ', 23);
-INSERT INTO RATING VALUES ('20', 1008, 5, 'õ', 96);
-INSERT INTO RATING VALUES ('21', 1008, 4, '̷ ', 63);
-INSERT INTO RATING VALUES ('22', 1008, 5, 'н ', 85);
-INSERT INTO RATING VALUES ('23', 1008, 4, 'AI ʺ', 50);
-INSERT INTO RATING VALUES ('24', 1008, 3, '', 28);
-INSERT INTO RATING VALUES ('25', 1008, 5, ' ', 91);
-INSERT INTO RATING VALUES ('26', 1008, 4, ' ̵', 58);
-INSERT INTO RATING VALUES ('27', 1008, 5, ' ', 80);
-INSERT INTO RATING VALUES ('28', 1008, 4, '⺻', 47);
-INSERT INTO RATING VALUES ('29', 1008, 3, '  ʿ', 25);
-INSERT INTO RATING VALUES ('30', 1008, 5, 'ְ', 98);
-INSERT INTO RATING VALUES ('31', 1008, 4, 'н õ', 65);
-INSERT INTO RATING VALUES ('32', 1008, 5, 'AI ', 87);
-INSERT INTO RATING VALUES ('33', 1008, 4, ' Ȯ', 52);
-INSERT INTO RATING VALUES ('34', 1008, 3, 'ʺ ', 30);
-INSERT INTO RATING VALUES ('35', 1008, 5, ' å', 93);
-INSERT INTO RATING VALUES ('36', 1008, 4, ' ⺻', 60);
-INSERT INTO RATING VALUES ('37', 1008, 5, 'õ ', 82);
-INSERT INTO RATING VALUES ('38', 1008, 4, '̷ ', 49);
-INSERT INTO RATING VALUES ('39', 1008, 3, ' ', 27);
-INSERT INTO RATING VALUES ('40', 1008, 5, 'Ʈ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1008, 5, '  ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1008, 4, '  ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1008, 5, 'Թ õ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1008, 3, ' ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1008, 5, 'AI н', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1008, 4, '⺻ ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1008, 5, ' å', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1008, 4, ' Թ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1008, 3, ' ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1008, 5, 'õ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1008, 4, '̷ ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1008, 5, 'н ', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1008, 4, 'AI ʺ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1008, 3, '', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1008, 5, ' ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1008, 4, ' ̵', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1008, 5, ' ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1008, 4, '⺻', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1008, 3, '  ʿ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1008, 5, 'ְ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1008, 4, 'н õ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1008, 5, 'AI ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1008, 4, ' Ȯ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1008, 3, 'ʺ ', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1008, 5, ' å', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1008, 4, ' ⺻', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1008, 5, 'õ ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1008, 4, '̷ ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1008, 3, ' ', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1008, 5, 'Ʈ', 95);
 
 -- Content 1009: SQL  ̵
-INSERT INTO RATING VALUES ('41', 1009, 5, 'SQL  ۼ ū ', 68);
-INSERT INTO RATING VALUES ('42', 1009, 5, '  ׷̵', 85);
-INSERT INTO RATING VALUES ('43', 1009, 4, 'ǹ  ǳ', 52);
-INSERT INTO RATING VALUES ('44', 1009, 5, 'ͺ̽ ȭ  ', 74);
-INSERT INTO RATING VALUES ('45', 1009, 5, '߱ õ', 39);
-INSERT INTO RATING VALUES ('46', 1009, 4, ' Ȯ', 17);
-INSERT INTO RATING VALUES ('47', 1009, 5, 'SQL  غ ', 90);
-INSERT INTO RATING VALUES ('48', 1009, 5, '  ', 67);
-INSERT INTO RATING VALUES ('49', 1009, 4, ' ', 45);
-INSERT INTO RATING VALUES ('50', 1009, 5, 'DB  ʵ', 88);
-INSERT INTO RATING VALUES ('51', 1009, 5, ' SQL ', 55);
-INSERT INTO RATING VALUES ('52', 1009, 4, 'н  ', 33);
-INSERT INTO RATING VALUES ('53', 1009, 5, 'õ ̵', 96);
-INSERT INTO RATING VALUES ('54', 1009, 5, 'SQL ', 73);
-INSERT INTO RATING VALUES ('55', 1009, 4, ' ', 41);
-INSERT INTO RATING VALUES ('56', 1009, 5, 'ǹ ', 94);
-INSERT INTO RATING VALUES ('57', 1009, 5, ' ȭ', 71);
-INSERT INTO RATING VALUES ('58', 1009, 4, ' ', 39);
-INSERT INTO RATING VALUES ('59', 1009, 5, ' ', 92);
-INSERT INTO RATING VALUES ('60', 1009, 5, ' å', 69);
-INSERT INTO RATING VALUES ('61', 1009, 4, 'SQL н', 37);
-INSERT INTO RATING VALUES ('62', 1009, 5, 'õ', 90);
-INSERT INTO RATING VALUES ('63', 1009, 5, ' ', 67);
-INSERT INTO RATING VALUES ('64', 1009, 4, '', 35);
-INSERT INTO RATING VALUES ('65', 1009, 1, 'ʹ ', 12);
-INSERT INTO RATING VALUES ('66', 1009, 1, ' ', 8);
-INSERT INTO RATING VALUES ('67', 1009, 2, ' ', 15);
-INSERT INTO RATING VALUES ('68', 1009, 2, '', 10);
-INSERT INTO RATING VALUES ('69', 1009, 3, ' ', 22);
-INSERT INTO RATING VALUES ('70', 1009, 3, '  å ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1009, 5, 'SQL  ۼ ū ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1009, 5, '  ׷̵', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1009, 4, 'ǹ  ǳ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1009, 5, 'ͺ̽ ȭ  ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1009, 5, '߱ õ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1009, 4, ' Ȯ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1009, 5, 'SQL  غ ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1009, 5, '  ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1009, 4, ' ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1009, 5, 'DB  ʵ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1009, 5, ' SQL ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1009, 4, 'н  ', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1009, 5, 'õ ̵', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1009, 5, 'SQL ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1009, 4, ' ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1009, 5, 'ǹ ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1009, 5, ' ȭ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1009, 4, ' ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1009, 5, ' ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1009, 5, ' å', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1009, 4, 'SQL н', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1009, 5, 'õ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1009, 5, ' ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1009, 4, '', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1009, 1, 'ʹ ', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1009, 1, ' ', 8);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1009, 2, ' ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1009, 2, '', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1009, 3, ' ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1009, 3, '  å ', 18);
 
 -- Content 1010: , , 
-INSERT INTO RATING VALUES ('71', 1010, 5, 'η    ', 78);
-INSERT INTO RATING VALUES ('72', 1010, 4, '   ', 45);
-INSERT INTO RATING VALUES ('73', 1010, 5, ' ؼ', 67);
-INSERT INTO RATING VALUES ('74', 1010, 3, 'ʹ  ݺ', 24);
-INSERT INTO RATING VALUES ('75', 1010, 5, '  ', 89);
-INSERT INTO RATING VALUES ('76', 1010, 4, ' ', 56);
-INSERT INTO RATING VALUES ('77', 1010, 5, 'õ ', 78);
-INSERT INTO RATING VALUES ('78', 1010, 4, 'þ  ', 43);
-INSERT INTO RATING VALUES ('79', 1010, 3, '  ', 21);
-INSERT INTO RATING VALUES ('80', 1010, 5, '  ', 92);
-INSERT INTO RATING VALUES ('81', 1010, 4, 'Ѱ  ', 59);
-INSERT INTO RATING VALUES ('82', 1010, 5, 'η ʵ', 81);
-INSERT INTO RATING VALUES ('83', 1010, 4, ' ', 46);
-INSERT INTO RATING VALUES ('84', 1010, 3, '  κ', 24);
-INSERT INTO RATING VALUES ('85', 1010, 5, ' ', 95);
-INSERT INTO RATING VALUES ('86', 1010, 4, '  õ', 62);
-INSERT INTO RATING VALUES ('87', 1010, 5, ' ', 84);
-INSERT INTO RATING VALUES ('88', 1010, 4, ' ', 49);
-INSERT INTO RATING VALUES ('89', 1010, 3, '', 27);
-INSERT INTO RATING VALUES ('90', 1010, 5, 'ְ å', 98);
-INSERT INTO RATING VALUES ('91', 1010, 4, 'λƮ ', 65);
-INSERT INTO RATING VALUES ('92', 1010, 5, '絶 ġ', 87);
-INSERT INTO RATING VALUES ('93', 1010, 4, ' ', 52);
-INSERT INTO RATING VALUES ('94', 1010, 1, 'ϰ ', 9);
-INSERT INTO RATING VALUES ('95', 1010, 1, '߸ ', 5);
-INSERT INTO RATING VALUES ('96', 1010, 2, ' ', 12);
-INSERT INTO RATING VALUES ('97', 1010, 2, 'ݺ ', 8);
-INSERT INTO RATING VALUES ('98', 1010, 5, ' ', 90);
-INSERT INTO RATING VALUES ('99', 1010, 5, ' м', 67);
-INSERT INTO RATING VALUES ('100', 1010, 5, 'õ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1010, 5, 'η    ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1010, 4, '   ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1010, 5, ' ؼ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1010, 3, 'ʹ  ݺ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1010, 5, '  ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1010, 4, ' ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1010, 5, 'õ ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1010, 4, 'þ  ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1010, 3, '  ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1010, 5, '  ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('81', 1010, 4, 'Ѱ  ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('82', 1010, 5, 'η ʵ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('83', 1010, 4, ' ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('84', 1010, 3, '  κ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('85', 1010, 5, ' ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('86', 1010, 4, '  õ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('87', 1010, 5, ' ', 84);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('88', 1010, 4, ' ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('89', 1010, 3, '', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('90', 1010, 5, 'ְ å', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('91', 1010, 4, 'λƮ ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('92', 1010, 5, '絶 ġ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 1010, 4, ' ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 1010, 1, 'ϰ ', 9);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 1010, 1, '߸ ', 5);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('96', 1010, 2, ' ', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('97', 1010, 2, 'ݺ ', 8);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('98', 1010, 5, ' ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('99', 1010, 5, ' м', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('100', 1010, 5, 'õ', 45);
 
 -- Content 1011: , ,  ( Ư)
-INSERT INTO RATING VALUES ('101', 1011, 5, '  ', 79);
-INSERT INTO RATING VALUES ('102', 1011, 4, ' ', 46);
-INSERT INTO RATING VALUES ('103', 1011, 5, 'η  ', 68);
-INSERT INTO RATING VALUES ('104', 1011, 3, ' ƽ', 25);
-INSERT INTO RATING VALUES ('105', 1011, 5, ' ȯ ', 90);
-INSERT INTO RATING VALUES ('106', 1011, 4, 'հ ', 57);
-INSERT INTO RATING VALUES ('107', 1011, 5, '  ', 79);
-INSERT INTO RATING VALUES ('108', 1011, 4, 'Ư ġ ', 44);
-INSERT INTO RATING VALUES ('109', 1011, 3, 'ݺ ', 22);
-INSERT INTO RATING VALUES ('110', 1011, 5, ' ', 93);
-INSERT INTO RATING VALUES ('111', 1011, 4, 'þ ', 60);
-INSERT INTO RATING VALUES ('112', 1011, 5, '  ʵ', 82);
-INSERT INTO RATING VALUES ('113', 1011, 4, ' ', 47);
-INSERT INTO RATING VALUES ('114', 1011, 3, ' ', 25);
-INSERT INTO RATING VALUES ('115', 1011, 5, 'λƮ ǳ', 96);
-INSERT INTO RATING VALUES ('116', 1011, 4, '  ؼ', 63);
-INSERT INTO RATING VALUES ('117', 1011, 5, 'Ư õ', 85);
-INSERT INTO RATING VALUES ('118', 1011, 4, ' ִ м', 50);
-INSERT INTO RATING VALUES ('119', 1011, 3, ' ǰ', 28);
-INSERT INTO RATING VALUES ('120', 1011, 5, 'ְ ', 99);
-INSERT INTO RATING VALUES ('121', 1011, 4, ' ؼ', 66);
-INSERT INTO RATING VALUES ('122', 1011, 5, ' ', 88);
-INSERT INTO RATING VALUES ('123', 1011, 4, 'η ', 53);
-INSERT INTO RATING VALUES ('124', 1011, 1, ' ', 10);
-INSERT INTO RATING VALUES ('125', 1011, 1, '', 6);
-INSERT INTO RATING VALUES ('126', 1011, 2, 'ġ  ħ', 13);
-INSERT INTO RATING VALUES ('127', 1011, 2, 'ݺ ', 9);
-INSERT INTO RATING VALUES ('128', 1011, 5, ' å', 91);
-INSERT INTO RATING VALUES ('129', 1011, 5, 'õ ', 68);
-INSERT INTO RATING VALUES ('130', 1011, 5, ' ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('101', 1011, 5, '  ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('102', 1011, 4, ' ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('103', 1011, 5, 'η  ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('104', 1011, 3, ' ƽ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('105', 1011, 5, ' ȯ ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('106', 1011, 4, 'հ ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('107', 1011, 5, '  ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('108', 1011, 4, 'Ư ġ ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('109', 1011, 3, 'ݺ ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('110', 1011, 5, ' ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('111', 1011, 4, 'þ ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('112', 1011, 5, '  ʵ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('113', 1011, 4, ' ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('114', 1011, 3, ' ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('115', 1011, 5, 'λƮ ǳ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('116', 1011, 4, '  ؼ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('117', 1011, 5, 'Ư õ', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('118', 1011, 4, ' ִ м', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('119', 1011, 3, ' ǰ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('120', 1011, 5, 'ְ ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('121', 1011, 4, ' ؼ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('122', 1011, 5, ' ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('123', 1011, 4, 'η ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('124', 1011, 1, ' ', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('125', 1011, 1, '', 6);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('126', 1011, 2, 'ġ  ħ', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('127', 1011, 2, 'ݺ ', 9);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('128', 1011, 5, ' å', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('129', 1011, 5, 'õ ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('130', 1011, 5, ' ', 46);
 
 -- Content 1012: ڽ
-INSERT INTO RATING VALUES ('131', 1012, 5, 'ֿ  Ƹٿ ', 80);
-INSERT INTO RATING VALUES ('132', 1012, 5, ' ȭ ', 97);
-INSERT INTO RATING VALUES ('133', 1012, 4, 'öа  ȭ', 64);
-INSERT INTO RATING VALUES ('134', 1012, 5, ' Ž ', 86);
-INSERT INTO RATING VALUES ('135', 1012, 5, 'Į ̰  ǥ', 51);
-INSERT INTO RATING VALUES ('136', 1012, 4, '  ', 29);
-INSERT INTO RATING VALUES ('137', 1012, 5, 'ʵ м', 92);
-INSERT INTO RATING VALUES ('138', 1012, 5, ' ź', 69);
-INSERT INTO RATING VALUES ('139', 1012, 4, '  þ', 47);
-INSERT INTO RATING VALUES ('140', 1012, 5, 'õ ', 90);
-INSERT INTO RATING VALUES ('141', 1012, 5, ' ', 57);
-INSERT INTO RATING VALUES ('142', 1012, 4, 'ΰ ġ', 35);
-INSERT INTO RATING VALUES ('143', 1012, 5, ' ', 98);
-INSERT INTO RATING VALUES ('144', 1012, 5, '̰ Ÿ', 75);
-INSERT INTO RATING VALUES ('145', 1012, 4, ' ڱ', 43);
-INSERT INTO RATING VALUES ('146', 1012, 5, 'ְ å', 96);
-INSERT INTO RATING VALUES ('147', 1012, 5, ' ', 73);
-INSERT INTO RATING VALUES ('148', 1012, 4, ' Թ', 41);
-INSERT INTO RATING VALUES ('149', 1012, 5, '絶 ġ', 94);
-INSERT INTO RATING VALUES ('150', 1012, 5, 'Ƹٿ ', 71);
-INSERT INTO RATING VALUES ('151', 1012, 5, '  õ', 39);
-INSERT INTO RATING VALUES ('152', 1012, 5, 'ö ', 92);
-INSERT INTO RATING VALUES ('153', 1012, 5, ' θǽ', 69);
-INSERT INTO RATING VALUES ('154', 1012, 5, ' ִ å', 37);
-INSERT INTO RATING VALUES ('155', 1012, 1, 'ʹ ', 11);
-INSERT INTO RATING VALUES ('156', 1012, 1, ' κ', 7);
-INSERT INTO RATING VALUES ('157', 1012, 2, '  ', 14);
-INSERT INTO RATING VALUES ('158', 1012, 2, ' ', 10);
-INSERT INTO RATING VALUES ('159', 1012, 3, '', 23);
-INSERT INTO RATING VALUES ('160', 1012, 3, 'Ʈ ʿ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('131', 1012, 5, 'ֿ  Ƹٿ ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('132', 1012, 5, ' ȭ ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('133', 1012, 4, 'öа  ȭ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('134', 1012, 5, ' Ž ', 86);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('135', 1012, 5, 'Į ̰  ǥ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('136', 1012, 4, '  ', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('137', 1012, 5, 'ʵ м', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('138', 1012, 5, ' ź', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('139', 1012, 4, '  þ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('140', 1012, 5, 'õ ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('141', 1012, 5, ' ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('142', 1012, 4, 'ΰ ġ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('143', 1012, 5, ' ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('144', 1012, 5, '̰ Ÿ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('145', 1012, 4, ' ڱ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('146', 1012, 5, 'ְ å', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('147', 1012, 5, ' ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('148', 1012, 4, ' Թ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('149', 1012, 5, '絶 ġ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('150', 1012, 5, 'Ƹٿ ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('151', 1012, 5, '  õ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('152', 1012, 5, 'ö ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('153', 1012, 5, ' θǽ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('154', 1012, 5, ' ִ å', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('155', 1012, 1, 'ʹ ', 11);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('156', 1012, 1, ' κ', 7);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('157', 1012, 2, '  ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('158', 1012, 2, ' ', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('159', 1012, 3, '', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('160', 1012, 3, 'Ʈ ʿ', 19);
 
 -- Content 1013: ڽ ()
-INSERT INTO RATING VALUES ('161', 1013, 5, ' Ʈ ', 89);
-INSERT INTO RATING VALUES ('162', 1013, 5, '  ', 96);
-INSERT INTO RATING VALUES ('163', 1013, 5, ' ȭ', 63);
-INSERT INTO RATING VALUES ('164', 1013, 5, 'ö ȭ', 85);
-INSERT INTO RATING VALUES ('165', 1013, 5, 'Ž ', 50);
-INSERT INTO RATING VALUES ('166', 1013, 5, ' ǥ', 28);
-INSERT INTO RATING VALUES ('167', 1013, 5, 'ʵ', 91);
-INSERT INTO RATING VALUES ('168', 1013, 5, 'ź ', 68);
-INSERT INTO RATING VALUES ('169', 1013, 5, 'þ Ȯ', 46);
-INSERT INTO RATING VALUES ('170', 1013, 5, ' õ', 89);
-INSERT INTO RATING VALUES ('171', 1013, 5, ' ', 56);
-INSERT INTO RATING VALUES ('172', 1013, 5, 'ΰ ġ', 34);
-INSERT INTO RATING VALUES ('173', 1013, 5, ' ', 97);
-INSERT INTO RATING VALUES ('174', 1013, 5, 'Ÿ ְ', 74);
-INSERT INTO RATING VALUES ('175', 1013, 5, 'ڱ ', 42);
-INSERT INTO RATING VALUES ('176', 1013, 5, 'ְ å', 95);
-INSERT INTO RATING VALUES ('177', 1013, 5, ' ', 72);
-INSERT INTO RATING VALUES ('178', 1013, 5, 'Թ ', 40);
-INSERT INTO RATING VALUES ('179', 1013, 5, '絶', 93);
-INSERT INTO RATING VALUES ('180', 1013, 5, 'Ƹٿ', 70);
-INSERT INTO RATING VALUES ('181', 1013, 4, '', 38);
-INSERT INTO RATING VALUES ('182', 1013, 4, ' õ', 91);
-INSERT INTO RATING VALUES ('183', 1013, 4, '', 68);
-INSERT INTO RATING VALUES ('184', 1013, 4, 'θǽ', 46);
-INSERT INTO RATING VALUES ('185', 1013, 1, ' ', 10);
-INSERT INTO RATING VALUES ('186', 1013, 1, '', 7);
-INSERT INTO RATING VALUES ('187', 1013, 2, ' ', 14);
-INSERT INTO RATING VALUES ('188', 1013, 2, '', 11);
-INSERT INTO RATING VALUES ('189', 1013, 3, 'ʿ Ʈ', 22);
-INSERT INTO RATING VALUES ('190', 1013, 3, '', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('161', 1013, 5, ' Ʈ ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('162', 1013, 5, '  ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('163', 1013, 5, ' ȭ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('164', 1013, 5, 'ö ȭ', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('165', 1013, 5, 'Ž ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('166', 1013, 5, ' ǥ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('167', 1013, 5, 'ʵ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('168', 1013, 5, 'ź ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('169', 1013, 5, 'þ Ȯ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('170', 1013, 5, ' õ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('171', 1013, 5, ' ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('172', 1013, 5, 'ΰ ġ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('173', 1013, 5, ' ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('174', 1013, 5, 'Ÿ ְ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('175', 1013, 5, 'ڱ ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('176', 1013, 5, 'ְ å', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('177', 1013, 5, ' ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('178', 1013, 5, 'Թ ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('179', 1013, 5, '絶', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('180', 1013, 5, 'Ƹٿ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('181', 1013, 4, '', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('182', 1013, 4, ' õ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('183', 1013, 4, '', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('184', 1013, 4, 'θǽ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('185', 1013, 1, ' ', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('186', 1013, 1, '', 7);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('187', 1013, 2, ' ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('188', 1013, 2, '', 11);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('189', 1013, 3, 'ʿ Ʈ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('190', 1013, 3, '', 19);
 
 -- Content 1014: ̾
-INSERT INTO RATING VALUES ('191', 1014, 5, 'ھ ߰ ', 90);
-INSERT INTO RATING VALUES ('192', 1014, 5, 'ö ', 97);
-INSERT INTO RATING VALUES ('193', 1014, 5, ' ̾߱', 64);
-INSERT INTO RATING VALUES ('194', 1014, 5, 'ƺ罺 ź', 86);
-INSERT INTO RATING VALUES ('195', 1014, 5, '켼 ǥ', 51);
-INSERT INTO RATING VALUES ('196', 1014, 5, 'ûҳ ʵ', 29);
-INSERT INTO RATING VALUES ('197', 1014, 5, 'ھ Ž', 92);
-INSERT INTO RATING VALUES ('198', 1014, 5, ' ḻ', 69);
-INSERT INTO RATING VALUES ('199', 1014, 5, 'λ ', 47);
-INSERT INTO RATING VALUES ('200', 1014, 5, 'õ ', 90);
-INSERT INTO RATING VALUES ('1', 1014, 5, 'ö ', 57);
-INSERT INTO RATING VALUES ('2', 1014, 5, ' ', 35);
-INSERT INTO RATING VALUES ('3', 1014, 5, '̾ ŷ', 98);
-INSERT INTO RATING VALUES ('4', 1014, 5, 'ھ ', 75);
-INSERT INTO RATING VALUES ('5', 1014, 5, ' ', 43);
-INSERT INTO RATING VALUES ('6', 1014, 5, 'ְ Ҽ', 96);
-INSERT INTO RATING VALUES ('7', 1014, 5, '絶 ġ', 73);
-INSERT INTO RATING VALUES ('8', 1014, 5, 'û õ', 41);
-INSERT INTO RATING VALUES ('9', 1014, 4, 'ö ', 94);
-INSERT INTO RATING VALUES ('10', 1014, 4, ' Ҽ', 71);
-INSERT INTO RATING VALUES ('11', 1014, 4, ' ', 39);
-INSERT INTO RATING VALUES ('12', 1014, 4, 'ھ ', 92);
-INSERT INTO RATING VALUES ('13', 1014, 4, '켼 Ÿ', 69);
-INSERT INTO RATING VALUES ('14', 1014, 4, '', 37);
-INSERT INTO RATING VALUES ('15', 1014, 1, '', 12);
-INSERT INTO RATING VALUES ('16', 1014, 1, '', 9);
-INSERT INTO RATING VALUES ('17', 1014, 2, ' ', 16);
-INSERT INTO RATING VALUES ('18', 1014, 2, '̾', 13);
-INSERT INTO RATING VALUES ('19', 1014, 3, '', 24);
-INSERT INTO RATING VALUES ('20', 1014, 3, ' ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('191', 1014, 5, 'ھ ߰ ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('192', 1014, 5, 'ö ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('193', 1014, 5, ' ̾߱', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('194', 1014, 5, 'ƺ罺 ź', 86);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('195', 1014, 5, '켼 ǥ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('196', 1014, 5, 'ûҳ ʵ', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('197', 1014, 5, 'ھ Ž', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('198', 1014, 5, ' ḻ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('199', 1014, 5, 'λ ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('200', 1014, 5, 'õ ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1014, 5, 'ö ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1014, 5, ' ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1014, 5, '̾ ŷ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1014, 5, 'ھ ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1014, 5, ' ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1014, 5, 'ְ Ҽ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1014, 5, '絶 ġ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1014, 5, 'û õ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1014, 4, 'ö ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1014, 4, ' Ҽ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1014, 4, ' ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1014, 4, 'ھ ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1014, 4, '켼 Ÿ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1014, 4, '', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1014, 1, '', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1014, 1, '', 9);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1014, 2, ' ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1014, 2, '̾', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1014, 3, '', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1014, 3, ' ', 21);
 
 -- Content 1015:  
-INSERT INTO RATING VALUES ('21', 1015, 5, 'λ  ', 91);
-INSERT INTO RATING VALUES ('22', 1015, 5, 'ȭ ', 98);
-INSERT INTO RATING VALUES ('23', 1015, 5, '  ', 65);
-INSERT INTO RATING VALUES ('24', 1015, 5, '  ', 87);
-INSERT INTO RATING VALUES ('25', 1015, 5, ' ȭ', 52);
-INSERT INTO RATING VALUES ('26', 1015, 5, '׸ Ƹٿ', 30);
-INSERT INTO RATING VALUES ('27', 1015, 5, '絶 õ', 93);
-INSERT INTO RATING VALUES ('28', 1015, 5, 'ΰ ', 70);
-INSERT INTO RATING VALUES ('29', 1015, 5, ' ', 48);
-INSERT INTO RATING VALUES ('30', 1015, 5, 'ְ ', 91);
-INSERT INTO RATING VALUES ('31', 1015, 5, 'ȭ ', 58);
-INSERT INTO RATING VALUES ('32', 1015, 5, ' õ', 36);
-INSERT INTO RATING VALUES ('33', 1015, 5, ' ̾߱', 99);
-INSERT INTO RATING VALUES ('34', 1015, 5, '丮', 76);
-INSERT INTO RATING VALUES ('35', 1015, 5, ' ', 44);
-INSERT INTO RATING VALUES ('36', 1015, 5, 'ʵ', 97);
-INSERT INTO RATING VALUES ('37', 1015, 5, 'λ ݼ', 74);
-INSERT INTO RATING VALUES ('38', 1015, 5, ' ', 42);
-INSERT INTO RATING VALUES ('39', 1015, 5, ' ', 95);
-INSERT INTO RATING VALUES ('40', 1015, 5, ' ǹ', 72);
-INSERT INTO RATING VALUES ('41', 1015, 4, ' ', 40);
-INSERT INTO RATING VALUES ('42', 1015, 4, 'ȭ õ', 93);
-INSERT INTO RATING VALUES ('43', 1015, 4, '', 70);
-INSERT INTO RATING VALUES ('44', 1015, 4, 'λ ', 48);
-INSERT INTO RATING VALUES ('45', 1015, 1, 'ġ', 13);
-INSERT INTO RATING VALUES ('46', 1015, 1, '', 10);
-INSERT INTO RATING VALUES ('47', 1015, 2, '̾', 17);
-INSERT INTO RATING VALUES ('48', 1015, 2, ' Ʒ', 14);
-INSERT INTO RATING VALUES ('49', 1015, 3, ' ȭ', 25);
-INSERT INTO RATING VALUES ('50', 1015, 3, 'ª ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1015, 5, 'λ  ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1015, 5, 'ȭ ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1015, 5, '  ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1015, 5, '  ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1015, 5, ' ȭ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1015, 5, '׸ Ƹٿ', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1015, 5, '絶 õ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1015, 5, 'ΰ ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1015, 5, ' ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1015, 5, 'ְ ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1015, 5, 'ȭ ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1015, 5, ' õ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1015, 5, ' ̾߱', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1015, 5, '丮', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1015, 5, ' ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1015, 5, 'ʵ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1015, 5, 'λ ݼ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1015, 5, ' ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1015, 5, ' ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1015, 5, ' ǹ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1015, 4, ' ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1015, 4, 'ȭ õ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1015, 4, '', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1015, 4, 'λ ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1015, 1, 'ġ', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1015, 1, '', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1015, 2, '̾', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1015, 2, ' Ʒ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1015, 3, ' ȭ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1015, 3, 'ª ', 22);
 
 -- Content 1016: ̳ ħ
-INSERT INTO RATING VALUES ('51', 1016, 5, 'λ  ', 92);
-INSERT INTO RATING VALUES ('52', 1016, 5, 'ڱ ְ', 99);
-INSERT INTO RATING VALUES ('53', 1016, 5, 'õ  ', 66);
-INSERT INTO RATING VALUES ('54', 1016, 5, 'ο ', 88);
-INSERT INTO RATING VALUES ('55', 1016, 5, ' ̵', 53);
-INSERT INTO RATING VALUES ('56', 1016, 5, 'Ʈ ', 31);
-INSERT INTO RATING VALUES ('57', 1016, 5, 'λ ȭ', 94);
-INSERT INTO RATING VALUES ('58', 1016, 5, 'õ å', 71);
-INSERT INTO RATING VALUES ('59', 1016, 5, 'ڱ ݼ', 49);
-INSERT INTO RATING VALUES ('60', 1016, 5, 'õ ߽', 92);
-INSERT INTO RATING VALUES ('61', 1016, 5, ' ', 59);
-INSERT INTO RATING VALUES ('62', 1016, 5, ' ', 37);
-INSERT INTO RATING VALUES ('63', 1016, 5, 'ħ ', 100);
-INSERT INTO RATING VALUES ('64', 1016, 5, '̳ Ÿ', 77);
-INSERT INTO RATING VALUES ('65', 1016, 5, 'λ ', 45);
-INSERT INTO RATING VALUES ('66', 1016, 5, 'ְ ڱ', 98);
-INSERT INTO RATING VALUES ('67', 1016, 5, '絶 ġ', 75);
-INSERT INTO RATING VALUES ('68', 1016, 5, ' õ', 43);
-INSERT INTO RATING VALUES ('69', 1016, 4, ' ', 96);
-INSERT INTO RATING VALUES ('70', 1016, 4, ' ο', 73);
-INSERT INTO RATING VALUES ('71', 1016, 4, ' ', 41);
-INSERT INTO RATING VALUES ('72', 1016, 4, ' ', 94);
-INSERT INTO RATING VALUES ('73', 1016, 4, 'ݼ ', 71);
-INSERT INTO RATING VALUES ('74', 1016, 4, 'õ ', 39);
-INSERT INTO RATING VALUES ('75', 1016, 1, '', 14);
-INSERT INTO RATING VALUES ('76', 1016, 1, '', 11);
-INSERT INTO RATING VALUES ('77', 1016, 2, '̾', 18);
-INSERT INTO RATING VALUES ('78', 1016, 2, ' ', 15);
-INSERT INTO RATING VALUES ('79', 1016, 3, '', 26);
-INSERT INTO RATING VALUES ('80', 1016, 3, 'Ϻ ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1016, 5, 'λ  ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1016, 5, 'ڱ ְ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1016, 5, 'õ  ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1016, 5, 'ο ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1016, 5, ' ̵', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1016, 5, 'Ʈ ', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1016, 5, 'λ ȭ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1016, 5, 'õ å', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1016, 5, 'ڱ ݼ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1016, 5, 'õ ߽', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1016, 5, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1016, 5, ' ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1016, 5, 'ħ ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1016, 5, '̳ Ÿ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1016, 5, 'λ ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1016, 5, 'ְ ڱ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1016, 5, '絶 ġ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1016, 5, ' õ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1016, 4, ' ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1016, 4, ' ο', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1016, 4, ' ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1016, 4, ' ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1016, 4, 'ݼ ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1016, 4, 'õ ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1016, 1, '', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1016, 1, '', 11);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1016, 2, '̾', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1016, 2, ' ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1016, 3, '', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1016, 3, 'Ϻ ', 23);
 
 -- Content 1017: 
-INSERT INTO RATING VALUES ('81', 1017, 5, 'λ  ġƮŰ ְ', 92);
-INSERT INTO RATING VALUES ('82', 1017, 5, ' 7ܰ õ ', 89);
-INSERT INTO RATING VALUES ('83', 1017, 5, 'ڱ ǿ', 76);
-INSERT INTO RATING VALUES ('84', 1017, 5, 'ο ', 63);
-INSERT INTO RATING VALUES ('85', 1017, 5, '  ̵', 50);
-INSERT INTO RATING VALUES ('86', 1017, 5, 'ŷ  ', 37);
-INSERT INTO RATING VALUES ('87', 1017, 5, ' Ż ', 94);
-INSERT INTO RATING VALUES ('88', 1017, 5, 'û ', 71);
-INSERT INTO RATING VALUES ('89', 1017, 5, 'λ ȭ', 58);
-INSERT INTO RATING VALUES ('90', 1017, 5, 'õ ʵ', 45);
-INSERT INTO RATING VALUES ('91', 1017, 5, 'õ  ', 32);
-INSERT INTO RATING VALUES ('92', 1017, 5, '7ܰ  Ϻ', 95);
-INSERT INTO RATING VALUES ('93', 1017, 5, 'ڱ ʼ', 72);
-INSERT INTO RATING VALUES ('94', 1017, 5, ' ', 59);
-INSERT INTO RATING VALUES ('95', 1017, 5, 'ο å', 46);
-INSERT INTO RATING VALUES ('96', 1017, 5, ' ', 33);
-INSERT INTO RATING VALUES ('97', 1017, 5, 'ְ ̵', 96);
-INSERT INTO RATING VALUES ('98', 1017, 5, 'λ ', 73);
-INSERT INTO RATING VALUES ('99', 1017, 5, 'Ʈ ', 60);
-INSERT INTO RATING VALUES ('100', 1017, 5, '絶 ġ', 47);
-INSERT INTO RATING VALUES ('101', 1017, 4, ' ', 34);
-INSERT INTO RATING VALUES ('102', 1017, 4, 'õ ߽', 91);
-INSERT INTO RATING VALUES ('103', 1017, 4, 'ο ', 68);
-INSERT INTO RATING VALUES ('104', 1017, 4, 'ڱ õ', 55);
-INSERT INTO RATING VALUES ('105', 1017, 1, ' ', 11);
-INSERT INTO RATING VALUES ('106', 1017, 1, 'ڱ ', 8);
-INSERT INTO RATING VALUES ('107', 1017, 2, ' ', 15);
-INSERT INTO RATING VALUES ('108', 1017, 2, ' ', 12);
-INSERT INTO RATING VALUES ('109', 1017, 3, ' ', 23);
-INSERT INTO RATING VALUES ('110', 1017, 3, 'Ϻ ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('81', 1017, 5, 'λ  ġƮŰ ְ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('82', 1017, 5, ' 7ܰ õ ', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('83', 1017, 5, 'ڱ ǿ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('84', 1017, 5, 'ο ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('85', 1017, 5, '  ̵', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('86', 1017, 5, 'ŷ  ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('87', 1017, 5, ' Ż ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('88', 1017, 5, 'û ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('89', 1017, 5, 'λ ȭ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('90', 1017, 5, 'õ ʵ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('91', 1017, 5, 'õ  ', 32);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('92', 1017, 5, '7ܰ  Ϻ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 1017, 5, 'ڱ ʼ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 1017, 5, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 1017, 5, 'ο å', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('96', 1017, 5, ' ', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('97', 1017, 5, 'ְ ̵', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('98', 1017, 5, 'λ ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('99', 1017, 5, 'Ʈ ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('100', 1017, 5, '絶 ġ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('101', 1017, 4, ' ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('102', 1017, 4, 'õ ߽', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('103', 1017, 4, 'ο ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('104', 1017, 4, 'ڱ õ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('105', 1017, 1, ' ', 11);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('106', 1017, 1, 'ڱ ', 8);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('107', 1017, 2, ' ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('108', 1017, 2, ' ', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('109', 1017, 3, ' ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('110', 1017, 3, 'Ϻ ', 20);
 
 -- Content 1018: ĿǮ
-INSERT INTO RATING VALUES ('111', 1018, 5, 'ø ȭ ̵ ְ', 93);
-INSERT INTO RATING VALUES ('112', 1018, 5, ' å ȭ', 90);
-INSERT INTO RATING VALUES ('113', 1018, 5, '  ʵ', 77);
-INSERT INTO RATING VALUES ('114', 1018, 5, ' λƮ', 64);
-INSERT INTO RATING VALUES ('115', 1018, 5, '  ', 51);
-INSERT INTO RATING VALUES ('116', 1018, 5, ' ȭ ', 38);
-INSERT INTO RATING VALUES ('117', 1018, 5, 'Ƽ ڵ ', 95);
-INSERT INTO RATING VALUES ('118', 1018, 5, '  ̵', 72);
-INSERT INTO RATING VALUES ('119', 1018, 5, ' ', 59);
-INSERT INTO RATING VALUES ('120', 1018, 5, 'õ ', 46);
-INSERT INTO RATING VALUES ('121', 1018, 5, 'ȭ ũ', 33);
-INSERT INTO RATING VALUES ('122', 1018, 5, ' ', 96);
-INSERT INTO RATING VALUES ('123', 1018, 5, ' ʼ', 73);
-INSERT INTO RATING VALUES ('124', 1018, 5, ' ', 60);
-INSERT INTO RATING VALUES ('125', 1018, 5, 'λ ', 47);
-INSERT INTO RATING VALUES ('126', 1018, 5, 'ø ', 34);
-INSERT INTO RATING VALUES ('127', 1018, 5, 'ְ å', 97);
-INSERT INTO RATING VALUES ('128', 1018, 5, 'ȭ ȭ', 74);
-INSERT INTO RATING VALUES ('129', 1018, 5, 'ũ', 61);
-INSERT INTO RATING VALUES ('130', 1018, 5, '絶 ġ', 48);
-INSERT INTO RATING VALUES ('131', 1018, 4, ' ', 35);
-INSERT INTO RATING VALUES ('132', 1018, 4, '濵 õ', 92);
-INSERT INTO RATING VALUES ('133', 1018, 4, 'ȭ ̵', 69);
-INSERT INTO RATING VALUES ('134', 1018, 4, '', 56);
-INSERT INTO RATING VALUES ('135', 1018, 1, 'ʹ ̷', 13);
-INSERT INTO RATING VALUES ('136', 1018, 1, ' ', 10);
-INSERT INTO RATING VALUES ('137', 1018, 2, '', 17);
-INSERT INTO RATING VALUES ('138', 1018, 2, ' ', 14);
-INSERT INTO RATING VALUES ('139', 1018, 3, '', 25);
-INSERT INTO RATING VALUES ('140', 1018, 3, 'Ϻ ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('111', 1018, 5, 'ø ȭ ̵ ְ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('112', 1018, 5, ' å ȭ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('113', 1018, 5, '  ʵ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('114', 1018, 5, ' λƮ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('115', 1018, 5, '  ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('116', 1018, 5, ' ȭ ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('117', 1018, 5, 'Ƽ ڵ ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('118', 1018, 5, '  ̵', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('119', 1018, 5, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('120', 1018, 5, 'õ ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('121', 1018, 5, 'ȭ ũ', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('122', 1018, 5, ' ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('123', 1018, 5, ' ʼ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('124', 1018, 5, ' ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('125', 1018, 5, 'λ ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('126', 1018, 5, 'ø ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('127', 1018, 5, 'ְ å', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('128', 1018, 5, 'ȭ ȭ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('129', 1018, 5, 'ũ', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('130', 1018, 5, '絶 ġ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('131', 1018, 4, ' ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('132', 1018, 4, '濵 õ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('133', 1018, 4, 'ȭ ̵', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('134', 1018, 4, '', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('135', 1018, 1, 'ʹ ̷', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('136', 1018, 1, ' ', 10);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('137', 1018, 2, '', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('138', 1018, 2, ' ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('139', 1018, 3, '', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('140', 1018, 3, 'Ϻ ', 22);
 
 -- Content 1019: ̾ ȭ 
-INSERT INTO RATING VALUES ('141', 1019, 5, '  ̾߱', 94);
-INSERT INTO RATING VALUES ('142', 1019, 5, 'ó ̰ ְ', 91);
-INSERT INTO RATING VALUES ('143', 1019, 5, 'ο ', 78);
-INSERT INTO RATING VALUES ('144', 1019, 5, ' ̽͸', 65);
-INSERT INTO RATING VALUES ('145', 1019, 5, 'ð  ', 52);
-INSERT INTO RATING VALUES ('146', 1019, 5, '߸ ', 39);
-INSERT INTO RATING VALUES ('147', 1019, 5, 'ʵ', 96);
-INSERT INTO RATING VALUES ('148', 1019, 5, '̾ ', 73);
-INSERT INTO RATING VALUES ('149', 1019, 5, ' ', 60);
-INSERT INTO RATING VALUES ('150', 1019, 5, 'õ Ҽ', 47);
-INSERT INTO RATING VALUES ('151', 1019, 5, 'λ ', 34);
-INSERT INTO RATING VALUES ('152', 1019, 5, ' ḻ', 97);
-INSERT INTO RATING VALUES ('153', 1019, 5, 'ð ', 74);
-INSERT INTO RATING VALUES ('154', 1019, 5, '', 61);
-INSERT INTO RATING VALUES ('155', 1019, 5, '̽͸ ', 48);
-INSERT INTO RATING VALUES ('156', 1019, 5, '絶 ġ', 35);
-INSERT INTO RATING VALUES ('157', 1019, 5, ' ', 98);
-INSERT INTO RATING VALUES ('158', 1019, 5, 'ο ̾߱', 75);
-INSERT INTO RATING VALUES ('159', 1019, 5, ' Ҽ', 62);
-INSERT INTO RATING VALUES ('160', 1019, 5, 'ְ å', 49);
-INSERT INTO RATING VALUES ('161', 1019, 4, '', 36);
-INSERT INTO RATING VALUES ('162', 1019, 4, '', 93);
-INSERT INTO RATING VALUES ('163', 1019, 4, '߸ ', 70);
-INSERT INTO RATING VALUES ('164', 1019, 4, 'ο ׸', 57);
-INSERT INTO RATING VALUES ('165', 1019, 1, '÷ ', 14);
-INSERT INTO RATING VALUES ('166', 1019, 1, ' ', 11);
-INSERT INTO RATING VALUES ('167', 1019, 2, ' κ', 18);
-INSERT INTO RATING VALUES ('168', 1019, 2, ' ', 15);
-INSERT INTO RATING VALUES ('169', 1019, 3, '', 26);
-INSERT INTO RATING VALUES ('170', 1019, 3, 'Ϻ ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('141', 1019, 5, '  ̾߱', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('142', 1019, 5, 'ó ̰ ְ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('143', 1019, 5, 'ο ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('144', 1019, 5, ' ̽͸', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('145', 1019, 5, 'ð  ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('146', 1019, 5, '߸ ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('147', 1019, 5, 'ʵ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('148', 1019, 5, '̾ ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('149', 1019, 5, ' ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('150', 1019, 5, 'õ Ҽ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('151', 1019, 5, 'λ ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('152', 1019, 5, ' ḻ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('153', 1019, 5, 'ð ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('154', 1019, 5, '', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('155', 1019, 5, '̽͸ ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('156', 1019, 5, '絶 ġ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('157', 1019, 5, ' ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('158', 1019, 5, 'ο ̾߱', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('159', 1019, 5, ' Ҽ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('160', 1019, 5, 'ְ å', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('161', 1019, 4, '', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('162', 1019, 4, '', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('163', 1019, 4, '߸ ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('164', 1019, 4, 'ο ׸', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('165', 1019, 1, '÷ ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('166', 1019, 1, ' ', 11);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('167', 1019, 2, ' κ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('168', 1019, 2, ' ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('169', 1019, 3, '', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('170', 1019, 3, 'Ϻ ', 23);
 
 -- Content 1020: ޷Ʈ  ȭ
-INSERT INTO RATING VALUES ('171', 1020, 5, ' ȭ ŷ', 95);
-INSERT INTO RATING VALUES ('172', 1020, 5, ' Ÿ ְ', 92);
-INSERT INTO RATING VALUES ('173', 1020, 5, '̹̿ ۰ ', 79);
-INSERT INTO RATING VALUES ('174', 1020, 5, ' ', 66);
-INSERT INTO RATING VALUES ('175', 1020, 5, ' ̾߱', 53);
-INSERT INTO RATING VALUES ('176', 1020, 5, 'ȭ  å', 40);
-INSERT INTO RATING VALUES ('177', 1020, 5, 'Ʈ ', 97);
-INSERT INTO RATING VALUES ('178', 1020, 5, ' ', 74);
-INSERT INTO RATING VALUES ('179', 1020, 5, ' Ǹ ', 61);
-INSERT INTO RATING VALUES ('180', 1020, 5, 'õ ʵ', 48);
-INSERT INTO RATING VALUES ('181', 1020, 5, ' ǳ', 35);
-INSERT INTO RATING VALUES ('182', 1020, 5, ' ', 98);
-INSERT INTO RATING VALUES ('183', 1020, 5, ' ', 75);
-INSERT INTO RATING VALUES ('184', 1020, 5, '޷Ʈ ', 62);
-INSERT INTO RATING VALUES ('185', 1020, 5, 'Ÿ ', 49);
-INSERT INTO RATING VALUES ('186', 1020, 5, '絶 ġ', 36);
-INSERT INTO RATING VALUES ('187', 1020, 5, '  å', 99);
-INSERT INTO RATING VALUES ('188', 1020, 5, ' ڱ', 76);
-INSERT INTO RATING VALUES ('189', 1020, 5, ' ̾߱', 63);
-INSERT INTO RATING VALUES ('190', 1020, 5, 'ְ Ÿ', 50);
-INSERT INTO RATING VALUES ('191', 1020, 4, '', 37);
-INSERT INTO RATING VALUES ('192', 1020, 4, ' ȿ', 94);
-INSERT INTO RATING VALUES ('193', 1020, 4, ' ׸', 71);
-INSERT INTO RATING VALUES ('194', 1020, 4, '', 58);
-INSERT INTO RATING VALUES ('195', 1020, 1, 'ʹ ', 15);
-INSERT INTO RATING VALUES ('196', 1020, 1, '÷ ', 12);
-INSERT INTO RATING VALUES ('197', 1020, 2, ' ', 19);
-INSERT INTO RATING VALUES ('198', 1020, 2, 'ο', 16);
-INSERT INTO RATING VALUES ('199', 1020, 3, '', 27);
-INSERT INTO RATING VALUES ('200', 1020, 3, 'Ϻ ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('171', 1020, 5, ' ȭ ŷ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('172', 1020, 5, ' Ÿ ְ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('173', 1020, 5, '̹̿ ۰ ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('174', 1020, 5, ' ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('175', 1020, 5, ' ̾߱', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('176', 1020, 5, 'ȭ  å', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('177', 1020, 5, 'Ʈ ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('178', 1020, 5, ' ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('179', 1020, 5, ' Ǹ ', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('180', 1020, 5, 'õ ʵ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('181', 1020, 5, ' ǳ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('182', 1020, 5, ' ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('183', 1020, 5, ' ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('184', 1020, 5, '޷Ʈ ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('185', 1020, 5, 'Ÿ ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('186', 1020, 5, '絶 ġ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('187', 1020, 5, '  å', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('188', 1020, 5, ' ڱ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('189', 1020, 5, ' ̾߱', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('190', 1020, 5, 'ְ Ÿ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('191', 1020, 4, '', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('192', 1020, 4, ' ȿ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('193', 1020, 4, ' ׸', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('194', 1020, 4, '', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('195', 1020, 1, 'ʹ ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('196', 1020, 1, '÷ ', 12);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('197', 1020, 2, ' ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('198', 1020, 2, 'ο', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('199', 1020, 3, '', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('200', 1020, 3, 'Ϻ ', 24);
 
 -- Content 1021:  
-INSERT INTO RATING VALUES ('1', 1021, 5, '  Ҽ', 96);
-INSERT INTO RATING VALUES ('2', 1021, 5, ' ŷ', 93);
-INSERT INTO RATING VALUES ('3', 1021, 5, ' ̾߱', 80);
-INSERT INTO RATING VALUES ('4', 1021, 5, ' ο', 67);
-INSERT INTO RATING VALUES ('5', 1021, 5, 'ȣ ְ', 54);
-INSERT INTO RATING VALUES ('6', 1021, 5, '߰ ˹', 41);
-INSERT INTO RATING VALUES ('7', 1021, 5, 'Ʈ', 98);
-INSERT INTO RATING VALUES ('8', 1021, 5, 'λ ', 75);
-INSERT INTO RATING VALUES ('9', 1021, 5, ' ǹ', 62);
-INSERT INTO RATING VALUES ('10', 1021, 5, 'õ å', 49);
-INSERT INTO RATING VALUES ('11', 1021, 5, ' Ҽ', 36);
-INSERT INTO RATING VALUES ('12', 1021, 5, ' ', 99);
-INSERT INTO RATING VALUES ('13', 1021, 5, '', 76);
-INSERT INTO RATING VALUES ('14', 1017, 5, ' մ', 63);
-INSERT INTO RATING VALUES ('15', 1021, 5, '絶 ġ', 50);
-INSERT INTO RATING VALUES ('16', 1021, 5, '', 37);
-INSERT INTO RATING VALUES ('17', 1021, 5, 'ι ŷ', 100);
-INSERT INTO RATING VALUES ('18', 1021, 5, 'Ҽ õ', 77);
-INSERT INTO RATING VALUES ('19', 1021, 5, ' ḻ', 64);
-INSERT INTO RATING VALUES ('20', 1021, 5, 'ְ ̾߱', 51);
-INSERT INTO RATING VALUES ('21', 1021, 4, '', 38);
-INSERT INTO RATING VALUES ('22', 1021, 4, ' ', 95);
-INSERT INTO RATING VALUES ('23', 1021, 4, 'ο ׸', 72);
-INSERT INTO RATING VALUES ('24', 1021, 4, 'İ', 59);
-INSERT INTO RATING VALUES ('25', 1021, 4, ' ŷ', 46);
-INSERT INTO RATING VALUES ('26', 1021, 4, '', 33);
-INSERT INTO RATING VALUES ('27', 1021, 1, 'ʹ ', 16);
-INSERT INTO RATING VALUES ('28', 1021, 1, '÷ ', 13);
-INSERT INTO RATING VALUES ('29', 1021, 2, '', 20);
-INSERT INTO RATING VALUES ('30', 1021, 2, ' ', 17);
-INSERT INTO RATING VALUES ('31', 1021, 3, '', 28);
-INSERT INTO RATING VALUES ('32', 1021, 3, 'Ϻ ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1021, 5, '  Ҽ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1021, 5, ' ŷ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1021, 5, ' ̾߱', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1021, 5, ' ο', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1021, 5, 'ȣ ְ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1021, 5, '߰ ˹', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1021, 5, 'Ʈ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1021, 5, 'λ ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1021, 5, ' ǹ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1021, 5, 'õ å', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1021, 5, ' Ҽ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1021, 5, ' ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1021, 5, '', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1017, 5, ' մ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1021, 5, '絶 ġ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1021, 5, '', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1021, 5, 'ι ŷ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1021, 5, 'Ҽ õ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1021, 5, ' ḻ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1021, 5, 'ְ ̾߱', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1021, 4, '', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1021, 4, ' ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1021, 4, 'ο ׸', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1021, 4, 'İ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1021, 4, ' ŷ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1021, 4, '', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1021, 1, 'ʹ ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1021, 1, '÷ ', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1021, 2, '', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1021, 2, ' ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1021, 3, '', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1021, 3, 'Ϻ ', 25);
 
 -- Content 1022: Ƹ
-INSERT INTO RATING VALUES ('33', 1022, 5, '  Ҽ', 97);
-INSERT INTO RATING VALUES ('34', 1022, 5, ' ŷ', 94);
-INSERT INTO RATING VALUES ('35', 1022, 5, ' Ҵ', 81);
-INSERT INTO RATING VALUES ('36', 1022, 5, 'տ ְ', 68);
-INSERT INTO RATING VALUES ('37', 1022, 5, 'Ƹ ǹ', 55);
-INSERT INTO RATING VALUES ('38', 1022, 5, '', 42);
-INSERT INTO RATING VALUES ('39', 1022, 5, 'ûҳ ʵ', 99);
-INSERT INTO RATING VALUES ('40', 1022, 5, ' ǥ', 76);
-INSERT INTO RATING VALUES ('41', 1022, 5, 'λ ', 63);
-INSERT INTO RATING VALUES ('42', 1022, 5, 'õ å', 50);
-INSERT INTO RATING VALUES ('43', 1022, 5, '', 37);
-INSERT INTO RATING VALUES ('44', 1022, 5, ' ̾߱', 100);
-INSERT INTO RATING VALUES ('45', 1022, 5, ' ɷ', 77);
-INSERT INTO RATING VALUES ('46', 1022, 5, ' ', 64);
-INSERT INTO RATING VALUES ('47', 1022, 5, '絶 ġ', 51);
-INSERT INTO RATING VALUES ('48', 1022, 5, ' Ҽ', 38);
-INSERT INTO RATING VALUES ('49', 1022, 5, 'ְ å', 95);
-INSERT INTO RATING VALUES ('50', 1022, 5, 'ι ', 72);
-INSERT INTO RATING VALUES ('51', 1022, 5, ' ', 59);
-INSERT INTO RATING VALUES ('52', 1022, 5, 'ʵ', 46);
-INSERT INTO RATING VALUES ('53', 1022, 4, '', 33);
-INSERT INTO RATING VALUES ('54', 1022, 4, ' ׸', 96);
-INSERT INTO RATING VALUES ('55', 1022, 4, '', 73);
-INSERT INTO RATING VALUES ('56', 1022, 4, '', 60);
-INSERT INTO RATING VALUES ('57', 1022, 1, 'ʹ ', 17);
-INSERT INTO RATING VALUES ('58', 1022, 1, '÷ ', 14);
-INSERT INTO RATING VALUES ('59', 1022, 2, '', 21);
-INSERT INTO RATING VALUES ('60', 1022, 2, ' ', 18);
-INSERT INTO RATING VALUES ('61', 1022, 3, '', 29);
-INSERT INTO RATING VALUES ('62', 1022, 3, 'Ϻ ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1022, 5, '  Ҽ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1022, 5, ' ŷ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1022, 5, ' Ҵ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1022, 5, 'տ ְ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1022, 5, 'Ƹ ǹ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1022, 5, '', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1022, 5, 'ûҳ ʵ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1022, 5, ' ǥ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1022, 5, 'λ ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1022, 5, 'õ å', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1022, 5, '', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1022, 5, ' ̾߱', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1022, 5, ' ɷ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1022, 5, ' ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1022, 5, '絶 ġ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1022, 5, ' Ҽ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1022, 5, 'ְ å', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1022, 5, 'ι ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1022, 5, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1022, 5, 'ʵ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1022, 4, '', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1022, 4, ' ׸', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1022, 4, '', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1022, 4, '', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1022, 1, 'ʹ ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1022, 1, '÷ ', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1022, 2, '', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1022, 2, ' ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1022, 3, '', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1022, 3, 'Ϻ ', 26);
 
 -- Content 1023: Ͼ
-INSERT INTO RATING VALUES ('63', 1023, 5, '߱ ǻ ', 98);
-INSERT INTO RATING VALUES ('64', 1023, 5, ' ü ְ', 95);
-INSERT INTO RATING VALUES ('65', 1023, 5, ' Ҽ', 82);
-INSERT INTO RATING VALUES ('66', 1023, 5, 'Ͼ ', 69);
-INSERT INTO RATING VALUES ('67', 1023, 5, '', 56);
-INSERT INTO RATING VALUES ('68', 1023, 5, '', 43);
-INSERT INTO RATING VALUES ('69', 1023, 5, 'Ʈ', 100);
-INSERT INTO RATING VALUES ('70', 1023, 5, '߱ ǻ', 77);
-INSERT INTO RATING VALUES ('71', 1023, 5, ' ', 64);
-INSERT INTO RATING VALUES ('72', 1023, 5, 'õ ʵ', 51);
-INSERT INTO RATING VALUES ('73', 1023, 5, ' λƮ', 38);
-INSERT INTO RATING VALUES ('74', 1023, 5, '', 93);
-INSERT INTO RATING VALUES ('75', 1023, 5, ' κι', 70);
-INSERT INTO RATING VALUES ('76', 1023, 5, 'û ̾߱', 57);
-INSERT INTO RATING VALUES ('77', 1023, 5, '絶 ġ', 44);
-INSERT INTO RATING VALUES ('78', 1023, 5, ' ', 31);
-INSERT INTO RATING VALUES ('79', 1023, 5, 'ְ Ҽ', 94);
-INSERT INTO RATING VALUES ('80', 1023, 5, 'ι ', 71);
-INSERT INTO RATING VALUES ('81', 1023, 4, 'ü Ƹٿ', 58);
-INSERT INTO RATING VALUES ('82', 1023, 4, ' ', 45);
-INSERT INTO RATING VALUES ('83', 1023, 4, '߱', 32);
-INSERT INTO RATING VALUES ('84', 1023, 4, '', 95);
-INSERT INTO RATING VALUES ('85', 1023, 4, 'Ҽ õ', 72);
-INSERT INTO RATING VALUES ('86', 1023, 4, ' ', 59);
-INSERT INTO RATING VALUES ('87', 1023, 1, 'ʹ ſ', 18);
-INSERT INTO RATING VALUES ('88', 1023, 1, '÷ ', 15);
-INSERT INTO RATING VALUES ('89', 1023, 2, '', 22);
-INSERT INTO RATING VALUES ('90', 1023, 2, ' ', 19);
-INSERT INTO RATING VALUES ('91', 1023, 3, '', 30);
-INSERT INTO RATING VALUES ('92', 1023, 3, 'Ϻ ', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1023, 5, '߱ ǻ ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1023, 5, ' ü ְ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1023, 5, ' Ҽ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1023, 5, 'Ͼ ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1023, 5, '', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1023, 5, '', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1023, 5, 'Ʈ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1023, 5, '߱ ǻ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1023, 5, ' ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1023, 5, 'õ ʵ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1023, 5, ' λƮ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1023, 5, '', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1023, 5, ' κι', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1023, 5, 'û ̾߱', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1023, 5, '絶 ġ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1023, 5, ' ', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1023, 5, 'ְ Ҽ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1023, 5, 'ι ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('81', 1023, 4, 'ü Ƹٿ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('82', 1023, 4, ' ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('83', 1023, 4, '߱', 32);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('84', 1023, 4, '', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('85', 1023, 4, 'Ҽ õ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('86', 1023, 4, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('87', 1023, 1, 'ʹ ſ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('88', 1023, 1, '÷ ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('89', 1023, 2, '', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('90', 1023, 2, ' ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('91', 1023, 3, '', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('92', 1023, 3, 'Ϻ ', 27);
 
 -- Content 1024: ģ
-INSERT INTO RATING VALUES ('93', 1024, 5, 'ϵ ', 99);
-INSERT INTO RATING VALUES ('94', 1024, 5, '̹ ְ', 96);
-INSERT INTO RATING VALUES ('95', 1024, 5, '4 ̾߱', 83);
-INSERT INTO RATING VALUES ('96', 1024, 5, 'ƽ', 70);
-INSERT INTO RATING VALUES ('97', 1024, 5, 'ģ ', 57);
-INSERT INTO RATING VALUES ('98', 1024, 5, ' ', 44);
-INSERT INTO RATING VALUES ('99', 1024, 5, 'Ʈ', 101);
-INSERT INTO RATING VALUES ('100', 1024, 5, '̴ġ ', 78);
-INSERT INTO RATING VALUES ('101', 1024, 5, 'ι ', 65);
-INSERT INTO RATING VALUES ('102', 1024, 5, 'õ Ҽ', 52);
-INSERT INTO RATING VALUES ('103', 1024, 5, ' λƮ', 39);
-INSERT INTO RATING VALUES ('104', 1024, 5, ' ̾߱', 96);
-INSERT INTO RATING VALUES ('105', 1024, 5, 'Ϻ ȸ', 73);
-INSERT INTO RATING VALUES ('106', 1024, 5, '', 60);
-INSERT INTO RATING VALUES ('107', 1024, 5, '絶 ġ', 47);
-INSERT INTO RATING VALUES ('108', 1024, 5, 'ƽ ', 34);
-INSERT INTO RATING VALUES ('109', 1024, 5, 'ְ å', 97);
-INSERT INTO RATING VALUES ('110', 1024, 5, '', 74);
-INSERT INTO RATING VALUES ('111', 1024, 4, '', 61);
-INSERT INTO RATING VALUES ('112', 1024, 4, ' Ҽ', 48);
-INSERT INTO RATING VALUES ('113', 1024, 4, ' ׸', 35);
-INSERT INTO RATING VALUES ('114', 1024, 4, 'ι ŷ', 98);
-INSERT INTO RATING VALUES ('115', 1024, 4, '', 75);
-INSERT INTO RATING VALUES ('116', 1024, 4, 'õ', 62);
-INSERT INTO RATING VALUES ('117', 1024, 1, 'ʹ ', 19);
-INSERT INTO RATING VALUES ('118', 1024, 1, '', 16);
-INSERT INTO RATING VALUES ('119', 1024, 2, ' κ', 23);
-INSERT INTO RATING VALUES ('120', 1024, 2, ' ', 20);
-INSERT INTO RATING VALUES ('121', 1024, 3, '', 31);
-INSERT INTO RATING VALUES ('122', 1024, 3, 'Ϻ ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 1024, 5, 'ϵ ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 1024, 5, '̹ ְ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 1024, 5, '4 ̾߱', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('96', 1024, 5, 'ƽ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('97', 1024, 5, 'ģ ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('98', 1024, 5, ' ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('99', 1024, 5, 'Ʈ', 101);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('100', 1024, 5, '̴ġ ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('101', 1024, 5, 'ι ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('102', 1024, 5, 'õ Ҽ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('103', 1024, 5, ' λƮ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('104', 1024, 5, ' ̾߱', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('105', 1024, 5, 'Ϻ ȸ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('106', 1024, 5, '', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('107', 1024, 5, '絶 ġ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('108', 1024, 5, 'ƽ ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('109', 1024, 5, 'ְ å', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('110', 1024, 5, '', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('111', 1024, 4, '', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('112', 1024, 4, ' Ҽ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('113', 1024, 4, ' ׸', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('114', 1024, 4, 'ι ŷ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('115', 1024, 4, '', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('116', 1024, 4, 'õ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('117', 1024, 1, 'ʹ ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('118', 1024, 1, '', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('119', 1024, 2, ' κ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('120', 1024, 2, ' ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('121', 1024, 3, '', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('122', 1024, 3, 'Ϻ ', 28);
 
 -- Content 1025: Ʈ ڸ 2024
-INSERT INTO RATING VALUES ('123', 1025, 5, 'Ʈ  Ȯ', 85);
-INSERT INTO RATING VALUES ('124', 1025, 4, 'ÿ ', 62);
-INSERT INTO RATING VALUES ('125', 1025, 3, 'Ϻ ߻', 39);
-INSERT INTO RATING VALUES ('126', 1025, 5, 'Һ Ʈ м ', 76);
-INSERT INTO RATING VALUES ('127', 1025, 4, ' ʵ', 53);
-INSERT INTO RATING VALUES ('128', 1025, 3, '  ', 30);
-INSERT INTO RATING VALUES ('129', 1025, 5, '̷  ', 93);
-INSERT INTO RATING VALUES ('130', 1025, 4, 'Ͻ λƮ', 70);
-INSERT INTO RATING VALUES ('131', 1025, 5, 'Ʈ ڸ ', 47);
-INSERT INTO RATING VALUES ('132', 1025, 4, ' ', 34);
-INSERT INTO RATING VALUES ('133', 1025, 3, 'ʹ ѱ ߽', 91);
-INSERT INTO RATING VALUES ('134', 1025, 5, 'õ å', 68);
-INSERT INTO RATING VALUES ('135', 1025, 4, 'Һ  ', 45);
-INSERT INTO RATING VALUES ('136', 1025, 3, '  ', 22);
-INSERT INTO RATING VALUES ('137', 1025, 5, 'Ʈ Ű ', 99);
-INSERT INTO RATING VALUES ('138', 1025, 4, ' ', 76);
-INSERT INTO RATING VALUES ('139', 1025, 3, 'õ ', 53);
-INSERT INTO RATING VALUES ('140', 1025, 5, ' Ʈ', 40);
-INSERT INTO RATING VALUES ('141', 1025, 4, 'λƮ ǳ', 97);
-INSERT INTO RATING VALUES ('142', 1025, 3, ' ŷڼ', 74);
-INSERT INTO RATING VALUES ('143', 1025, 5, 'Ͻ õ', 61);
-INSERT INTO RATING VALUES ('144', 1025, 4, 'Ʈ м', 48);
-INSERT INTO RATING VALUES ('145', 1025, 3, ' ', 35);
-INSERT INTO RATING VALUES ('146', 1025, 5, '̷ غ', 92);
-INSERT INTO RATING VALUES ('147', 1025, 4, 'Һ ', 69);
-INSERT INTO RATING VALUES ('148', 1025, 1, ' Ʋ', 16);
-INSERT INTO RATING VALUES ('149', 1025, 1, ' ̵', 13);
-INSERT INTO RATING VALUES ('150', 1025, 2, ' ', 20);
-INSERT INTO RATING VALUES ('151', 1025, 2, 'ݺ ', 17);
-INSERT INTO RATING VALUES ('152', 1025, 3, '', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('123', 1025, 5, 'Ʈ  Ȯ', 85);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('124', 1025, 4, 'ÿ ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('125', 1025, 3, 'Ϻ ߻', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('126', 1025, 5, 'Һ Ʈ м ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('127', 1025, 4, ' ʵ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('128', 1025, 3, '  ', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('129', 1025, 5, '̷  ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('130', 1025, 4, 'Ͻ λƮ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('131', 1025, 5, 'Ʈ ڸ ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('132', 1025, 4, ' ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('133', 1025, 3, 'ʹ ѱ ߽', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('134', 1025, 5, 'õ å', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('135', 1025, 4, 'Һ  ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('136', 1025, 3, '  ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('137', 1025, 5, 'Ʈ Ű ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('138', 1025, 4, ' ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('139', 1025, 3, 'õ ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('140', 1025, 5, ' Ʈ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('141', 1025, 4, 'λƮ ǳ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('142', 1025, 3, ' ŷڼ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('143', 1025, 5, 'Ͻ õ', 61);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('144', 1025, 4, 'Ʈ м', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('145', 1025, 3, ' ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('146', 1025, 5, '̷ غ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('147', 1025, 4, 'Һ ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('148', 1025, 1, ' Ʋ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('149', 1025, 1, ' ̵', 13);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('150', 1025, 2, ' ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('151', 1025, 2, 'ݺ ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('152', 1025, 3, '', 24);
 
 -- Content 1026: Ʈ ڸ 2023
-INSERT INTO RATING VALUES ('153', 1026, 5, '  Ʈ  ', 86);
-INSERT INTO RATING VALUES ('154', 1026, 4, ' ', 63);
-INSERT INTO RATING VALUES ('155', 1026, 3, '̹  Ʈ', 40);
-INSERT INTO RATING VALUES ('156', 1026, 5, 'Һ ȭ м', 77);
-INSERT INTO RATING VALUES ('157', 1026, 4, ' ø', 54);
-INSERT INTO RATING VALUES ('158', 1026, 3, ' Ȯ ', 31);
-INSERT INTO RATING VALUES ('159', 1026, 5, 'Ʈ Ű ', 94);
-INSERT INTO RATING VALUES ('160', 1026, 4, 'Ͻ ', 71);
-INSERT INTO RATING VALUES ('161', 1026, 5, 'õ ʵ', 48);
-INSERT INTO RATING VALUES ('162', 1026, 4, ' ǳ', 35);
-INSERT INTO RATING VALUES ('163', 1026, 3, 'ѱ ', 92);
-INSERT INTO RATING VALUES ('164', 1026, 5, '̷ غ ', 69);
-INSERT INTO RATING VALUES ('165', 1026, 4, 'Һ Ʈ', 46);
-INSERT INTO RATING VALUES ('166', 1026, 3, '  ݺ', 23);
-INSERT INTO RATING VALUES ('167', 1026, 5, 'Ʈ ', 100);
-INSERT INTO RATING VALUES ('168', 1026, 4, ' ', 77);
-INSERT INTO RATING VALUES ('169', 1026, 3, 'õ ', 54);
-INSERT INTO RATING VALUES ('170', 1026, 5, ' Ʈ å', 41);
-INSERT INTO RATING VALUES ('171', 1026, 4, 'λƮ ', 98);
-INSERT INTO RATING VALUES ('172', 1026, 3, 'ŷڼ ǹ', 75);
-INSERT INTO RATING VALUES ('173', 1026, 5, 'Ͻ õ', 62);
-INSERT INTO RATING VALUES ('174', 1026, 4, 'Ʈ ', 49);
-INSERT INTO RATING VALUES ('175', 1026, 3, ' ', 36);
-INSERT INTO RATING VALUES ('176', 1026, 5, 'Һ ', 93);
-INSERT INTO RATING VALUES ('177', 1026, 4, '̷ ', 70);
-INSERT INTO RATING VALUES ('178', 1026, 1, 'Ʋ ', 17);
-INSERT INTO RATING VALUES ('179', 1026, 1, '', 14);
-INSERT INTO RATING VALUES ('180', 1026, 2, '̾', 21);
-INSERT INTO RATING VALUES ('181', 1026, 2, 'ġ  ħ', 18);
-INSERT INTO RATING VALUES ('182', 1026, 3, '', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('153', 1026, 5, '  Ʈ  ', 86);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('154', 1026, 4, ' ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('155', 1026, 3, '̹  Ʈ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('156', 1026, 5, 'Һ ȭ м', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('157', 1026, 4, ' ø', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('158', 1026, 3, ' Ȯ ', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('159', 1026, 5, 'Ʈ Ű ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('160', 1026, 4, 'Ͻ ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('161', 1026, 5, 'õ ʵ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('162', 1026, 4, ' ǳ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('163', 1026, 3, 'ѱ ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('164', 1026, 5, '̷ غ ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('165', 1026, 4, 'Һ Ʈ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('166', 1026, 3, '  ݺ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('167', 1026, 5, 'Ʈ ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('168', 1026, 4, ' ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('169', 1026, 3, 'õ ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('170', 1026, 5, ' Ʈ å', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('171', 1026, 4, 'λƮ ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('172', 1026, 3, 'ŷڼ ǹ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('173', 1026, 5, 'Ͻ õ', 62);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('174', 1026, 4, 'Ʈ ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('175', 1026, 3, ' ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('176', 1026, 5, 'Һ ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('177', 1026, 4, '̷ ', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('178', 1026, 1, 'Ʋ ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('179', 1026, 1, '', 14);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('180', 1026, 2, '̾', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('181', 1026, 2, 'ġ  ħ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('182', 1026, 3, '', 25);
 
 -- Content 1027:  Ӽ
-INSERT INTO RATING VALUES ('183', 1027, 5, '  ', 87);
-INSERT INTO RATING VALUES ('184', 1027, 4, 'ũ  ', 64);
-INSERT INTO RATING VALUES ('185', 1027, 3, '⺻ ', 41);
-INSERT INTO RATING VALUES ('186', 1027, 5, ' ö', 78);
-INSERT INTO RATING VALUES ('187', 1027, 4, 'õ ߽', 55);
-INSERT INTO RATING VALUES ('188', 1027, 3, '߻ κ', 32);
-INSERT INTO RATING VALUES ('189', 1027, 5, '  ̵', 95);
-INSERT INTO RATING VALUES ('190', 1027, 4, 'λƮ ǳ', 72);
-INSERT INTO RATING VALUES ('191', 1027, 5, 'õ ũ', 49);
-INSERT INTO RATING VALUES ('192', 1027, 4, ' ε', 36);
-INSERT INTO RATING VALUES ('193', 1027, 3, ' ', 93);
-INSERT INTO RATING VALUES ('194', 1027, 5, ' ε', 70);
-INSERT INTO RATING VALUES ('195', 1027, 4, ' Ӽ', 47);
-INSERT INTO RATING VALUES ('196', 1027, 3, 'ݺ', 24);
-INSERT INTO RATING VALUES ('197', 1027, 5, 'ũ ʵ', 101);
-INSERT INTO RATING VALUES ('198', 1027, 4, ' ', 78);
-INSERT INTO RATING VALUES ('199', 1027, 3, 'õ ', 55);
-INSERT INTO RATING VALUES ('200', 1027, 5, ' ö', 42);
-INSERT INTO RATING VALUES ('1', 1027, 4, 'λƮ ', 99);
-INSERT INTO RATING VALUES ('2', 1027, 3, ' ', 76);
-INSERT INTO RATING VALUES ('3', 1027, 5, ' ', 63);
-INSERT INTO RATING VALUES ('4', 1027, 4, ' Ǵ ', 50);
-INSERT INTO RATING VALUES ('5', 1027, 3, ' ', 37);
-INSERT INTO RATING VALUES ('6', 1027, 5, 'ε ȭ', 94);
-INSERT INTO RATING VALUES ('7', 1027, 4, 'ũ õ', 71);
-INSERT INTO RATING VALUES ('8', 1027, 1, '', 18);
-INSERT INTO RATING VALUES ('9', 1027, 1, 'ǹ', 15);
-INSERT INTO RATING VALUES ('10', 1027, 2, '̾', 22);
-INSERT INTO RATING VALUES ('11', 1027, 2, 'Ʋ ', 19);
-INSERT INTO RATING VALUES ('12', 1027, 3, '', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('183', 1027, 5, '  ', 87);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('184', 1027, 4, 'ũ  ', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('185', 1027, 3, '⺻ ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('186', 1027, 5, ' ö', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('187', 1027, 4, 'õ ߽', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('188', 1027, 3, '߻ κ', 32);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('189', 1027, 5, '  ̵', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('190', 1027, 4, 'λƮ ǳ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('191', 1027, 5, 'õ ũ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('192', 1027, 4, ' ε', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('193', 1027, 3, ' ', 93);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('194', 1027, 5, ' ε', 70);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('195', 1027, 4, ' Ӽ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('196', 1027, 3, 'ݺ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('197', 1027, 5, 'ũ ʵ', 101);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('198', 1027, 4, ' ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('199', 1027, 3, 'õ ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('200', 1027, 5, ' ö', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1027, 4, 'λƮ ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1027, 3, ' ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1027, 5, ' ', 63);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1027, 4, ' Ǵ ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1027, 3, ' ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1027, 5, 'ε ȭ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1027, 4, 'ũ õ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1027, 1, '', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1027, 1, 'ǹ', 15);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1027, 2, '̾', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1027, 2, 'Ʋ ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1027, 3, '', 26);
 
 -- Content 1028:  ι
-INSERT INTO RATING VALUES ('13', 1028, 5, ' ö ', 88);
-INSERT INTO RATING VALUES ('14', 1028, 4, 'ι ', 65);
-INSERT INTO RATING VALUES ('15', 1028, 3, '߻', 42);
-INSERT INTO RATING VALUES ('16', 1028, 5, ' ε', 79);
-INSERT INTO RATING VALUES ('17', 1028, 4, 'ι ', 56);
-INSERT INTO RATING VALUES ('18', 1028, 3, 'ġ ̴', 33);
-INSERT INTO RATING VALUES ('19', 1028, 5, ' ', 96);
-INSERT INTO RATING VALUES ('20', 1028, 4, 'λƮ ', 73);
-INSERT INTO RATING VALUES ('21', 1028, 5, 'õ ', 50);
-INSERT INTO RATING VALUES ('22', 1028, 4, 'ö ũ', 37);
-INSERT INTO RATING VALUES ('23', 1028, 3, 'õ ', 94);
-INSERT INTO RATING VALUES ('24', 1028, 5, 'ι ', 71);
-INSERT INTO RATING VALUES ('25', 1028, 4, ' Ǵ ', 48);
-INSERT INTO RATING VALUES ('26', 1028, 3, 'ݺ ', 25);
-INSERT INTO RATING VALUES ('27', 1028, 5, ' ִ å', 102);
-INSERT INTO RATING VALUES ('28', 1028, 4, 'ι ', 79);
-INSERT INTO RATING VALUES ('29', 1028, 3, ' κ', 56);
-INSERT INTO RATING VALUES ('30', 1028, 5, ' ι', 43);
-INSERT INTO RATING VALUES ('31', 1028, 4, 'λƮ ', 100);
-INSERT INTO RATING VALUES ('32', 1028, 3, '', 77);
-INSERT INTO RATING VALUES ('33', 1028, 5, 'ũ ö', 64);
-INSERT INTO RATING VALUES ('34', 1028, 4, ' ö', 51);
-INSERT INTO RATING VALUES ('35', 1028, 3, '', 38);
-INSERT INTO RATING VALUES ('36', 1028, 5, 'ι õ', 95);
-INSERT INTO RATING VALUES ('37', 1028, 4, ' ', 72);
-INSERT INTO RATING VALUES ('38', 1028, 1, 'ǹ', 19);
-INSERT INTO RATING VALUES ('39', 1028, 1, 'ð ', 16);
-INSERT INTO RATING VALUES ('40', 1028, 2, '', 23);
-INSERT INTO RATING VALUES ('41', 1028, 2, ' ', 20);
-INSERT INTO RATING VALUES ('42', 1028, 3, '', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1028, 5, ' ö ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1028, 4, 'ι ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1028, 3, '߻', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1028, 5, ' ε', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1028, 4, 'ι ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1028, 3, 'ġ ̴', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1028, 5, ' ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1028, 4, 'λƮ ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1028, 5, 'õ ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1028, 4, 'ö ũ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1028, 3, 'õ ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1028, 5, 'ι ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1028, 4, ' Ǵ ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1028, 3, 'ݺ ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1028, 5, ' ִ å', 102);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1028, 4, 'ι ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1028, 3, ' κ', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1028, 5, ' ι', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1028, 4, 'λƮ ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1028, 3, '', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1028, 5, 'ũ ö', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1028, 4, ' ö', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1028, 3, '', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1028, 5, 'ι õ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1028, 4, ' ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1028, 1, 'ǹ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1028, 1, 'ð ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1028, 2, '', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1028, 2, ' ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1028, 3, '', 27);
 
 -- Content 1029: ö   Ⱑ Ǵ°
-INSERT INTO RATING VALUES ('43', 1029, 5, 'ö ǿ뼺', 89);
-INSERT INTO RATING VALUES ('44', 1029, 4, ' ', 66);
-INSERT INTO RATING VALUES ('45', 1029, 3, '߻ ', 43);
-INSERT INTO RATING VALUES ('46', 1029, 5, '50 ', 80);
-INSERT INTO RATING VALUES ('47', 1029, 4, 'Ͻ ö', 57);
-INSERT INTO RATING VALUES ('48', 1029, 3, ' ', 34);
-INSERT INTO RATING VALUES ('49', 1029, 5, 'ö ̵', 97);
-INSERT INTO RATING VALUES ('50', 1029, 4, 'λƮ ǳ', 74);
-INSERT INTO RATING VALUES ('51', 1029, 5, 'õ öм', 51);
-INSERT INTO RATING VALUES ('52', 1029, 4, ' ', 38);
-INSERT INTO RATING VALUES ('53', 1029, 3, 'õ ', 95);
-INSERT INTO RATING VALUES ('54', 1029, 5, 'ö ', 72);
-INSERT INTO RATING VALUES ('55', 1029, 4, ' ', 49);
-INSERT INTO RATING VALUES ('56', 1029, 3, 'ݺ ', 26);
-INSERT INTO RATING VALUES ('57', 1029, 5, 'Ͻ õ', 103);
-INSERT INTO RATING VALUES ('58', 1029, 4, 'ö Ȱ', 80);
-INSERT INTO RATING VALUES ('59', 1029, 3, ' ̴', 57);
-INSERT INTO RATING VALUES ('60', 1029, 5, ' ö', 44);
-INSERT INTO RATING VALUES ('61', 1029, 4, 'λƮ ', 101);
-INSERT INTO RATING VALUES ('62', 1029, 3, '', 78);
-INSERT INTO RATING VALUES ('63', 1029, 5, ' Ǵ ö', 65);
-INSERT INTO RATING VALUES ('64', 1029, 4, ' ̵', 52);
-INSERT INTO RATING VALUES ('65', 1029, 3, ' κ', 39);
-INSERT INTO RATING VALUES ('66', 1029, 5, 'ö õ', 96);
-INSERT INTO RATING VALUES ('67', 1029, 4, ' ', 73);
-INSERT INTO RATING VALUES ('68', 1029, 1, 'ǹ', 20);
-INSERT INTO RATING VALUES ('69', 1029, 1, 'ð ', 17);
-INSERT INTO RATING VALUES ('70', 1029, 2, '̾', 24);
-INSERT INTO RATING VALUES ('71', 1029, 2, 'ġ  ħ', 21);
-INSERT INTO RATING VALUES ('72', 1029, 3, '', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1029, 5, 'ö ǿ뼺', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1029, 4, ' ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1029, 3, '߻ ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1029, 5, '50 ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1029, 4, 'Ͻ ö', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1029, 3, ' ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1029, 5, 'ö ̵', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1029, 4, 'λƮ ǳ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1029, 5, 'õ öм', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1029, 4, ' ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1029, 3, 'õ ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1029, 5, 'ö ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1029, 4, ' ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1029, 3, 'ݺ ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1029, 5, 'Ͻ õ', 103);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1029, 4, 'ö Ȱ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1029, 3, ' ̴', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1029, 5, ' ö', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1029, 4, 'λƮ ', 101);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1029, 3, '', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1029, 5, ' Ǵ ö', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1029, 4, ' ̵', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1029, 3, ' κ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1029, 5, 'ö õ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1029, 4, ' ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1029, 1, 'ǹ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1029, 1, 'ð ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1029, 2, '̾', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1029, 2, 'ġ  ħ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1029, 3, '', 28);
 
 -- Content 1030: ̿ 
-INSERT INTO RATING VALUES ('73', 1030, 5, 'Ƶ鷯 ɸ', 90);
-INSERT INTO RATING VALUES ('74', 1030, 4, 'ο ', 67);
-INSERT INTO RATING VALUES ('75', 1030, 3, 'ȭü ', 44);
-INSERT INTO RATING VALUES ('76', 1030, 5, '̿ ', 81);
-INSERT INTO RATING VALUES ('77', 1030, 4, 'λ ', 58);
-INSERT INTO RATING VALUES ('78', 1030, 3, '߻', 35);
-INSERT INTO RATING VALUES ('79', 1030, 5, 'ڱ ʵ', 98);
-INSERT INTO RATING VALUES ('80', 1030, 4, 'Ƶ鷯 ö', 75);
-INSERT INTO RATING VALUES ('81', 1030, 5, 'õ å', 52);
-INSERT INTO RATING VALUES ('82', 1030, 4, ' ִ', 39);
-INSERT INTO RATING VALUES ('83', 1030, 3, 'ݺ', 96);
-INSERT INTO RATING VALUES ('84', 1030, 5, 'λ ȭ', 73);
-INSERT INTO RATING VALUES ('85', 1030, 4, '̿ޱ', 50);
-INSERT INTO RATING VALUES ('86', 1030, 3, ' ̴', 27);
-INSERT INTO RATING VALUES ('87', 1030, 5, 'ɸ õ', 104);
-INSERT INTO RATING VALUES ('88', 1030, 4, ' ö', 81);
-INSERT INTO RATING VALUES ('89', 1030, 3, 'ȭ ', 58);
-INSERT INTO RATING VALUES ('90', 1030, 5, ' ', 45);
-INSERT INTO RATING VALUES ('91', 1030, 4, 'λƮ ', 102);
-INSERT INTO RATING VALUES ('92', 1030, 3, '', 79);
-INSERT INTO RATING VALUES ('93', 1030, 5, 'Ƶ鷯 ', 66);
-INSERT INTO RATING VALUES ('94', 1030, 4, ' ', 53);
-INSERT INTO RATING VALUES ('95', 1030, 3, '', 40);
-INSERT INTO RATING VALUES ('96', 1030, 5, 'ڱ', 97);
-INSERT INTO RATING VALUES ('97', 1030, 4, '̿', 74);
-INSERT INTO RATING VALUES ('98', 1030, 1, 'ǹ', 21);
-INSERT INTO RATING VALUES ('99', 1030, 1, 'ð ', 18);
-INSERT INTO RATING VALUES ('100', 1030, 2, '̾', 25);
-INSERT INTO RATING VALUES ('101', 1030, 2, ' ', 22);
-INSERT INTO RATING VALUES ('102', 1030, 3, '', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1030, 5, 'Ƶ鷯 ɸ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1030, 4, 'ο ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1030, 3, 'ȭü ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1030, 5, '̿ ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1030, 4, 'λ ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1030, 3, '߻', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1030, 5, 'ڱ ʵ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1030, 4, 'Ƶ鷯 ö', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('81', 1030, 5, 'õ å', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('82', 1030, 4, ' ִ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('83', 1030, 3, 'ݺ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('84', 1030, 5, 'λ ȭ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('85', 1030, 4, '̿ޱ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('86', 1030, 3, ' ̴', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('87', 1030, 5, 'ɸ õ', 104);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('88', 1030, 4, ' ö', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('89', 1030, 3, 'ȭ ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('90', 1030, 5, ' ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('91', 1030, 4, 'λƮ ', 102);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('92', 1030, 3, '', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 1030, 5, 'Ƶ鷯 ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 1030, 4, ' ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 1030, 3, '', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('96', 1030, 5, 'ڱ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('97', 1030, 4, '̿', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('98', 1030, 1, 'ǹ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('99', 1030, 1, 'ð ', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('100', 1030, 2, '̾', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('101', 1030, 2, ' ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('102', 1030, 3, '', 29);
 
 -- Content 1031:  īױ ΰ
-INSERT INTO RATING VALUES ('103', 1031, 5, 'ΰ ̺', 91);
-INSERT INTO RATING VALUES ('104', 1031, 4, 'Ŭ ڱ', 68);
-INSERT INTO RATING VALUES ('105', 1031, 3, ' ', 45);
-INSERT INTO RATING VALUES ('106', 1031, 5, 'Ŀ´̼ ', 82);
-INSERT INTO RATING VALUES ('107', 1031, 4, 'ΰ', 59);
-INSERT INTO RATING VALUES ('108', 1031, 3, '⺻ ', 36);
-INSERT INTO RATING VALUES ('109', 1031, 5, 'õ ', 99);
-INSERT INTO RATING VALUES ('110', 1031, 4, 'īױ Ģ', 76);
-INSERT INTO RATING VALUES ('111', 1031, 5, 'ΰ ', 53);
-INSERT INTO RATING VALUES ('112', 1031, 4, 'õ ̵', 40);
-INSERT INTO RATING VALUES ('113', 1031, 3, 'ݺ', 97);
-INSERT INTO RATING VALUES ('114', 1031, 5, 'Ŀ´̼', 74);
-INSERT INTO RATING VALUES ('115', 1031, 4, 'ΰ ', 51);
-INSERT INTO RATING VALUES ('116', 1031, 3, ' ', 28);
-INSERT INTO RATING VALUES ('117', 1031, 5, 'ڱ ʵ', 105);
-INSERT INTO RATING VALUES ('118', 1031, 4, 'īױ ', 82);
-INSERT INTO RATING VALUES ('119', 1031, 3, ' ', 59);
-INSERT INTO RATING VALUES ('120', 1031, 5, ' ', 46);
-INSERT INTO RATING VALUES ('121', 1031, 4, 'λƮ ', 103);
-INSERT INTO RATING VALUES ('122', 1031, 3, '', 80);
-INSERT INTO RATING VALUES ('123', 1031, 5, 'ΰ õ', 67);
-INSERT INTO RATING VALUES ('124', 1031, 4, 'Ģ ', 54);
-INSERT INTO RATING VALUES ('125', 1031, 3, '', 41);
-INSERT INTO RATING VALUES ('126', 1031, 5, 'Ŭ', 98);
-INSERT INTO RATING VALUES ('127', 1031, 4, 'Ŀ´̼', 75);
-INSERT INTO RATING VALUES ('128', 1031, 1, '', 22);
-INSERT INTO RATING VALUES ('129', 1031, 1, 'ǹ', 19);
-INSERT INTO RATING VALUES ('130', 1031, 2, '̾', 26);
-INSERT INTO RATING VALUES ('131', 1031, 2, ' ', 23);
-INSERT INTO RATING VALUES ('132', 1031, 3, '', 30);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('103', 1031, 5, 'ΰ ̺', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('104', 1031, 4, 'Ŭ ڱ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('105', 1031, 3, ' ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('106', 1031, 5, 'Ŀ´̼ ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('107', 1031, 4, 'ΰ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('108', 1031, 3, '⺻ ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('109', 1031, 5, 'õ ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('110', 1031, 4, 'īױ Ģ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('111', 1031, 5, 'ΰ ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('112', 1031, 4, 'õ ̵', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('113', 1031, 3, 'ݺ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('114', 1031, 5, 'Ŀ´̼', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('115', 1031, 4, 'ΰ ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('116', 1031, 3, ' ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('117', 1031, 5, 'ڱ ʵ', 105);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('118', 1031, 4, 'īױ ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('119', 1031, 3, ' ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('120', 1031, 5, ' ', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('121', 1031, 4, 'λƮ ', 103);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('122', 1031, 3, '', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('123', 1031, 5, 'ΰ õ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('124', 1031, 4, 'Ģ ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('125', 1031, 3, '', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('126', 1031, 5, 'Ŭ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('127', 1031, 4, 'Ŀ´̼', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('128', 1031, 1, '', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('129', 1031, 1, 'ǹ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('130', 1031, 2, '̾', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('131', 1031, 2, ' ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('132', 1031, 3, '', 30);
 
 -- Content 1032: 
-INSERT INTO RATING VALUES ('133', 1032, 5, 'ൿ Թ', 92);
-INSERT INTO RATING VALUES ('134', 1032, 4, ' ȿ', 69);
-INSERT INTO RATING VALUES ('135', 1032, 3, '̷ ߽', 46);
-INSERT INTO RATING VALUES ('136', 1032, 5, ' ', 83);
-INSERT INTO RATING VALUES ('137', 1032, 4, ' ', 60);
-INSERT INTO RATING VALUES ('138', 1032, 3, ' ', 37);
-INSERT INTO RATING VALUES ('139', 1032, 5, 'õ ', 100);
-INSERT INTO RATING VALUES ('140', 1032, 4, ' ', 77);
-INSERT INTO RATING VALUES ('141', 1032, 5, 'ൿ ȭ', 54);
-INSERT INTO RATING VALUES ('142', 1032, 4, ' ', 41);
-INSERT INTO RATING VALUES ('143', 1032, 3, ' ', 98);
-INSERT INTO RATING VALUES ('144', 1032, 5, ' Űó', 75);
-INSERT INTO RATING VALUES ('145', 1032, 4, ' ', 52);
-INSERT INTO RATING VALUES ('146', 1032, 3, 'ݺ', 29);
-INSERT INTO RATING VALUES ('147', 1032, 5, ' õ', 106);
-INSERT INTO RATING VALUES ('148', 1032, 4, 'ൿ', 83);
-INSERT INTO RATING VALUES ('149', 1032, 3, 'õ ', 60);
-INSERT INTO RATING VALUES ('150', 1032, 5, ' ', 47);
-INSERT INTO RATING VALUES ('151', 1032, 4, 'λƮ ', 104);
-INSERT INTO RATING VALUES ('152', 1032, 3, '', 81);
-INSERT INTO RATING VALUES ('153', 1032, 5, ' ', 68);
-INSERT INTO RATING VALUES ('154', 1032, 4, ' ', 55);
-INSERT INTO RATING VALUES ('155', 1032, 3, ' κ', 42);
-INSERT INTO RATING VALUES ('156', 1032, 5, 'ൿ ȭ', 99);
-INSERT INTO RATING VALUES ('157', 1032, 4, ' õ', 76);
-INSERT INTO RATING VALUES ('158', 1032, 1, 'ǹ', 23);
-INSERT INTO RATING VALUES ('159', 1032, 1, 'ð ', 20);
-INSERT INTO RATING VALUES ('160', 1032, 2, '̾', 27);
-INSERT INTO RATING VALUES ('161', 1032, 2, ' ', 24);
-INSERT INTO RATING VALUES ('162', 1032, 3, '', 31);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('133', 1032, 5, 'ൿ Թ', 92);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('134', 1032, 4, ' ȿ', 69);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('135', 1032, 3, '̷ ߽', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('136', 1032, 5, ' ', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('137', 1032, 4, ' ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('138', 1032, 3, ' ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('139', 1032, 5, 'õ ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('140', 1032, 4, ' ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('141', 1032, 5, 'ൿ ȭ', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('142', 1032, 4, ' ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('143', 1032, 3, ' ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('144', 1032, 5, ' Űó', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('145', 1032, 4, ' ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('146', 1032, 3, 'ݺ', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('147', 1032, 5, ' õ', 106);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('148', 1032, 4, 'ൿ', 83);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('149', 1032, 3, 'õ ', 60);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('150', 1032, 5, ' ', 47);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('151', 1032, 4, 'λƮ ', 104);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('152', 1032, 3, '', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('153', 1032, 5, ' ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('154', 1032, 4, ' ', 55);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('155', 1032, 3, ' κ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('156', 1032, 5, 'ൿ ȭ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('157', 1032, 4, ' õ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('158', 1032, 1, 'ǹ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('159', 1032, 1, 'ð ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('160', 1032, 2, '̾', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('161', 1032, 2, ' ', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('162', 1032, 3, '', 31);
 
 -- Content 1033: ǿ
-INSERT INTO RATING VALUES ('163', 1033, 5, 'η  ְ ', 88);
-INSERT INTO RATING VALUES ('164', 1033, 4, ' þ ', 65);
-INSERT INTO RATING VALUES ('165', 1033, 3, 'Ϻ ', 42);
-INSERT INTO RATING VALUES ('166', 1033, 5, 'ǿ ȭ ', 79);
-INSERT INTO RATING VALUES ('167', 1033, 4, 'ȭ  м', 56);
-INSERT INTO RATING VALUES ('168', 1033, 3, '  ', 33);
-INSERT INTO RATING VALUES ('169', 1033, 5, '̷  ڱ', 96);
-INSERT INTO RATING VALUES ('170', 1033, 4, 'η  ', 73);
-INSERT INTO RATING VALUES ('171', 1033, 5, 'õ ', 50);
-INSERT INTO RATING VALUES ('172', 1033, 4, '϶ Ÿ ŷ', 37);
-INSERT INTO RATING VALUES ('173', 1033, 3, ' ', 94);
-INSERT INTO RATING VALUES ('174', 1033, 5, 'η ', 71);
-INSERT INTO RATING VALUES ('175', 1033, 4, '  ', 48);
-INSERT INTO RATING VALUES ('176', 1033, 3, 'ݺ ', 25);
-INSERT INTO RATING VALUES ('177', 1033, 5, 'ں м', 102);
-INSERT INTO RATING VALUES ('178', 1033, 4, ' ', 79);
-INSERT INTO RATING VALUES ('179', 1033, 5, 'η ̷', 56);
-INSERT INTO RATING VALUES ('180', 1033, 4, ' ', 43);
-INSERT INTO RATING VALUES ('181', 1033, 5, ' ڱ', 100);
-INSERT INTO RATING VALUES ('182', 1033, 4, 'η ', 77);
-INSERT INTO RATING VALUES ('183', 1033, 5, 'ְ 缭', 64);
-INSERT INTO RATING VALUES ('184', 1033, 4, '϶ ', 51);
-INSERT INTO RATING VALUES ('185', 1033, 5, '絶 ġ', 38);
-INSERT INTO RATING VALUES ('186', 1033, 4, 'η ̾߱', 95);
-INSERT INTO RATING VALUES ('187', 1033, 5, '̷ο ', 72);
-INSERT INTO RATING VALUES ('188', 1033, 1, 'ϰ ', 19);
-INSERT INTO RATING VALUES ('189', 1033, 1, '߸ ', 16);
-INSERT INTO RATING VALUES ('190', 1033, 2, ' ', 23);
-INSERT INTO RATING VALUES ('191', 1033, 2, ' ', 20);
-INSERT INTO RATING VALUES ('192', 1033, 3, ' ', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('163', 1033, 5, 'η  ְ ', 88);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('164', 1033, 4, ' þ ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('165', 1033, 3, 'Ϻ ', 42);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('166', 1033, 5, 'ǿ ȭ ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('167', 1033, 4, 'ȭ  м', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('168', 1033, 3, '  ', 33);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('169', 1033, 5, '̷  ڱ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('170', 1033, 4, 'η  ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('171', 1033, 5, 'õ ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('172', 1033, 4, '϶ Ÿ ŷ', 37);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('173', 1033, 3, ' ', 94);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('174', 1033, 5, 'η ', 71);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('175', 1033, 4, '  ', 48);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('176', 1033, 3, 'ݺ ', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('177', 1033, 5, 'ں м', 102);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('178', 1033, 4, ' ', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('179', 1033, 5, 'η ̷', 56);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('180', 1033, 4, ' ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('181', 1033, 5, ' ڱ', 100);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('182', 1033, 4, 'η ', 77);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('183', 1033, 5, 'ְ 缭', 64);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('184', 1033, 4, '϶ ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('185', 1033, 5, '絶 ġ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('186', 1033, 4, 'η ̾߱', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('187', 1033, 5, '̷ο ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('188', 1033, 1, 'ϰ ', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('189', 1033, 1, '߸ ', 16);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('190', 1033, 2, ' ', 23);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('191', 1033, 2, ' ', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('192', 1033, 3, ' ', 27);
 
 -- Content 1034: Ƕ ΰ
-INSERT INTO RATING VALUES ('193', 1034, 5, 'ǿ   ִ Ž', 89);
-INSERT INTO RATING VALUES ('194', 1034, 4, 'ö  ', 66);
-INSERT INTO RATING VALUES ('195', 1034, 3, 'ȭü ', 43);
-INSERT INTO RATING VALUES ('196', 1034, 5, '굨   ', 80);
-INSERT INTO RATING VALUES ('197', 1034, 4, '  ', 57);
-INSERT INTO RATING VALUES ('198', 1034, 3, '߻ ', 34);
-INSERT INTO RATING VALUES ('199', 1034, 5, ' ̷ Ұ', 97);
-INSERT INTO RATING VALUES ('200', 1034, 4, ' ', 74);
-INSERT INTO RATING VALUES ('1', 1034, 5, ' ', 51);
-INSERT INTO RATING VALUES ('2', 1034, 4, ' ', 38);
-INSERT INTO RATING VALUES ('3', 1034, 3, 'ݺ ', 95);
-INSERT INTO RATING VALUES ('4', 1034, 5, 'ö Թ', 72);
-INSERT INTO RATING VALUES ('5', 1034, 4, ' ', 49);
-INSERT INTO RATING VALUES ('6', 1034, 3, '  ', 26);
-INSERT INTO RATING VALUES ('7', 1034, 5, ' ڱ', 103);
-INSERT INTO RATING VALUES ('8', 1034, 4, ' ö', 80);
-INSERT INTO RATING VALUES ('9', 1034, 5, '굨 ', 57);
-INSERT INTO RATING VALUES ('10', 1034, 4, ' ', 44);
-INSERT INTO RATING VALUES ('11', 1034, 5, 'ʵ', 101);
-INSERT INTO RATING VALUES ('12', 1034, 4, 'ö õ', 78);
-INSERT INTO RATING VALUES ('13', 1034, 5, ' ', 65);
-INSERT INTO RATING VALUES ('14', 1034, 4, '', 52);
-INSERT INTO RATING VALUES ('15', 1034, 5, '', 39);
-INSERT INTO RATING VALUES ('16', 1034, 4, '', 96);
-INSERT INTO RATING VALUES ('17', 1034, 5, '絶 ġ', 73);
-INSERT INTO RATING VALUES ('18', 1034, 1, '', 20);
-INSERT INTO RATING VALUES ('19', 1034, 1, 'ð ', 17);
-INSERT INTO RATING VALUES ('20', 1034, 2, '̾', 24);
-INSERT INTO RATING VALUES ('21', 1034, 2, ' ', 21);
-INSERT INTO RATING VALUES ('22', 1034, 3, '', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('193', 1034, 5, 'ǿ   ִ Ž', 89);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('194', 1034, 4, 'ö  ', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('195', 1034, 3, 'ȭü ', 43);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('196', 1034, 5, '굨   ', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('197', 1034, 4, '  ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('198', 1034, 3, '߻ ', 34);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('199', 1034, 5, ' ̷ Ұ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('200', 1034, 4, ' ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('1', 1034, 5, ' ', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('2', 1034, 4, ' ', 38);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('3', 1034, 3, 'ݺ ', 95);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('4', 1034, 5, 'ö Թ', 72);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('5', 1034, 4, ' ', 49);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('6', 1034, 3, '  ', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('7', 1034, 5, ' ڱ', 103);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('8', 1034, 4, ' ö', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('9', 1034, 5, '굨 ', 57);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('10', 1034, 4, ' ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('11', 1034, 5, 'ʵ', 101);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('12', 1034, 4, 'ö õ', 78);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('13', 1034, 5, ' ', 65);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('14', 1034, 4, '', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('15', 1034, 5, '', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('16', 1034, 4, '', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('17', 1034, 5, '絶 ġ', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('18', 1034, 1, '', 20);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('19', 1034, 1, 'ð ', 17);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('20', 1034, 2, '̾', 24);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('21', 1034, 2, ' ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('22', 1034, 3, '', 28);
 
 -- Content 1035:  ΰ
-INSERT INTO RATING VALUES ('23', 1035, 5, ' ö ', 90);
-INSERT INTO RATING VALUES ('24', 1035, 4, ' Թ', 67);
-INSERT INTO RATING VALUES ('25', 1035, 3, ' ', 44);
-INSERT INTO RATING VALUES ('26', 1035, 5, 'ī ', 81);
-INSERT INTO RATING VALUES ('27', 1035, 4, ' ؼ', 58);
-INSERT INTO RATING VALUES ('28', 1035, 3, ' ', 35);
-INSERT INTO RATING VALUES ('29', 1035, 5, ' ڱ', 98);
-INSERT INTO RATING VALUES ('30', 1035, 4, ' ', 75);
-INSERT INTO RATING VALUES ('31', 1035, 5, 'ʵ', 52);
-INSERT INTO RATING VALUES ('32', 1035, 4, ' ', 39);
-INSERT INTO RATING VALUES ('33', 1035, 3, ' ', 96);
-INSERT INTO RATING VALUES ('34', 1035, 5, ' ö', 73);
-INSERT INTO RATING VALUES ('35', 1035, 4, 'ī ', 50);
-INSERT INTO RATING VALUES ('36', 1035, 3, 'ݺ', 27);
-INSERT INTO RATING VALUES ('37', 1035, 5, ' õ', 104);
-INSERT INTO RATING VALUES ('38', 1035, 4, 'ؼ ', 81);
-INSERT INTO RATING VALUES ('39', 1035, 3, ' ̴', 58);
-INSERT INTO RATING VALUES ('40', 1035, 5, ' ', 45);
-INSERT INTO RATING VALUES ('41', 1035, 4, 'Ŭ', 102);
-INSERT INTO RATING VALUES ('42', 1035, 3, '', 79);
-INSERT INTO RATING VALUES ('43', 1035, 5, ' ̵', 66);
-INSERT INTO RATING VALUES ('44', 1035, 4, ' ', 53);
-INSERT INTO RATING VALUES ('45', 1035, 3, '', 40);
-INSERT INTO RATING VALUES ('46', 1035, 5, '', 97);
-INSERT INTO RATING VALUES ('47', 1035, 4, 'ī å', 74);
-INSERT INTO RATING VALUES ('48', 1035, 1, 'ǹ', 21);
-INSERT INTO RATING VALUES ('49', 1035, 1, '', 18);
-INSERT INTO RATING VALUES ('50', 1035, 2, '̾', 25);
-INSERT INTO RATING VALUES ('51', 1035, 2, ' ', 22);
-INSERT INTO RATING VALUES ('52', 1035, 3, '', 29);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('23', 1035, 5, ' ö ', 90);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('24', 1035, 4, ' Թ', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('25', 1035, 3, ' ', 44);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('26', 1035, 5, 'ī ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('27', 1035, 4, ' ؼ', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('28', 1035, 3, ' ', 35);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('29', 1035, 5, ' ڱ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('30', 1035, 4, ' ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('31', 1035, 5, 'ʵ', 52);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('32', 1035, 4, ' ', 39);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('33', 1035, 3, ' ', 96);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('34', 1035, 5, ' ö', 73);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('35', 1035, 4, 'ī ', 50);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('36', 1035, 3, 'ݺ', 27);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('37', 1035, 5, ' õ', 104);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('38', 1035, 4, 'ؼ ', 81);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('39', 1035, 3, ' ̴', 58);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('40', 1035, 5, ' ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('41', 1035, 4, 'Ŭ', 102);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('42', 1035, 3, '', 79);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('43', 1035, 5, ' ̵', 66);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('44', 1035, 4, ' ', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('45', 1035, 3, '', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('46', 1035, 5, '', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('47', 1035, 4, 'ī å', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('48', 1035, 1, 'ǹ', 21);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('49', 1035, 1, '', 18);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('50', 1035, 2, '̾', 25);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('51', 1035, 2, ' ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('52', 1035, 3, '', 29);
 
 -- Content 1036: ̱ 
-INSERT INTO RATING VALUES ('53', 1036, 5, ' ߽ ȭ', 91);
-INSERT INTO RATING VALUES ('54', 1036, 4, 'Ų ', 68);
-INSERT INTO RATING VALUES ('55', 1036, 3, '  ', 45);
-INSERT INTO RATING VALUES ('56', 1036, 5, '̱  ', 82);
-INSERT INTO RATING VALUES ('57', 1036, 4, 'ȭ  ', 59);
-INSERT INTO RATING VALUES ('58', 1036, 3, '߻ ', 36);
-INSERT INTO RATING VALUES ('59', 1036, 5, ' ', 99);
-INSERT INTO RATING VALUES ('60', 1036, 4, ' ൿ', 76);
-INSERT INTO RATING VALUES ('61', 1036, 5, 'õ м', 53);
-INSERT INTO RATING VALUES ('62', 1036, 4, 'ȭ  ', 40);
-INSERT INTO RATING VALUES ('63', 1036, 3, 'Ⱓ ', 97);
-INSERT INTO RATING VALUES ('64', 1036, 5, 'Ų ', 74);
-INSERT INTO RATING VALUES ('65', 1036, 4, ' ߽', 51);
-INSERT INTO RATING VALUES ('66', 1036, 3, 'ݺ ', 28);
-INSERT INTO RATING VALUES ('67', 1036, 5, ' ', 105);
-INSERT INTO RATING VALUES ('68', 1036, 4, 'ȭ  õ', 82);
-INSERT INTO RATING VALUES ('69', 1036, 3, ' ̴', 59);
-INSERT INTO RATING VALUES ('70', 1036, 5, ' ̱⼺', 46);
-INSERT INTO RATING VALUES ('71', 1036, 4, ' λƮ', 103);
-INSERT INTO RATING VALUES ('72', 1036, 3, '', 80);
-INSERT INTO RATING VALUES ('73', 1036, 5, 'Ų å', 67);
-INSERT INTO RATING VALUES ('74', 1036, 4, 'ȭ ̵', 54);
-INSERT INTO RATING VALUES ('75', 1036, 3, ' κ', 41);
-INSERT INTO RATING VALUES ('76', 1036, 5, ' õ', 98);
-INSERT INTO RATING VALUES ('77', 1036, 4, ' ', 75);
-INSERT INTO RATING VALUES ('78', 1036, 1, ' ', 22);
-INSERT INTO RATING VALUES ('79', 1036, 1, ' ̷', 19);
-INSERT INTO RATING VALUES ('80', 1036, 2, '̾', 26);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('53', 1036, 5, ' ߽ ȭ', 91);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('54', 1036, 4, 'Ų ', 68);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('55', 1036, 3, '  ', 45);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('56', 1036, 5, '̱  ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('57', 1036, 4, 'ȭ  ', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('58', 1036, 3, '߻ ', 36);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('59', 1036, 5, ' ', 99);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('60', 1036, 4, ' ൿ', 76);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('61', 1036, 5, 'õ м', 53);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('62', 1036, 4, 'ȭ  ', 40);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('63', 1036, 3, 'Ⱓ ', 97);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('64', 1036, 5, 'Ų ', 74);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('65', 1036, 4, ' ߽', 51);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('66', 1036, 3, 'ݺ ', 28);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('67', 1036, 5, ' ', 105);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('68', 1036, 4, 'ȭ  õ', 82);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('69', 1036, 3, ' ̴', 59);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('70', 1036, 5, ' ̱⼺', 46);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('71', 1036, 4, ' λƮ', 103);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('72', 1036, 3, '', 80);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('73', 1036, 5, 'Ų å', 67);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('74', 1036, 4, 'ȭ ̵', 54);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('75', 1036, 3, ' κ', 41);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('76', 1036, 5, ' õ', 98);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('77', 1036, 4, ' ', 75);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('78', 1036, 1, ' ', 22);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('79', 1036, 1, ' ̷', 19);
+INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('80', 1036, 2, '̾', 26);
 
 --  RATING
 -- 301
@@ -6528,4 +6528,19 @@ INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('93', 2060, 3, '
 INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('94', 2060, 4, ' źźؿ', 337);
 INSERT INTO RATING (MID, CID, Rating, Comm, Likes) VALUES ('95', 2060, 5, 'OST Ҿ', 434);
 
+--    ʱȭ
+INSERT INTO CONTENT_STATS (CID, RatingCount, RatingSum, AvgRating, Rating1, Rating2, Rating3, Rating4, Rating5)
+SELECT c.ContentID,
+       COUNT(r.Rating),
+       NVL(SUM(r.Rating), 0),
+       ROUND(AVG(r.Rating), 1),
+       COUNT(CASE WHEN r.Rating = 1 THEN 1 END),
+       COUNT(CASE WHEN r.Rating = 2 THEN 1 END),
+       COUNT(CASE WHEN r.Rating = 3 THEN 1 END),
+       COUNT(CASE WHEN r.Rating = 4 THEN 1 END),
+       COUNT(CASE WHEN r.Rating = 5 THEN 1 END)
+FROM CONTENT c
+LEFT JOIN RATING r ON r.CID = c.ContentID
+GROUP BY c.ContentID;
+
 COMMIT;
\ No newline at end of file
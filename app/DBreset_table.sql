@@ -11,6 +11,8 @@ DROP TABLE TAG CASCADE CONSTRAINTS;
 DROP TABLE TAG_TO CASCADE CONSTRAINTS;
 DROP TABLE SHOP CASCADE CONSTRAINTS;
 DROP TABLE RATING CASCADE CONSTRAINTS;
+DROP TABLE REVIEW_LIKE CASCADE CONSTRAINTS;
+DROP TABLE CONTENT_STATS CASCADE CONSTRAINTS;
 
 --  ID
 CREATE SEQUENCE CONTENT_SEQ
@@ -93,9 +95,46 @@ CREATE TABLE RATING(
 	Rating		INT			NOT NULL,
 	Comm		VARCHAR(1024),
 	Likes			INT,
+	--   1  (   ü , ƿ ø )
+	Version		INT			DEFAULT 0	NOT NULL,
 	PRIMARY KEY (MID, CID),
 	FOREIGN KEY (MID) REFERENCES MEMBER(ID),
 	FOREIGN KEY (CID) REFERENCES CONTENT(ContentID)
 );
 
+--     ĺ ε (top / highest / lowest)
+CREATE INDEX RATING_CID_TOP_IDX ON RATING (CID, NVL(Likes, 0) DESC, Rating DESC, MID);
+CREATE INDEX RATING_CID_HIGH_IDX ON RATING (CID, Rating DESC, NVL(Likes, 0) DESC, MID);
+CREATE INDEX RATING_CID_LOW_IDX ON RATING (CID, Rating, NVL(Likes, 0) DESC, MID);
+
+--  ƿ  (ȸ  ϳ  , RATING.Likes   Ʈǿ )
+-- 䳪  ȸ Ǹ Բ 
+CREATE TABLE REVIEW_LIKE(
+	ActorID		VARCHAR(16)	NOT NULL,
+	MID			VARCHAR(16)	NOT NULL,
+	CID			INT			NOT NULL,
+	LikedAt		DATE		DEFAULT SYSDATE	NOT NULL,
+	PRIMARY KEY (ActorID, MID, CID),
+	FOREIGN KEY (ActorID) REFERENCES MEMBER(ID) ON DELETE CASCADE,
+	FOREIGN KEY (MID, CID) REFERENCES RATING(MID, CID) ON DELETE CASCADE
+);
+
+--      
+CREATE INDEX REVIEW_LIKE_REVIEW_IDX ON REVIEW_LIKE (MID, CID);
+
+--    (RATING    Ʈǿ )
+CREATE TABLE CONTENT_STATS(
+	CID			INT			NOT NULL,
+	RatingCount	INT			DEFAULT 0	NOT NULL,
+	RatingSum		INT			DEFAULT 0	NOT NULL,
+	AvgRating		NUMBER(2,1),
+	Rating1		INT			DEFAULT 0	NOT NULL,
+	Rating2		INT			DEFAULT 0	NOT NULL,
+	Rating3		INT			DEFAULT 0	NOT NULL,
+	Rating4		INT			DEFAULT 0	NOT NULL,
+	Rating5		INT			DEFAULT 0	NOT NULL,
+	PRIMARY KEY (CID),
+	FOREIGN KEY (CID) REFERENCES CONTENT(ContentID)
+);
+
 COMMIT;
\ No newline at end of file
@@ -4,6 +4,7 @@ Flask 애플리케이션 팩토리
 from flask import Flask
 from app.config import Config
 from app.db import db
+from app.cache import cache
 
 # 주의: .env 파일은 run.py에서 이미 로드되므로 여기서는 로드하지 않음
 # (run.py가 진입점이므로 run.py에서 load_dotenv() 호출)
@@ -25,6 +26,23 @@ def create_app(config_class=Config):
     # 데이터베이스 초기화
     db.init_app(app)
     
+    # 캐시 초기화 (CACHE_BACKEND 설정)
+    cache.init_app(app)
+    
+    # 검색 색인 구축 (실패해도 첫 검색 때 다시 시도)
+    from app.search import review_index, search_index, suggester
+    search_index.init_app(app)
+    suggester.init_app(app)
+    review_index.init_app(app)
+    
+    # 좋아요 쓰기 지연 버퍼 (LIKE_WRITE_BEHIND 가 켜져 있으면 반영 스레드 시작)
+    from app.services.like_buffer import like_buffer
+    like_buffer.init_app(app)
+    
+    # 중복 좋아요 필터 (REVIEW_LIKE 원장으로 블룸 필터 구축)
+    from app.services.like_filter import like_filter
+    like_filter.init_app(app)
+    
     # Blueprint 등록
     from app.controllers.auth_bp import auth_bp
     from app.controllers.member_bp import member_bp
@@ -38,5 +56,9 @@ def create_app(config_class=Config):
     app.register_blueprint(content_bp)
     app.register_blueprint(admin_bp)
     
+    # 관리용 CLI 명령 등록 (flask stats rebuild / verify)
+    from app import cli
+    cli.init_app(app)
+    
     return app
 
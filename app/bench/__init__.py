@@ -0,0 +1,17 @@
+"""
+동시성 부하 측정 (python -m app.bench)
+
+Oracle 대신 행 잠금을 흉내 내는 메모리 DB(standin)에 서비스 함수를 동시에 보내
+좋아요 / 리뷰 작성 경로의 잠금 전략을 숫자로 비교한다.
+"""
+from app.bench.harness import LIKE_STRATEGIES, Report, bench_edits, bench_likes, bench_reviews
+from app.bench.standin import StandInDatabase
+
+__all__ = [
+    "LIKE_STRATEGIES",
+    "Report",
+    "StandInDatabase",
+    "bench_edits",
+    "bench_likes",
+    "bench_reviews",
+]
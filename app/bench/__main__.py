@@ -0,0 +1,65 @@
+"""
+동시성 부하 측정 실행
+
+    python -m app.bench likes                       # 좋아요 전략 전체 비교
+    python -m app.bench likes --strategy atomic --threads 32 --ops 100
+    python -m app.bench likes --strategy atomic_sync,atomic --log-sync-ms 2   # 일반 / 비동기 커밋
+    python -m app.bench likes --strategy atomic_sync --threads 32 --pool 4 --max-waiters 8   # 풀 포화 시 503
+    python -m app.bench likes --strategy atomic --repeat 3   # 같은 회원이 세 번씩 (중복 좋아요 거절)
+    python -m app.bench reviews --threads 16 --members 5
+    python -m app.bench edits --threads 8            # 리뷰 수정 Version 충돌
+    python -m app.bench likes --json                # 결과를 JSON 으로
+"""
+import argparse
+import json
+
+from app.bench.harness import LIKE_STRATEGIES, bench_edits, bench_likes, bench_reviews
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m app.bench", description="좋아요 / 리뷰 작성 동시성 측정")
+    parser.add_argument("scenario", choices=["likes", "reviews", "edits"])
+    parser.add_argument("--strategy", default="all",
+                        help="좋아요 전략, 쉼표로 여러 개 (likes 전용): all, " + ", ".join(LIKE_STRATEGIES))
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=50, help="스레드당 호출 수")
+    parser.add_argument("--repeat", type=int, default=1, help="같은 회원이 연달아 누르는 횟수 (likes 전용)")
+    parser.add_argument("--members", type=int, default=5, help="작성 회원 수 (reviews 전용)")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="문장/커밋 한 번의 왕복 시간")
+    parser.add_argument("--log-sync-ms", type=float, default=1.0,
+                        help="일반 COMMIT 이 리두 로그 기록을 기다리는 시간 (NOWAIT 커밋은 안 기다림)")
+    parser.add_argument("--pool", type=int, default=10, help="커넥션 풀 크기 (DB_POOL_MAX)")
+    parser.add_argument("--pool-wait-ms", type=float, default=0,
+                        help="연결 대기 최대 시간, 0 이면 무한 대기 (DB_POOL_WAIT_TIMEOUT_MS)")
+    parser.add_argument("--max-waiters", type=int, default=0,
+                        help="동시에 연결을 기다릴 수 있는 요청 수, 0 이면 제한 없음 (DB_POOL_MAX_WAITERS)")
+    parser.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    args = parser.parse_args(argv)
+
+    rtt = args.rtt_ms / 1000
+    log_sync = args.log_sync_ms / 1000
+    pool_options = {"pool_wait": args.pool_wait_ms / 1000, "max_waiters": args.max_waiters}
+    if args.scenario == "likes":
+        strategies = list(LIKE_STRATEGIES) if args.strategy == "all" else args.strategy.split(",")
+        unknown = [name for name in strategies if name not in LIKE_STRATEGIES]
+        if unknown:
+            parser.error(f"unknown strategy: {', '.join(unknown)}")
+        reports = [
+            bench_likes(name, args.threads, args.ops, rtt, args.pool, repeat=args.repeat, log_sync=log_sync,
+                        **pool_options)
+            for name in strategies
+        ]
+    elif args.scenario == "reviews":
+        reports = [bench_reviews(args.threads, args.ops, args.members, rtt, args.pool, log_sync=log_sync,
+                                 **pool_options)]
+    else:
+        reports = [bench_edits(args.threads, args.ops, rtt, args.pool, log_sync=log_sync, **pool_options)]
+
+    if args.json:
+        print(json.dumps([report.as_dict() for report in reports], ensure_ascii=False, indent=2))
+    else:
+        print("\n\n".join(report.format() for report in reports))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,337 @@
+"""
+좋아요 / 리뷰 작성 경로 동시성 부하 측정
+
+스레드 N 개가 서비스 함수를 동시에 호출하고 (요청 하나 = 앱 컨텍스트 하나),
+처리량, 지연 p50/p99, 행 잠금 대기, 갱신 손실, 중복 INSERT 오류를 센다.
+DB 는 app.bench.standin 의 메모리 대역을 쓰므로 Oracle 없이 돌아간다.
+절대값보다는 같은 조건에서 전략끼리 비교하는 용도.
+"""
+import threading
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List
+
+from flask import Flask
+
+from app.bench.standin import StandInDatabase
+from app.cache import cache
+from app.config import Config
+from app.db import db
+from app.models import review_dao
+from app.services import review_service
+from app.services.like_buffer import like_buffer
+from app.services.like_filter import like_filter
+
+BENCH_CONTENT_ID = 1
+BENCH_AUTHOR = "bench_author"
+
+
+# ----------------------------------------------------
+# 좋아요 전략
+# ----------------------------------------------------
+def _like_naive(actor: str) -> None:
+    """잠금 없이 읽고 +1 해서 쓰기 (갱신 손실 비교용)"""
+    with db.transaction() as conn:
+        row = review_dao.get_review_by_member_and_content(conn, BENCH_AUTHOR, BENCH_CONTENT_ID)
+        if row is None:
+            raise review_service.ReviewNotFoundError("해당 리뷰를 찾을 수 없습니다.")
+        review_dao.update_likes(conn, BENCH_AUTHOR, BENCH_CONTENT_ID, (row["likes"] or 0) + 1)
+
+
+def _like_for_update(actor: str) -> None:
+    """SELECT ... FOR UPDATE 로 잠그고 읽은 뒤 +1 해서 쓰기"""
+    with db.transaction() as conn:
+        row = review_dao.get_review_for_update(conn, BENCH_AUTHOR, BENCH_CONTENT_ID)
+        if row is None:
+            raise review_service.ReviewNotFoundError("해당 리뷰를 찾을 수 없습니다.")
+        review_dao.update_likes(conn, BENCH_AUTHOR, BENCH_CONTENT_ID, (row["likes"] or 0) + 1)
+
+
+def _like_service(actor: str) -> None:
+    """review_service.like_review (atomic / write_behind, REVIEW_LIKE 원장 + 중복 필터)"""
+    review_service.like_review(actor, BENCH_AUTHOR, BENCH_CONTENT_ID)
+
+
+LIKE_STRATEGIES: Dict[str, Callable[[str], None]] = {
+    "naive": _like_naive,
+    "for_update": _like_for_update,
+    "atomic_sync": _like_service,
+    "atomic": _like_service,
+    "write_behind": _like_service,
+}
+
+
+# ----------------------------------------------------
+# 측정
+# ----------------------------------------------------
+def percentile(values: List[float], p: float) -> float:
+    """정렬된 값들의 p 백분위 (최근접 순위)"""
+    if not values:
+        return 0.0
+    rank = max(0, min(len(values) - 1, int(round(p / 100 * len(values) + 0.5)) - 1))
+    return values[rank]
+
+
+class Report:
+    """한 번의 측정 결과"""
+
+    def __init__(self, name: str, threads: int):
+        self.name = name
+        self.threads = threads
+        self.elapsed = 0.0
+        self.latencies: List[float] = []
+        self.ok = 0
+        self.errors: Counter = Counter()
+        self.lock_waits = 0
+        self.lock_wait_seconds = 0.0
+        self.pool_wait_seconds = 0.0
+        self.checks: Dict[str, Any] = {}
+
+    @property
+    def attempts(self) -> int:
+        return len(self.latencies)
+
+    @property
+    def throughput(self) -> float:
+        return self.attempts / self.elapsed if self.elapsed else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "name": self.name,
+            "threads": self.threads,
+            "attempts": self.attempts,
+            "ok": self.ok,
+            "errors": dict(self.errors),
+            "elapsed_s": round(self.elapsed, 3),
+            "throughput_ops": round(self.throughput, 1),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "lock_waits": self.lock_waits,
+            "lock_wait_ms": round(self.lock_wait_seconds * 1000, 1),
+            "pool_wait_ms": round(self.pool_wait_seconds * 1000, 1),
+            **self.checks,
+        }
+
+    def format(self) -> str:
+        data = self.as_dict()
+        lines = [
+            f"[{data['name']}] threads={data['threads']} attempts={data['attempts']} ok={data['ok']}",
+            f"  throughput {data['throughput_ops']} ops/s, latency p50 {data['p50_ms']} ms / p99 {data['p99_ms']} ms",
+            f"  lock waits {data['lock_waits']} ({data['lock_wait_ms']} ms total), pool wait {data['pool_wait_ms']} ms",
+        ]
+        if data["errors"]:
+            lines.append("  errors " + ", ".join(f"{name}={count}" for name, count in sorted(data["errors"].items())))
+        for key, value in self.checks.items():
+            lines.append(f"  {key} {value}")
+        return "\n".join(lines)
+
+
+def make_app(database: StandInDatabase, pool_size: int = 10, pool_wait: float = 0.0,
+             max_waiters: int = 0) -> Flask:
+    """
+    대역 DB 풀을 쓰는 최소 Flask 앱 (블루프린트/색인 구축 없음)
+
+    Args:
+        pool_wait: 연결 대기 최대 시간 (초, 0 이면 무한 대기 - DB_POOL_WAIT_TIMEOUT_MS)
+        max_waiters: 동시에 연결을 기다릴 수 있는 요청 수 (0 이면 제한 없음 - DB_POOL_MAX_WAITERS)
+    """
+    app = Flask("bench")
+    app.config.from_object(Config)
+    app.config.update(CACHE_BACKEND="lru", SEARCH_INDEX_ON_STARTUP=False)
+    db.pool = database.pool(pool_size, pool_wait)
+    db.set_max_waiters(max_waiters)
+    db.reset_stats()
+    app.teardown_appcontext(db.close_db)
+    cache.init_app(app)
+    return app
+
+
+def _error_name(error: Exception) -> str:
+    text = str(error)
+    if text.startswith("ORA-"):
+        return text.split(":", 1)[0]
+    return type(error).__name__
+
+
+def run_threads(app: Flask, report: Report, threads: int, ops: int,
+                operation: Callable[[int, int], None]) -> None:
+    """
+    threads 개 스레드가 operation(스레드 번호, 회차) 을 ops 번씩 동시에 실행
+
+    요청처럼 매 호출마다 앱 컨텍스트를 열고 닫는다 (연결은 teardown 에서 반납).
+    """
+    barrier = threading.Barrier(threads + 1)
+    lock = threading.Lock()
+
+    def worker(thread_no: int):
+        latencies, ok, errors = [], 0, Counter()
+        barrier.wait()
+        for i in range(ops):
+            started = time.perf_counter()
+            try:
+                with app.app_context():
+                    operation(thread_no, i)
+                ok += 1
+            except Exception as e:
+                errors[_error_name(e)] += 1
+            latencies.append(time.perf_counter() - started)
+        with lock:
+            report.latencies.extend(latencies)
+            report.ok += ok
+            report.errors.update(errors)
+
+    workers = [threading.Thread(target=worker, args=(n,), daemon=True) for n in range(threads)]
+    for thread in workers:
+        thread.start()
+    barrier.wait()
+    started = time.perf_counter()
+    for thread in workers:
+        thread.join()
+    report.elapsed = time.perf_counter() - started
+
+
+def _collect(report: Report, database: StandInDatabase) -> None:
+    metrics = database.metrics()
+    report.lock_waits = metrics["lock_waits"]
+    report.lock_wait_seconds = metrics["lock_wait_seconds"]
+    report.pool_wait_seconds = db.pool.acquire_wait_seconds
+    report.checks["commits"] = metrics["commits"]
+    shed = db.pool_stats()
+    if shed["shed_waiters"] or shed["shed_timeout"]:
+        report.checks["shed_waiters"] = shed["shed_waiters"]
+        report.checks["shed_timeout"] = shed["shed_timeout"]
+    if metrics["async_commits"]:
+        report.checks["async_commits"] = metrics["async_commits"]
+    if metrics["deadlocks"]:
+        report.checks["deadlocks"] = metrics["deadlocks"]
+
+
+def bench_likes(strategy: str, threads: int = 16, ops: int = 50, rtt: float = 0.001,
+                pool_size: int = 10, flush_interval: float = 0.05, repeat: int = 1,
+                log_sync: float = 0.0, pool_wait: float = 0.0, max_waiters: int = 0) -> Report:
+    """
+    리뷰 한 건에 좋아요를 threads x ops 번 동시에 누른다.
+
+    Args:
+        strategy: LIKE_STRATEGIES 의 키
+        rtt: 문장/커밋 한 번의 왕복 시간 (초)
+        flush_interval: write_behind 반영 주기 (초)
+        repeat: 같은 회원이 연달아 누르는 횟수 (2 이상이면 중복 좋아요 거절을 잰다)
+        log_sync: 일반 COMMIT 의 리두 로그 기록 대기 (초, atomic_sync 는 이걸 기다리고 atomic 은 안 기다림)
+
+    Returns:
+        Report - checks 에 최종 Likes 와 갱신 손실(lost_updates) 포함,
+        원장을 쓰는 전략(atomic / write_behind)은 원장 행 수와 Likes 의 차이(ledger_drift) 포함
+    """
+    operation = LIKE_STRATEGIES[strategy]
+    database = StandInDatabase(rtt, log_sync)
+    database.put_review(BENCH_AUTHOR, BENCH_CONTENT_ID, comment="bench", likes=0)
+    app = make_app(database, pool_size, pool_wait, max_waiters)
+    db.async_commit = strategy != "atomic_sync"
+
+    like_buffer.enabled = strategy == "write_behind"
+    like_filter.capacity = max(1000, threads * ops)
+    like_filter.reset()
+    like_filter.reset_stats()
+    if like_buffer.enabled:
+        like_buffer.flush_interval = flush_interval
+        like_buffer.max_staleness = flush_interval * 5
+        like_buffer.start()
+
+    report = Report(f"likes/{strategy}", threads)
+    try:
+        run_threads(app, report, threads, ops, lambda t, i: operation(f"actor{t}-{i // repeat}"))
+    finally:
+        if like_buffer.enabled:
+            like_buffer.stop()
+            like_buffer.enabled = False
+        db.async_commit = True
+
+    _collect(report, database)
+    likes = database.review(BENCH_AUTHOR, BENCH_CONTENT_ID)["LIKES"]
+    report.checks["final_likes"] = likes
+    report.checks["lost_updates"] = report.ok - likes
+    if operation is _like_service:
+        ledger = len(database.likes_of(BENCH_AUTHOR, BENCH_CONTENT_ID))
+        report.checks["ledger_rows"] = ledger
+        report.checks["ledger_drift"] = likes - ledger
+        # 필터 hit 중 원장에 실제로 있어 거절한 수 / hit 이지만 원장에 없어 통과시킨 수
+        filter_stats = like_filter.stats()
+        report.checks["filter_confirmed"] = filter_stats["confirmed"]
+        report.checks["filter_false_hits"] = filter_stats["hits"] - filter_stats["confirmed"]
+    return report
+
+
+def bench_reviews(threads: int = 16, ops: int = 20, members: int = 5, rtt: float = 0.001,
+                  pool_size: int = 10, log_sync: float = 0.0, pool_wait: float = 0.0,
+                  max_waiters: int = 0) -> Report:
+    """
+    같은 회원들의 리뷰 작성을 여러 스레드가 동시에 보낸다 (중복 제출 경쟁).
+
+    회차 i 에는 모든 스레드가 회원 member{i % members} 로 작성하므로
+    회원마다 한 건만 성공하고 나머지는 중복으로 거절돼야 한다.
+
+    Returns:
+        Report - checks 에 리뷰 행 수, 중복 행, PK 로 거절된 중복(ORA-00001 / MERGE),
+        CONTENT_STATS 리뷰 수와 실제 행 수의 차이 포함
+    """
+    database = StandInDatabase(rtt, log_sync)
+    app = make_app(database, pool_size, pool_wait, max_waiters)
+    report = Report("reviews/create", threads)
+
+    def operation(thread_no: int, i: int) -> None:
+        review_service.create_review(f"member{i % members}", BENCH_CONTENT_ID, 1 + thread_no % 5, "bench")
+
+    run_threads(app, report, threads, ops, operation)
+    _collect(report, database)
+
+    rows = database.reviews_of(BENCH_CONTENT_ID)
+    stats = database.stats_of(BENCH_CONTENT_ID) or {"RATINGCOUNT": 0}
+    expected = min(members, ops)
+    report.checks["review_rows"] = len(rows)
+    report.checks["duplicate_rows"] = len(rows) - len({row["MID"] for row in rows})
+    report.checks["missing_rows"] = expected - len(rows)
+    report.checks["pk_rejections"] = database.metrics()["unique_violations"]
+    report.checks["stats_count_drift"] = stats["RATINGCOUNT"] - len(rows)
+    return report
+
+
+def bench_edits(threads: int = 16, ops: int = 20, rtt: float = 0.001, pool_size: int = 10,
+                think: float = 0.002, log_sync: float = 0.0, pool_wait: float = 0.0,
+                max_waiters: int = 0) -> Report:
+    """
+    리뷰 한 건을 여러 스레드가 동시에 수정한다 (수정 폼의 낙관적 동시성 제어).
+
+    매 회차 커밋된 Version 을 읽고 (폼 열기) think 초 뒤에 그 Version 으로 수정을 보낸다.
+    그 사이 다른 수정이 커밋됐으면 ReviewConflictError 로 거절돼야 한다.
+
+    Returns:
+        Report - checks 에 최종 Version, 잃어버린 수정(lost_edits: 성공 수 - Version),
+        CONTENT_STATS 평점 합계와 실제 평점의 차이 포함
+    """
+    database = StandInDatabase(rtt, log_sync)
+    database.put_review(BENCH_AUTHOR, BENCH_CONTENT_ID, rating=3, comment="bench")
+    database.tables["CONTENT_STATS"][BENCH_CONTENT_ID] = {
+        "CID": BENCH_CONTENT_ID, "RATINGCOUNT": 1, "RATINGSUM": 3, "AVGRATING": 3.0,
+        "RATING1": 0, "RATING2": 0, "RATING3": 1, "RATING4": 0, "RATING5": 0,
+    }
+    app = make_app(database, pool_size, pool_wait, max_waiters)
+    report = Report("reviews/edit", threads)
+
+    def operation(thread_no: int, i: int) -> None:
+        version = database.review(BENCH_AUTHOR, BENCH_CONTENT_ID)["VERSION"]
+        time.sleep(think)
+        review_service.update_review(
+            BENCH_AUTHOR, BENCH_CONTENT_ID, 1 + (thread_no + i) % 5, f"edit {thread_no}-{i}", version
+        )
+
+    run_threads(app, report, threads, ops, operation)
+    _collect(report, database)
+
+    row = database.review(BENCH_AUTHOR, BENCH_CONTENT_ID)
+    stats = database.stats_of(BENCH_CONTENT_ID)
+    report.checks["final_version"] = row["VERSION"]
+    report.checks["lost_edits"] = report.ok - row["VERSION"]
+    report.checks["stats_sum_drift"] = stats["RATINGSUM"] - row["RATING"]
+    return report
@@ -0,0 +1,511 @@
+"""
+부하 측정용 Oracle 대역 (메모리 DB)
+
+review_dao / content_stats_dao 가 RATING, CONTENT_STATS, REVIEW_LIKE 에 보내는 문장만 해석한다.
+동시성 측정에 필요한 Oracle 의 성질은 그대로 흉내 낸다.
+
+- 읽기는 커밋된 값만 본다 (자기 트랜잭션의 변경은 보인다).
+- UPDATE / SELECT ... FOR UPDATE / INSERT / MERGE 는 행 잠금을 잡고 커밋/롤백까지 유지한다.
+  다른 트랜잭션이 잡은 행이면 풀릴 때까지 기다린다 (대기 시간을 잰다).
+- UPDATE 의 SET Likes = NVL(Likes, 0) + :delta 는 잠금을 잡은 뒤의 최신 커밋 값에 더한다.
+- 같은 PK 로 INSERT 하면 ORA-00001, 잠금 대기가 순환하면 ORA-00060.
+- review_dao.WRITE_REVIEW_BLOCKS / LIKE_REVIEW_BLOCK 의 PL/SQL 블록은 같은 의미로 직접 실행한다 (한 번의 왕복).
+  LIKE_REVIEW_BLOCK 은 executemany + setinputsizes 의 배열 OUT 바인드도 받는다.
+- 문장마다, 커밋마다 rtt 초를 쉰다 (네트워크 왕복 대신).
+  일반 COMMIT 은 리두 로그 기록을 기다리는 log_sync 초를 더 쉬고,
+  COMMIT WRITE BATCH NOWAIT (db.DURABILITY_ASYNC) 문장은 기다리지 않는다.
+
+모르는 문장은 NotImplementedError 를 낸다.
+"""
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import oracledb
+
+from app.db import ASYNC_COMMIT_SQL
+from app.models import review_dao
+
+RowKey = Tuple[str, Any]
+
+
+def _normalize_sql(sql: str) -> str:
+    return " ".join(sql.split()).upper()
+
+
+def _split_top_level(text: str) -> List[str]:
+    """괄호 밖의 쉼표로 나눈다"""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(text):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return parts
+
+
+_SELECT_REVIEW = re.compile(
+    r"^SELECT (?P<cols>.+?) FROM RATING WHERE (?P<extra>COMM IS NOT NULL AND )?"
+    r"MID = :MID AND CID = :CID(?P<lock> FOR UPDATE)?$"
+)
+_SELECT_LEDGER = "SELECT ACTORID, MID, CID FROM REVIEW_LIKE"
+_SELECT_LIKE = re.compile(r"^SELECT 1 FROM REVIEW_LIKE WHERE ACTORID = :ACTOR AND MID = :MID AND CID = :CID$")
+_UPDATE_REVIEW = re.compile(
+    r"^UPDATE RATING SET (?P<sets>.+?) WHERE MID = :MID AND CID = :CID"
+    r"(?: RETURNING (?P<ret>.+?) INTO (?P<into>.+))?$"
+)
+# review_dao.write_review 의 PL/SQL 블록은 본문 대신 문장 전체로 알아본다
+_WRITE_REVIEW_ACTIONS = {_normalize_sql(sql): action for action, sql in review_dao.WRITE_REVIEW_BLOCKS.items()}
+_LIKE_REVIEW_BLOCK = _normalize_sql(review_dao.LIKE_REVIEW_BLOCK)
+_ASYNC_COMMIT = _normalize_sql(ASYNC_COMMIT_SQL)
+_ASSIGN_BIND = re.compile(r"^(\w+) = :(\w+)$")
+_ASSIGN_ADD = re.compile(r"^(\w+) = (?:NVL\((\w+), 0\)|(\w+)) \+ :(\w+)$")
+
+
+class _Var:
+    """
+    cursor.var() 대역 (DML RETURNING INTO 는 목록, PL/SQL OUT 바인드는 값 하나,
+    arraysize 를 준 변수는 executemany 의 행별 값)
+    """
+
+    def __init__(self, arraysize: Optional[int] = None):
+        self._value: Any = None
+        self._returning = False
+        self._values: Optional[List[Any]] = [None] * arraysize if arraysize else None
+
+    def setvalue(self, pos, value):
+        if self._values is not None:
+            self._values[pos] = value
+            return
+        self._value = value
+
+    def set_returning(self, value):
+        self._value = value
+        self._returning = True
+
+    def getvalue(self, pos=0):
+        if self._values is not None:
+            return self._values[pos]
+        return [self._value] if self._returning else self._value
+
+
+class _RowSlot:
+    """executemany 의 행 하나에 묶인 배열 변수의 칸"""
+
+    def __init__(self, var: _Var, row: int):
+        self._var = var
+        self._row = row
+
+    def setvalue(self, pos, value):
+        self._var.setvalue(self._row, value)
+
+
+class StandInDatabase:
+    """
+    커밋된 상태와 행 잠금을 가진 메모리 DB
+
+    Args:
+        rtt: 문장/커밋 한 번에 쉬는 시간 (초)
+        log_sync: 일반 COMMIT 이 리두 로그 기록을 기다리는 시간 (초)
+    """
+
+    def __init__(self, rtt: float = 0.0, log_sync: float = 0.0):
+        self.rtt = rtt
+        self.log_sync = log_sync
+        self.tables: Dict[str, Dict[Any, Dict[str, Any]]] = {"RATING": {}, "CONTENT_STATS": {}, "REVIEW_LIKE": {}}
+        self._cond = threading.Condition()
+        self._owners: Dict[RowKey, "StandInConnection"] = {}
+        self._metrics = {"statements": 0, "commits": 0, "lock_waits": 0, "lock_wait_seconds": 0.0,
+                         "async_commits": 0, "unique_violations": 0, "deadlocks": 0}
+
+    # ---- 초기 데이터 / 결과 확인 ----
+    def put_review(self, member_id: str, content_id: int, rating: int = 5,
+                   comment: Optional[str] = None, likes: int = 0) -> None:
+        self.tables["RATING"][(member_id, content_id)] = {
+            "MID": member_id, "CID": content_id, "RATING": rating, "COMM": comment, "LIKES": likes,
+            "VERSION": 0,
+        }
+
+    def review(self, member_id: str, content_id: int) -> Optional[Dict[str, Any]]:
+        """커밋된 리뷰 행"""
+        return self.tables["RATING"].get((member_id, content_id))
+
+    def reviews_of(self, content_id: int) -> List[Dict[str, Any]]:
+        return [row for row in self.tables["RATING"].values() if row["CID"] == content_id]
+
+    def likes_of(self, member_id: str, content_id: int) -> List[str]:
+        """커밋된 좋아요 원장의 누른 회원 ID 목록"""
+        return [key[0] for key in self.tables["REVIEW_LIKE"] if key[1:] == (member_id, content_id)]
+
+    def stats_of(self, content_id: int) -> Optional[Dict[str, Any]]:
+        return self.tables["CONTENT_STATS"].get(content_id)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return dict(self._metrics)
+
+    def pool(self, max_size: int = 10, wait_timeout: float = 0.0) -> "StandInPool":
+        return StandInPool(self, max_size, wait_timeout)
+
+    # ---- 잠금 ----
+    def _waits_on(self, owner: "StandInConnection", conn: "StandInConnection") -> bool:
+        """owner 가 (잠금 대기 사슬을 따라) conn 을 기다리고 있는가"""
+        seen = set()
+        while owner is not None and id(owner) not in seen:
+            if owner is conn:
+                return True
+            seen.add(id(owner))
+            owner = self._owners.get(owner.waiting_for) if owner.waiting_for else None
+        return False
+
+    def lock(self, conn: "StandInConnection", key: RowKey) -> None:
+        with self._cond:
+            owner = self._owners.get(key)
+            if owner is None or owner is conn:
+                self._owners[key] = conn
+                conn.locks.add(key)
+                return
+
+            started = time.perf_counter()
+            conn.waiting_for = key
+            try:
+                while True:
+                    owner = self._owners.get(key)
+                    if owner is None:
+                        break
+                    if self._waits_on(owner, conn):
+                        self._metrics["deadlocks"] += 1
+                        raise oracledb.DatabaseError("ORA-00060: deadlock detected while waiting for resource")
+                    self._cond.wait()
+            finally:
+                conn.waiting_for = None
+                waited = time.perf_counter() - started
+                conn.lock_wait += waited
+                self._metrics["lock_waits"] += 1
+                self._metrics["lock_wait_seconds"] += waited
+            self._owners[key] = conn
+            conn.locks.add(key)
+
+    def release(self, conn: "StandInConnection") -> None:
+        with self._cond:
+            for key in conn.locks:
+                if self._owners.get(key) is conn:
+                    del self._owners[key]
+            conn.locks.clear()
+            self._cond.notify_all()
+
+    def commit(self, conn: "StandInConnection", wait: bool = True) -> None:
+        with self._cond:
+            for (table, key), row in conn.writes.items():
+                if row is None:
+                    self.tables[table].pop(key, None)
+                else:
+                    self.tables[table][key] = row
+            conn.writes.clear()
+            self._metrics["commits" if wait else "async_commits"] += 1
+        self.release(conn)
+
+    def read(self, conn: "StandInConnection", table: str, key) -> Optional[Dict[str, Any]]:
+        with self._cond:
+            if (table, key) in conn.writes:
+                row = conn.writes[(table, key)]
+            else:
+                row = self.tables[table].get(key)
+            return dict(row) if row is not None else None
+
+    def count_statement(self) -> None:
+        with self._cond:
+            self._metrics["statements"] += 1
+
+    def count_unique_violation(self) -> None:
+        with self._cond:
+            self._metrics["unique_violations"] += 1
+
+
+class StandInCursor:
+    def __init__(self, conn: "StandInConnection"):
+        self.conn = conn
+        self.database = conn.database
+        self.rowcount = 0
+        self.description = None
+        self._rows: List[tuple] = []
+        self._array_counts: List[int] = []
+        self._input_vars: Dict[str, _Var] = {}
+        self.arraysize = 100
+        self.prefetchrows = 100
+
+    def var(self, typ=None, *args, arraysize: Optional[int] = None, **kwargs):
+        return _Var(arraysize)
+
+    def setinputsizes(self, **kwargs) -> None:
+        self._input_vars = {name.upper(): value for name, value in kwargs.items() if isinstance(value, _Var)}
+
+    def execute(self, sql: str, params: Optional[Dict[str, Any]] = None) -> None:
+        params = {name.upper(): value for name, value in (params or {}).items()}
+        self.database.count_statement()
+        if self.database.rtt:
+            time.sleep(self.database.rtt)
+        self.rowcount = 0
+        self._rows = []
+        self._dispatch(_normalize_sql(sql), params)
+
+    def executemany(self, sql: str, rows, arraydmlrowcounts: bool = False, **kwargs) -> None:
+        text = _normalize_sql(sql)
+        self.database.count_statement()
+        if self.database.rtt:
+            time.sleep(self.database.rtt)
+        self._array_counts = []
+        for i, params in enumerate(rows):
+            params = {name.upper(): value for name, value in params.items()}
+            params.update({name: _RowSlot(var, i) for name, var in self._input_vars.items()})
+            self._dispatch(text, params)
+            self._array_counts.append(self.rowcount)
+        self.rowcount = sum(self._array_counts)
+
+    def getarraydmlrowcounts(self) -> List[int]:
+        return list(self._array_counts)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self) -> None:
+        pass
+
+    # ---- 문장 해석 ----
+    def _dispatch(self, sql: str, params: Dict[str, Any]) -> None:
+        if sql == _ASYNC_COMMIT:
+            # 왕복은 execute 에서 쉬었고, 리두 로그 기록은 기다리지 않는다
+            self.database.commit(self.conn, wait=False)
+            return
+        action = _WRITE_REVIEW_ACTIONS.get(sql)
+        if action is not None:
+            self._write_review(action, params)
+            return
+        if sql == _LIKE_REVIEW_BLOCK:
+            self._record_like(params)
+            return
+        if sql == _SELECT_LEDGER:
+            # 좋아요 중복 필터 재구축용 원장 전체 (커밋된 행)
+            with self.database._cond:
+                self._rows = list(self.database.tables["REVIEW_LIKE"])
+            self.description = [("ACTORID",), ("MID",), ("CID",)]
+            return
+        for pattern, handler in (
+            (_SELECT_REVIEW, self._select_review),
+            (_SELECT_LIKE, self._select_like),
+            (_UPDATE_REVIEW, self._update_review),
+        ):
+            match = pattern.match(sql)
+            if match:
+                handler(match, params)
+                return
+        raise NotImplementedError(f"stand-in does not support: {sql[:80]}")
+
+    def _review_key(self, params) -> Tuple[str, int]:
+        return params["MID"], int(params["CID"])
+
+    def _select_review(self, match, params) -> None:
+        key = self._review_key(params)
+        if match.group("lock"):
+            self.database.lock(self.conn, ("RATING", key))
+        row = self.database.read(self.conn, "RATING", key)
+        columns = [col.split(".")[-1] for col in _split_top_level(match.group("cols"))]
+        self.description = [(col,) for col in columns]
+        if row is None or (match.group("extra") and row.get("COMM") is None):
+            return
+        self._rows = [tuple(row.get(col) for col in columns)]
+        self.rowcount = 1
+
+    def _select_like(self, match, params) -> None:
+        key = (params["ACTOR"], *self._review_key(params))
+        self.description = [("1",)]
+        self._rows = [(1,)] if self.database.read(self.conn, "REVIEW_LIKE", key) is not None else []
+        self.rowcount = len(self._rows)
+
+    def _update_review(self, match, params) -> None:
+        key = self._review_key(params)
+        self.database.lock(self.conn, ("RATING", key))
+        row = self.database.read(self.conn, "RATING", key)
+        if row is None:
+            return
+
+        for assignment in _split_top_level(match.group("sets")):
+            simple = _ASSIGN_BIND.match(assignment)
+            if simple:
+                row[simple.group(1)] = params[simple.group(2)]
+                continue
+            add = _ASSIGN_ADD.match(assignment)
+            if not add:
+                raise NotImplementedError(f"stand-in does not support: SET {assignment}")
+            row[add.group(1)] = (row.get(add.group(1)) or 0) + params[add.group(4)]
+
+        self.conn.writes[("RATING", key)] = row
+        self.rowcount = 1
+
+        if match.group("ret"):
+            columns = _split_top_level(match.group("ret"))
+            binds = [name.strip().lstrip(":") for name in _split_top_level(match.group("into"))]
+            for column, bind in zip(columns, binds):
+                params[bind].set_returning(row.get(column))
+
+    def _apply_rating_change(self, content_id: int, old_rating: Optional[int],
+                             new_rating: Optional[int]) -> Dict[str, Any]:
+        """CONTENT_STATS 요약 행에 평점 변경 1건 반영 (행 잠금)"""
+        self.database.lock(self.conn, ("CONTENT_STATS", content_id))
+        row = self.database.read(self.conn, "CONTENT_STATS", content_id) or {
+            "CID": content_id, "RATINGCOUNT": 0, "RATINGSUM": 0,
+            "RATING1": 0, "RATING2": 0, "RATING3": 0, "RATING4": 0, "RATING5": 0,
+        }
+        row["RATINGCOUNT"] += (new_rating is not None) - (old_rating is not None)
+        row["RATINGSUM"] += (new_rating or 0) - (old_rating or 0)
+        if old_rating is not None:
+            row[f"RATING{old_rating}"] -= 1
+        if new_rating is not None:
+            row[f"RATING{new_rating}"] += 1
+        row["AVGRATING"] = round(row["RATINGSUM"] / row["RATINGCOUNT"], 1) if row["RATINGCOUNT"] > 0 else None
+        self.conn.writes[("CONTENT_STATS", content_id)] = row
+        return row
+
+    def _write_review(self, action: str, params) -> None:
+        key = self._review_key(params)
+        self.database.lock(self.conn, ("RATING", key))
+        row = self.database.read(self.conn, "RATING", key)
+
+        if action == "create":
+            if row is not None:
+                self.database.count_unique_violation()
+                params["STATUS"].setvalue(0, "exists")
+                return
+            old_rating, new_rating = None, params["RATING"]
+            self.conn.writes[("RATING", key)] = {
+                "MID": key[0], "CID": key[1], "RATING": new_rating, "COMM": params["COMM"], "LIKES": 0,
+                "VERSION": 0,
+            }
+        else:
+            if row is None:
+                params["STATUS"].setvalue(0, "missing")
+                return
+            old_rating = row["RATING"]
+            if action == "update":
+                if params["VERSION"] is not None and row["VERSION"] != params["VERSION"]:
+                    params["STATUS"].setvalue(0, "conflict")
+                    return
+                new_rating = params["RATING"]
+                row.update(RATING=new_rating, COMM=params["COMM"], VERSION=row["VERSION"] + 1)
+                self.conn.writes[("RATING", key)] = row
+                params["NEW_VERSION"].setvalue(0, row["VERSION"])
+            else:
+                new_rating = None
+                self.conn.writes[("RATING", key)] = None
+                # REVIEW_LIKE 의 ON DELETE CASCADE
+                for like_key in list(self.database.tables["REVIEW_LIKE"]):
+                    if like_key[1:] == key:
+                        self.conn.writes[("REVIEW_LIKE", like_key)] = None
+
+        stats = self._apply_rating_change(key[1], old_rating, new_rating)
+        params["STATUS"].setvalue(0, "ok")
+        params["OLD_RATING"].setvalue(0, old_rating)
+        params["STAT_COUNT"].setvalue(0, stats["RATINGCOUNT"])
+        params["STAT_AVG"].setvalue(0, stats["AVGRATING"])
+
+    def _record_like(self, params) -> None:
+        review_key = self._review_key(params)
+        key = (params["ACTOR"], *review_key)
+
+        # 커밋 안 된 같은 원장 INSERT 가 있으면 그 트랜잭션이 끝날 때까지 기다린다
+        self.database.lock(self.conn, ("REVIEW_LIKE", key))
+        if self.database.read(self.conn, "REVIEW_LIKE", key) is not None:
+            self.database.count_unique_violation()
+            params["LIKED"].setvalue(0, review_dao.LIKE_DUPLICATE)
+            return
+        if self.database.read(self.conn, "RATING", review_key) is None:
+            params["LIKED"].setvalue(0, review_dao.LIKE_MISSING)
+            return
+        self.conn.writes[("REVIEW_LIKE", key)] = {"ACTORID": key[0], "MID": key[1], "CID": key[2]}
+
+        self.database.lock(self.conn, ("RATING", review_key))
+        row = self.database.read(self.conn, "RATING", review_key)
+        row["LIKES"] = (row["LIKES"] or 0) + 1
+        self.conn.writes[("RATING", review_key)] = row
+        params["LIKED"].setvalue(0, review_dao.LIKE_RECORDED)
+
+
+class StandInConnection:
+    def __init__(self, database: StandInDatabase, pool: Optional["StandInPool"] = None):
+        self.database = database
+        self.pool = pool
+        self.writes: Dict[Tuple[str, Any], Optional[Dict[str, Any]]] = {}
+        self.locks = set()
+        self.waiting_for: Optional[RowKey] = None
+        self.lock_wait = 0.0
+        self.closed = False
+
+    def cursor(self) -> StandInCursor:
+        return StandInCursor(self)
+
+    def commit(self) -> None:
+        if self.database.rtt or self.database.log_sync:
+            time.sleep(self.database.rtt + self.database.log_sync)
+        self.database.commit(self)
+
+    def rollback(self) -> None:
+        self.writes.clear()
+        self.database.release(self)
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        self.rollback()
+        if self.pool is not None:
+            self.pool._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class StandInPool:
+    """
+    oracledb 커넥션 풀 대역 (max_size 개까지 빌려주고 나머지는 기다림)
+
+    wait_timeout 초 안에 못 빌리면 POOL_GETMODE_TIMEDWAIT 처럼 DPY-4005 (0 이면 무한 대기)
+    """
+
+    def __init__(self, database: StandInDatabase, max_size: int = 10, wait_timeout: float = 0.0):
+        self.database = database
+        self.max = max_size
+        self.wait_timeout = wait_timeout
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._lock = threading.Lock()
+        self.busy = 0
+        self.opened = max_size
+        self.acquire_wait_seconds = 0.0
+
+    def acquire(self) -> StandInConnection:
+        started = time.perf_counter()
+        acquired = self._slots.acquire(timeout=self.wait_timeout or None)
+        with self._lock:
+            self.acquire_wait_seconds += time.perf_counter() - started
+            if not acquired:
+                raise oracledb.DatabaseError(
+                    "DPY-4005: timed out waiting for the connection pool to return a connection"
+                )
+            self.busy += 1
+        return StandInConnection(self.database, self)
+
+    def _release(self) -> None:
+        with self._lock:
+            self.busy -= 1
+        self._slots.release()
@@ -0,0 +1,27 @@
+"""
+캐시 서브시스템
+
+    from app.cache import cache, cached
+
+    # 직접 사용
+    value = cache.get_or_load("theme_stats", load_fn, ttl=60, tags=["contents"])
+    cache.invalidate_tags("contents")
+
+    # 데코레이터로 opt-in
+    @cached("content_detail", ttl=60, tags=("content:{content_id}",))
+    def get_content_detail(conn, content_id): ...
+
+백엔드는 설정 CACHE_BACKEND 로 고른다 ('lru' 기본, 'shared', 'none').
+"""
+from app.cache.backends import CacheBackend, LRUBackend, NullBackend, SharedBackend
+from app.cache.core import Cache, cache, cached
+
+__all__ = [
+    "Cache",
+    "CacheBackend",
+    "LRUBackend",
+    "NullBackend",
+    "SharedBackend",
+    "cache",
+    "cached",
+]
@@ -0,0 +1,263 @@
+"""
+캐시 저장소 백엔드
+
+- LRUBackend: 프로세스 메모리, 항목 수 상한 (가장 오래 안 쓴 항목부터 제거)
+- SharedBackend: 같은 서버의 여러 워커 프로세스가 함께 쓰는 SQLite 파일 (pickle 직렬화)
+- NullBackend: 아무것도 저장하지 않음 (캐시 끄기)
+
+태그 무효화는 태그별 버전 번호로 처리한다.
+항목을 저장할 때 연결된 태그들의 현재 버전을 함께 기록해 두고,
+읽을 때 기록된 버전이 현재 버전과 다르면 무효로 본다 (bump_tags 한 번으로
+그 태그에 걸린 모든 항목이 무효화되고, 실제 삭제는 나중에 일어난다).
+"""
+import os
+import pickle
+import sqlite3
+import stat
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+# (값, 만료 시각(time.time) 또는 None, {태그: 버전})
+Entry = Tuple[Any, Optional[float], Dict[str, int]]
+
+
+class CacheBackend:
+    """백엔드 공통 인터페이스"""
+
+    name = "base"
+
+    def get(self, key: str) -> Optional[Entry]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: Any, expires_at: Optional[float], tag_versions: Dict[str, int]) -> None:
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """저장된 항목을 모두 삭제 (태그 버전은 유지)"""
+        raise NotImplementedError
+
+    def tag_versions(self, tags: Iterable[str]) -> Dict[str, int]:
+        """태그별 현재 버전 (한 번도 무효화되지 않은 태그는 0)"""
+        raise NotImplementedError
+
+    def bump_tags(self, tags: Iterable[str]) -> None:
+        """태그 버전을 올려 해당 태그가 걸린 항목을 모두 무효화"""
+        raise NotImplementedError
+
+    def size(self) -> int:
+        return 0
+
+
+class NullBackend(CacheBackend):
+    name = "none"
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, expires_at, tag_versions):
+        pass
+
+    def delete(self, key):
+        pass
+
+    def clear(self):
+        pass
+
+    def tag_versions(self, tags):
+        return {tag: 0 for tag in tags}
+
+    def bump_tags(self, tags):
+        pass
+
+
+class LRUBackend(CacheBackend):
+    """
+    프로세스 메모리 LRU 캐시
+
+    Args:
+        max_entries: 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)
+    """
+
+    name = "lru"
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max(int(max_entries), 1)
+        self._data: "OrderedDict[str, Entry]" = OrderedDict()
+        self._tags: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                self._data.move_to_end(key)
+            return entry
+
+    def set(self, key, value, expires_at, tag_versions):
+        with self._lock:
+            self._data[key] = (value, expires_at, tag_versions)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        # 태그 버전은 남긴다 (버전이 0 부터 다시 올라가면 예전 버전을 기록한 색인/항목이 다시 유효해진다)
+        with self._lock:
+            self._data.clear()
+
+    def tag_versions(self, tags):
+        with self._lock:
+            return {tag: self._tags.get(tag, 0) for tag in tags}
+
+    def bump_tags(self, tags):
+        with self._lock:
+            for tag in tags:
+                self._tags[tag] = self._tags.get(tag, 0) + 1
+
+    def size(self):
+        return len(self._data)
+
+
+class SharedBackend(CacheBackend):
+    """
+    워커 프로세스 간 공유 캐시 (SQLite 파일)
+
+    gunicorn 등으로 워커를 여러 개 띄우면 LRU 캐시는 워커마다 따로 생기고
+    무효화도 그 워커에만 적용된다. 이 백엔드는 같은 서버의 워커들이
+    하나의 파일을 함께 쓰므로 한 워커의 무효화가 모든 워커에 바로 반영된다.
+
+    값을 pickle 로 저장하므로 파일을 쓸 수 있는 사람은 워커에서 코드를 실행할 수 있다.
+    그래서 파일과 디렉터리는 이 프로세스 사용자만 읽고 쓸 수 있게 만들고,
+    다른 사용자 소유이거나 그룹/다른 사용자가 쓸 수 있는 파일이면 쓰지 않는다.
+
+    Args:
+        path: SQLite 파일 경로 (Cache.init_app 은 CACHE_SHARED_PATH, 없으면 앱 instance 폴더의 cache.sqlite3)
+        max_entries: 최대 항목 수 (주기적으로 만료된 항목, 오래 안 쓴 항목 순으로 정리하므로
+            정리 사이에는 잠시 넘을 수 있음)
+    """
+
+    name = "shared"
+
+    # 이 횟수의 set 마다 한 번 상한 정리
+    _PRUNE_EVERY = 64
+
+    def __init__(self, path: str, max_entries: int = 10000):
+        self.path = os.path.abspath(path)
+        self.max_entries = max(int(max_entries), 1)
+        self._prepare_file(self.path)
+        self._local = threading.local()
+        self._writes = 0
+
+        conn = self._conn()
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS cache_entry (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                expires_at REAL,
+                tag_versions BLOB NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE TABLE IF NOT EXISTS cache_tag (tag TEXT PRIMARY KEY, version INTEGER NOT NULL)")
+        conn.commit()
+
+    @staticmethod
+    def _prepare_file(path: str) -> None:
+        """캐시 파일을 이 사용자 전용(0600, 디렉터리 0700)으로 만들고 기존 파일의 소유자/권한을 확인"""
+        directory = os.path.dirname(path)
+        if not os.path.isdir(directory):
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        # O_NOFOLLOW: 다른 사용자가 미리 심어 둔 심볼릭 링크를 따라가지 않는다
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0), 0o600)
+        try:
+            info = os.fstat(fd)
+        finally:
+            os.close(fd)
+        if hasattr(os, "getuid") and info.st_uid != os.getuid():
+            raise RuntimeError(f"공유 캐시 파일의 소유자가 현재 사용자가 아닙니다: {path}")
+        if info.st_mode & (stat.S_IWGRP | stat.S_IWOTH):
+            raise RuntimeError(f"공유 캐시 파일을 다른 사용자가 쓸 수 있습니다 (chmod 600 필요): {path}")
+
+    def _conn(self) -> sqlite3.Connection:
+        # sqlite3 연결은 스레드 간 공유하지 않는다
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at, tag_versions FROM cache_entry WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        conn.execute("UPDATE cache_entry SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        try:
+            return pickle.loads(row[0]), row[1], pickle.loads(row[2])
+        except Exception:
+            # 코드 변경 등으로 역직렬화가 안 되는 항목은 버린다
+            self.delete(key)
+            return None
+
+    def set(self, key, value, expires_at, tag_versions):
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entry (key, value, expires_at, tag_versions, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires_at,
+             pickle.dumps(tag_versions, pickle.HIGHEST_PROTOCOL), time.time()),
+        )
+        self._writes += 1
+        if self._writes % self._PRUNE_EVERY == 0:
+            self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        conn.execute("DELETE FROM cache_entry WHERE expires_at IS NOT NULL AND expires_at < ?", (time.time(),))
+        conn.execute(
+            "DELETE FROM cache_entry WHERE key IN ("
+            " SELECT key FROM cache_entry ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,),
+        )
+
+    def delete(self, key):
+        self._conn().execute("DELETE FROM cache_entry WHERE key = ?", (key,))
+
+    def clear(self):
+        # 태그 버전은 남긴다 (LRUBackend.clear 참고)
+        self._conn().execute("DELETE FROM cache_entry")
+
+    def tag_versions(self, tags):
+        tags = list(tags)
+        versions = {tag: 0 for tag in tags}
+        if not tags:
+            return versions
+        placeholders = ", ".join("?" for _ in tags)
+        rows = self._conn().execute(
+            f"SELECT tag, version FROM cache_tag WHERE tag IN ({placeholders})", tags
+        ).fetchall()
+        versions.update(dict(rows))
+        return versions
+
+    def bump_tags(self, tags):
+        conn = self._conn()
+        for tag in tags:
+            conn.execute(
+                "INSERT INTO cache_tag (tag, version) VALUES (?, 1) "
+                "ON CONFLICT(tag) DO UPDATE SET version = version + 1",
+                (tag,),
+            )
+
+    def size(self):
+        return self._conn().execute("SELECT COUNT(*) FROM cache_entry").fetchone()[0]
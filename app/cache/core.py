@@ -0,0 +1,292 @@
+"""
+캐시 프런트엔드 (Cache) 와 @cached 데코레이터
+"""
+import functools
+import inspect
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from app.cache.backends import CacheBackend, LRUBackend, NullBackend, SharedBackend
+
+# 값이 없음을 나타내는 표식 (None 도 캐시할 수 있도록)
+_MISSING = object()
+
+
+class _Flight:
+    """같은 키를 동시에 로드하려는 요청들이 공유하는 진행 중 로드"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error: Optional[BaseException] = None
+
+
+class Cache:
+    """
+    캐시 프런트엔드
+
+    - 키별 TTL (초, None 이면 태그 무효화 전까지 유지)
+    - 태그 무효화: set/get_or_load 때 tags=['content:42', 'tags'] 처럼 의존 태그를 달고,
+      데이터가 바뀌면 invalidate_tags('content:42') 로 한 번에 무효화
+    - single-flight: 같은 키에 대한 동시 miss 는 한 요청만 로더를 실행하고
+      나머지는 그 결과를 기다려 받는다 (프로세스 내)
+    - 네임스페이스(키의 ':' 앞부분)별 hit/miss 카운터
+
+    캐시된 값은 여러 요청이 공유하므로 읽기 전용으로 다뤄야 한다.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, default_ttl: Optional[int] = 300):
+        self.backend = backend or LRUBackend()
+        self.default_ttl = default_ttl
+        self._flights: Dict[str, _Flight] = {}
+        self._flights_lock = threading.Lock()
+        self._stats = defaultdict(lambda: defaultdict(int))
+        self._stats_lock = threading.Lock()
+
+    def init_app(self, app):
+        """
+        Flask 설정으로 백엔드 구성
+
+        CACHE_BACKEND: 'lru' | 'shared' | 'none'
+        CACHE_MAX_ENTRIES: 최대 항목 수
+        CACHE_DEFAULT_TTL: 기본 TTL (초, 0 이면 만료 없음)
+        CACHE_SHARED_PATH: shared 백엔드 SQLite 파일 경로 (없으면 app.instance_path/cache.sqlite3)
+        """
+        kind = (app.config.get("CACHE_BACKEND") or "lru").lower()
+        max_entries = int(app.config.get("CACHE_MAX_ENTRIES", 1024))
+
+        if kind == "shared":
+            path = app.config.get("CACHE_SHARED_PATH") or os.path.join(app.instance_path, "cache.sqlite3")
+            backend = SharedBackend(path, max_entries)
+        elif kind == "none":
+            backend = NullBackend()
+        elif kind == "lru":
+            backend = LRUBackend(max_entries)
+        else:
+            raise RuntimeError(f"알 수 없는 CACHE_BACKEND: {kind}")
+
+        ttl = int(app.config.get("CACHE_DEFAULT_TTL", 300))
+        self.configure(backend, ttl or None)
+        app.extensions["cache"] = self
+
+    def configure(self, backend: CacheBackend, default_ttl: Optional[int] = 300) -> None:
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.reset_stats()
+
+    # ----------------------------------------------------
+    # 카운터
+    # ----------------------------------------------------
+    def _count(self, key: str, field: str, n: int = 1) -> None:
+        namespace = key.split(":", 1)[0]
+        with self._stats_lock:
+            self._stats[namespace][field] += n
+
+    def stats(self, namespace: Optional[str] = None) -> Dict[str, Any]:
+        """
+        hit/miss 통계
+
+        Returns:
+            {'hits', 'misses', 'loads', 'load_errors', 'coalesced', 'hit_ratio'}
+            namespace 를 주지 않으면 전체 합계에 'namespaces' 별 통계와 'size' 를 더해서 반환
+        """
+        with self._stats_lock:
+            snapshot = {ns: dict(counts) for ns, counts in self._stats.items()}
+
+        def summarize(counts):
+            result = {field: counts.get(field, 0)
+                      for field in ("hits", "misses", "loads", "load_errors", "coalesced")}
+            lookups = result["hits"] + result["misses"]
+            result["hit_ratio"] = result["hits"] / lookups if lookups else 0.0
+            return result
+
+        if namespace is not None:
+            return summarize(snapshot.get(namespace, {}))
+
+        total = defaultdict(int)
+        for counts in snapshot.values():
+            for field, n in counts.items():
+                total[field] += n
+        result = summarize(total)
+        result["namespaces"] = {ns: summarize(counts) for ns, counts in sorted(snapshot.items())}
+        result["backend"] = self.backend.name
+        result["size"] = self.backend.size()
+        return result
+
+    def reset_stats(self) -> None:
+        with self._stats_lock:
+            self._stats.clear()
+
+    # ----------------------------------------------------
+    # 기본 연산
+    # ----------------------------------------------------
+    def _lookup(self, key: str) -> Any:
+        entry = self.backend.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at, tag_versions = entry
+        if expires_at is not None and expires_at <= time.time():
+            self.backend.delete(key)
+            return _MISSING
+        if tag_versions and self.backend.tag_versions(tag_versions) != tag_versions:
+            self.backend.delete(key)
+            return _MISSING
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = self._lookup(key)
+        if value is _MISSING:
+            self._count(key, "misses")
+            return default
+        self._count(key, "hits")
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = _MISSING,
+            tags: Iterable[str] = (), tag_versions: Optional[Dict[str, int]] = None) -> None:
+        """
+        Args:
+            ttl: 초 (생략하면 default_ttl, None 이면 만료 없음)
+            tags: 의존 태그
+            tag_versions: 로드 시작 전에 읽어 둔 태그 버전 (get_or_load 내부용)
+        """
+        if ttl is _MISSING:
+            ttl = self.default_ttl
+        expires_at = time.time() + ttl if ttl else None
+        if tag_versions is None:
+            tag_versions = self.backend.tag_versions(tags)
+        self.backend.set(key, value, expires_at, tag_versions)
+
+    def delete(self, key: str) -> None:
+        self.backend.delete(key)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def invalidate_tags(self, *tags: str) -> None:
+        """태그가 걸린 항목을 모두 무효화 (데이터 변경 커밋 후 호출)"""
+        if tags:
+            self.backend.bump_tags(tags)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any], ttl: Optional[int] = _MISSING,
+                    tags: Iterable[str] = ()) -> Any:
+        """
+        캐시에 있으면 반환, 없으면 loader() 결과를 저장 후 반환
+
+        같은 키를 동시에 요청하면 loader 는 한 번만 실행된다.
+        로드 도중 태그가 무효화되면 결과는 이번 요청에만 쓰고 저장하지 않는다
+        (태그 버전을 로드 시작 전에 기록하므로 다음 조회에서 자연히 무효).
+        """
+        value = self._lookup(key)
+        if value is not _MISSING:
+            self._count(key, "hits")
+            return value
+        self._count(key, "misses")
+
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            self._count(key, "coalesced")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            # 앞선 로드가 방금 끝났을 수 있으니 한 번 더 확인
+            value = self._lookup(key)
+            if value is not _MISSING:
+                flight.value = value
+                return value
+
+            tags = list(tags)
+            tag_versions = self.backend.tag_versions(tags)
+            self._count(key, "loads")
+            flight.value = loader()
+            self.set(key, flight.value, ttl, tag_versions=tag_versions)
+            return flight.value
+        except BaseException as e:
+            self._count(key, "load_errors")
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+
+def _format_key(namespace: str, arguments: Dict[str, Any]) -> str:
+    parts = [f"{name}={arguments[name]!r}" for name in sorted(arguments)]
+    return f"{namespace}:" + ",".join(parts)
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[int] = _MISSING,
+    tags: Sequence[str] = (),
+    ignore: Sequence[str] = ("conn",),
+    cache_obj: Optional[Cache] = None,
+):
+    """
+    서비스/DAO 함수 결과를 캐시하는 데코레이터
+
+    사용 예:
+        @cached("content_detail", ttl=60, tags=("content:{content_id}", "tags"))
+        def get_content_detail(conn, content_id): ...
+
+    Args:
+        namespace: 키 접두어 (통계도 이 단위로 집계)
+        ttl: 초 (생략하면 캐시 기본값)
+        tags: 의존 태그. '{인자명}' 자리표시자는 호출 인자로 채워진다
+        ignore: 키에서 뺄 인자 (DB 연결 등)
+        cache_obj: 사용할 Cache (기본: 전역 cache)
+
+    데코레이트된 함수에는 다음이 추가된다.
+        fn.uncached(...)    캐시 없이 원래 함수 호출
+        fn.invalidate(...)  같은 인자로 만들어진 키 삭제
+        fn.cache_key(...)   같은 인자로 만들어질 키
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        def bind(args, kwargs, partial=False) -> Dict[str, Any]:
+            # invalidate/cache_key 는 DB 연결 등 무시되는 인자 없이 불러도 된다
+            bound = signature.bind_partial(*args, **kwargs) if partial else signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return dict(bound.arguments)
+
+        def key_for(arguments):
+            return _format_key(namespace, {k: v for k, v in arguments.items() if k not in ignore})
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            target = cache_obj or cache
+            arguments = bind(args, kwargs)
+            resolved_tags = [tag.format(**arguments) for tag in tags]
+            return target.get_or_load(
+                key_for(arguments), lambda: fn(*args, **kwargs), ttl=ttl, tags=resolved_tags
+            )
+
+        def invalidate(*args, **kwargs):
+            (cache_obj or cache).delete(key_for(bind(args, kwargs, partial=True)))
+
+        def cache_key(*args, **kwargs):
+            return key_for(bind(args, kwargs, partial=True))
+
+        wrapper.uncached = fn
+        wrapper.invalidate = invalidate
+        wrapper.cache_key = cache_key
+        return wrapper
+
+    return decorator
+
+
+# 싱글톤 인스턴스 (create_app 에서 init_app 으로 설정 적용)
+cache = Cache()
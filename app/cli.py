@@ -0,0 +1,88 @@
+"""
+Flask CLI 명령 (관리용)
+
+사용 예:
+    flask --app run stats verify     # CONTENT_STATS 와 RATING 집계 비교
+    flask --app run stats rebuild    # RATING 전체를 다시 집계해서 CONTENT_STATS 재구축
+    flask --app run cache clear      # 캐시 비우기 (shared 백엔드면 모든 워커에 적용)
+    flask --app run cache invalidate content:42 tags   # 태그 무효화
+    flask --app run search rebuild   # 검색 색인 재구축 (다른 워커는 다음 검색 때 재구축)
+"""
+import click
+from flask.cli import AppGroup
+
+from app.cache import cache
+from app.db import db
+from app.models import content_stats_dao
+from app.search import CONTENTS_TAG, search_index
+
+stats_cli = AppGroup("stats", help="콘텐츠 평점 요약(CONTENT_STATS) 관리")
+cache_cli = AppGroup("cache", help="캐시 관리")
+search_cli = AppGroup("search", help="검색 색인 관리")
+
+
+@stats_cli.command("rebuild")
+def rebuild_stats():
+    """RATING 을 다시 집계해서 CONTENT_STATS 를 재구축합니다."""
+    with db.transaction() as conn:
+        count = content_stats_dao.rebuild(conn)
+    click.echo(f"✅ CONTENT_STATS 재구축 완료: {count}건")
+
+
+@stats_cli.command("verify")
+@click.option("--fix", is_flag=True, help="불일치가 있으면 바로 재구축합니다.")
+def verify_stats(fix):
+    """CONTENT_STATS 가 RATING 실제 집계와 일치하는지 확인합니다."""
+    conn = db.get_db()
+    mismatches = content_stats_dao.verify(conn)
+
+    if not mismatches:
+        click.echo("✅ CONTENT_STATS 가 RATING 과 일치합니다.")
+        return
+
+    click.echo(f"⚠️  불일치 {len(mismatches)}건")
+    for row in mismatches:
+        click.echo(
+            f"   CID={row['cid']}: "
+            f"count {row['storedcount']} -> {row['actualcount']}, "
+            f"sum {row['storedsum']} -> {row['actualsum']}, "
+            f"avg {row['storedavg']} -> {row['actualavg']}"
+        )
+
+    if fix:
+        with db.transaction() as conn:
+            count = content_stats_dao.rebuild(conn)
+        click.echo(f"✅ CONTENT_STATS 재구축 완료: {count}건")
+    else:
+        raise SystemExit(1)
+
+
+@cache_cli.command("clear")
+def clear_cache():
+    """캐시를 모두 비웁니다."""
+    cache.clear()
+    click.echo(f"✅ 캐시를 비웠습니다. (backend={cache.backend.name})")
+
+
+@cache_cli.command("invalidate")
+@click.argument("tags", nargs=-1, required=True)
+def invalidate_cache(tags):
+    """태그가 걸린 캐시 항목을 무효화합니다."""
+    cache.invalidate_tags(*tags)
+    click.echo(f"✅ 무효화: {', '.join(tags)}")
+
+
+@search_cli.command("rebuild")
+def rebuild_search_index():
+    """CONTENT 를 다시 읽어 검색 색인을 재구축합니다."""
+    # 실행 중인 워커들도 다음 검색 때 재구축하도록 태그 무효화 (shared 캐시일 때)
+    cache.invalidate_tags(CONTENTS_TAG)
+    search_index.rebuild(db.get_db())
+    click.echo(f"✅ 검색 색인 재구축 완료: 제목 {len(search_index.titles)}건")
+
+
+def init_app(app):
+    """CLI 명령 등록"""
+    app.cli.add_command(stats_cli)
+    app.cli.add_command(cache_cli)
+    app.cli.add_command(search_cli)
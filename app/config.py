@@ -22,6 +22,64 @@ class Config:
     # Connection Pool 설정
     DB_POOL_MIN = int(os.environ.get('DB_POOL_MIN', 2))
     DB_POOL_MAX = int(os.environ.get('DB_POOL_MAX', 10))
+    # 연결이 모두 사용 중일 때 기다리는 최대 시간 (밀리초, 0 이면 무한 대기)
+    # 동시에 기다릴 수 있는 요청 수 (넘으면 기다리지 않고 503, 0 이면 제한 없음) / 503 응답의 Retry-After (초)
+    DB_POOL_WAIT_TIMEOUT_MS = int(os.environ.get('DB_POOL_WAIT_TIMEOUT_MS', 1000))
+    DB_POOL_MAX_WAITERS = int(os.environ.get('DB_POOL_MAX_WAITERS', 20))
+    DB_RETRY_AFTER = int(os.environ.get('DB_RETRY_AFTER', 2))
+    
+    # 상세 페이지 등 여러 SELECT 를 한 번의 왕복으로 묶어서 실행 (False 면 순차 실행)
+    DB_BATCH_QUERIES = os.environ.get('DB_BATCH_QUERIES', 'True').lower() == 'true'
+    
+    # 좋아요 같은 카운터 쓰기를 COMMIT WRITE BATCH NOWAIT 로 커밋 (False 면 모두 일반 COMMIT)
+    DB_ASYNC_COMMIT = os.environ.get('DB_ASYNC_COMMIT', 'True').lower() == 'true'
+    
+    # 교착 상태/잠금 대기 초과 시 트랜잭션 재시도 (db.run_transaction)
+    # 최대 재시도 횟수, 백오프 기본/최대 (밀리초, 지터 포함 지수 증가), 재시도 포함 전체 시간 예산 (밀리초)
+    DB_RETRY_ATTEMPTS = int(os.environ.get('DB_RETRY_ATTEMPTS', 3))
+    DB_RETRY_BASE_MS = float(os.environ.get('DB_RETRY_BASE_MS', 20))
+    DB_RETRY_MAX_MS = float(os.environ.get('DB_RETRY_MAX_MS', 500))
+    DB_RETRY_BUDGET_MS = float(os.environ.get('DB_RETRY_BUDGET_MS', 2000))
+    
+    # 데이터 조회가 끝나면 템플릿 렌더링 전에 연결을 풀에 반납 (커밋 안 된 트랜잭션이 있으면 요청 끝까지 유지)
+    # 라우트별 연결 점유 시간 / 실제 DB 호출 시간 집계 (관리자 대시보드)
+    DB_RELEASE_BEFORE_RENDER = os.environ.get('DB_RELEASE_BEFORE_RENDER', 'True').lower() == 'true'
+    DB_ROUTE_TIMING = os.environ.get('DB_ROUTE_TIMING', 'True').lower() == 'true'
+    
+    # 제작사/시리즈/태그 기준 정보 캐시 유효 시간 (초, 0 이면 무효화될 때까지 유지)
+    # 관리자 수정은 캐시 태그로 무효화된다 (CACHE_BACKEND=lru 면 다른 워커에는 이 시간 안에 반영).
+    REFERENCE_CACHE_TTL = int(os.environ.get('REFERENCE_CACHE_TTL', 300))
+    
+    # 캐시 (app/cache) 설정
+    # CACHE_BACKEND: lru(프로세스 메모리) / shared(워커 간 공유 SQLite 파일) / none(끄기)
+    CACHE_BACKEND = os.environ.get('CACHE_BACKEND', 'lru')
+    CACHE_MAX_ENTRIES = int(os.environ.get('CACHE_MAX_ENTRIES', 1024))
+    CACHE_DEFAULT_TTL = int(os.environ.get('CACHE_DEFAULT_TTL', 300))
+    CACHE_SHARED_PATH = os.environ.get('CACHE_SHARED_PATH') or None
+    
+    # 제목 검색 색인 (app/search)
+    # 시작 시 구축 여부, 최대 유지 시간 (초, 0 이면 변경 감지 시에만 재구축)
+    SEARCH_INDEX_ON_STARTUP = os.environ.get('SEARCH_INDEX_ON_STARTUP', 'True').lower() == 'true'
+    SEARCH_INDEX_MAX_AGE = int(os.environ.get('SEARCH_INDEX_MAX_AGE', 0))
+    # 검색 결과 ID 목록 캐시 유효 시간 (초, 0 이면 무효화될 때까지 유지)
+    SEARCH_CACHE_TTL = int(os.environ.get('SEARCH_CACHE_TTL', 300))
+    # 관련도순 정렬에 쓰는 콘텐츠 인기도(리뷰 수, 평균 평점) 캐시 유효 시간 (초)
+    SEARCH_POPULARITY_TTL = int(os.environ.get('SEARCH_POPULARITY_TTL', 300))
+    # 결과가 없을 때 오타 교정에 쓰는 최대 시간 (밀리초)
+    SEARCH_SPELLING_BUDGET_MS = int(os.environ.get('SEARCH_SPELLING_BUDGET_MS', 20))
+    # 자동완성 트라이 최대 유지 시간 (초, 지나면 백그라운드에서 재구축 / 0 이면 변경 감지 시에만)
+    SUGGEST_MAX_AGE = int(os.environ.get('SUGGEST_MAX_AGE', 600))
+    
+    # 리뷰 좋아요 쓰기 지연 (True 면 증가분을 메모리에 모았다가 한꺼번에 반영)
+    # LIKE_FLUSH_INTERVAL: 반영 주기 (초), LIKE_MAX_STALENESS: 반영되지 않은 좋아요의 최대 지연 (초)
+    LIKE_WRITE_BEHIND = os.environ.get('LIKE_WRITE_BEHIND', 'False').lower() == 'true'
+    LIKE_FLUSH_INTERVAL = float(os.environ.get('LIKE_FLUSH_INTERVAL', 2))
+    LIKE_MAX_STALENESS = float(os.environ.get('LIKE_MAX_STALENESS', 10))
+    # 중복 좋아요 블룸 필터 (필터에 없으면 원장 조회 없이 기록, 있으면 원장 PK 를 조회해 실제로 있을 때만 거절)
+    # LIKE_FILTER_CAPACITY 건까지 오탐(누른 적 없는데 PK 조회가 필요한 경우) 비율이 LIKE_FILTER_ERROR_RATE 이하
+    LIKE_FILTER_ENABLED = os.environ.get('LIKE_FILTER_ENABLED', 'True').lower() == 'true'
+    LIKE_FILTER_CAPACITY = int(os.environ.get('LIKE_FILTER_CAPACITY', 1000000))
+    LIKE_FILTER_ERROR_RATE = float(os.environ.get('LIKE_FILTER_ERROR_RATE', 0.001))
     
     # 디버그 모드
     DEBUG = os.environ.get('FLASK_DEBUG', 'False').lower() == 'true'
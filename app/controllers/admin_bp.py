@@ -4,6 +4,11 @@
 from flask import Blueprint, render_template, request, session, redirect, url_for, flash
 from app.utils.decorators import admin_required
 from app.db import db
+from app.models import content_stats_dao, review_dao
+from app.services import reference_service
+from app.services.like_filter import like_filter
+from app.search import TAGS_TAG, review_index, search_index
+from app.cache import cache
 import oracledb
 
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
@@ -22,9 +27,10 @@ def check_admin():
 @admin_required
 def dashboard():
     """
-    관리자 대시보드
+    관리자 대시보드 (캐시 적중률, 트랜잭션 재시도, 커넥션 풀 통계 포함)
     """
-    return render_template('admin/dashboard.html')
+    return render_template('admin/dashboard.html', cache_stats=cache.stats(), retry_stats=db.retry_stats(),
+                           pool_stats=db.pool_stats(), route_stats=db.route_stats()[:10])
 
 
 @admin_bp.route('/members', methods=['GET', 'POST'])
@@ -45,19 +51,33 @@ def manage_members():
             if action == 'delete':
                 member_id = request.form.get('member_id')
                 
-                # 1) RATING 테이블의 자식 레코드를 먼저 삭제
-                # 회원 탈퇴 시 작성한 리뷰도 함께 삭제하는 것이 일반적입니다.
-                sql_delete_rating = "DELETE FROM RATING WHERE MID = :mid"
-                cursor.execute(sql_delete_rating, mid=member_id)
-                
-                # 2) MEMBER 삭제
-                sql_delete_member = "DELETE FROM MEMBER WHERE ID = :mid"
-                cursor.execute(sql_delete_member, mid=member_id)
+                def delete_member(conn):
+                    cursor = conn.cursor()
+                    # 1) RATING 테이블의 자식 레코드를 먼저 삭제
+                    # 회원 탈퇴 시 작성한 리뷰도 함께 삭제하는 것이 일반적입니다.
+                    # (삭제 전에 해당 리뷰들을 콘텐츠 평점 요약에서 차감, 좋아요 원장은 FK 로 연쇄 삭제)
+                    content_stats_dao.remove_member_ratings(conn, member_id)
+                    # 회원이 누른 좋아요는 원장에서 연쇄 삭제되므로 Likes 카운터도 미리 줄인다
+                    review_dao.remove_member_likes(conn, member_id)
+                    sql_delete_rating = "DELETE FROM RATING WHERE MID = :mid"
+                    cursor.execute(sql_delete_rating, mid=member_id)
+
+                    # 2) MEMBER 삭제
+                    sql_delete_member = "DELETE FROM MEMBER WHERE ID = :mid"
+                    cursor.execute(sql_delete_member, mid=member_id)
+
+                # 좋아요/리뷰 작성과 잠금이 엇갈리면 (ORA-00060 등) 백오프 후 다시 실행
+                db.run_transaction(delete_member)
                 
                 flash(f'회원 [{member_id}]가 성공적으로 삭제되었습니다.', 'warning')
                 
             conn.commit()
 
+            # 커밋 후 리뷰 본문 색인에서 탈퇴 회원의 리뷰 제거, 좋아요 중복 필터 재구축
+            if action == 'delete':
+                review_index.remove_reviews_of(member_id=member_id)
+                like_filter.invalidate()
+
         except oracledb.Error as e:
             conn.rollback()
             error_obj, = e.args
@@ -147,6 +167,7 @@ def manage_producers():
                     return redirect(url_for('admin.manage_producers'))
 
             conn.commit()
+            reference_service.invalidate(reference_service.PRODUCERS)
 
         except Exception as e:
             conn.rollback()
@@ -155,15 +176,9 @@ def manage_producers():
             
         return redirect(url_for('admin.manage_producers'))
 
-    # 2. GET 요청 처리 (목록 조회)
+    # 2. GET 요청 처리 (목록 조회 - 기준 정보 캐시)
     try:
-        sql = "SELECT ProdcoID, Prodname, ProdInfo FROM PRODUCT_CO ORDER BY ProdcoID DESC"
-        cursor.execute(sql)
-        
-        columns = [col[0].lower() for col in cursor.description]
-        cursor.rowfactory = lambda *args: dict(zip(columns, args))
-        
-        producers = cursor.fetchall()
+        producers = reference_service.get_producers()
         
     except Exception as e:
         flash(f'데이터 조회 실패: {str(e)}', 'danger')
@@ -216,6 +231,7 @@ def manage_series():
                     return redirect(url_for('admin.manage_series'))
 
             conn.commit()
+            reference_service.invalidate(reference_service.SERIES)
 
         except Exception as e:
             conn.rollback()
@@ -224,15 +240,9 @@ def manage_series():
             
         return redirect(url_for('admin.manage_series'))
     
-    # 목록 조회
+    # 목록 조회 (기준 정보 캐시)
     try:
-        sql = "SELECT SeriesID, SName FROM SERIES ORDER BY SName"
-        cursor.execute(sql)
-        
-        columns = [col[0].lower() for col in cursor.description]
-        cursor.rowfactory = lambda *args: dict(zip(columns, args))
-        
-        series_list = cursor.fetchall()
+        series_list = reference_service.get_series_list()
         
     except Exception as e:
         flash(f'데이터 조회 실패: {str(e)}', 'danger')
@@ -258,6 +268,8 @@ def manage_contents():
     if request.method == 'POST':
         action = request.form.get('action')
         
+        index_change = None  # 검색 색인 반영 (content_id, 삭제 여부)
+
         try:
             # 체크박스로 선택된 태그 코드 리스트 가져오기
             selected_tags = request.form.getlist('tags') # ['1', '3', '5'] 형태
@@ -280,6 +292,7 @@ def manage_contents():
                     VALUES (:nid, :title, TO_DATE(:r_date, 'YYYY-MM-DD'), :pid, :sid)
                 """
                 cursor.execute(sql_content, nid=new_id, title=title, r_date=release_date, pid=pid, sid=sid)
+                content_stats_dao.create_empty(conn, new_id)
 
                 # 2) 태그 연결 저장 (반복문)
                 if selected_tags:
@@ -289,6 +302,7 @@ def manage_contents():
                         cursor.execute(sql_tag, tcode=tag_code, cid=new_id)
 
                 flash(f'콘텐츠가 등록되었습니다. (태그 {len(selected_tags)}개)', 'success')
+                index_change = (new_id, False)
 
             elif action == 'update':
                 content_id = request.form.get('content_id')
@@ -317,22 +331,38 @@ def manage_contents():
                     for tag_code in selected_tags:
                         cursor.execute(sql_tag, tcode=tag_code, cid=content_id)
 
+                index_change = (content_id, False)
                 flash('콘텐츠 정보가 수정되었습니다.', 'success')
 
             elif action == 'delete':
                 content_id = request.form.get('content_id')
                 
-                # 자식 데이터 삭제 (태그 매핑, 상점, 리뷰)
-                cursor.execute("DELETE FROM TAG_TO WHERE CID = :cid", cid=content_id)
-                cursor.execute("DELETE FROM SHOP WHERE CID = :cid", cid=content_id)
-                cursor.execute("DELETE FROM RATING WHERE CID = :cid", cid=content_id)
-                
-                # 본체 삭제
-                cursor.execute("DELETE FROM CONTENT WHERE ContentID = :cid", cid=content_id)
+                def delete_content(conn):
+                    cursor = conn.cursor()
+                    # 자식 데이터 삭제 (태그 매핑, 상점, 리뷰, 평점 요약 / 좋아요 원장은 FK 로 연쇄 삭제)
+                    cursor.execute("DELETE FROM TAG_TO WHERE CID = :cid", cid=content_id)
+                    cursor.execute("DELETE FROM SHOP WHERE CID = :cid", cid=content_id)
+                    cursor.execute("DELETE FROM RATING WHERE CID = :cid", cid=content_id)
+                    content_stats_dao.delete_stats(conn, content_id)
+
+                    # 본체 삭제
+                    cursor.execute("DELETE FROM CONTENT WHERE ContentID = :cid", cid=content_id)
+                    return cursor.rowcount
+
+                # 리뷰/좋아요 작성과 잠금이 엇갈리면 (ORA-00060 등) 백오프 후 다시 실행
+                if db.run_transaction(delete_content) > 0:
+                    index_change = (content_id, True)
                 flash('콘텐츠가 삭제되었습니다.', 'warning')
 
             conn.commit()
 
+            # 커밋 후 제목 검색 색인 부분 갱신 (CONTENTS_TAG 무효화 - 검색 결과와 테마 통계 캐시도 함께)
+            if index_change:
+                search_index.refresh_content(*index_change)
+                if index_change[1]:
+                    review_index.remove_reviews_of(content_id=index_change[0])
+                    like_filter.invalidate()
+
         except oracledb.Error as e:
             conn.rollback()
             error_obj, = e.args
@@ -345,21 +375,16 @@ def manage_contents():
 
     # 2. GET 요청 처리 (조회)
     try:
-        # A. 콘텐츠 목록 + 태그 목록 조회 (기존 코드 유지)
+        # A. 콘텐츠 목록 + 태그 코드 조회
+        # 제작사/시리즈/태그 이름은 기준 정보 캐시에서 채운다
         sql_list = """
             SELECT c.ContentID, c.Title, 
                    TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-                   c.PID, p.Prodname,
-                   c.SID, s.SName,
-                   (SELECT LISTAGG(t.Tag, ', ') WITHIN GROUP (ORDER BY t.Tag)
-                    FROM TAG_TO tt JOIN TAG t ON tt.TCode = t.TagCode
-                    WHERE tt.CID = c.ContentID) as TagNames,
-                   (SELECT LISTAGG(t.TagCode, ',') WITHIN GROUP (ORDER BY t.TagCode)
-                    FROM TAG_TO tt JOIN TAG t ON tt.TCode = t.TagCode
+                   c.PID, c.SID,
+                   (SELECT LISTAGG(tt.TCode, ',') WITHIN GROUP (ORDER BY tt.TCode)
+                    FROM TAG_TO tt
                     WHERE tt.CID = c.ContentID) as TagCodes
             FROM CONTENT c
-            JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-            LEFT JOIN SERIES s ON c.SID = s.SeriesID
             ORDER BY c.ContentID DESC
         """
         cursor.execute(sql_list)
@@ -367,23 +392,18 @@ def manage_contents():
         cursor.rowfactory = lambda *args: dict(zip(columns, args))
         contents = cursor.fetchall()
 
-        # B. 제작사 & 시리즈 목록 (기존 코드 유지)
-        cursor.execute("SELECT ProdcoID, Prodname FROM PRODUCT_CO ORDER BY Prodname")
-        producers = [{'id': row[0], 'name': row[1]} for row in cursor.fetchall()]
-        cursor.execute("SELECT SeriesID, SName FROM SERIES ORDER BY SName")
-        series_list = [{'id': row[0], 'name': row[1]} for row in cursor.fetchall()]
+        for content in contents:
+            reference_service.attach_names(content)
+            codes = content['tagcodes'].split(',') if content['tagcodes'] else []
+            tag_names = sorted(tag['tag'] for tag in reference_service.resolve_tags(codes))
+            content['tagnames'] = ', '.join(tag_names) if tag_names else None
+
+        # B. 제작사 & 시리즈 목록 (기준 정보 캐시)
+        producers = reference_service.get_producer_options()
+        series_list = reference_service.get_series_options()
         
-        # C. 태그 목록 (기존 코드 유지)
-        cursor.execute("SELECT TagCode, Category, Tag FROM TAG ORDER BY Category, Tag")
-        all_tags = []
-        for row in cursor.fetchall():
-            all_tags.append({'code': row[0], 'category': row[1], 'name': row[2]})
-            
-        tags_by_category = {}
-        for tag in all_tags:
-            cat = tag['category']
-            if cat not in tags_by_category: tags_by_category[cat] = []
-            tags_by_category[cat].append(tag)
+        # C. 태그 목록 (기준 정보 캐시)
+        tags_by_category = reference_service.get_tags_by_category()
             
         # D. 모든 구매처(SHOP) 정보 조회 및 매핑
         # 콘텐츠별로 어떤 구매처가 있는지 미리 다 가져옵니다.
@@ -492,6 +512,10 @@ def manage_tags():
                 flash('태그가 삭제되었습니다.', 'warning')
 
             conn.commit()
+            reference_service.invalidate(reference_service.TAGS)
+            cache.invalidate_tags(TAGS_TAG)
+            if action == 'delete':
+                search_index.refresh_tag_removed(tag_code)
 
         except oracledb.IntegrityError:
             conn.rollback()
@@ -505,14 +529,9 @@ def manage_tags():
     # GET 로직 (목록 조회)
     tags = []
     try:
-        sql = "SELECT TagCode, Category, Tag FROM TAG ORDER BY Category, Tag"
-        cursor.execute(sql)
-        columns = [col[0].lower() for col in cursor.description]
-        cursor.rowfactory = lambda *args: dict(zip(columns, args))
-        tags = cursor.fetchall()
-        
-        # 카테고리 목록 추출 (드롭다운용)
-        categories = sorted(list(set(tag['category'] for tag in tags)))
+        # 기준 정보 캐시에서 태그/카테고리 목록 (드롭다운용)
+        tags = reference_service.get_tags()
+        categories = reference_service.get_tag_categories()
     except Exception as e:
         flash(f'데이터 조회 중 오류: {str(e)}', 'danger')
         categories = []
@@ -487,13 +487,31 @@ from flask import (
     redirect,
     url_for,
     flash,
+    jsonify,
 )
 from app.utils.decorators import login_required
-from app.db import db
 from app.services import review_service
+from app.services import content_service
+from app.search import QuerySyntaxError
+from app.models.review_dao import REVIEW_SORTS, DEFAULT_REVIEW_SORT
+from app.utils.pagination import Page, get_page_args
 import oracledb
 
 
+# 상세 페이지 리뷰 정렬 선택지 (표시 순서)
+REVIEW_SORT_LABELS = [
+    ("top", "추천순"),
+    ("highest", "평점 높은순"),
+    ("lowest", "평점 낮은순"),
+]
+
+# 검색 결과 정렬 선택지 (표시 순서)
+SEARCH_SORT_LABELS = [
+    ("relevance", "관련도순"),
+    ("latest", "최신순"),
+]
+
+
 content_bp = Blueprint("content", __name__, url_prefix="/content")
 
 
@@ -521,6 +539,23 @@ def books():
     return _get_contents_by_theme(1001, 2000, "도서")
 
 
+def _facet_links(facets, endpoint, args):
+    """
+    패싯 선택지마다 이동 주소(url)를 붙인다.
+    선택된 값은 해제 주소, 나머지는 그 값으로 필터를 바꾼 주소 (페이지는 처음으로)
+
+    Args:
+        args: 현재 검색 조건 + 필터 (쿼리 파라미터)
+    """
+    for facet in facets or []:
+        for option in facet["options"]:
+            params = {k: v for k, v in args.items() if k != facet["name"] and v not in (None, "")}
+            if not option["active"]:
+                params[facet["name"]] = option["value"]
+            option["url"] = url_for(endpoint, **params)
+    return facets
+
+
 def _get_contents_by_theme(min_id, max_id, theme_name):
     """
     테마별 콘텐츠 목록 조회 헬퍼 함수 (ContentID 범위 기반)
@@ -530,50 +565,24 @@ def _get_contents_by_theme(min_id, max_id, theme_name):
         max_id: ContentID 최대값
         theme_name: 테마 이름 (한글)
     """
-    conn = db.get_db()
-    cursor = conn.cursor()
-
-    page = request.args.get("page", 1, type=int)
-    per_page = 20
-    offset = (page - 1) * per_page
+    page, per_page, after = get_page_args()
+    filters = content_service.parse_facet_filters(request.values)
 
     try:
-        sql_list = """
-            SELECT c.ContentID, c.Title, 
-                   TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-                   p.Prodname, s.SName,
-                   (SELECT ROUND(AVG(r.Rating), 1) FROM RATING r WHERE r.CID = c.ContentID) as AvgRating,
-                   (SELECT COUNT(*) FROM RATING r WHERE r.CID = c.ContentID) as ReviewCount
-            FROM CONTENT c
-            JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-            LEFT JOIN SERIES s ON c.SID = s.SeriesID
-            WHERE c.ContentID >= :min_id AND c.ContentID <= :max_id
-            ORDER BY c.ReleaseDate DESC
-        """
-        cursor.execute(sql_list, min_id=min_id, max_id=max_id)
-        columns = [col[0].lower() for col in cursor.description]
-        cursor.rowfactory = lambda *args: dict(zip(columns, args))
-        all_contents = cursor.fetchall()
-
-        total = len(all_contents)
-        contents = all_contents[offset : offset + per_page]
-
+        pagination = content_service.list_contents(min_id, max_id, page, per_page, after, filters)
+        facets = content_service.get_facets(min_id=min_id, max_id=max_id, filters=filters)
     except Exception as e:
         flash(f"데이터 조회 중 오류 발생: {str(e)}", "danger")
-        contents = []
-        total = 0
-    finally:
-        cursor.close()
+        pagination = Page.empty(page, per_page)
+        facets = None
 
     return render_template(
         "content/theme_list.html",
         theme_name=theme_name,
-        contents=contents,
-        page=page,
-        per_page=per_page,
-        total=total,
-        has_prev=page > 1,
-        has_next=offset + per_page < total,
+        contents=pagination.items,
+        pagination=pagination,
+        facets=_facet_links(facets, request.endpoint, filters),
+        filters=filters,
     )
 
 
@@ -582,40 +591,157 @@ def search():
     """
     콘텐츠 검색 페이지 및 검색 처리
 
-    GET: 검색 폼 표시
+    GET: 검색 폼 표시 (search_term/tag 파라미터가 있으면 해당 페이지의 검색 결과)
     POST: 검색 결과 표시
     """
-    if request.method == "POST":
-        search_term = request.form.get("search_term", "").strip()
-        tag = request.form.get("tag", "").strip() or None
+    # POST(폼 제출)와 GET(페이지 이동 링크) 모두 같은 파라미터로 처리
+    search_term = request.values.get("search_term", "").strip()
+    tag = request.values.get("tag", "").strip() or None
+    sort = request.values.get("sort", content_service.DEFAULT_SEARCH_SORT)
+    if sort not in content_service.SEARCH_SORTS:
+        sort = content_service.DEFAULT_SEARCH_SORT
+    filters = content_service.parse_facet_filters(request.values)
 
+    if request.method == "POST" or search_term or tag:
         # 둘 다 비어있으면 에러
         if not search_term and not tag:
             flash("검색어 또는 태그를 입력해주세요.", "error")
             return render_template("content/search.html")
 
-        # ContentService를 통한 검색
-        from app.services import content_service
-        results = content_service.search_content(
-            search_term=search_term if search_term else None,
-            tag=tag
-        )
+        page, per_page, after = get_page_args()
 
-        if len(results) > 0:
-            flash(f"검색 결과: {len(results)}개", "success")
+        # ContentService를 통한 검색
+        try:
+            results = content_service.search_content(
+                search_term=search_term if search_term else None,
+                tag=tag,
+                page=page,
+                per_page=per_page,
+                after=after,
+                sort=sort,
+                filters=filters,
+            )
+        except QuerySyntaxError as e:
+            flash(f"태그 검색식 오류: {e}", "error")
+            return render_template("content/search.html", search_term=search_term, tag=tag)
+
+        # 결과가 없으면 오타를 교정한 검색어로 다시 검색 (exact=1 이면 입력 그대로)
+        corrected_from = None
+        if results.total == 0 and page == 1 and not request.values.get("exact"):
+            correction = content_service.suggest_correction(search_term, tag)
+            if correction:
+                corrected = content_service.search_content(
+                    search_term=correction["search_term"],
+                    tag=correction["tag"],
+                    page=page,
+                    per_page=per_page,
+                    sort=sort,
+                    filters=filters,
+                )
+                if corrected.total > 0:
+                    corrected_from = {"search_term": search_term, "tag": tag}
+                    search_term, tag, results = correction["search_term"] or "", correction["tag"], corrected
+
+        facets = content_service.get_facets(search_term, tag, filters=filters)
+        facet_args = dict(filters, search_term=search_term, tag=tag, sort=sort)
+
+        if results.total > 0:
+            if corrected_from:
+                flash("입력한 검색어의 결과가 없어 비슷한 검색어로 검색했습니다.", "info")
+            elif request.method == "POST":
+                flash(f"검색 결과: {results.total}개", "success")
         else:
             flash("검색 결과가 없습니다.", "info")
 
         return render_template(
             "content/search_results.html",
-            results=results,
+            results=results.items,
+            pagination=results,
             search_term=search_term,
             tag=tag,
+            sort=sort,
+            search_sorts=SEARCH_SORT_LABELS,
+            corrected_from=corrected_from,
+            facets=_facet_links(facets, "content.search", facet_args),
+            filters=filters,
         )
 
     return render_template("content/search.html")
 
 
+@content_bp.route("/reviews/search")
+def search_reviews():
+    """
+    리뷰 본문 검색 (콘텐츠별로 묶은 결과)
+
+    Query:
+        q: 검색어 (띄어쓴 단어는 모두 들어 있어야 함)
+        page, per_page, after: 페이지네이션
+    """
+    query = request.args.get("q", "").strip()
+    if not query:
+        return render_template("content/review_search.html", query="", results=None)
+
+    page, per_page, after = get_page_args(default_per_page=10)
+    try:
+        results = review_service.search_reviews(query, page, per_page, after)
+    except review_service.ReviewServiceError as e:
+        flash(str(e), "danger")
+        results = Page.empty(page, per_page)
+
+    return render_template("content/review_search.html", query=query, results=results)
+
+
+@content_bp.route("/suggest")
+def suggest():
+    """
+    검색창 자동완성 (JSON)
+
+    Query:
+        q: 입력 중인 문자열 (한글 초성 가능)
+        limit: 종류별 최대 개수
+
+    Returns:
+        {"query": q, "title": [...], "tag": [...], "producer": [...], "series": [...]}
+        제목 항목에는 상세 페이지 주소(url)가 들어 있다.
+    """
+    query = request.args.get("q", "")
+    limit = request.args.get("limit", content_service.SUGGEST_LIMIT, type=int)
+
+    body = {"query": query}
+    for kind, items in content_service.suggest(query, limit).items():
+        # 트라이의 항목은 공유 객체이므로 복사해서 응답을 만든다
+        body[kind] = [{k: v for k, v in item.items() if k != "weight"} for item in items]
+    for item in body["title"]:
+        item["url"] = url_for("content.detail", content_id=item["id"])
+    return jsonify(body)
+
+
+def _read_review_form():
+    """
+    POST 리뷰 폼 값 검증
+
+    Returns:
+        (평점, 코멘트, 오류 메시지) - 오류가 없으면 메시지는 None
+    """
+    try:
+        rating = int(request.form.get("rating", 0))
+    except ValueError:
+        return None, None, "평점은 숫자로 입력해주세요."
+
+    comment = request.form.get("comment", "").strip()
+    if rating < 1 or rating > 5:
+        return rating, comment, "평점은 1-5 사이의 값이어야 합니다."
+    return rating, comment, None
+
+
+def _with_stats(message, stats):
+    """리뷰 쓰기가 돌려준 평점 요약을 안내 메시지에 붙인다"""
+    if not stats or not stats.get("reviewcount"):
+        return message
+    return f"{message} (평균 {stats['avgrating']:.1f}점, 리뷰 {stats['reviewcount']}개)"
+
+
 @content_bp.route("/<int:content_id>/review", methods=["GET", "POST"])
 @login_required
 def create_review(content_id):
@@ -626,78 +752,49 @@ def create_review(content_id):
         content_id: 콘텐츠 ID
 
     GET: 리뷰 등록 폼 표시
-    POST: 리뷰 등록 처리 (ReviewService 사용)
+    POST: 리뷰 등록 처리 (중복 확인은 ReviewService 의 MERGE 가 PK 로 처리)
     """
     user_id = session.get("user_id")
-    conn = db.get_db()
-    cursor = conn.cursor()
 
-    # 콘텐츠 정보 조회 + 기존 리뷰 존재 여부 확인
+    if request.method == "POST":
+        rating, comment, error = _read_review_form()
+        if error:
+            flash(error, "error")
+        else:
+            try:
+                stats = review_service.create_review(user_id, content_id, rating, comment)
+                flash(_with_stats("리뷰가 성공적으로 등록되었습니다.", stats), "success")
+                return redirect(url_for("content.detail", content_id=content_id))
+            except review_service.ReviewAlreadyExistsError as e:
+                flash(str(e), "warning")
+                return redirect(url_for("content.detail", content_id=content_id))
+            except review_service.ReviewServiceError as e:
+                flash(str(e), "danger")
+            except oracledb.IntegrityError as e:
+                # ORA-02291: 참조하는 콘텐츠가 없음
+                if "ORA-02291" not in str(e):
+                    raise
+                flash("존재하지 않는 콘텐츠입니다.", "danger")
+                return redirect(url_for("main.index"))
+            except Exception as e:
+                flash(f"리뷰 등록 중 오류 발생: {str(e)}", "danger")
+
+    # 폼을 보여줄 때만 콘텐츠 제목과 기존 리뷰 여부를 한 번에 조회
     try:
-        sql_content = """
-            SELECT c.ContentID, c.Title
-            FROM CONTENT c
-            WHERE c.ContentID = :cid
-        """
-        cursor.execute(sql_content, cid=content_id)
-        content_row = cursor.fetchone()
-
-        if not content_row:
-            flash("존재하지 않는 콘텐츠입니다.", "danger")
-            return redirect(url_for("main.index"))
-
-        content = {
-            "content_id": content_row[0],
-            "title": content_row[1],
-        }
-
-        # 이미 리뷰가 있는지 확인 (뷰 단에서 한 번 더 안내용)
-        sql_check = "SELECT COUNT(*) FROM RATING WHERE MID = :mid AND CID = :cid"
-        cursor.execute(sql_check, mid=user_id, cid=content_id)
-        if cursor.fetchone()[0] > 0 and request.method == "GET":
-            flash("이미 리뷰를 작성하셨습니다. 수정 기능을 이용해주세요.", "warning")
-            return redirect(url_for("content.detail", content_id=content_id))
-
+        form = review_service.get_review_form(user_id, content_id)
     except Exception as e:
         flash(f"콘텐츠 조회 중 오류 발생: {str(e)}", "danger")
         return redirect(url_for("main.index"))
-    finally:
-        cursor.close()
 
-    if request.method == "POST":
-        try:
-            rating = int(request.form.get("rating", 0))
-        except ValueError:
-            flash("평점은 숫자로 입력해주세요.", "error")
-            return render_template(
-                "content/review_form.html",
-                content=content,
-                action="create",
-            )
-
-        comment = request.form.get("comment", "").strip()
-
-        if rating < 1 or rating > 5:
-            flash("평점은 1-5 사이의 값이어야 합니다.", "error")
-            return render_template(
-                "content/review_form.html",
-                content=content,
-                action="create",
-            )
+    if form is None:
+        flash("존재하지 않는 콘텐츠입니다.", "danger")
+        return redirect(url_for("main.index"))
 
-        # ✅ 동시성 제어 포함된 ReviewService 사용
-        try:
-            review_service.create_review(user_id, content_id, rating, comment)
-            flash("리뷰가 성공적으로 등록되었습니다.", "success")
-            return redirect(url_for("content.detail", content_id=content_id))
-        except review_service.ReviewAlreadyExistsError as e:
-            flash(str(e), "warning")
-            return redirect(url_for("content.detail", content_id=content_id))
-        except review_service.ReviewServiceError as e:
-            flash(str(e), "danger")
-        except Exception as e:
-            flash(f"리뷰 등록 중 오류 발생: {str(e)}", "danger")
+    if form["rating"] is not None and request.method == "GET":
+        flash("이미 리뷰를 작성하셨습니다. 수정 기능을 이용해주세요.", "warning")
+        return redirect(url_for("content.detail", content_id=content_id))
 
+    content = {"content_id": form["content_id"], "title": form["title"]}
     return render_template("content/review_form.html", content=content, action="create")
 
 
@@ -712,102 +809,29 @@ def detail(content_id):
     Returns:
         콘텐츠 상세 페이지 템플릿
     """
-    conn = db.get_db()
-    cursor = conn.cursor()
     user_id = session.get("user_id")
+    review_sort = request.args.get("sort", DEFAULT_REVIEW_SORT)
+    if review_sort not in REVIEW_SORTS:
+        review_sort = DEFAULT_REVIEW_SORT
+    review_after = request.args.get("after") or None
 
     try:
-        # 1. 콘텐츠 기본 정보 조회
-        sql_content = """
-            SELECT c.ContentID, c.Title, 
-                   TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-                   p.ProdcoID, p.Prodname, p.ProdInfo,
-                   s.SeriesID, s.SName
-            FROM CONTENT c
-            JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-            LEFT JOIN SERIES s ON c.SID = s.SeriesID
-            WHERE c.ContentID = :cid
-        """
-        cursor.execute(sql_content, cid=content_id)
-        content_row = cursor.fetchone()
+        # 콘텐츠/태그/구매처/리뷰 통계/리뷰 목록/내 리뷰를 한 번의 왕복으로 조회
+        detail_data = content_service.get_content_detail(
+            content_id, user_id, review_sort, review_after
+        )
 
-        if not content_row:
+        if not detail_data:
             flash("존재하지 않는 콘텐츠입니다.", "danger")
             return redirect(url_for("main.index"))
 
-        columns = [col[0].lower() for col in cursor.description]
-        content = dict(zip(columns, content_row))
-
-        # 2. 태그 정보 조회 (카테고리별)
-        sql_tags = """
-            SELECT t.Category, LISTAGG(t.Tag, ', ') WITHIN GROUP (ORDER BY t.Tag) as Tags
-            FROM TAG t
-            JOIN TAG_TO tt ON t.TagCode = tt.TCode
-            WHERE tt.CID = :cid
-            GROUP BY t.Category
-        """
-        cursor.execute(sql_tags, cid=content_id)
-        tags_by_category = {}
-        for row in cursor.fetchall():
-            tags_by_category[row[0]] = row[1]
-
-        # 3. 구매처 정보 조회
-        sql_shops = "SELECT MainURL, SubURL FROM SHOP WHERE CID = :cid ORDER BY MainURL"
-        cursor.execute(sql_shops, cid=content_id)
-        shops = []
-        for row in cursor.fetchall():
-            shops.append({"main_url": row[0], "sub_url": row[1]})
-
-        # 4. 리뷰 통계 조회
-        sql_stats = """
-            SELECT ROUND(AVG(Rating), 1) as AvgRating, 
-                   COUNT(*) as ReviewCount,
-                   COUNT(CASE WHEN Rating = 5 THEN 1 END) as Rating5,
-                   COUNT(CASE WHEN Rating = 4 THEN 1 END) as Rating4,
-                   COUNT(CASE WHEN Rating = 3 THEN 1 END) as Rating3,
-                   COUNT(CASE WHEN Rating = 2 THEN 1 END) as Rating2,
-                   COUNT(CASE WHEN Rating = 1 THEN 1 END) as Rating1
-            FROM RATING
-            WHERE CID = :cid
-        """
-        cursor.execute(sql_stats, cid=content_id)
-        stats_row = cursor.fetchone()
-        stats_columns = [col[0].lower() for col in cursor.description]
-        stats = (
-            dict(zip(stats_columns, stats_row))
-            if stats_row
-            else {
-                "avgrating": None,
-                "reviewcount": 0,
-                "rating5": 0,
-                "rating4": 0,
-                "rating3": 0,
-                "rating2": 0,
-                "rating1": 0,
-            }
-        )
-
-        # 5. 리뷰 목록 조회
-        sql_reviews = """
-            SELECT r.Rating, r.Comm, r.Likes, 
-                   m.Name as MemberName, m.ID as MemberID, r.MID, r.CID
-            FROM RATING r
-            JOIN MEMBER m ON r.MID = m.ID
-            WHERE r.CID = :cid
-            ORDER BY r.Likes DESC NULLS LAST, r.Rating DESC, m.ID
-        """
-        cursor.execute(sql_reviews, cid=content_id)
-        columns_review = [col[0].lower() for col in cursor.description]
-        cursor.rowfactory = lambda *args: dict(zip(columns_review, args))
-        reviews = cursor.fetchall()
-
-        # 사용자가 작성한 리뷰 확인
-        user_review = None
-        if user_id:
-            for review in reviews:
-                if review["memberid"] == user_id:
-                    user_review = review
-                    break
+        content = detail_data["content"]
+        tags_by_category = detail_data["tags_by_category"]
+        shops = detail_data["shops"]
+        stats = detail_data["stats"]
+        reviews = detail_data["reviews"]
+        # 사용자가 작성한 리뷰 (PK 조회 결과)
+        user_review = detail_data["user_review"]
 
     except Exception as e:
         flash(f"데이터 조회 중 오류 발생: {str(e)}", "danger")
@@ -815,10 +839,8 @@ def detail(content_id):
         tags_by_category = {}
         shops = []
         stats = {"avgrating": None, "reviewcount": 0}
-        reviews = []
+        reviews = Page.empty()
         user_review = None
-    finally:
-        cursor.close()
 
     if not content:
         return redirect(url_for("main.index"))
@@ -830,11 +852,40 @@ def detail(content_id):
         shops=shops,
         stats=stats,
         reviews=reviews,
+        review_sort=review_sort,
+        review_sorts=REVIEW_SORT_LABELS,
         user_review=user_review,
         user_id=user_id,
     )
 
 
+@content_bp.route("/<int:content_id>/reviews")
+def reviews(content_id):
+    """
+    리뷰 목록 "더 보기" (HTML 조각)
+
+    Args:
+        content_id: 콘텐츠 ID
+
+    Query:
+        sort: top / highest / lowest
+        after: 이전 목록의 keyset 커서
+    """
+    review_sort = request.args.get("sort", DEFAULT_REVIEW_SORT)
+    if review_sort not in REVIEW_SORTS:
+        review_sort = DEFAULT_REVIEW_SORT
+    review_after = request.args.get("after") or None
+
+    page = content_service.get_content_reviews(content_id, review_sort, review_after)
+    return render_template(
+        "content/_review_items.html",
+        content={"contentid": content_id},
+        reviews=page,
+        review_sort=review_sort,
+        user_id=session.get("user_id"),
+    )
+
+
 @content_bp.route("/<int:content_id>/review/edit", methods=["GET", "POST"])
 @login_required
 def update_review(content_id):
@@ -844,103 +895,55 @@ def update_review(content_id):
     Args:
         content_id: 콘텐츠 ID
 
-    GET: 리뷰 수정 폼 표시
-    POST: 리뷰 수정 처리
+    GET: 리뷰 수정 폼 표시 (현재 Version 을 숨은 필드로 담는다)
+    POST: 리뷰 수정 처리 (폼의 Version 이 그대로일 때만 수정)
     """
     user_id = session.get("user_id")
-    conn = db.get_db()
-    cursor = conn.cursor()
+    # 충돌로 폼을 다시 보여줄 때 사용자가 입력했던 내용
+    draft = None
 
-    # 콘텐츠 정보 조회
+    if request.method == "POST":
+        rating, comment, error = _read_review_form()
+        version = request.form.get("version", type=int)
+        if error:
+            flash(error, "error")
+        else:
+            try:
+                # 리뷰 수정 (평점 요약 갱신 포함, DB 왕복 1번)
+                stats = review_service.update_review(user_id, content_id, rating, comment, version)
+                flash(_with_stats("리뷰가 성공적으로 수정되었습니다.", stats), "success")
+                return redirect(url_for("content.detail", content_id=content_id))
+            except review_service.ReviewNotFoundError as e:
+                flash(str(e), "warning")
+                return redirect(url_for("content.detail", content_id=content_id))
+            except review_service.ReviewConflictError as e:
+                flash(str(e), "warning")
+                draft = {"rating": rating, "comment": comment}
+            except Exception as e:
+                flash(f"리뷰 수정 중 오류 발생: {str(e)}", "danger")
+
+    # 콘텐츠 제목과 기존 리뷰를 한 번에 조회
     try:
-        sql_content = """
-            SELECT c.ContentID, c.Title
-            FROM CONTENT c
-            WHERE c.ContentID = :cid
-        """
-        cursor.execute(sql_content, cid=content_id)
-        content_row = cursor.fetchone()
-
-        if not content_row:
-            flash("존재하지 않는 콘텐츠입니다.", "danger")
-            return redirect(url_for("main.index"))
-
-        content = {
-            "content_id": content_row[0],
-            "title": content_row[1],
-        }
-
-        # 기존 리뷰 조회
-        sql_review = """
-            SELECT Rating, Comm
-            FROM RATING
-            WHERE MID = :mid AND CID = :cid
-        """
-        cursor.execute(sql_review, mid=user_id, cid=content_id)
-        review_row = cursor.fetchone()
-
-        if not review_row:
-            flash("작성한 리뷰가 없습니다.", "warning")
-            return redirect(url_for("content.detail", content_id=content_id))
-
-        review = {
-            "rating": review_row[0],
-            "comment": review_row[1] if review_row[1] else "",
-        }
-
+        form = review_service.get_review_form(user_id, content_id)
     except Exception as e:
         flash(f"데이터 조회 중 오류 발생: {str(e)}", "danger")
         return redirect(url_for("content.detail", content_id=content_id))
-    finally:
-        cursor.close()
 
-    if request.method == "POST":
-        conn = db.get_db()
-        cursor = conn.cursor()
-
-        try:
-            rating = int(request.form.get("rating", 0))
-            comment = request.form.get("comment", "").strip()
-
-            if rating < 1 or rating > 5:
-                flash("평점은 1-5 사이의 값이어야 합니다.", "error")
-                return render_template(
-                    "content/review_form.html",
-                    content=content,
-                    review=review,
-                    action="update",
-                )
-
-            # 리뷰 수정
-            sql_update = """
-                UPDATE RATING 
-                SET Rating = :rating, Comm = :comm
-                WHERE MID = :mid AND CID = :cid
-            """
-            cursor.execute(
-                sql_update,
-                rating=rating,
-                comm=comment if comment else None,
-                mid=user_id,
-                cid=content_id,
-            )
-            conn.commit()
-
-            flash("리뷰가 성공적으로 수정되었습니다.", "success")
-            return redirect(url_for("content.detail", content_id=content_id))
+    if form is None:
+        flash("존재하지 않는 콘텐츠입니다.", "danger")
+        return redirect(url_for("main.index"))
 
-        except ValueError:
-            flash("평점은 숫자로 입력해주세요.", "error")
-        except Exception as e:
-            conn.rollback()
-            flash(f"리뷰 수정 중 오류 발생: {str(e)}", "danger")
-        finally:
-            cursor.close()
+    if form["rating"] is None:
+        flash("작성한 리뷰가 없습니다.", "warning")
+        return redirect(url_for("content.detail", content_id=content_id))
 
+    content = {"content_id": form["content_id"], "title": form["title"]}
+    review = {"rating": form["rating"], "comment": form["comment"], "version": form["version"]}
     return render_template(
         "content/review_form.html",
         content=content,
         review=review,
+        draft=draft,
         action="update",
     )
 
@@ -955,25 +958,16 @@ def delete_review(content_id):
         content_id: 콘텐츠 ID
     """
     user_id = session.get("user_id")
-    conn = db.get_db()
-    cursor = conn.cursor()
 
     try:
-        # 리뷰 삭제
-        sql_delete = "DELETE FROM RATING WHERE MID = :mid AND CID = :cid"
-        cursor.execute(sql_delete, mid=user_id, cid=content_id)
-
-        if cursor.rowcount == 0:
-            flash("삭제할 리뷰가 없습니다.", "warning")
-        else:
-            conn.commit()
-            flash("리뷰가 성공적으로 삭제되었습니다.", "success")
+        # 리뷰 삭제 (평점 요약 갱신 포함)
+        stats = review_service.delete_review(user_id, content_id)
+        flash(_with_stats("리뷰가 성공적으로 삭제되었습니다.", stats), "success")
 
+    except review_service.ReviewNotFoundError:
+        flash("삭제할 리뷰가 없습니다.", "warning")
     except Exception as e:
-        conn.rollback()
         flash(f"리뷰 삭제 중 오류 발생: {str(e)}", "danger")
-    finally:
-        cursor.close()
 
     return redirect(url_for("content.detail", content_id=content_id))
 
@@ -993,6 +987,8 @@ def like_review(content_id, review_member_id):
     try:
         review_service.like_review(actor_id, review_member_id, content_id)
         flash("좋아요가 반영되었습니다.", "success")
+    except review_service.ReviewAlreadyLikedError as e:
+        flash(str(e), "info")
     except review_service.ReviewNotFoundError as e:
         flash(str(e), "danger")
     except review_service.ReviewServiceError as e:
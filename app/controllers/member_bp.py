@@ -9,6 +9,7 @@ from flask import Blueprint, render_template, request, redirect, url_for, flash,
 from app.services import member_service
 from app.utils.decorators import login_required
 from app.services import review_service
+from app.utils.pagination import get_page_args
 
 member_bp = Blueprint("member", __name__, url_prefix="/member")
 
@@ -16,8 +17,9 @@ member_bp = Blueprint("member", __name__, url_prefix="/member")
 @login_required
 def my_reviews():
     user_id = session.get("user_id")
-    reviews = review_service.get_my_reviews(user_id)
-    return render_template("member/my_reviews.html", reviews=reviews)
+    page, per_page, after = get_page_args()
+    pagination = review_service.get_my_reviews(user_id, page, per_page, after)
+    return render_template("member/my_reviews.html", reviews=pagination.items, pagination=pagination)
 
 
 
@@ -69,13 +69,133 @@ db = OracleDB()
 
 # app/db.py
 from contextlib import contextmanager
+import random
+import re
+import threading
+import time
 import oracledb
-from flask import g
+from flask import before_render_template, g, has_request_context, make_response, render_template, request, session
+
+# 커밋 내구성 수준 (db.transaction(durability=...))
+# - DURABILITY_SYNC: 일반 COMMIT (리두 로그가 디스크에 기록될 때까지 기다림)
+# - DURABILITY_ASYNC: COMMIT WRITE BATCH NOWAIT (기다리지 않음, 장애 시 마지막 수 ms 의 커밋을 잃을 수 있음)
+#   좋아요 수처럼 잃어도 되는 카운터 쓰기에만 쓴다. 리뷰/회원/관리자 수정은 DURABILITY_SYNC.
+DURABILITY_SYNC = "sync"
+DURABILITY_ASYNC = "async"
+ASYNC_COMMIT_SQL = "COMMIT WRITE BATCH NOWAIT"
+
+# 다시 실행하면 성공할 수 있는 일시적 오류 (db.run_transaction 이 재시도)
+# - ORA-00060: 교착 상태 (Oracle 이 한쪽 문장을 되돌림)
+# - ORA-00054: NOWAIT 잠금 실패 / ORA-30006: WAIT n 잠금 대기 시간 초과
+# - ORA-08177: SERIALIZABLE 트랜잭션의 직렬화 실패
+TRANSIENT_ERROR_CODES = {60, 54, 30006, 8177}
+_ORA_CODE = re.compile(r"ORA-(\d{5})")
+
+
+class DatabaseUnavailableError(Exception):
+    """커넥션 풀이 포화되어 연결을 빌려주지 못할 때 (503 + Retry-After 로 응답)"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _TimedCursor:
+    """DB 호출(execute/fetch) 시간을 연결의 query_seconds 에 누적하는 커서 래퍼"""
+
+    _TIMED = {"execute", "executemany", "callproc", "callfunc", "fetchone", "fetchmany", "fetchall"}
+
+    def __init__(self, cursor, conn: "_TimedConnection"):
+        object.__setattr__(self, "raw", cursor)
+        object.__setattr__(self, "_conn", conn)
+
+    def __getattr__(self, name):
+        attr = getattr(self.raw, name)
+        if name not in self._TIMED:
+            return attr
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return attr(*args, **kwargs)
+            finally:
+                self._conn.query_seconds += time.perf_counter() - started
+        return timed
+
+    def __setattr__(self, name, value):
+        # arraysize / prefetchrows 등은 실제 커서에 설정
+        setattr(self.raw, name, value)
+
+    def __iter__(self):
+        rows = iter(self.raw)
+        while True:
+            started = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                self._conn.query_seconds += time.perf_counter() - started
+            yield row
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.raw.close()
+
+
+class _TimedConnection:
+    """요청 연결 래퍼 - 커서의 DB 호출과 커밋/롤백에 걸린 시간을 query_seconds 에 누적"""
+
+    def __init__(self, conn, endpoint=None):
+        self.raw = conn
+        self.endpoint = endpoint
+        self.query_seconds = 0.0
+        self.acquired_at = time.perf_counter()
+
+    def __getattr__(self, name):
+        return getattr(self.raw, name)
+
+    def cursor(self, *args, **kwargs):
+        return _TimedCursor(self.raw.cursor(*args, **kwargs), self)
+
+    def commit(self):
+        self._timed(self.raw.commit)
+
+    def rollback(self):
+        self._timed(self.raw.rollback)
+
+    def _timed(self, call):
+        started = time.perf_counter()
+        try:
+            call()
+        finally:
+            self.query_seconds += time.perf_counter() - started
 
 
 class OracleDB:
     def __init__(self):
         self.pool = None
+        # 여러 SELECT 를 한 번의 왕복으로 보내는 배치 조회 사용 여부
+        self.batch_queries = True
+        # False 면 DURABILITY_ASYNC 도 일반 COMMIT 으로 처리
+        self.async_commit = True
+        # run_transaction 재시도 설정 (재시도 횟수, 백오프 밀리초, 전체 시간 예산 밀리초)
+        self.retry_attempts = 3
+        self.retry_base_ms = 20
+        self.retry_max_ms = 500
+        self.retry_budget_ms = 2000
+        self._retry_lock = threading.Lock()
+        self._retry_stats = {"retries": 0, "recovered": 0, "exhausted": 0, "codes": {}}
+        # 풀 포화 시 부하 차단 (503 응답의 Retry-After 초, 동시에 연결을 기다릴 수 있는 요청 수)
+        self.retry_after = 2
+        self._waiters = None
+        self._shed_stats = {"waiters": 0, "timeout": 0}
+        # 데이터 조회가 끝나면 템플릿 렌더링 전에 연결 반납, 라우트별 연결 점유 / 쿼리 시간 집계
+        self.release_before_render = True
+        self.route_timing = True
+        self._route_stats = {}
 
     def init_app(self, app):
         """Flask 앱 초기화 시 실행되어 커넥션 풀을 생성합니다."""
@@ -85,6 +205,17 @@ class OracleDB:
         dsn = app.config.get("DB_DSN")
         min_pool = int(app.config.get("DB_POOL_MIN", 2))
         max_pool = int(app.config.get("DB_POOL_MAX", 10))
+        self.batch_queries = bool(app.config.get("DB_BATCH_QUERIES", True))
+        self.async_commit = bool(app.config.get("DB_ASYNC_COMMIT", True))
+        self.retry_attempts = int(app.config.get("DB_RETRY_ATTEMPTS", 3))
+        self.retry_base_ms = float(app.config.get("DB_RETRY_BASE_MS", 20))
+        self.retry_max_ms = float(app.config.get("DB_RETRY_MAX_MS", 500))
+        self.retry_budget_ms = float(app.config.get("DB_RETRY_BUDGET_MS", 2000))
+        wait_timeout = int(app.config.get("DB_POOL_WAIT_TIMEOUT_MS", 1000))
+        self.retry_after = int(app.config.get("DB_RETRY_AFTER", 2))
+        self.set_max_waiters(int(app.config.get("DB_POOL_MAX_WAITERS", max_pool * 2)))
+        self.release_before_render = bool(app.config.get("DB_RELEASE_BEFORE_RENDER", True))
+        self.route_timing = bool(app.config.get("DB_ROUTE_TIMING", True))
 
         if not user or not password or not dsn:
             raise RuntimeError(
@@ -98,6 +229,9 @@ class OracleDB:
             min=min_pool,
             max=max_pool,
             increment=1,
+            # 연결이 모두 사용 중이면 wait_timeout 밀리초까지만 기다린다 (0 이하면 무한 대기)
+            getmode=oracledb.POOL_GETMODE_TIMEDWAIT if wait_timeout > 0 else oracledb.POOL_GETMODE_WAIT,
+            wait_timeout=max(wait_timeout, 0),
         )
 
         print(f"✅ Oracle DB Pool initialized (DSN: {dsn})")
@@ -105,21 +239,111 @@ class OracleDB:
         # 요청 끝날 때마다 close_db 실행
         app.teardown_appcontext(self.close_db)
 
+        # 풀 포화로 연결을 못 빌린 요청은 503 + Retry-After
+        # (컨트롤러가 예외를 잡아 flash 로 바꾼 경우도 after_request 에서 503 으로 바꾼다)
+        app.register_error_handler(DatabaseUnavailableError, self.unavailable_response)
+        app.after_request(self._shed_swallowed)
+
+        # 템플릿 렌더링이 시작되면 (= 데이터 조회가 끝나면) 연결을 바로 풀에 돌려준다
+        # 렌더링 중이나 그 뒤에 다시 get_db() 를 부르면 새로 빌린다
+        if self.release_before_render:
+            before_render_template.connect(self._release_before_render, app)
+
+    def set_max_waiters(self, max_waiters: int) -> None:
+        """동시에 풀 연결을 기다릴 수 있는 요청 수 (0 이하면 제한 없음)"""
+        self._waiters = threading.BoundedSemaphore(max_waiters) if max_waiters > 0 else None
+
     def get_db(self):
-        """현재 요청에 할당된 DB 연결 반환 (없으면 풀에서 하나 빌려옴)."""
+        """
+        현재 요청에 할당된 DB 연결 반환 (없으면 풀에서 하나 빌려옴).
+
+        Raises:
+            DatabaseUnavailableError: 기다리는 요청이 DB_POOL_MAX_WAITERS 를 넘었거나
+                DB_POOL_WAIT_TIMEOUT_MS 안에 연결을 빌리지 못했을 때
+        """
         if self.pool is None:
             raise RuntimeError("DB pool is not initialized.")
 
         if "db_conn" not in g:
-            try:
-                g.db_conn = self.pool.acquire()
-            except oracledb.Error as e:
-                print(f"Connection acquire failed: {e}")
-                return None
+            conn = self._acquire()
+            if self.route_timing:
+                # 요청 끝(teardown)에는 request 가 없으므로 라우트는 빌릴 때 기록해 둔다
+                endpoint = (request.endpoint or request.path) if has_request_context() else None
+                conn = _TimedConnection(conn, endpoint)
+            g.db_conn = conn
         return g.db_conn
 
-    def close_db(self, e=None):
-        """요청이 끝나면 연결을 풀에 반환합니다."""
+    def _acquire(self):
+        waiters = self._waiters
+        # 대기열이 가득 차면 기다리지 않고 바로 거절 (스레드가 쌓여 모두 느려지는 것 방지)
+        if waiters is not None and not waiters.acquire(blocking=False):
+            raise self._shed("waiters", "요청이 많아 잠시 처리할 수 없습니다.")
+        try:
+            return self.pool.acquire()
+        except oracledb.Error as e:
+            # 대기 시간 초과(DPY-4005)는 과부하 때 쏟아지므로 통계로만 남긴다
+            error_obj = e.args[0] if e.args else None
+            if (getattr(error_obj, "full_code", None) or str(e)[:8]) != "DPY-4005":
+                print(f"Connection acquire failed: {e}")
+            raise self._shed("timeout", "데이터베이스 연결이 지연되고 있습니다.") from e
+        finally:
+            if waiters is not None:
+                waiters.release()
+
+    def _shed(self, reason: str, message: str) -> DatabaseUnavailableError:
+        with self._retry_lock:
+            self._shed_stats[reason] += 1
+        error = DatabaseUnavailableError(message, self.retry_after)
+        g.db_unavailable = error
+        if has_request_context():
+            # 이 시점까지 쌓인 flash - 503 으로 응답할 때 이대로 되돌린다 (unavailable_response)
+            g.db_unavailable_flashes = list(session.get("_flashes", []))
+        return error
+
+    def unavailable_response(self, error: DatabaseUnavailableError):
+        """503 Service Unavailable + Retry-After 응답"""
+        # 503 화면은 flash 를 꺼내 쓰지 않는다. 연결을 못 빌린 시점까지 쌓여 있던 flash 만 되돌려 두고
+        # (이전 요청/리다이렉트에서 넘어온 것), 그 뒤 컨트롤러가 예외를 잡고 남긴 오류 flash 는 버린다.
+        flashes = g.pop("db_unavailable_flashes", None)
+        if flashes is None:
+            flashes = list(session.get("_flashes", []))
+        response = make_response(render_template("layout/unavailable.html", error=error), 503)
+        response.headers["Retry-After"] = str(error.retry_after)
+        if flashes:
+            session["_flashes"] = flashes
+        else:
+            session.pop("_flashes", None)
+        return response
+
+    def _shed_swallowed(self, response):
+        error = g.pop("db_unavailable", None)
+        if error is None or response.status_code == 503:
+            return response
+        # 컨트롤러가 예외를 잡아 flash 로 바꾼 경우도 503 으로 응답
+        return self.unavailable_response(error)
+
+    def reset_stats(self) -> None:
+        """재시도 / 부하 차단 / 라우트별 연결 점유 통계 초기화"""
+        with self._retry_lock:
+            self._retry_stats = {"retries": 0, "recovered": 0, "exhausted": 0, "codes": {}}
+            self._shed_stats = {"waiters": 0, "timeout": 0}
+            self._route_stats = {}
+
+    def pool_stats(self):
+        """커넥션 풀 사용 현황과 부하 차단 수 (busy, opened, max, shed_waiters, shed_timeout)"""
+        with self._retry_lock:
+            shed = dict(self._shed_stats)
+        pool = self.pool
+        return {
+            "busy": getattr(pool, "busy", 0),
+            "opened": getattr(pool, "opened", 0),
+            "max": getattr(pool, "max", 0),
+            "shed_waiters": shed["waiters"],
+            "shed_timeout": shed["timeout"],
+        }
+
+    def close_db(self, e=None, before_render: bool = False):
+        """요청이 끝나면 (DB_RELEASE_BEFORE_RENDER 면 템플릿 렌더링 전에) 연결을 풀에 반환합니다."""
         db_conn = g.pop("db_conn", None)
         if db_conn is not None:
             try:
@@ -127,24 +351,249 @@ class OracleDB:
                 db_conn.close()
             except oracledb.Error as e:
                 print(f"Connection release failed: {e}")
+            if isinstance(db_conn, _TimedConnection):
+                self._add_route_time(db_conn, before_render)
+        if not before_render:
+            self._record_route()
+
+    def _release_before_render(self, sender, template=None, context=None, **extra):
+        db_conn = g.get("db_conn")
+        # 커밋 안 된 작업이 있으면 반납(= 롤백)하지 않고 요청 끝까지 유지
+        if db_conn is None or getattr(db_conn, "transaction_in_progress", False):
+            return
+        self.close_db(before_render=True)
+
+    def _add_route_time(self, conn: _TimedConnection, before_render: bool) -> None:
+        """반납한 연결의 점유/쿼리 시간을 이번 요청 합계에 더한다 (렌더링 중에 다시 빌린 연결 포함)"""
+        timing = g.get("db_route_timing")
+        if timing is None:
+            timing = g.db_route_timing = {
+                "endpoint": conn.endpoint, "hold": 0.0, "query": 0.0, "released_before_render": False,
+            }
+        timing["hold"] += time.perf_counter() - conn.acquired_at
+        timing["query"] += conn.query_seconds
+        timing["released_before_render"] |= before_render
+
+    def _record_route(self) -> None:
+        """요청이 끝날 때 이번 요청의 합계를 라우트 통계에 한 번만 기록"""
+        timing = g.pop("db_route_timing", None)
+        if timing is None or timing["endpoint"] is None:
+            return
+        with self._retry_lock:
+            stats = self._route_stats.get(timing["endpoint"])
+            if stats is None:
+                stats = self._route_stats[timing["endpoint"]] = {
+                    "requests": 0, "hold": 0.0, "query": 0.0, "max_hold": 0.0, "released_before_render": 0,
+                }
+            stats["requests"] += 1
+            stats["hold"] += timing["hold"]
+            stats["query"] += timing["query"]
+            stats["max_hold"] = max(stats["max_hold"], timing["hold"])
+            stats["released_before_render"] += int(timing["released_before_render"])
+
+    def route_stats(self):
+        """
+        라우트별 연결 점유 시간과 그중 실제 DB 호출 시간 (점유 시간 합계가 큰 순서)
+
+        Returns:
+            [{'endpoint', 'requests', 'hold_ms', 'query_ms', 'max_hold_ms', 'idle_ratio',
+              'released_before_render'}] - hold_ms / query_ms 는 요청당 평균,
+            idle_ratio 는 연결을 잡고도 DB 를 쓰지 않은 시간 비율
+        """
+        with self._retry_lock:
+            items = [(endpoint, dict(stats)) for endpoint, stats in self._route_stats.items()]
+        items.sort(key=lambda item: item[1]["hold"], reverse=True)
+        result = []
+        for endpoint, stats in items:
+            n = stats["requests"]
+            result.append({
+                "endpoint": endpoint,
+                "requests": n,
+                "hold_ms": stats["hold"] * 1000 / n,
+                "query_ms": stats["query"] * 1000 / n,
+                "max_hold_ms": stats["max_hold"] * 1000,
+                "idle_ratio": max(0.0, 1 - stats["query"] / stats["hold"]) if stats["hold"] else 0.0,
+                "released_before_render": stats["released_before_render"],
+            })
+        return result
+
+    def commit(self, conn, durability: str = DURABILITY_SYNC):
+        """
+        내구성 수준에 맞춰 커밋합니다.
+
+        Args:
+            conn: 커밋할 연결
+            durability: DURABILITY_SYNC 또는 DURABILITY_ASYNC
+        """
+        if durability not in (DURABILITY_SYNC, DURABILITY_ASYNC):
+            raise ValueError(f"Unknown commit durability: {durability}")
+        if durability == DURABILITY_ASYNC and self.async_commit:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(ASYNC_COMMIT_SQL)
+            finally:
+                cursor.close()
+        else:
+            conn.commit()
 
     @contextmanager
-    def transaction(self):
+    def transaction(self, durability: str = DURABILITY_SYNC):
         """
         트랜잭션 컨텍스트 매니저.
         사용 예:
             with db.transaction() as conn:
                 cursor = conn.cursor()
                 cursor.execute(...)
+
+        Args:
+            durability: 커밋 내구성 수준 (카운터 쓰기만 DURABILITY_ASYNC)
         """
         conn = self.get_db()
         try:
             yield conn
-            conn.commit()
+            self.commit(conn, durability)
         except Exception:
             conn.rollback()
             raise
 
+    @staticmethod
+    def transient_error_code(error: Exception):
+        """
+        재시도할 수 있는 오류면 ORA 코드를, 아니면 None 을 반환합니다.
+        (드라이버 오류 객체에 code 가 없으면 메시지의 ORA-xxxxx 를 읽는다)
+        """
+        if not isinstance(error, oracledb.DatabaseError):
+            return None
+        code = getattr(error.args[0], "code", None) if error.args else None
+        if code is None:
+            match = _ORA_CODE.search(str(error))
+            code = int(match.group(1)) if match else None
+        return code if code in TRANSIENT_ERROR_CODES else None
+
+    def _record_retry(self, outcome: str, code=None):
+        with self._retry_lock:
+            self._retry_stats[outcome] += 1
+            if code is not None:
+                codes = self._retry_stats["codes"]
+                codes[code] = codes.get(code, 0) + 1
+
+    def retry_stats(self):
+        """run_transaction 재시도 통계 (retries, recovered, exhausted, codes: ORA 코드별 발생 수)"""
+        with self._retry_lock:
+            return dict(self._retry_stats, codes=dict(self._retry_stats["codes"]))
+
+    def run_transaction(self, work, durability: str = DURABILITY_SYNC):
+        """
+        work(conn) 을 트랜잭션으로 실행하고 커밋합니다.
+        교착 상태/잠금 대기 초과 같은 일시적 오류면 롤백하고 지터를 섞은 지수 백오프 후
+        work 를 처음부터 다시 실행합니다 (DB_RETRY_ATTEMPTS 번, DB_RETRY_BUDGET_MS 안에서).
+        사용 예:
+            likes = db.run_transaction(lambda conn: review_dao.record_like(conn, ...))
+
+        Args:
+            work: 연결을 받아 DML 을 실행하는 함수 (다시 실행될 수 있으므로 DB 밖의 부수 효과 금지)
+            durability: 커밋 내구성 수준
+
+        Returns:
+            마지막으로 성공한 work 의 반환값
+        """
+        conn = self.get_db()
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            try:
+                result = work(conn)
+                self.commit(conn, durability)
+            except Exception as e:
+                conn.rollback()
+                code = self.transient_error_code(e)
+                if code is None:
+                    raise
+                attempt += 1
+                # full jitter: 0 ~ min(최대, 기본 * 2^(n-1)) 밀리초
+                delay = random.uniform(0, min(self.retry_max_ms, self.retry_base_ms * 2 ** (attempt - 1))) / 1000
+                elapsed = time.monotonic() - started
+                if attempt > self.retry_attempts or elapsed + delay > self.retry_budget_ms / 1000:
+                    self._record_retry("exhausted", code)
+                    print(f"트랜잭션 재시도 포기 (ORA-{code:05d}, {attempt - 1}회 재시도): {e}")
+                    raise
+                self._record_retry("retries", code)
+                time.sleep(delay)
+                continue
+            if attempt:
+                self._record_retry("recovered")
+            return result
+
+
+    def fetch_batch(self, conn, queries, prefetch_rows=100):
+        """
+        여러 SELECT 문을 한 번의 DB 왕복으로 실행한다.
+
+        python-oracledb 의 파이프라이닝은 asyncio 연결에서만 지원되므로,
+        동기 연결에서는 PL/SQL 블록 하나로 REF CURSOR 들을 열고
+        prefetchrows 로 첫 행들을 같은 왕복에 받아오는 방식으로 묶는다.
+        배치 실행이 불가능하면 순차 실행으로 대체한다.
+
+        Args:
+            conn: Oracle DB 연결 객체
+            queries: [(sql, params), ...]
+            prefetch_rows: REF CURSOR 당 미리 받아올 행 수
+
+        Returns:
+            쿼리 순서대로 결과 행 리스트 (컬럼명 소문자 dict)
+        """
+        if self.batch_queries and len(queries) > 1:
+            try:
+                return self._fetch_batch_refcursor(conn, queries, prefetch_rows)
+            except (oracledb.DatabaseError, ValueError) as e:
+                print(f"Batch query failed, falling back to sequential: {e}")
+
+        return [self._fetch_all(conn, sql, params) for sql, params in queries]
+
+    @staticmethod
+    def _fetch_all(conn, sql, params):
+        cursor = conn.cursor()
+        try:
+            cursor.execute(sql, params or {})
+            columns = [col[0].lower() for col in cursor.description]
+            return [dict(zip(columns, row)) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def _fetch_batch_refcursor(conn, queries, prefetch_rows):
+        binds = {}
+        ref_cursors = []
+        statements = []
+        for i, (sql, params) in enumerate(queries):
+            for name, value in (params or {}).items():
+                # PL/SQL 블록 안에서는 같은 이름의 바인드 변수가 하나의 값만 가진다
+                if name in binds and binds[name] != value:
+                    raise ValueError(f"bind variable :{name} has conflicting values")
+                binds[name] = value
+
+            ref_cursor = conn.cursor()
+            ref_cursor.prefetchrows = prefetch_rows
+            ref_cursor.arraysize = prefetch_rows
+            ref_cursors.append(ref_cursor)
+            # 시간 측정 래퍼가 아니라 실제 커서를 바인드해야 한다
+            binds[f"rc_{i}"] = getattr(ref_cursor, "raw", ref_cursor)
+            statements.append(f"OPEN :rc_{i} FOR {sql.strip()};")
+
+        block = "BEGIN\n" + "\n".join(statements) + "\nEND;"
+        cursor = conn.cursor()
+        try:
+            cursor.execute(block, binds)
+            results = []
+            for ref_cursor in ref_cursors:
+                columns = [col[0].lower() for col in ref_cursor.description]
+                results.append([dict(zip(columns, row)) for row in ref_cursor.fetchall()])
+            return results
+        finally:
+            for ref_cursor in ref_cursors:
+                ref_cursor.close()
+            cursor.close()
+
 
 # 싱글톤 인스턴스
 db = OracleDB()
@@ -2,6 +2,54 @@
 # 콘텐츠 검색 관련 DAO 함수들
 from typing import List, Dict, Any, Optional
 
+from app.db import db
+from app.models import content_stats_dao, review_dao
+from app.utils.pagination import Page, paginate, make_page, DEFAULT_PER_PAGE
+
+# 미디어 타입별 ContentID 범위 (이름, 최소, 최대)
+# 영화: 2001 ~ 3000, 게임: 301 ~ 1000, 도서: 1001 ~ 2000
+MEDIA_TYPES = [
+    ("Movie", 2001, 3000),
+    ("Video Game", 301, 1000),
+    ("Book", 1001, 2000),
+]
+
+
+def _media_type_case(column: str) -> str:
+    """MEDIA_TYPES 범위로 미디어 타입 이름을 돌려주는 CASE 식."""
+    whens = " ".join(
+        f"WHEN {column} BETWEEN {min_id} AND {max_id} THEN '{name}'"
+        for name, min_id, max_id in MEDIA_TYPES
+    )
+    return f"CASE {whens} ELSE 'Unknown' END"
+
+
+# 목록 정렬 기준 (최신 출시일 순, 동일 날짜는 ContentID 역순)
+# keyset 페이지네이션 커서도 이 순서를 따른다.
+LIST_ORDER = [
+    ("ReleaseDateRaw", "DESC", "date"),
+    ("ContentID", "DESC", "int"),
+]
+
+# 목록 화면 공통 SELECT 절
+_LIST_COLUMNS = f"""
+        c.ContentID, c.Title,
+        TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
+        c.ReleaseDate as ReleaseDateRaw,
+        p.Prodname, s.SName,
+        {_media_type_case("c.ContentID")} as MediaType,
+        cs.AvgRating,
+        NVL(cs.RatingCount, 0) as ReviewCount
+"""
+
+# 목록 화면 공통 FROM 절 (평점은 CONTENT_STATS 요약을 조인)
+_LIST_FROM = """
+        FROM CONTENT c
+        JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
+        LEFT JOIN SERIES s ON c.SID = s.SeriesID
+        LEFT JOIN CONTENT_STATS cs ON cs.CID = c.ContentID
+"""
+
 
 def _row_to_content_dict(row, columns) -> Dict[str, Any]:
     """
@@ -10,114 +58,345 @@ def _row_to_content_dict(row, columns) -> Dict[str, Any]:
     return dict(zip(columns, row))
 
 
-def search_by_title(conn, search_term: str) -> List[Dict[str, Any]]:
+def count_by_media_type(conn) -> Dict[str, int]:
     """
-    콘텐츠 제목으로 검색 (LIKE 검색)
-    
+    미디어 타입별 콘텐츠 수를 한 번의 GROUP BY 로 집계
+
+    Returns:
+        {'Movie': n, 'Video Game': n, 'Book': n}
+    """
+    media_type = _media_type_case("ContentID")
+    sql = f"""
+        SELECT {media_type} AS MediaType, COUNT(*)
+        FROM CONTENT
+        GROUP BY {media_type}
+    """
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    counts = {name: 0 for name, _, _ in MEDIA_TYPES}
+    for media_type, count in cursor.fetchall():
+        if media_type in counts:
+            counts[media_type] = count
+    cursor.close()
+    return counts
+
+
+def list_contents(
+    conn,
+    min_id: Optional[int] = None,
+    max_id: Optional[int] = None,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Page:
+    """
+    콘텐츠 목록 한 페이지 조회 (메인 / 테마별 목록)
+
     Args:
         conn: Oracle DB 연결 객체
-        search_term: 검색어 (콘텐츠 제목의 일부)
-    
+        min_id: ContentID 최소값 (테마 범위, 선택사항)
+        max_id: ContentID 최대값 (테마 범위, 선택사항)
+        page: 페이지 번호
+        per_page: 페이지당 개수
+        after: keyset 커서 (이전 페이지의 next_cursor)
+
     Returns:
-        검색된 콘텐츠 리스트
+        Page 객체
     """
-    cursor = conn.cursor()
-    
-    sql = """
-        SELECT c.ContentID, c.Title, 
-               TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-               p.Prodname, s.SName,
-               (SELECT ROUND(AVG(r.Rating), 1) FROM RATING r WHERE r.CID = c.ContentID) as AvgRating,
-               (SELECT COUNT(*) FROM RATING r WHERE r.CID = c.ContentID) as ReviewCount
-        FROM CONTENT c
-        JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-        LEFT JOIN SERIES s ON c.SID = s.SeriesID
-        WHERE UPPER(c.Title) LIKE UPPER('%' || :search_term || '%')
-        ORDER BY c.ReleaseDate DESC
+    sql = f"""
+        SELECT {_LIST_COLUMNS}
+        {_LIST_FROM}
     """
-    
-    cursor.execute(sql, {"search_term": search_term})
-    columns = [col[0].lower() for col in cursor.description]
-    cursor.rowfactory = lambda *args: dict(zip(columns, args))
-    results = cursor.fetchall()
-    cursor.close()
-    
-    return results
+    params = {}
+    if min_id is not None and max_id is not None:
+        sql += " WHERE c.ContentID >= :min_id AND c.ContentID <= :max_id"
+        params = {"min_id": min_id, "max_id": max_id}
 
+    return paginate(conn, sql, params, order_by=LIST_ORDER,
+                    page=page, per_page=per_page, after=after)
 
-def search_by_tag(conn, tag: str) -> List[Dict[str, Any]]:
+
+def get_contents_by_ids(conn, content_ids: List[int]) -> List[Dict[str, Any]]:
     """
-    태그로 콘텐츠 검색 (부분 일치, 대소문자 구분 없음)
-    
+    ID 목록으로 목록 화면용 행 조회 (검색 색인 결과의 현재 페이지만 읽을 때)
+
     Args:
         conn: Oracle DB 연결 객체
-        tag: 태그명 (부분 일치 검색)
-    
+        content_ids: ContentID 목록 (페이지 크기 이하)
+
     Returns:
-        검색된 콘텐츠 리스트
+        content_ids 순서대로 정렬된 dict 리스트 (그새 삭제된 콘텐츠는 빠짐)
     """
-    cursor = conn.cursor()
-    
-    sql = """
-        SELECT DISTINCT c.ContentID, c.Title, 
-               TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-               c.ReleaseDate as ReleaseDateRaw,
-               p.Prodname, s.SName,
-               (SELECT ROUND(AVG(r.Rating), 1) FROM RATING r WHERE r.CID = c.ContentID) as AvgRating,
-               (SELECT COUNT(*) FROM RATING r WHERE r.CID = c.ContentID) as ReviewCount
-        FROM CONTENT c
-        JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-        LEFT JOIN SERIES s ON c.SID = s.SeriesID
-        JOIN TAG_TO tt ON c.ContentID = tt.CID
-        JOIN TAG t ON tt.TCode = t.TagCode
-        WHERE UPPER(t.Tag) LIKE UPPER('%' || :tag || '%')
-        ORDER BY c.ReleaseDate DESC
+    if not content_ids:
+        return []
+
+    binds = {f"id{i}": cid for i, cid in enumerate(content_ids)}
+    placeholders = ", ".join(f":{name}" for name in binds)
+    sql = f"""
+        SELECT {_LIST_COLUMNS}
+        {_LIST_FROM}
+        WHERE c.ContentID IN ({placeholders})
     """
-    
-    cursor.execute(sql, {"tag": tag})
+    cursor = conn.cursor()
+    cursor.execute(sql, binds)
     columns = [col[0].lower() for col in cursor.description]
-    cursor.rowfactory = lambda *args: dict(zip(columns, args))
-    results = cursor.fetchall()
+    rows = {row[0]: _row_to_content_dict(row, columns) for row in cursor.fetchall()}
     cursor.close()
-    
-    return results
+    return [rows[cid] for cid in content_ids if cid in rows]
+
+
+def get_title_index_rows(conn, content_id: Optional[int] = None) -> List[tuple]:
+    """
+    제목 검색 색인용 (ContentID, Title, ReleaseDate) 조회
+
+    Args:
+        content_id: 주면 해당 콘텐츠 한 건만 (색인 부분 갱신용)
+    """
+    sql = "SELECT ContentID, Title, ReleaseDate FROM CONTENT"
+    params = {}
+    if content_id is not None:
+        sql += " WHERE ContentID = :cid"
+        params = {"cid": content_id}
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
 
+def get_tag_index_rows(conn, content_id: Optional[int] = None) -> List[tuple]:
+    """
+    태그 검색 색인용 TAG_TO (TCode, CID) 조회
 
-def search_by_title_and_tag(conn, search_term: str, tag: str) -> List[Dict[str, Any]]:
+    Args:
+        content_id: 주면 해당 콘텐츠의 연결만 (색인 부분 갱신용)
     """
-    제목과 태그를 모두 사용한 검색
+    sql = "SELECT TCode, CID FROM TAG_TO"
+    params = {}
+    if content_id is not None:
+        sql += " WHERE CID = :cid"
+        params = {"cid": content_id}
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def get_facet_rows(conn, content_id: Optional[int] = None) -> List[tuple]:
+    """
+    패싯 색인용 (ContentID, PID, ReleaseDate) 조회
+
+    Args:
+        content_id: 주면 해당 콘텐츠 한 건만 (색인 부분 갱신용)
+    """
+    sql = "SELECT ContentID, PID, ReleaseDate FROM CONTENT"
+    params = {}
+    if content_id is not None:
+        sql += " WHERE ContentID = :cid"
+        params = {"cid": content_id}
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def get_suggest_sources(conn) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    자동완성 트라이용 원본 (제목, 태그, 제작사, 시리즈와 각각의 가중치)
+
+    가중치: 제목은 리뷰 수, 태그/제작사/시리즈는 연결된 콘텐츠 수
+
+    Returns:
+        {'title': [...], 'tag': [...], 'producer': [...], 'series': [...]}
+        각 행은 {'id', 'text', 'weight'} (태그는 'category' 포함)
+    """
+    queries = [
+        (f"""
+            SELECT c.ContentID AS id, c.Title AS text, NVL(cs.RatingCount, 0) AS weight
+            FROM CONTENT c
+            LEFT JOIN {content_stats_dao.TABLE} cs ON cs.CID = c.ContentID
+        """, None),
+        ("""
+            SELECT t.TagCode AS id, t.Tag AS text, t.Category AS category, COUNT(tt.CID) AS weight
+            FROM TAG t
+            LEFT JOIN TAG_TO tt ON tt.TCode = t.TagCode
+            GROUP BY t.TagCode, t.Tag, t.Category
+        """, None),
+        ("""
+            SELECT p.ProdcoID AS id, p.Prodname AS text, COUNT(c.ContentID) AS weight
+            FROM PRODUCT_CO p
+            LEFT JOIN CONTENT c ON c.PID = p.ProdcoID
+            GROUP BY p.ProdcoID, p.Prodname
+        """, None),
+        ("""
+            SELECT s.SeriesID AS id, s.SName AS text, COUNT(c.ContentID) AS weight
+            FROM SERIES s
+            LEFT JOIN CONTENT c ON c.SID = s.SeriesID
+            GROUP BY s.SeriesID, s.SName
+        """, None),
+    ]
+    titles, tags, producers, series = db.fetch_batch(conn, queries)
+    return {"title": titles, "tag": tags, "producer": producers, "series": series}
+
+
+def search_by_title(
+    conn,
+    search_term: str,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Page:
+    """
+    콘텐츠 제목으로 검색 (LIKE 검색)
     
     Args:
         conn: Oracle DB 연결 객체
         search_term: 검색어 (콘텐츠 제목의 일부)
-        tag: 태그명 (부분 일치 검색)
+        page: 페이지 번호
+        per_page: 페이지당 개수
+        after: keyset 커서
     
     Returns:
-        검색된 콘텐츠 리스트
+        검색된 콘텐츠 Page
     """
-    cursor = conn.cursor()
-    
-    sql = """
-        SELECT DISTINCT c.ContentID, c.Title, 
-               TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
-               c.ReleaseDate as ReleaseDateRaw,
-               p.Prodname, s.SName,
-               (SELECT ROUND(AVG(r.Rating), 1) FROM RATING r WHERE r.CID = c.ContentID) as AvgRating,
-               (SELECT COUNT(*) FROM RATING r WHERE r.CID = c.ContentID) as ReviewCount
-        FROM CONTENT c
-        JOIN PRODUCT_CO p ON c.PID = p.ProdcoID
-        LEFT JOIN SERIES s ON c.SID = s.SeriesID
-        JOIN TAG_TO tt ON c.ContentID = tt.CID
-        JOIN TAG t ON tt.TCode = t.TagCode
+    sql = f"""
+        SELECT {_LIST_COLUMNS}
+        {_LIST_FROM}
         WHERE UPPER(c.Title) LIKE UPPER('%' || :search_term || '%')
-          AND UPPER(t.Tag) LIKE UPPER('%' || :tag || '%')
-        ORDER BY c.ReleaseDate DESC
     """
+    return paginate(conn, sql, {"search_term": search_term}, order_by=LIST_ORDER,
+                    page=page, per_page=per_page, after=after)
+
+
+def _tag_query_sql(node, params: Dict[str, Any]) -> str:
+    """
+    태그 검색식 구문 트리(app.search.query)를 EXISTS 조건식으로 변환
+    (항마다 EXISTS 하나 - 조인이 없으므로 DISTINCT 가 필요 없다)
+    """
+    op = node[0]
+    if op == "term":
+        name = f"tag{len(params)}"
+        params[name] = node[1]
+        return f"""EXISTS (
+            SELECT 1 FROM TAG_TO tt JOIN TAG t ON tt.TCode = t.TagCode
+            WHERE tt.CID = c.ContentID AND UPPER(t.Tag) LIKE UPPER('%' || :{name} || '%'))"""
+    if op == "not":
+        return f"NOT ({_tag_query_sql(node[1], params)})"
+    joiner = " AND " if op == "and" else " OR "
+    return "(" + joiner.join(_tag_query_sql(child, params) for child in node[1:]) + ")"
+
+
+def search_by_tag_query(
+    conn,
+    tag_query,
+    search_term: Optional[str] = None,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Page:
+    """
+    태그 검색식으로 콘텐츠 검색 (부분 일치, 대소문자 구분 없음)
+    메모리 검색 색인을 쓸 수 없을 때의 SQL 경로
     
-    cursor.execute(sql, {"search_term": search_term, "tag": tag})
-    columns = [col[0].lower() for col in cursor.description]
-    cursor.rowfactory = lambda *args: dict(zip(columns, args))
-    results = cursor.fetchall()
-    cursor.close()
+    Args:
+        conn: Oracle DB 연결 객체
+        tag_query: 태그 검색식 구문 트리 (app.search.parse_query 결과)
+        search_term: 검색어 (콘텐츠 제목의 일부, 선택사항)
+        page: 페이지 번호
+        per_page: 페이지당 개수
+        after: keyset 커서
     
-    return results
+    Returns:
+        검색된 콘텐츠 Page
+    """
+    params: Dict[str, Any] = {}
+    where = _tag_query_sql(tag_query, params)
+    if search_term:
+        where += " AND UPPER(c.Title) LIKE UPPER('%' || :search_term || '%')"
+        params["search_term"] = search_term
+
+    sql = f"""
+        SELECT {_LIST_COLUMNS}
+        {_LIST_FROM}
+        WHERE {where}
+    """
+    return paginate(conn, sql, params, order_by=LIST_ORDER,
+                    page=page, per_page=per_page, after=after)
+
+
+def get_content_detail(
+    conn,
+    content_id: int,
+    user_id: Optional[str] = None,
+    review_sort: str = review_dao.DEFAULT_REVIEW_SORT,
+    review_per_page: int = DEFAULT_PER_PAGE,
+    review_after: Optional[str] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    상세 페이지 데이터 일괄 조회
+    (콘텐츠, 카테고리별 태그, 구매처, 리뷰 통계, 리뷰 목록 첫 페이지, 내 리뷰를 한 번의 왕복으로)
+
+    Args:
+        conn: Oracle DB 연결 객체
+        content_id: 콘텐츠 ID
+        user_id: 로그인 사용자 ID (있으면 내 리뷰를 PK 로 조회)
+        review_sort: 리뷰 정렬 (top / highest / lowest)
+        review_per_page: 리뷰 페이지 크기
+        review_after: 리뷰 keyset 커서 ("더 보기")
+
+    Returns:
+        {'content', 'tag_codes', 'shops', 'stats', 'reviews', 'user_review'}
+        content 는 PID/SID 만 포함 (이름은 reference_service 로 채움),
+        reviews 는 Page 객체. 콘텐츠가 없으면 None
+    """
+    params = {"cid": content_id}
+    review_sql, review_bind, review_keyset, review_order = review_dao.build_content_reviews_query(
+        content_id, review_sort, review_per_page, review_after
+    )
+    queries = [
+        # 1. 콘텐츠 기본 정보 (제작사/시리즈 이름은 기준 정보 캐시에서)
+        ("""
+            SELECT c.ContentID, c.Title,
+                   TO_CHAR(c.ReleaseDate, 'YYYY-MM-DD') as ReleaseDate,
+                   c.PID, c.SID
+            FROM CONTENT c
+            WHERE c.ContentID = :cid
+        """, params),
+        # 2. 태그 코드 (이름/카테고리는 기준 정보 캐시에서)
+        ("SELECT TCode FROM TAG_TO WHERE CID = :cid", params),
+        # 3. 구매처 정보
+        ("SELECT MainURL, SubURL FROM SHOP WHERE CID = :cid ORDER BY MainURL", params),
+        # 4. 리뷰 통계 (CONTENT_STATS 요약)
+        (f"""
+            SELECT AvgRating, RatingCount as ReviewCount,
+                   Rating5, Rating4, Rating3, Rating2, Rating1
+            FROM {content_stats_dao.TABLE}
+            WHERE CID = :cid
+        """, params),
+        # 5. 리뷰 목록 (정렬별 top-N, keyset)
+        (review_sql, review_bind),
+    ]
+    if user_id:
+        # 6. 내 리뷰 (PK 조회)
+        queries.append(review_dao.build_member_review_query(user_id, content_id))
+
+    results = db.fetch_batch(conn, queries)
+    content_rows, tag_rows, shop_rows, stats_rows, review_rows = results[:5]
+    if not content_rows:
+        return None
+
+    stats = stats_rows[0] if stats_rows else dict(content_stats_dao.EMPTY_STATS)
+    reviews = make_page(review_rows, order_by=review_order, page=1, per_page=review_per_page,
+                        keyset_values=review_keyset, total=stats["reviewcount"])
+    user_review = results[5][0] if user_id and results[5] else None
+
+    return {
+        "content": content_rows[0],
+        "tag_codes": [row["tcode"] for row in tag_rows],
+        "shops": [{"main_url": row["mainurl"], "sub_url": row["suburl"]} for row in shop_rows],
+        "stats": stats,
+        "reviews": reviews,
+        "user_review": user_review,
+    }
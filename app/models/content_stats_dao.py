@@ -0,0 +1,229 @@
+# app/models/content_stats_dao.py
+# 콘텐츠별 평점 요약(CONTENT_STATS) DAO
+#
+# RATING 을 쓰는 모든 경로(리뷰 작성/수정/삭제, 관리자 삭제)는
+# 같은 트랜잭션 안에서 이 모듈의 RATING_CHANGE_PLSQL 조각(리뷰 쓰기 블록)이나 함수로 요약 행을 함께 갱신한다.
+# 목록/상세 화면은 RATING 집계 대신 이 요약을 조인한다.
+# ----------------------------------------------------
+
+from typing import Any, Dict, List, Tuple
+
+TABLE = "CONTENT_STATS"
+
+# 상세 페이지 템플릿이 기대하는 키 이름에 맞춘 SELECT 절
+_STATS_COLUMNS = """
+    AvgRating, RatingCount as ReviewCount,
+    Rating5, Rating4, Rating3, Rating2, Rating1
+"""
+
+EMPTY_STATS = {
+    "avgrating": None,
+    "reviewcount": 0,
+    "rating5": 0,
+    "rating4": 0,
+    "rating3": 0,
+    "rating2": 0,
+    "rating1": 0,
+}
+
+
+# 리뷰 쓰기 PL/SQL 블록(review_dao.WRITE_REVIEW_BLOCKS) 안에서 요약 행을 갱신하는 문장.
+# 블록은 v_old / v_new (없으면 NULL) 를 채우고 RATING_CHANGE_DECLARE 를 선언해야 한다.
+# 갱신된 리뷰 수와 평균은 RETURNING 으로 v_count / v_avg 에 담긴다.
+RATING_CHANGE_DECLARE = f"""
+    v_dcount  {TABLE}.RatingCount%TYPE;
+    v_dsum    {TABLE}.RatingSum%TYPE;
+    v_count   {TABLE}.RatingCount%TYPE;
+    v_avg     {TABLE}.AvgRating%TYPE;
+"""
+
+_HISTOGRAM_PLSQL = ",\n".join(
+    f"        Rating{i} = Rating{i} + CASE WHEN v_new = {i} THEN 1 ELSE 0 END"
+    f" - CASE WHEN v_old = {i} THEN 1 ELSE 0 END"
+    for i in range(1, 6)
+)
+_HISTOGRAM_VALUES_PLSQL = ", ".join(
+    f"CASE WHEN v_new = {i} THEN 1 ELSE 0 END" for i in range(1, 6)
+)
+
+_RATING_UPDATE_PLSQL = f"""
+    UPDATE {TABLE} SET
+        RatingCount = RatingCount + v_dcount,
+        RatingSum = RatingSum + v_dsum,
+        AvgRating = CASE WHEN RatingCount + v_dcount > 0
+                         THEN ROUND((RatingSum + v_dsum) / (RatingCount + v_dcount), 1)
+                    END,
+{_HISTOGRAM_PLSQL}
+    WHERE CID = :cid
+    RETURNING RatingCount, AvgRating INTO v_count, v_avg;"""
+
+# 요약 행이 없으면 INSERT 한다. 같은 콘텐츠의 첫 리뷰가 동시에 들어와 둘 다 INSERT 로 가면
+# 늦은 쪽은 DUP_VAL_ON_INDEX 를 받으므로, 그때는 먼저 들어간 행에 UPDATE 를 다시 적용한다.
+RATING_CHANGE_PLSQL = f"""
+    v_dcount := CASE WHEN v_new IS NOT NULL THEN 1 ELSE 0 END
+              - CASE WHEN v_old IS NOT NULL THEN 1 ELSE 0 END;
+    v_dsum := NVL(v_new, 0) - NVL(v_old, 0);
+{_RATING_UPDATE_PLSQL}
+
+    IF SQL%ROWCOUNT = 0 THEN
+        BEGIN
+            INSERT INTO {TABLE}
+                (CID, RatingCount, RatingSum, AvgRating, Rating1, Rating2, Rating3, Rating4, Rating5)
+            VALUES
+                (:cid, v_dcount, v_dsum,
+                 CASE WHEN v_dcount > 0 THEN ROUND(v_dsum / v_dcount, 1) END,
+                 {_HISTOGRAM_VALUES_PLSQL})
+            RETURNING RatingCount, AvgRating INTO v_count, v_avg;
+        EXCEPTION
+            WHEN DUP_VAL_ON_INDEX THEN
+{_RATING_UPDATE_PLSQL}
+        END;
+    END IF;
+"""
+
+
+def create_empty(conn, content_id: int) -> None:
+    """콘텐츠 등록 시 빈 요약 행 생성."""
+    cursor = conn.cursor()
+    cursor.execute(f"INSERT INTO {TABLE} (CID) VALUES (:cid)", {"cid": content_id})
+    cursor.close()
+
+
+def delete_stats(conn, content_id: int) -> None:
+    """콘텐츠 삭제 시 요약 행 삭제 (CONTENT 삭제 전에 호출)."""
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {TABLE} WHERE CID = :cid", {"cid": content_id})
+    cursor.close()
+
+
+def remove_member_ratings(conn, member_id: str) -> None:
+    """
+    회원 삭제 시 해당 회원의 리뷰들을 요약에서 한 번에 차감한다.
+    RATING 삭제 전에 호출해야 한다.
+    """
+    cursor = conn.cursor()
+    sql = f"""
+        MERGE INTO {TABLE} cs
+        USING (
+            SELECT CID,
+                   COUNT(*) AS cnt,
+                   SUM(Rating) AS sm,
+                   COUNT(CASE WHEN Rating = 1 THEN 1 END) AS r1,
+                   COUNT(CASE WHEN Rating = 2 THEN 1 END) AS r2,
+                   COUNT(CASE WHEN Rating = 3 THEN 1 END) AS r3,
+                   COUNT(CASE WHEN Rating = 4 THEN 1 END) AS r4,
+                   COUNT(CASE WHEN Rating = 5 THEN 1 END) AS r5
+            FROM RATING
+            WHERE MID = :mid
+            GROUP BY CID
+        ) d
+        ON (cs.CID = d.CID)
+        WHEN MATCHED THEN UPDATE SET
+            cs.RatingCount = cs.RatingCount - d.cnt,
+            cs.RatingSum = cs.RatingSum - d.sm,
+            cs.AvgRating = CASE WHEN cs.RatingCount - d.cnt > 0
+                                THEN ROUND((cs.RatingSum - d.sm) / (cs.RatingCount - d.cnt), 1)
+                           END,
+            cs.Rating1 = cs.Rating1 - d.r1,
+            cs.Rating2 = cs.Rating2 - d.r2,
+            cs.Rating3 = cs.Rating3 - d.r3,
+            cs.Rating4 = cs.Rating4 - d.r4,
+            cs.Rating5 = cs.Rating5 - d.r5
+    """
+    cursor.execute(sql, {"mid": member_id})
+    cursor.close()
+
+
+def get_stats(conn, content_id: int) -> Dict[str, Any]:
+    """상세 페이지용 평점 요약 조회 (행이 없으면 0으로 채운 dict)."""
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT {_STATS_COLUMNS} FROM {TABLE} WHERE CID = :cid", {"cid": content_id})
+    row = cursor.fetchone()
+    columns = [col[0].lower() for col in cursor.description]
+    cursor.close()
+
+    if not row:
+        return dict(EMPTY_STATS)
+    return dict(zip(columns, row))
+
+
+def get_popularity(conn) -> Dict[int, Tuple[int, float]]:
+    """
+    검색 순위용 전체 콘텐츠 인기도 {ContentID: (리뷰 수, 평균 평점)}
+    (리뷰가 없는 콘텐츠는 빠진다)
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"SELECT CID, RatingCount, NVL(AvgRating, 0) FROM {TABLE} WHERE RatingCount > 0")
+    popularity = {int(cid): (int(count), float(avg)) for cid, count, avg in cursor.fetchall()}
+    cursor.close()
+    return popularity
+
+
+# ----------------------------------------------------
+# 재구축 / 검증
+# ----------------------------------------------------
+_COMPUTED_SQL = """
+    SELECT c.ContentID AS CID,
+           COUNT(r.Rating) AS RatingCount,
+           NVL(SUM(r.Rating), 0) AS RatingSum,
+           ROUND(AVG(r.Rating), 1) AS AvgRating,
+           COUNT(CASE WHEN r.Rating = 1 THEN 1 END) AS Rating1,
+           COUNT(CASE WHEN r.Rating = 2 THEN 1 END) AS Rating2,
+           COUNT(CASE WHEN r.Rating = 3 THEN 1 END) AS Rating3,
+           COUNT(CASE WHEN r.Rating = 4 THEN 1 END) AS Rating4,
+           COUNT(CASE WHEN r.Rating = 5 THEN 1 END) AS Rating5
+    FROM CONTENT c
+    LEFT JOIN RATING r ON r.CID = c.ContentID
+    GROUP BY c.ContentID
+"""
+
+
+def rebuild(conn) -> int:
+    """
+    RATING 전체를 다시 집계해서 요약 테이블을 덮어쓴다.
+
+    Returns:
+        재구축된 행 수
+    """
+    cursor = conn.cursor()
+    cursor.execute(f"DELETE FROM {TABLE}")
+    cursor.execute(f"""
+        INSERT INTO {TABLE}
+            (CID, RatingCount, RatingSum, AvgRating, Rating1, Rating2, Rating3, Rating4, Rating5)
+        SELECT CID, RatingCount, RatingSum, AvgRating, Rating1, Rating2, Rating3, Rating4, Rating5
+        FROM ({_COMPUTED_SQL})
+    """)
+    count = cursor.rowcount
+    cursor.close()
+    return count
+
+
+def verify(conn) -> List[Dict[str, Any]]:
+    """
+    저장된 요약과 RATING 실제 집계를 비교한다.
+
+    Returns:
+        불일치 행 목록 (cid, 저장값, 실제값)
+    """
+    cursor = conn.cursor()
+    sql = f"""
+        SELECT NVL(a.CID, s.CID) AS CID,
+               s.RatingCount AS StoredCount, a.RatingCount AS ActualCount,
+               s.RatingSum AS StoredSum, a.RatingSum AS ActualSum,
+               s.AvgRating AS StoredAvg, a.AvgRating AS ActualAvg
+        FROM ({_COMPUTED_SQL}) a
+        FULL OUTER JOIN {TABLE} s ON s.CID = a.CID
+        WHERE s.CID IS NULL OR a.CID IS NULL
+           OR s.RatingCount <> a.RatingCount
+           OR s.RatingSum <> a.RatingSum
+           OR DECODE(s.AvgRating, a.AvgRating, 0, 1) = 1
+           OR s.Rating1 <> a.Rating1 OR s.Rating2 <> a.Rating2
+           OR s.Rating3 <> a.Rating3 OR s.Rating4 <> a.Rating4
+           OR s.Rating5 <> a.Rating5
+        ORDER BY 1
+    """
+    cursor.execute(sql)
+    columns = [col[0].lower() for col in cursor.description]
+    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
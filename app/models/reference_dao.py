@@ -0,0 +1,32 @@
+# app/models/reference_dao.py
+# 기준 정보(제작사, 시리즈, 태그) 전체 조회 DAO
+#
+# 세 테이블 모두 작고 거의 바뀌지 않으므로 reference_service 가
+# 프로세스 메모리에 통째로 올려두고 사용한다.
+# ----------------------------------------------------
+
+from typing import Any, Dict, List
+
+
+def _fetch_dicts(conn, sql: str) -> List[Dict[str, Any]]:
+    cursor = conn.cursor()
+    cursor.execute(sql)
+    columns = [col[0].lower() for col in cursor.description]
+    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+    cursor.close()
+    return rows
+
+
+def get_all_producers(conn) -> List[Dict[str, Any]]:
+    """전체 제작사 (최근 등록순)."""
+    return _fetch_dicts(conn, "SELECT ProdcoID, Prodname, ProdInfo FROM PRODUCT_CO ORDER BY ProdcoID DESC")
+
+
+def get_all_series(conn) -> List[Dict[str, Any]]:
+    """전체 시리즈 (이름순)."""
+    return _fetch_dicts(conn, "SELECT SeriesID, SName FROM SERIES ORDER BY SName")
+
+
+def get_all_tags(conn) -> List[Dict[str, Any]]:
+    """전체 태그 (카테고리, 태그명순)."""
+    return _fetch_dicts(conn, "SELECT TagCode, Category, Tag FROM TAG ORDER BY Category, Tag")
@@ -3,30 +3,192 @@
 #       def get_review_by_member()
 # ----------------------------------------------------
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.db import db
+from app.models import content_stats_dao
+from app.utils.pagination import Page, paginate, build_page_query, make_page, DEFAULT_PER_PAGE
 
 TABLE = "RATING"
 
+# 내 리뷰 목록 정렬 기준 (MID 고정이므로 CID 만으로 유일)
+MY_REVIEW_ORDER = [("CID", "DESC", "int")]
+
+# 상세 페이지 리뷰 목록 정렬 기준 (CID 고정이므로 MID 로 유일)
+# 각 정렬은 DBreset_table.sql 의 RATING_CID_*_IDX 인덱스 순서와 같다.
+REVIEW_SORTS = {
+    "top": [("LikesKey", "DESC", "int"), ("Rating", "DESC", "int"), ("MID", "ASC", "str")],
+    "highest": [("Rating", "DESC", "int"), ("LikesKey", "DESC", "int"), ("MID", "ASC", "str")],
+    "lowest": [("Rating", "ASC", "int"), ("LikesKey", "DESC", "int"), ("MID", "ASC", "str")],
+}
+DEFAULT_REVIEW_SORT = "top"
+
+
+# 리뷰 쓰기 PL/SQL 블록 (action 별로 DB 왕복 한 번에 RATING 과 CONTENT_STATS 를 함께 갱신)
+# - create: (MID, CID) PK 에 기대는 INSERT 전용 MERGE. 이미 있으면 'exists'
+#           (동시에 같은 키를 넣다가 ORA-00001 이 나도 'exists')
+# - update: 폼의 Version 이 그대로일 때만 UPDATE 하고 Version 을 올린다 (행 잠금은 UPDATE 동안만).
+#           Version 없이 온 수정은 기존 평점을 읽을 때부터 행을 잠근다.
+#           없으면 'missing', 그 사이 다른 수정이 있었으면 'conflict'
+# - delete: DELETE ... RETURNING 으로 기존 평점을 받는다. 없으면 'missing'
+# 요약 갱신 후 리뷰 수 / 평균을 :stat_count / :stat_avg 로 돌려준다.
+_WRITE_REVIEW_DECLARE = f"""
+DECLARE
+    v_old  {TABLE}.Rating%TYPE;
+    v_new  {TABLE}.Rating%TYPE;
+    v_rows PLS_INTEGER := 0;
+{content_stats_dao.RATING_CHANGE_DECLARE}"""
+
+_WRITE_REVIEW_RESULT = f"""
+{content_stats_dao.RATING_CHANGE_PLSQL}
+    :status := 'ok';
+    :old_rating := v_old;
+    :stat_count := v_count;
+    :stat_avg := v_avg;
+"""
 
-def insert_review(conn, member_id: str, content_id: int, rating: int, comment: str) -> None:
+WRITE_REVIEW_BLOCKS = {
+    "create": f"""{_WRITE_REVIEW_DECLARE}
+BEGIN
+    BEGIN
+        MERGE INTO {TABLE} r
+        USING (SELECT :mid AS MID, :cid AS CID FROM DUAL) src
+        ON (r.MID = src.MID AND r.CID = src.CID)
+        WHEN NOT MATCHED THEN INSERT (MID, CID, Rating, Comm, Likes)
+            VALUES (src.MID, src.CID, :rating, :comm, 0);
+        v_rows := SQL%ROWCOUNT;
+    EXCEPTION
+        WHEN DUP_VAL_ON_INDEX THEN
+            v_rows := 0;
+    END;
+    IF v_rows = 0 THEN
+        :status := 'exists';
+        RETURN;
+    END IF;
+    v_new := :rating;
+{_WRITE_REVIEW_RESULT}
+END;""",
+    "update": f"""{_WRITE_REVIEW_DECLARE}
+BEGIN
+    -- 폼을 열 때 읽은 Version 과 같을 때만 수정한다 (:version 이 NULL 이면 조건 없음).
+    -- 평점을 바꾸는 수정은 모두 Version 을 올리므로 여기서 읽은 평점이 곧 수정 직전 값이다.
+    -- Version 이 없으면 그 보장이 없으므로 행을 잠그고 읽는다 (동시 수정이 옛 평점으로 요약을 증감하지 않도록).
+    BEGIN
+        IF :version IS NULL THEN
+            SELECT Rating INTO v_old FROM {TABLE}
+            WHERE MID = :mid AND CID = :cid
+            FOR UPDATE;
+        ELSE
+            SELECT Rating INTO v_old FROM {TABLE}
+            WHERE MID = :mid AND CID = :cid AND Version = :version;
+        END IF;
+    EXCEPTION
+        WHEN NO_DATA_FOUND THEN
+            v_old := NULL;
+    END;
+    IF v_old IS NOT NULL THEN
+        UPDATE {TABLE} SET Rating = :rating, Comm = :comm, Version = Version + 1
+        WHERE MID = :mid AND CID = :cid
+          AND (:version IS NULL OR Version = :version)
+        RETURNING Version INTO :new_version;
+        v_rows := SQL%ROWCOUNT;
+    END IF;
+    IF v_rows = 0 THEN
+        SELECT COUNT(*) INTO v_rows FROM {TABLE} WHERE MID = :mid AND CID = :cid;
+        :status := CASE WHEN v_rows = 0 THEN 'missing' ELSE 'conflict' END;
+        RETURN;
+    END IF;
+    v_new := :rating;
+{_WRITE_REVIEW_RESULT}
+END;""",
+    "delete": f"""{_WRITE_REVIEW_DECLARE}
+BEGIN
+    DELETE FROM {TABLE}
+    WHERE MID = :mid AND CID = :cid
+    RETURNING Rating INTO v_old;
+    IF SQL%ROWCOUNT = 0 THEN
+        :status := 'missing';
+        RETURN;
+    END IF;
+{_WRITE_REVIEW_RESULT}
+END;""",
+}
+
+
+def write_review(conn, action: str, member_id: str, content_id: int,
+                 rating: Optional[int] = None, comment: Optional[str] = None,
+                 version: Optional[int] = None) -> Dict[str, Any]:
     """
-    새 리뷰 INSERT.
-    Likes는 0으로 시작.
+    리뷰 작성/수정/삭제와 평점 요약 갱신을 PL/SQL 블록 하나로 실행 (DB 왕복 1번).
+
+    Args:
+        action: 'create' / 'update' / 'delete'
+        rating, comment: create / update 일 때
+        version: update 일 때 폼을 열 때 읽은 Version (None 이면 확인하지 않고 행을 잠가 덮어씀)
+
+    Returns:
+        {'status', 'old_rating', 'reviewcount', 'avgrating', 'version'}
+        status 는 'ok', 'exists'(create 중복), 'missing'(update/delete 대상 없음),
+        'conflict'(update 중 Version 불일치). ok 가 아니면 나머지 값은 None.
+        version 은 update 후의 새 Version
+    """
+    cursor = conn.cursor()
+    out = {
+        "status": cursor.var(str),
+        "old_rating": cursor.var(int),
+        "stat_count": cursor.var(int),
+        "stat_avg": cursor.var(float),
+    }
+    params = {"mid": member_id, "cid": content_id, **out}
+    if action != "delete":
+        params["rating"] = rating
+        params["comm"] = comment if comment else None
+    new_version = None
+    if action == "update":
+        new_version = cursor.var(int)
+        params["version"] = version
+        params["new_version"] = new_version
+    cursor.execute(WRITE_REVIEW_BLOCKS[action], params)
+    cursor.close()
+
+    return {
+        "status": out["status"].getvalue(),
+        "old_rating": out["old_rating"].getvalue(),
+        "reviewcount": out["stat_count"].getvalue(),
+        "avgrating": out["stat_avg"].getvalue(),
+        "version": new_version.getvalue() if new_version is not None else None,
+    }
+
+
+def get_review_form(conn, member_id: str, content_id: int) -> Optional[Dict[str, Any]]:
+    """
+    리뷰 작성/수정 폼용 콘텐츠 제목과 내 리뷰를 한 번에 조회.
+
+    Returns:
+        {'content_id', 'title', 'rating', 'comment', 'version'} (리뷰가 없으면 rating 은 None),
+        콘텐츠가 없으면 None
     """
     cursor = conn.cursor()
     sql = f"""
-        INSERT INTO {TABLE} (MID, CID, Rating, Comm, Likes)
-        VALUES (:mid, :cid, :rating, :comm, 0)
+        SELECT c.ContentID, c.Title, r.Rating, r.Comm, r.Version
+        FROM CONTENT c
+        LEFT JOIN {TABLE} r ON r.CID = c.ContentID AND r.MID = :mid
+        WHERE c.ContentID = :cid
     """
-    cursor.execute(
-        sql,
-        {
-            "mid": member_id,
-            "cid": content_id,
-            "rating": rating,
-            "comm": comment if comment else None,
-        },
-    )
+    cursor.execute(sql, {"mid": member_id, "cid": content_id})
+    row = cursor.fetchone()
+    cursor.close()
+
+    if not row:
+        return None
+
+    return {
+        "content_id": row[0],
+        "title": row[1],
+        "rating": row[2],
+        "comment": row[3] if row[3] else "",
+        "version": row[4],
+    }
 
 
 def get_review_by_member_and_content(conn, member_id: str, content_id: int) -> Optional[Dict[str, Any]]:
@@ -57,7 +219,7 @@ def get_review_by_member_and_content(conn, member_id: str, content_id: int) -> O
 
 def get_review_for_update(conn, review_member_id: str, content_id: int) -> Optional[Dict[str, Any]]:
     """
-    좋아요 증가 시 동시성 제어용.
+    좋아요 증가 / 리뷰 수정·삭제 시 동시성 제어용.
     해당 리뷰 행에 SELECT ... FOR UPDATE로 락을 건다.
 
     Args:
@@ -66,7 +228,7 @@ def get_review_for_update(conn, review_member_id: str, content_id: int) -> Optio
     """
     cursor = conn.cursor()
     sql = f"""
-        SELECT MID, CID, Likes
+        SELECT MID, CID, Likes, Rating
         FROM {TABLE}
         WHERE MID = :mid AND CID = :cid
         FOR UPDATE
@@ -82,23 +244,90 @@ def get_review_for_update(conn, review_member_id: str, content_id: int) -> Optio
         "mid": row[0],
         "cid": row[1],
         "likes": row[2],
+        "rating": row[3],
     }
 
-def get_reviews_by_member(conn, member_id: str):
-    cursor = conn.cursor()
+def build_content_reviews_query(
+    content_id: int,
+    sort: str = DEFAULT_REVIEW_SORT,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+):
+    """
+    콘텐츠의 리뷰 목록 한 페이지(top-N) 조회 쿼리 생성.
+    전체 리뷰 수는 CONTENT_STATS 에 있으므로 COUNT(*) OVER() 없이 N+1 행만 읽는다.
+
+    Returns:
+        (sql, 바인드 변수, keyset 값, 정렬 정의)
+    """
+    order_by = REVIEW_SORTS.get(sort, REVIEW_SORTS[DEFAULT_REVIEW_SORT])
+    sql = f"""
+        SELECT r.Rating, r.Comm, r.Likes, NVL(r.Likes, 0) as LikesKey,
+               m.Name as MemberName, m.ID as MemberID, r.MID, r.CID
+        FROM {TABLE} r
+        JOIN MEMBER m ON r.MID = m.ID
+        WHERE r.CID = :cid
+    """
+    wrapped, bind, keyset_values = build_page_query(
+        sql, {"cid": content_id}, order_by=order_by,
+        per_page=per_page, after=after, count_total=False,
+    )
+    return wrapped, bind, keyset_values, order_by
+
+
+def get_content_review_page(
+    conn,
+    content_id: int,
+    sort: str = DEFAULT_REVIEW_SORT,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Page:
+    """
+    콘텐츠 리뷰 목록 한 페이지 조회 ("더 보기" 요청용).
+    리뷰 수(CONTENT_STATS)와 리뷰 페이지를 한 번의 왕복으로 가져온다.
+    """
+    sql, bind, keyset_values, order_by = build_content_reviews_query(content_id, sort, per_page, after)
+    stats_sql = f"SELECT RatingCount FROM {content_stats_dao.TABLE} WHERE CID = :cid"
+    stats_rows, rows = db.fetch_batch(conn, [(stats_sql, {"cid": content_id}), (sql, bind)])
+    total = stats_rows[0]["ratingcount"] if stats_rows else 0
+    return make_page(rows, order_by=order_by, page=1, per_page=per_page,
+                     keyset_values=keyset_values, total=total)
+
+
+def build_member_review_query(member_id: str, content_id: int):
+    """
+    상세 페이지에서 로그인 사용자의 리뷰를 PK(MID, CID)로 바로 찾는 쿼리.
+
+    Returns:
+        (sql, 바인드 변수)
+    """
+    sql = f"""
+        SELECT r.Rating, r.Comm, r.Likes,
+               m.Name as MemberName, m.ID as MemberID, r.MID, r.CID
+        FROM {TABLE} r
+        JOIN MEMBER m ON r.MID = m.ID
+        WHERE r.MID = :mid AND r.CID = :cid
+    """
+    return sql, {"mid": member_id, "cid": content_id}
+
+
+def get_reviews_by_member(
+    conn,
+    member_id: str,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Page:
+    """
+    특정 회원이 작성한 리뷰 목록 한 페이지 조회.
+    """
     sql = """
         SELECT r.MID, r.CID, r.Rating, r.Comm, r.Likes
         FROM RATING r
         WHERE r.MID = :mid
-        ORDER BY r.CID DESC
     """
-    cursor.execute(sql, {"mid": member_id})
-
-    columns = [col[0].lower() for col in cursor.description]
-    rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
-
-    cursor.close()
-    return rows
+    return paginate(conn, sql, {"mid": member_id}, order_by=MY_REVIEW_ORDER,
+                    page=page, per_page=per_page, after=after)
 
 
 
@@ -117,3 +346,170 @@ def update_likes(conn, review_member_id: str, content_id: int, new_likes: int) -
         {"likes": new_likes, "mid": review_member_id, "cid": content_id},
     )
     cursor.close()
+
+
+# 좋아요 기록 결과 (record_like / record_likes)
+LIKE_RECORDED = 1
+LIKE_DUPLICATE = 0
+LIKE_MISSING = -1
+
+# 좋아요 원장(REVIEW_LIKE) INSERT 와 Likes 증가를 한 블록에서 처리한다.
+# - 원장 PK (ActorID, MID, CID) 가 회원당 한 번만 허용 (DUP_VAL_ON_INDEX -> 0)
+# - 원장 FK 가 RATING 을 가리키므로 삭제된 리뷰면 ORA-02291 (-> -1)
+# executemany 로 여러 건을 보내도 행마다 따로 처리되고, 왕복은 한 번이다.
+LIKE_REVIEW_BLOCK = f"""
+    BEGIN
+        INSERT INTO REVIEW_LIKE (ActorID, MID, CID) VALUES (:actor, :mid, :cid);
+        UPDATE {TABLE}
+        SET Likes = NVL(Likes, 0) + 1
+        WHERE MID = :mid AND CID = :cid;
+        :liked := {LIKE_RECORDED};
+    EXCEPTION
+        WHEN DUP_VAL_ON_INDEX THEN
+            :liked := {LIKE_DUPLICATE};
+        WHEN OTHERS THEN
+            IF SQLCODE = -2291 THEN
+                :liked := {LIKE_MISSING};
+            ELSE
+                RAISE;
+            END IF;
+    END;
+"""
+
+
+def record_like(conn, actor_member_id: str, review_member_id: str, content_id: int) -> int:
+    """
+    좋아요 한 건 기록 (원장 INSERT + Likes 증가, DB 왕복 1번).
+
+    Returns:
+        LIKE_RECORDED / LIKE_DUPLICATE(이미 누름) / LIKE_MISSING(리뷰 없음)
+    """
+    cursor = conn.cursor()
+    liked_var = cursor.var(int)
+    cursor.execute(
+        LIKE_REVIEW_BLOCK,
+        {"actor": actor_member_id, "mid": review_member_id, "cid": content_id, "liked": liked_var},
+    )
+    liked = liked_var.getvalue()
+    cursor.close()
+    return liked
+
+
+def record_likes(conn, likes: List[Tuple[str, str, int]]) -> List[int]:
+    """
+    여러 좋아요를 배열 DML 한 번으로 기록 (좋아요 쓰기 지연 버퍼 반영용).
+
+    Args:
+        likes: (ActorID, MID, CID) 목록
+
+    Returns:
+        행별 결과 (likes 순서, LIKE_RECORDED / LIKE_DUPLICATE / LIKE_MISSING)
+    """
+    if not likes:
+        return []
+    cursor = conn.cursor()
+    liked_var = cursor.var(int, arraysize=len(likes))
+    cursor.setinputsizes(liked=liked_var)
+    cursor.executemany(
+        LIKE_REVIEW_BLOCK,
+        [{"actor": actor, "mid": mid, "cid": cid} for actor, mid, cid in likes],
+    )
+    results = [liked_var.getvalue(i) for i in range(len(likes))]
+    cursor.close()
+    return results
+
+
+def has_liked(conn, actor_member_id: str, review_member_id: str, content_id: int) -> bool:
+    """
+    원장(REVIEW_LIKE)에 이 회원의 좋아요가 있는지 (PK 조회)
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        "SELECT 1 FROM REVIEW_LIKE WHERE ActorID = :actor AND MID = :mid AND CID = :cid",
+        {"actor": actor_member_id, "mid": review_member_id, "cid": content_id},
+    )
+    row = cursor.fetchone()
+    cursor.close()
+    return row is not None
+
+
+def remove_member_likes(conn, member_id: str) -> int:
+    """
+    회원 삭제 전에 그 회원이 누른 좋아요를 리뷰들의 Likes 에서 뺀다.
+    (원장 행은 MEMBER 삭제 시 FK 로 연쇄 삭제되지만 Likes 카운터는 그대로 남기 때문)
+
+    Returns:
+        Likes 를 줄인 리뷰 수
+    """
+    cursor = conn.cursor()
+    cursor.execute(
+        f"""
+        UPDATE {TABLE}
+        SET Likes = GREATEST(NVL(Likes, 0) - 1, 0)
+        WHERE (MID, CID) IN (SELECT MID, CID FROM REVIEW_LIKE WHERE ActorID = :mid)
+        """,
+        {"mid": member_id},
+    )
+    count = cursor.rowcount
+    cursor.close()
+    return count
+
+
+def get_like_ledger_rows(conn) -> List[tuple]:
+    """
+    좋아요 원장 전체 (ActorID, MID, CID) 조회 (중복 좋아요 필터 구축용)
+    """
+    cursor = conn.cursor()
+    cursor.arraysize = 5000
+    cursor.execute("SELECT ActorID, MID, CID FROM REVIEW_LIKE")
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def get_review_index_rows(conn, member_id: Optional[str] = None, content_id: Optional[int] = None) -> List[tuple]:
+    """
+    리뷰 본문 색인용 (MID, CID, Comm) 조회 (본문이 있는 리뷰만)
+
+    Args:
+        member_id, content_id: 둘 다 주면 해당 리뷰 한 건만 (색인 부분 갱신용)
+    """
+    sql = f"SELECT MID, CID, Comm FROM {TABLE} WHERE Comm IS NOT NULL"
+    params = {}
+    if member_id is not None and content_id is not None:
+        sql += " AND MID = :mid AND CID = :cid"
+        params = {"mid": member_id, "cid": content_id}
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    rows = cursor.fetchall()
+    cursor.close()
+    return rows
+
+
+def get_reviews_by_keys(conn, keys: List[Tuple[str, int]]) -> List[Dict[str, Any]]:
+    """
+    (MID, CID) 목록의 리뷰를 한 번에 조회 (리뷰 검색 결과 페이지용)
+
+    Returns:
+        리뷰 dict 목록 (keys 순서)
+    """
+    if not keys:
+        return []
+    params: Dict[str, Any] = {}
+    pairs = []
+    for i, (member_id, content_id) in enumerate(keys):
+        pairs.append(f"(:mid{i}, :cid{i})")
+        params[f"mid{i}"] = member_id
+        params[f"cid{i}"] = content_id
+    sql = f"""
+        SELECT r.MID, r.CID, r.Rating, r.Comm, r.Likes, m.Name as MemberName
+        FROM {TABLE} r
+        JOIN MEMBER m ON r.MID = m.ID
+        WHERE (r.MID, r.CID) IN ({", ".join(pairs)})
+    """
+    cursor = conn.cursor()
+    cursor.execute(sql, params)
+    columns = [col[0].lower() for col in cursor.description]
+    rows = {(row["mid"], row["cid"]): row for row in (dict(zip(columns, r)) for r in cursor.fetchall())}
+    cursor.close()
+    return [rows[key] for key in keys if key in rows]
@@ -0,0 +1,43 @@
+"""
+콘텐츠 검색 색인 (메모리)
+
+    from app.search import search_index
+
+    ids = search_index.search_titles("젤다")      # 제목 n-gram 색인
+    keys = search_index.ordered(ids)              # (출시일, ContentID) DESC 정렬
+
+    node = parse_query("action AND (rpg OR strategy) NOT horror")   # 태그 검색식
+
+    suggester.suggest("ㅈㄷ")                      # 자동완성 (제목/태그/제작사/시리즈)
+
+    review_index.search("타격감 좋")               # 리뷰 본문 {(MID, CID)}
+
+create_app 에서 search_index / suggester / review_index 의 init_app(app) 으로 구축된다.
+"""
+from app.search.index import CONTENTS_TAG, TAGS_TAG, SearchIndex, search_index
+from app.search.review_index import REVIEWS_TAG, ReviewSearchIndex, review_index
+from app.search.query import QuerySyntaxError, canonical as canonical_query, parse as parse_query
+from app.search.spelling import SpellingIndex
+from app.search.suggest import Suggester, suggester
+from app.search.text import chosung, ngrams, normalize
+from app.search.title_index import TitleIndex
+
+__all__ = [
+    "CONTENTS_TAG",
+    "QuerySyntaxError",
+    "REVIEWS_TAG",
+    "ReviewSearchIndex",
+    "TAGS_TAG",
+    "SearchIndex",
+    "SpellingIndex",
+    "Suggester",
+    "TitleIndex",
+    "canonical_query",
+    "chosung",
+    "ngrams",
+    "normalize",
+    "parse_query",
+    "review_index",
+    "search_index",
+    "suggester",
+]
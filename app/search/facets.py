@@ -0,0 +1,94 @@
+"""
+패싯 검색용 콘텐츠 속성 열 (제작사, 출시 연도)
+
+속성 값마다 ContentID 비트맵을 들고 있다가, 후보 비트맵과 & 한 뒤
+bit_count 로 센다. 값 하나당 워드 단위 연산 한 번이므로 후보 수와 관계없이
+COUNT 쿼리 없이 모든 값의 건수를 한 번에 구한다.
+(미디어 타입은 ContentID 범위, 태그는 TagIndex 의 비트맵을 그대로 쓴다)
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.search import bitmap
+
+
+class FacetIndex:
+    """제작사 / 출시 연도별 ContentID 비트맵 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._producers: Dict[int, int] = {}
+        self._years: Dict[int, int] = {}
+        # ContentID -> (PID, 연도) (부분 갱신 시 이전 값 제거용)
+        self._by_content: Dict[int, Tuple[Optional[int], Optional[int]]] = {}
+
+    def __len__(self):
+        return len(self._by_content)
+
+    def build(self, rows: Iterable[Tuple[int, Optional[int], Optional[datetime]]]) -> None:
+        """
+        전체 재구축
+
+        Args:
+            rows: (ContentID, PID, ReleaseDate) 목록
+        """
+        fresh = FacetIndex()
+        for content_id, producer_id, release_date in rows:
+            fresh._add(int(content_id), producer_id, release_date)
+        with self._lock:
+            self._producers, self._years = fresh._producers, fresh._years
+            self._by_content = fresh._by_content
+
+    def _add(self, content_id: int, producer_id, release_date) -> None:
+        producer_id = int(producer_id) if producer_id is not None else None
+        year = release_date.year if release_date is not None else None
+        self._by_content[content_id] = (producer_id, year)
+        bit = 1 << content_id
+        if producer_id is not None:
+            self._producers[producer_id] = self._producers.get(producer_id, 0) | bit
+        if year is not None:
+            self._years[year] = self._years.get(year, 0) | bit
+
+    def _remove(self, content_id: int) -> None:
+        old = self._by_content.pop(content_id, None)
+        if old is None:
+            return
+        mask = ~(1 << content_id)
+        for column, value in ((self._producers, old[0]), (self._years, old[1])):
+            if value is None:
+                continue
+            bits = column.get(value, 0) & mask
+            if bits:
+                column[value] = bits
+            else:
+                column.pop(value, None)
+
+    def upsert(self, content_id: int, producer_id, release_date) -> None:
+        """콘텐츠 등록/수정 반영"""
+        with self._lock:
+            self._remove(int(content_id))
+            self._add(int(content_id), producer_id, release_date)
+
+    def remove(self, content_id: int) -> None:
+        """콘텐츠 삭제 반영"""
+        with self._lock:
+            self._remove(int(content_id))
+
+    def producer_bitmap(self, producer_id: int) -> int:
+        with self._lock:
+            return self._producers.get(int(producer_id), bitmap.EMPTY)
+
+    def year_bitmap(self, year: int) -> int:
+        with self._lock:
+            return self._years.get(int(year), bitmap.EMPTY)
+
+    def producer_counts(self, bits: int) -> Dict[int, int]:
+        """후보 비트맵 안에서 제작사별 콘텐츠 수 {PID: n}"""
+        with self._lock:
+            return bitmap.counts(self._producers, bits)
+
+    def year_counts(self, bits: int) -> Dict[int, int]:
+        """후보 비트맵 안에서 출시 연도별 콘텐츠 수 {연도: n}"""
+        with self._lock:
+            return bitmap.counts(self._years, bits)
@@ -0,0 +1,203 @@
+"""
+검색 색인 관리자 (구축 / 부분 갱신 / 최신 여부 확인)
+
+- 앱 시작 시 한 번 구축한다 (실패하면 첫 검색 때 다시 시도).
+- 제목 n-gram 색인(titles), 태그별 ContentID 비트맵(tags), 제작사/출시 연도별 비트맵(facets),
+  제목 단어 오타 교정 사전(words)을 함께 관리한다.
+- 관리자 콘텐츠 등록/수정/삭제, 태그 삭제는 커밋 후 refresh_content / refresh_tag_removed 로
+  그 자리에서 반영한다.
+- 다른 워커의 변경은 캐시 태그 CONTENTS_TAG 의 버전으로 감지해서 재구축한다
+  (CACHE_BACKEND=shared 일 때 워커 간 공유). SEARCH_INDEX_MAX_AGE 초가 지나도 재구축한다.
+"""
+import threading
+import time
+from typing import List, Optional, Set, Tuple
+
+from app.cache import cache
+from app.db import db
+from app.models import content_dao
+from app.search import bitmap, query
+from app.search.facets import FacetIndex
+from app.search.spelling import SpellingIndex
+from app.search.tag_index import TagIndex
+from app.search.text import normalize
+from app.search.title_index import TitleIndex
+
+# 콘텐츠 변경 시 무효화하는 캐시 태그
+CONTENTS_TAG = "contents"
+# 태그 사전(TAG) 변경 시 무효화하는 캐시 태그
+TAGS_TAG = "tags"
+
+
+class SearchIndex:
+    def __init__(self):
+        self.titles = TitleIndex()
+        self.tags = TagIndex()
+        self.facets = FacetIndex()
+        self.words = SpellingIndex()
+        self.max_age = 0
+        self._built_at: Optional[float] = None
+        self._version: Optional[int] = None
+        self._build_lock = threading.Lock()
+
+    def init_app(self, app):
+        """Flask 앱 초기화 시 색인을 구축합니다 (SEARCH_INDEX_ON_STARTUP)."""
+        self.max_age = int(app.config.get("SEARCH_INDEX_MAX_AGE", 0))
+        app.extensions["search_index"] = self
+
+        if not app.config.get("SEARCH_INDEX_ON_STARTUP", True):
+            return
+        try:
+            self.rebuild()
+            print(f"✅ Search index built ({len(self.titles)} titles, {len(self.tags)} tags)")
+        except Exception as e:
+            # DB 가 아직 준비되지 않았으면 첫 검색 때 다시 구축
+            print(f"⚠️  Search index build skipped: {e}")
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at is not None
+
+    def _current_version(self) -> int:
+        return cache.backend.tag_versions([CONTENTS_TAG])[CONTENTS_TAG]
+
+    @staticmethod
+    def _load(conn):
+        return (
+            content_dao.get_title_index_rows(conn),
+            content_dao.get_tag_index_rows(conn),
+            content_dao.get_facet_rows(conn),
+        )
+
+    def rebuild(self, conn=None) -> None:
+        """
+        DB 에서 전체 재구축
+
+        Args:
+            conn: 사용할 연결 (없으면 풀에서 잠시 빌린다 - 요청 밖에서도 호출 가능)
+        """
+        with self._build_lock:
+            version = self._current_version()
+            if conn is not None:
+                title_rows, tag_rows, facet_rows = self._load(conn)
+            else:
+                if db.pool is None:
+                    raise RuntimeError("DB pool is not initialized.")
+                with db.pool.acquire() as own_conn:
+                    title_rows, tag_rows, facet_rows = self._load(own_conn)
+            self.titles.build(title_rows)
+            self.tags.build(tag_rows)
+            self.facets.build(facet_rows)
+            self.words = SpellingIndex.from_texts(normalize(title) for _, title, _ in title_rows)
+            self._version = version
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self) -> bool:
+        """
+        색인이 없거나 낡았으면 재구축한다.
+
+        Returns:
+            색인을 쓸 수 있으면 True (재구축 실패 시 False - 호출자는 SQL 검색으로 대체)
+        """
+        stale = not self.ready or self._version != self._current_version()
+        if not stale and self.max_age > 0:
+            stale = time.monotonic() - self._built_at > self.max_age
+        if not stale:
+            return True
+
+        try:
+            self.rebuild(db.get_db())
+            return True
+        except Exception as e:
+            print(f"검색 색인 재구축 실패: {e}")
+            return self.ready
+
+    def refresh_content(self, content_id, deleted: bool = False, conn=None) -> None:
+        """
+        콘텐츠 한 건의 변경을 색인에 반영 (관리자 등록/수정/삭제 커밋 후 호출)
+
+        다른 워커와 검색 결과 캐시가 알 수 있도록 CONTENTS_TAG 도 무효화한다.
+        """
+        content_id = int(content_id)
+        try:
+            rows = None
+            if not deleted:
+                conn = conn or db.get_db()
+                rows = content_dao.get_title_index_rows(conn, content_id)
+            if rows:
+                self.titles.upsert(*rows[0])
+                # 지워진 단어는 다음 전체 재구축 때 빠진다
+                self.words.add_text(normalize(rows[0][1]))
+                self.tags.set_content_tags(
+                    content_id, [tcode for tcode, _ in content_dao.get_tag_index_rows(conn, content_id)]
+                )
+                for row in content_dao.get_facet_rows(conn, content_id):
+                    self.facets.upsert(*row)
+            else:
+                self.titles.remove(content_id)
+                self.tags.remove_content(content_id)
+                self.facets.remove(content_id)
+        except Exception as e:
+            # 부분 갱신에 실패하면 다음 검색 때 전체 재구축
+            print(f"검색 색인 갱신 실패 (CID={content_id}): {e}")
+            self._version = None
+            cache.invalidate_tags(CONTENTS_TAG)
+            return
+
+        self._mark_changed()
+
+    def refresh_tag_removed(self, tag_code) -> None:
+        """태그 삭제 반영 (관리자 태그 삭제 커밋 후 호출)"""
+        self.tags.remove_tag(int(tag_code))
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        """CONTENTS_TAG 를 무효화하고, 이 워커의 색인은 최신으로 표시"""
+        was_current = self._version == self._current_version()
+        cache.invalidate_tags(CONTENTS_TAG)
+        if was_current:
+            # 이 워커의 색인은 방금 반영했으므로 최신
+            self._version = self._current_version()
+
+    # ----------------------------------------------------
+    # 조회
+    # ----------------------------------------------------
+    def search_titles(self, term: str) -> Optional[Set[int]]:
+        """제목 검색 후보 ContentID 집합 (색인을 쓸 수 없으면 None)"""
+        if not self.ensure_fresh():
+            return None
+        return self.titles.search(term)
+
+    def title_bitmap(self, term: str) -> int:
+        """제목에 term 이 들어간 콘텐츠 비트맵 (ensure_fresh 이후 호출)"""
+        return bitmap.from_ids(self.titles.search(term))
+
+    def tag_bitmap(self, tag_codes) -> int:
+        """태그 코드들 중 하나라도 달린 콘텐츠 비트맵 (ensure_fresh 이후 호출)"""
+        return self.tags.bitmap_for(tag_codes)
+
+    def query_bitmap(self, node, term_bitmap) -> int:
+        """
+        태그 검색식(app.search.query 구문 트리)을 비트맵 연산으로 평가 (ensure_fresh 이후 호출)
+
+        Args:
+            term_bitmap: 태그 항 -> 콘텐츠 비트맵
+        """
+        return query.evaluate(node, term_bitmap, self.titles.universe())
+
+    def correct_title(self, term: str, deadline: Optional[float] = None) -> Optional[str]:
+        """
+        제목 검색어 오타 교정 (ensure_fresh 이후 호출)
+
+        Returns:
+            제목 단어 사전 기준으로 교정한 검색어 (바뀐 것이 없으면 None)
+        """
+        return self.words.correct(normalize(term), deadline)
+
+    def ordered(self, content_ids) -> List[Tuple]:
+        """목록 순서(출시일 DESC, ContentID DESC)의 정렬 키 목록"""
+        return self.titles.ordered(content_ids)
+
+
+# 싱글톤 인스턴스
+search_index = SearchIndex()
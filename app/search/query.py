@@ -0,0 +1,241 @@
+"""
+태그 검색식 파서 / 평가기
+
+문법 (키워드는 대소문자 무시):
+    expr    := or_expr
+    or_expr := and_expr ("OR" and_expr)*
+    and_expr:= not_expr (["AND"] not_expr)*      # 나란히 쓴 항은 AND
+    not_expr:= "NOT" not_expr | atom
+    atom    := TERM | '"' 여러 단어 '"' | "(" expr ")"
+
+예)  action AND (rpg OR strategy) NOT horror
+     "action rpg" OR 퍼즐
+
+연산자/괄호/따옴표가 하나도 없는 입력("Action RPG")은 예전처럼
+태그 이름 부분 문자열 하나로 취급한다.
+
+노드는 튜플로 표현한다: ('term', 문자열), ('and', a, b), ('or', a, b), ('not', a)
+"""
+import re
+from typing import Callable, Dict, List, Tuple
+
+from app.search.text import normalize
+
+# 검색식 하나에 허용하는 최대 항 수
+MAX_TERMS = 20
+
+_TOKEN = re.compile(r'\(|\)|"[^"]*"?|[^\s()"]+')
+_KEYWORDS = {"AND", "OR", "NOT"}
+
+Node = Tuple
+
+
+class QuerySyntaxError(ValueError):
+    """검색식 문법 오류 (메시지는 사용자에게 그대로 보여준다)"""
+    pass
+
+
+def _tokenize(text: str) -> List[Tuple[str, str]]:
+    tokens = []
+    for raw in _TOKEN.findall(text):
+        if raw in ("(", ")"):
+            tokens.append((raw, raw))
+        elif raw.startswith('"'):
+            if len(raw) < 2 or not raw.endswith('"'):
+                raise QuerySyntaxError("따옴표가 닫히지 않았습니다.")
+            phrase = raw[1:-1].strip()
+            if phrase:
+                tokens.append(("term", phrase))
+        elif raw.upper() in _KEYWORDS:
+            tokens.append((raw.upper(), raw))
+        else:
+            tokens.append(("term", raw))
+    return tokens
+
+
+def is_boolean(text: str) -> bool:
+    """연산자, 괄호, 따옴표가 들어간 검색식인지"""
+    return any(kind != "term" for kind, _ in _tokenize(text)) or '"' in text
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+        self.terms = 0
+
+    def peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def take(self):
+        token = self.tokens[self.pos]
+        self.pos += 1
+        return token
+
+    def parse(self) -> Node:
+        if not self.tokens:
+            raise QuerySyntaxError("검색식이 비어 있습니다.")
+        node = self.or_expr()
+        if self.pos < len(self.tokens):
+            raise QuerySyntaxError(f"'{self.tokens[self.pos][1]}' 근처의 검색식을 해석할 수 없습니다.")
+        return node
+
+    def or_expr(self) -> Node:
+        node = self.and_expr()
+        while self.peek() == "OR":
+            self.take()
+            node = ("or", node, self.and_expr())
+        return node
+
+    def and_expr(self) -> Node:
+        node = self.not_expr()
+        while self.peek() in ("AND", "NOT", "term", "("):
+            if self.peek() == "AND":
+                self.take()
+            node = ("and", node, self.not_expr())
+        return node
+
+    def not_expr(self) -> Node:
+        if self.peek() == "NOT":
+            self.take()
+            return ("not", self.not_expr())
+        return self.atom()
+
+    def atom(self) -> Node:
+        kind = self.peek()
+        if kind == "term":
+            self.terms += 1
+            if self.terms > MAX_TERMS:
+                raise QuerySyntaxError(f"검색식의 태그는 {MAX_TERMS}개까지 사용할 수 있습니다.")
+            return ("term", self.take()[1])
+        if kind == "(":
+            self.take()
+            node = self.or_expr()
+            if self.peek() != ")":
+                raise QuerySyntaxError("괄호가 닫히지 않았습니다.")
+            self.take()
+            return node
+        if kind is None:
+            raise QuerySyntaxError("검색식이 연산자로 끝났습니다.")
+        raise QuerySyntaxError(f"'{self.tokens[self.pos][1]}' 앞에 태그가 필요합니다.")
+
+
+def parse(text: str) -> Node:
+    """
+    태그 검색식을 구문 트리로 변환
+
+    Raises:
+        QuerySyntaxError: 문법 오류
+    """
+    text = (text or "").strip()
+    if not is_boolean(text):
+        if not text:
+            raise QuerySyntaxError("검색식이 비어 있습니다.")
+        return ("term", text)
+    return _Parser(_tokenize(text)).parse()
+
+
+def canonical(node: Node) -> str:
+    """
+    캐시 키용 정규 문자열 (대소문자/공백/키워드 표기 차이를 없앤다)
+    예) 'Action and  RPG' -> '("action" AND "rpg")'
+    """
+    op = node[0]
+    if op == "term":
+        return '"' + normalize(node[1]) + '"'
+    if op == "not":
+        return "NOT " + canonical(node[1])
+    return "(" + f" {op.upper()} ".join(canonical(child) for child in node[1:]) + ")"
+
+
+def terms(node: Node) -> List[str]:
+    """구문 트리에 들어 있는 태그 항 목록 (중복 제거, 등장 순서)"""
+    found: List[str] = []
+
+    def walk(n):
+        if n[0] == "term":
+            if n[1] not in found:
+                found.append(n[1])
+        else:
+            for child in n[1:]:
+                walk(child)
+
+    walk(node)
+    return found
+
+
+def positive_terms(node: Node) -> List[str]:
+    """NOT 아래에 있지 않은 태그 항 목록 (검색 순위의 태그 겹침 계산용)"""
+    found: List[str] = []
+
+    def walk(n, negated):
+        if n[0] == "term":
+            if not negated and n[1] not in found:
+                found.append(n[1])
+        else:
+            for child in n[1:]:
+                walk(child, negated != (n[0] == "not"))
+
+    walk(node, False)
+    return found
+
+
+def replace_terms(node: Node, mapping: Dict[str, str]) -> Node:
+    """태그 항을 mapping 에 따라 바꾼 새 구문 트리 (오타 교정용)"""
+    if node[0] == "term":
+        return ("term", mapping.get(node[1], node[1]))
+    return (node[0],) + tuple(replace_terms(child, mapping) for child in node[1:])
+
+
+# 연산자 결합 순위 (높을수록 먼저)
+_PRECEDENCE = {"or": 1, "and": 2, "not": 3, "term": 4}
+
+
+def to_text(node: Node) -> str:
+    """
+    구문 트리를 다시 검색식 문자열로 (parse 와 왕복 가능)
+    예) ('and', ('term', 'action'), ('or', ('term', 'rpg'), ('term', 'open world')))
+        -> 'action AND (rpg OR "open world")'
+    """
+    if node[0] == "term":
+        # 연산자 없는 단일 항은 띄어쓰기가 있어도 그대로 (parse 가 한 항으로 본다)
+        return node[1]
+
+    def render(n, parent_precedence):
+        op = n[0]
+        if op == "term":
+            text = n[1]
+            return f'"{text}"' if " " in text or text.upper() in _KEYWORDS else text
+        if op == "not":
+            text = "NOT " + render(n[1], _PRECEDENCE["not"])
+        else:
+            text = f" {op.upper()} ".join(render(child, _PRECEDENCE[op]) for child in n[1:])
+        return f"({text})" if _PRECEDENCE[op] < parent_precedence else text
+
+    return render(node, 0)
+
+
+def evaluate(node: Node, term_bitmap: Callable[[str], int], universe: int) -> int:
+    """
+    구문 트리를 ContentID 비트맵 연산으로 평가
+
+    Args:
+        term_bitmap: 태그 항 -> 해당 콘텐츠 비트맵
+        universe: 전체 콘텐츠 비트맵 (NOT 의 기준)
+    """
+    memo: Dict[str, int] = {}
+
+    def ev(n) -> int:
+        op = n[0]
+        if op == "term":
+            if n[1] not in memo:
+                memo[n[1]] = term_bitmap(n[1])
+            return memo[n[1]]
+        if op == "and":
+            left = ev(n[1])
+            return left & ev(n[2]) if left else 0
+        if op == "or":
+            return ev(n[1]) | ev(n[2])
+        return universe & ~ev(n[1])
+
+    return ev(node)
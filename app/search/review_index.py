@@ -0,0 +1,255 @@
+"""
+리뷰 본문(RATING.Comm) 역색인
+
+UPPER(Comm) LIKE '%단어%' 는 RATING 전체를 훑는다. 이 색인은 리뷰 본문의
+2-gram(1글자 검색용 1-gram 포함)별로 리뷰 키 (MID, CID) 집합을 들고 있다가,
+검색어의 단어마다 n-gram 교집합으로 후보를 좁힌 뒤 본문에 단어가 실제로
+들어 있는지 확인한다. 단어가 여러 개면 모두 들어 있는 리뷰만 (AND).
+
+- 리뷰 작성/수정/삭제는 review_service 가 커밋 후 put_review / remove_review 로 반영한다.
+- 다른 워커의 변경은 캐시 태그 REVIEWS_TAG 의 버전으로 감지해서 재구축한다.
+  SEARCH_INDEX_MAX_AGE 초가 지나도 재구축한다.
+"""
+import threading
+import time
+from typing import Dict, Iterable, Optional, Set, Tuple
+
+from app.cache import cache
+from app.db import db
+from app.models import review_dao
+from app.search.text import NGRAM_SIZE, ngrams, normalize
+
+# 리뷰 작성/수정/삭제 시 무효화하는 캐시 태그
+REVIEWS_TAG = "reviews"
+
+ReviewKey = Tuple[str, int]
+
+
+class ReviewTextIndex:
+    """리뷰 본문 n-gram 역색인 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[ReviewKey, str] = {}
+        self._grams: Dict[str, Set[ReviewKey]] = {}
+        self._chars: Dict[str, Set[ReviewKey]] = {}
+
+    def __len__(self):
+        return len(self._docs)
+
+    def build(self, rows: Iterable[Tuple[str, int, Optional[str]]]) -> None:
+        """
+        전체 재구축 (새 색인을 만든 뒤 한 번에 교체)
+
+        Args:
+            rows: (MID, CID, Comm) 목록
+        """
+        fresh = ReviewTextIndex()
+        for member_id, content_id, comment in rows:
+            fresh._add((member_id, int(content_id)), comment)
+        with self._lock:
+            self._docs, self._grams, self._chars = fresh._docs, fresh._grams, fresh._chars
+
+    def _add(self, key: ReviewKey, comment: Optional[str]) -> None:
+        text = normalize(comment or "")
+        if not text:
+            return
+        self._docs[key] = text
+        for gram in ngrams(text):
+            self._grams.setdefault(gram, set()).add(key)
+        for char in set(text):
+            self._chars.setdefault(char, set()).add(key)
+
+    def _remove(self, key: ReviewKey) -> None:
+        text = self._docs.pop(key, None)
+        if text is None:
+            return
+        for postings, grams in ((self._grams, ngrams(text)), (self._chars, set(text))):
+            for gram in grams:
+                keys = postings.get(gram)
+                if keys is not None:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[gram]
+
+    def upsert(self, member_id: str, content_id: int, comment: Optional[str]) -> None:
+        """리뷰 작성/수정 반영 (본문이 비어 있으면 색인에서 뺀다)"""
+        key = (member_id, int(content_id))
+        with self._lock:
+            self._remove(key)
+            self._add(key, comment)
+
+    def remove(self, member_id: str, content_id: int) -> None:
+        with self._lock:
+            self._remove((member_id, int(content_id)))
+
+    def remove_where(self, member_id: Optional[str] = None, content_id: Optional[int] = None) -> None:
+        """회원 탈퇴 / 콘텐츠 삭제로 지워진 리뷰들 반영"""
+        with self._lock:
+            keys = [
+                key for key in self._docs
+                if (member_id is None or key[0] == member_id)
+                and (content_id is None or key[1] == int(content_id))
+            ]
+            for key in keys:
+                self._remove(key)
+
+    def _word_candidates(self, word: str) -> Set[ReviewKey]:
+        if len(word) == 1:
+            return set(self._chars.get(word, ()))
+
+        postings = []
+        for gram in ngrams(word, NGRAM_SIZE):
+            keys = self._grams.get(gram)
+            if not keys:
+                return set()
+            postings.append(keys)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for keys in postings[1:]:
+            candidates &= keys
+            if not candidates:
+                break
+        return candidates
+
+    def search(self, query: str) -> Set[ReviewKey]:
+        """
+        본문에 검색어의 모든 단어가 들어 있는 리뷰 키 (MID, CID) 집합 (대소문자 무시)
+        """
+        words = sorted(set(normalize(query).split()), key=len, reverse=True)
+        if not words:
+            return set()
+
+        with self._lock:
+            # 긴 단어일수록 후보가 적으므로 먼저
+            candidates: Optional[Set[ReviewKey]] = None
+            for word in words:
+                found = self._word_candidates(word)
+                candidates = found if candidates is None else candidates & found
+                if not candidates:
+                    return set()
+            return {
+                key for key in candidates
+                if all(word in self._docs[key] for word in words)
+            }
+
+
+class ReviewSearchIndex:
+    """리뷰 본문 색인 관리자 (구축 / 부분 갱신 / 최신 여부 확인)"""
+
+    def __init__(self):
+        self.texts = ReviewTextIndex()
+        self.max_age = 0
+        self._built_at: Optional[float] = None
+        self._version: Optional[int] = None
+        self._build_lock = threading.Lock()
+
+    def init_app(self, app):
+        """Flask 앱 초기화 시 색인을 구축합니다 (SEARCH_INDEX_ON_STARTUP)."""
+        self.max_age = int(app.config.get("SEARCH_INDEX_MAX_AGE", 0))
+        app.extensions["review_index"] = self
+
+        if not app.config.get("SEARCH_INDEX_ON_STARTUP", True):
+            return
+        try:
+            self.rebuild()
+            print(f"✅ Review index built ({len(self.texts)} reviews)")
+        except Exception as e:
+            print(f"⚠️  Review index build skipped: {e}")
+
+    @property
+    def ready(self) -> bool:
+        return self._built_at is not None
+
+    def _current_version(self) -> int:
+        return cache.backend.tag_versions([REVIEWS_TAG])[REVIEWS_TAG]
+
+    def rebuild(self, conn=None) -> None:
+        """
+        DB 에서 전체 재구축
+
+        Args:
+            conn: 사용할 연결 (없으면 풀에서 잠시 빌린다)
+        """
+        with self._build_lock:
+            version = self._current_version()
+            if conn is not None:
+                rows = review_dao.get_review_index_rows(conn)
+            else:
+                if db.pool is None:
+                    raise RuntimeError("DB pool is not initialized.")
+                with db.pool.acquire() as own_conn:
+                    rows = review_dao.get_review_index_rows(own_conn)
+            self.texts.build(rows)
+            self._version = version
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self) -> bool:
+        """
+        색인이 없거나 낡았으면 재구축한다.
+
+        Returns:
+            색인을 쓸 수 있으면 True
+        """
+        stale = not self.ready or self._version != self._current_version()
+        if not stale and self.max_age > 0:
+            stale = time.monotonic() - self._built_at > self.max_age
+        if not stale:
+            return True
+
+        try:
+            self.rebuild(db.get_db())
+            return True
+        except Exception as e:
+            print(f"리뷰 색인 재구축 실패: {e}")
+            return self.ready
+
+    def refresh_review(self, member_id: str, content_id, conn=None) -> None:
+        """
+        리뷰 한 건의 작성/수정을 색인에 반영 (커밋 후 호출)
+        """
+        try:
+            conn = conn or db.get_db()
+            rows = review_dao.get_review_index_rows(conn, member_id, int(content_id))
+            if rows:
+                self.texts.upsert(*rows[0])
+            else:
+                self.texts.remove(member_id, content_id)
+        except Exception as e:
+            print(f"리뷰 색인 갱신 실패 (MID={member_id}, CID={content_id}): {e}")
+            self._version = None
+            cache.invalidate_tags(REVIEWS_TAG)
+            return
+        self._mark_changed()
+
+    def put_review(self, member_id: str, content_id, comment: Optional[str]) -> None:
+        """방금 쓴 본문으로 리뷰 한 건을 반영 (커밋 후 호출, DB 를 다시 읽지 않는다)"""
+        self.texts.upsert(member_id, content_id, comment)
+        self._mark_changed()
+
+    def remove_review(self, member_id: str, content_id) -> None:
+        """리뷰 삭제 반영 (커밋 후 호출)"""
+        self.texts.remove(member_id, content_id)
+        self._mark_changed()
+
+    def remove_reviews_of(self, member_id: Optional[str] = None, content_id=None) -> None:
+        """회원 탈퇴 / 콘텐츠 삭제로 함께 지워진 리뷰 반영 (커밋 후 호출)"""
+        self.texts.remove_where(member_id, content_id)
+        self._mark_changed()
+
+    def _mark_changed(self) -> None:
+        """REVIEWS_TAG 를 무효화하고, 이 워커의 색인은 최신으로 표시"""
+        was_current = self._version == self._current_version()
+        cache.invalidate_tags(REVIEWS_TAG)
+        if was_current:
+            self._version = self._current_version()
+
+    def search(self, query: str) -> Optional[Set[ReviewKey]]:
+        """검색어의 모든 단어가 본문에 들어 있는 리뷰 키 집합 (색인을 쓸 수 없으면 None)"""
+        if not self.ensure_fresh():
+            return None
+        return self.texts.search(query)
+
+
+# 싱글톤 인스턴스
+review_index = ReviewSearchIndex()
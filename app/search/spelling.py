@@ -0,0 +1,148 @@
+"""
+오타 교정 사전 (SymSpell 방식 삭제 사전)
+
+단어마다 글자를 최대 max_distance 개 지운 변형들을 미리 색인해 두고,
+검색어도 같은 방식으로 지운 변형을 만들어 겹치는 단어만 후보로 본다.
+후보에 대해서만 실제 편집 거리(인접 글자 바꿈 포함)를 계산하므로
+사전 전체를 훑지 않는다. 긴 단어는 앞 prefix_length 글자로만 변형을 만든다.
+
+    words = SpellingIndex()
+    words.add_text("the legend of zelda")
+    words.correct("legnd of zelda")     # -> 'legend of zelda'
+"""
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 이보다 짧은 단어는 교정하지 않는다
+MIN_WORD_LENGTH = 2
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """
+    인접 글자 바꿈을 한 번의 편집으로 치는 편집 거리 (Optimal String Alignment)
+
+    Args:
+        limit: 이 값을 넘으면 계산을 멈추고 limit + 1 을 돌려준다
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        row = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            row[j] = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                row[j] = min(row[j], prev2[j - 2] + 1)
+        if min(row) > limit:
+            return limit + 1
+        prev2, prev = prev, row
+    return prev[-1]
+
+
+def max_distance_for(word: str) -> int:
+    """단어 길이별 허용 편집 거리 (짧은 단어는 1)"""
+    return 1 if len(word) <= 4 else 2
+
+
+class SpellingIndex:
+    """
+    단어 -> 빈도 사전과 삭제 변형 색인
+
+    Args:
+        max_distance: 색인하는 최대 편집 거리
+        prefix_length: 변형을 만들 때 쓰는 앞부분 길이
+    """
+
+    def __init__(self, max_distance: int = 2, prefix_length: int = 7):
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self._words: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = {}
+
+    def __len__(self):
+        return len(self._words)
+
+    def __contains__(self, word):
+        return word in self._words
+
+    def _variants(self, word: str, distance: int) -> Set[str]:
+        """word 에서 글자를 0 ~ distance 개 지운 변형들"""
+        found = {word}
+        frontier = {word}
+        for _ in range(distance):
+            frontier = {w[:i] + w[i + 1:] for w in frontier for i in range(len(w))} - found
+            found |= frontier
+        return found
+
+    def add(self, word: str, count: int = 1) -> None:
+        """단어 등록 (이미 있으면 빈도만 더한다)"""
+        if len(word) < MIN_WORD_LENGTH:
+            return
+        if word in self._words:
+            self._words[word] += count
+            return
+        self._words[word] = count
+        for variant in self._variants(word[:self.prefix_length], self.max_distance):
+            self._deletes.setdefault(variant, []).append(word)
+
+    def add_text(self, text: str) -> None:
+        """정규화된 문자열의 단어들을 등록"""
+        for word in text.split():
+            self.add(word)
+
+    def lookup(self, word: str, deadline: Optional[float] = None) -> Optional[Tuple[str, int]]:
+        """
+        가장 가까운 사전 단어
+
+        Args:
+            word: 정규화된 단어
+            deadline: time.perf_counter() 기준 마감 시각 (넘으면 그때까지 찾은 최선을 돌려줌)
+
+        Returns:
+            (단어, 편집 거리) - 사전에 있으면 거리 0, 허용 거리 안에 없으면 None
+        """
+        if word in self._words:
+            return word, 0
+        if len(word) < MIN_WORD_LENGTH:
+            return None
+
+        limit = min(max_distance_for(word), self.max_distance)
+        best: Optional[Tuple[int, int, str]] = None  # (거리, -빈도, 단어)
+        checked: Set[str] = set()
+        for variant in self._variants(word[:self.prefix_length], limit):
+            for candidate in self._deletes.get(variant, ()):
+                if candidate in checked:
+                    continue
+                if deadline is not None and time.perf_counter() > deadline:
+                    return (best[2], best[0]) if best else None
+                checked.add(candidate)
+                distance = edit_distance(word, candidate, limit)
+                if distance > limit:
+                    continue
+                key = (distance, -self._words[candidate], candidate)
+                if best is None or key < best:
+                    best = key
+        return (best[2], best[0]) if best else None
+
+    def correct(self, text: str, deadline: Optional[float] = None) -> Optional[str]:
+        """
+        단어별로 교정한 문자열
+
+        Returns:
+            바뀐 단어가 있으면 교정된 문자열, 없으면 None
+        """
+        words = text.split()
+        corrected = []
+        for word in words:
+            found = self.lookup(word, deadline)
+            corrected.append(found[0] if found else word)
+        return " ".join(corrected) if corrected != words else None
+
+    @classmethod
+    def from_texts(cls, texts: Iterable[str], **kwargs) -> "SpellingIndex":
+        index = cls(**kwargs)
+        for text in texts:
+            index.add_text(text)
+        return index
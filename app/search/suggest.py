@@ -0,0 +1,161 @@
+"""
+검색어 자동완성 (제목 / 태그 / 제작사 / 시리즈)
+
+- 종류별로 접두어 트라이를 두고, 각 단어의 시작 위치마다 키를 넣어
+  'legend' 로 'The Legend of ...' 도 찾는다.
+- 한글은 초성 트라이를 따로 만들어 'ㅈㄷ' 으로 '젤다' 를 찾는다.
+- 요청 처리 중에는 DB 를 전혀 쓰지 않는다. 데이터가 바뀌면(캐시 태그 버전)
+  또는 SUGGEST_MAX_AGE 초가 지나면 백그라운드 스레드에서 다시 만들고,
+  그동안은 이전 트라이로 응답한다.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from app.cache import cache
+from app.db import db
+from app.models import content_dao
+from app.search.index import CONTENTS_TAG, TAGS_TAG
+from app.search.text import chosung, has_chosung, normalize
+from app.search.trie import MAX_KEY_LENGTH, PrefixTrie
+
+SUGGEST_TYPES = ("title", "tag", "producer", "series")
+
+# 트라이가 의존하는 캐시 태그 (제작사/시리즈는 reference_service.cache_tag 와 같은 이름)
+_DEPENDENCY_TAGS = (CONTENTS_TAG, TAGS_TAG, "reference:producers", "reference:series")
+
+
+def _word_starts(text: str) -> List[int]:
+    return [i for i, char in enumerate(text) if char != " " and (i == 0 or text[i - 1] == " ")]
+
+
+class _TypeIndex:
+    """한 종류(제목/태그/...)의 일반 트라이 + 초성 트라이"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.entries: List[Dict[str, Any]] = []
+        self.texts: List[str] = []
+        self.trie = PrefixTrie()
+        self.chosung_trie = PrefixTrie()
+
+        # 가중치 내림차순으로 넣어야 노드별 상위 k 가 맞는다
+        for row in sorted(rows, key=lambda r: (-(r.get("weight") or 0), r.get("text") or "")):
+            text = normalize(row.get("text") or "")
+            if not text:
+                continue
+            entry_id = len(self.entries)
+            self.entries.append(row)
+            self.texts.append(text)
+
+            initials = chosung(text)
+            for start in _word_starts(text):
+                self.trie.insert(text[start:], entry_id)
+                if initials != text:
+                    self.chosung_trie.insert(initials[start:], entry_id)
+
+    def lookup(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        if has_chosung(query):
+            key = chosung(query)
+            ids = self.chosung_trie.top(key)
+            texts = [chosung(self.texts[i]) for i in ids] if len(key) > MAX_KEY_LENGTH else None
+        else:
+            key = query
+            ids = self.trie.top(key)
+            texts = [self.texts[i] for i in ids] if len(key) > MAX_KEY_LENGTH else None
+
+        if texts is not None:
+            # 트라이 키 길이를 넘는 긴 검색어는 전체 문자열로 한 번 더 거른다
+            ids = [i for i, text in zip(ids, texts) if key in text]
+        return [self.entries[i] for i in ids[:limit]]
+
+
+class Suggester:
+    def __init__(self):
+        self.max_age = 600
+        self._indexes: Optional[Dict[str, _TypeIndex]] = None
+        self._built_at = 0.0
+        self._versions: Optional[Dict[str, int]] = None
+        self._rebuilding = threading.Lock()
+
+    def init_app(self, app):
+        """Flask 앱 초기화 시 트라이를 구축합니다 (SEARCH_INDEX_ON_STARTUP 설정을 따름)."""
+        self.max_age = int(app.config.get("SUGGEST_MAX_AGE", 600))
+        app.extensions["suggester"] = self
+
+        if not app.config.get("SEARCH_INDEX_ON_STARTUP", True):
+            return
+        try:
+            self.rebuild()
+            print("✅ Suggest tries built")
+        except Exception as e:
+            print(f"⚠️  Suggest trie build skipped: {e}")
+
+    def _current_versions(self) -> Dict[str, int]:
+        return cache.backend.tag_versions(_DEPENDENCY_TAGS)
+
+    def rebuild(self, conn=None) -> None:
+        """
+        DB 에서 트라이 전체 재구축
+
+        Args:
+            conn: 사용할 연결 (없으면 풀에서 잠시 빌린다)
+        """
+        versions = self._current_versions()
+        if conn is not None:
+            sources = content_dao.get_suggest_sources(conn)
+        else:
+            if db.pool is None:
+                raise RuntimeError("DB pool is not initialized.")
+            with db.pool.acquire() as own_conn:
+                sources = content_dao.get_suggest_sources(own_conn)
+
+        indexes = {kind: _TypeIndex(sources.get(kind, [])) for kind in SUGGEST_TYPES}
+        # 참조 한 번으로 교체 (읽는 쪽은 잠금 없이 이전/새 트라이 중 하나를 본다)
+        self._indexes = indexes
+        self._versions = versions
+        self._built_at = time.monotonic()
+
+    def _rebuild_in_background(self) -> None:
+        if not self._rebuilding.acquire(blocking=False):
+            return  # 이미 다른 요청이 재구축 중
+
+        def run():
+            try:
+                self.rebuild()
+            except Exception as e:
+                print(f"자동완성 트라이 재구축 실패: {e}")
+            finally:
+                self._rebuilding.release()
+
+        threading.Thread(target=run, name="suggest-rebuild", daemon=True).start()
+
+    def _check_fresh(self) -> None:
+        stale = self._versions != self._current_versions()
+        if not stale and self.max_age > 0:
+            stale = time.monotonic() - self._built_at > self.max_age
+        if stale:
+            self._rebuild_in_background()
+
+    def suggest(self, query: str, limit: int = 5) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        자동완성 후보
+
+        Args:
+            query: 사용자가 입력 중인 문자열 (초성 가능)
+            limit: 종류별 최대 개수
+
+        Returns:
+            {'title': [...], 'tag': [...], 'producer': [...], 'series': [...]}
+            각 항목은 {'id', 'text', 'weight'} (태그는 'category' 포함).
+            트라이가 아직 없으면 빈 목록들
+        """
+        self._check_fresh()
+        indexes = self._indexes
+        query = normalize(query)
+        if not indexes or not query:
+            return {kind: [] for kind in SUGGEST_TYPES}
+        return {kind: indexes[kind].lookup(query, limit) for kind in SUGGEST_TYPES}
+
+
+# 싱글톤 인스턴스
+suggester = Suggester()
@@ -0,0 +1,90 @@
+"""
+태그별 ContentID posting 색인
+
+TAG_TO 를 TagCode -> ContentID 비트맵으로 들고 있다가,
+태그 검색은 (메모리에서 찾은) 태그 코드들의 비트맵 합집합으로,
+제목 + 태그 검색은 제목 결과와의 교집합으로 처리한다.
+조인으로 생기는 중복이 없으므로 DISTINCT 가 필요 없다.
+"""
+import threading
+from typing import Dict, Iterable, Set, Tuple
+
+from app.search import bitmap
+
+
+class TagIndex:
+    """TagCode 별 ContentID 비트맵 (스레드 안전)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._postings: Dict[int, int] = {}
+        self._by_content: Dict[int, Set[int]] = {}
+
+    def __len__(self):
+        return len(self._postings)
+
+    def build(self, rows: Iterable[Tuple[int, int]]) -> None:
+        """
+        전체 재구축
+
+        Args:
+            rows: TAG_TO 의 (TCode, CID) 목록
+        """
+        postings: Dict[int, int] = {}
+        by_content: Dict[int, Set[int]] = {}
+        for tag_code, content_id in rows:
+            tag_code, content_id = int(tag_code), int(content_id)
+            postings[tag_code] = postings.get(tag_code, 0) | (1 << content_id)
+            by_content.setdefault(content_id, set()).add(tag_code)
+        with self._lock:
+            self._postings, self._by_content = postings, by_content
+
+    def _unlink(self, content_id: int) -> None:
+        mask = ~(1 << content_id)
+        for tag_code in self._by_content.pop(content_id, ()):
+            bits = self._postings.get(tag_code, 0) & mask
+            if bits:
+                self._postings[tag_code] = bits
+            else:
+                self._postings.pop(tag_code, None)
+
+    def set_content_tags(self, content_id: int, tag_codes: Iterable[int]) -> None:
+        """콘텐츠 한 건의 태그 연결을 통째로 교체 (등록/수정)"""
+        content_id = int(content_id)
+        codes = {int(code) for code in tag_codes}
+        with self._lock:
+            self._unlink(content_id)
+            for tag_code in codes:
+                self._postings[tag_code] = self._postings.get(tag_code, 0) | (1 << content_id)
+            if codes:
+                self._by_content[content_id] = codes
+
+    def remove_content(self, content_id: int) -> None:
+        with self._lock:
+            self._unlink(int(content_id))
+
+    def remove_tag(self, tag_code: int) -> None:
+        """태그 삭제 (TAG_TO 연결도 함께 삭제된 경우)"""
+        tag_code = int(tag_code)
+        with self._lock:
+            bits = self._postings.pop(tag_code, 0)
+            for content_id in bitmap.iter_ids(bits):
+                codes = self._by_content.get(content_id)
+                if codes is not None:
+                    codes.discard(tag_code)
+                    if not codes:
+                        del self._by_content[content_id]
+
+    def bitmap_for(self, tag_codes: Iterable[int]) -> int:
+        """태그 코드들 중 하나라도 달린 콘텐츠 비트맵 (합집합)"""
+        with self._lock:
+            return bitmap.union(self._postings.get(int(code), 0) for code in tag_codes)
+
+    def counts(self, bits: int) -> Dict[int, int]:
+        """후보 비트맵 안에서 태그별 콘텐츠 수 {TagCode: n} (패싯)"""
+        with self._lock:
+            return bitmap.counts(self._postings, bits)
+
+    def tags_of(self, content_id: int) -> Set[int]:
+        with self._lock:
+            return set(self._by_content.get(int(content_id), ()))
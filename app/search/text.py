@@ -0,0 +1,66 @@
+"""
+검색용 문자열 정규화 / n-gram 분해
+
+- NFKC 정규화 후 casefold (Oracle UPPER(...) LIKE 와 같은 대소문자 무시 비교)
+- 한글은 완성형 음절 하나가 한 글자이므로 영문과 같은 방식으로 n-gram 을 만든다
+- 공백은 한 칸으로 줄여서 그대로 둔다 (LIKE '%term%' 과 같은 부분 문자열 의미 유지)
+"""
+import re
+import unicodedata
+from typing import Set
+
+# 제목 색인에 쓰는 n-gram 길이
+NGRAM_SIZE = 2
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """비교용 정규화 문자열."""
+    if not text:
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    return _SPACES.sub(" ", text).strip()
+
+
+def ngrams(text: str, n: int = NGRAM_SIZE) -> Set[str]:
+    """
+    정규화된 문자열의 n-gram 집합.
+    n 보다 짧은 문자열은 문자열 자체를 돌려준다.
+    """
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+# ----------------------------------------------------
+# 한글 초성
+# ----------------------------------------------------
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_HANGUL_FIRST, _HANGUL_LAST = 0xAC00, 0xD7A3
+# NFKC(normalize) 는 호환 자모 'ㅈ' 를 첫소리 자모 U+110C 로 바꾸므로 그쪽도 초성으로 본다
+_JAMO_FIRST, _JAMO_LAST = 0x1100, 0x1112
+# 초성 하나당 음절 수 (중성 21 x 종성 28)
+_SYLLABLES_PER_CHOSUNG = 588
+
+
+def chosung(text: str) -> str:
+    """
+    한글 음절을 초성으로 바꾼 문자열 (그 밖의 문자는 그대로)
+    예) '젤다의 전설' -> 'ㅈㄷㅇ ㅈㅅ'
+    """
+    chars = []
+    for char in text:
+        code = ord(char)
+        if _HANGUL_FIRST <= code <= _HANGUL_LAST:
+            chars.append(_CHOSUNG[(code - _HANGUL_FIRST) // _SYLLABLES_PER_CHOSUNG])
+        elif _JAMO_FIRST <= code <= _JAMO_LAST:
+            chars.append(_CHOSUNG[code - _JAMO_FIRST])
+        else:
+            chars.append(char)
+    return "".join(chars)
+
+
+def has_chosung(text: str) -> bool:
+    """초성(호환 자모 자음)이 들어 있는지 - 'ㅈㄷ' 같은 초성 검색어 판별"""
+    return any(char in _CHOSUNG or _JAMO_FIRST <= ord(char) <= _JAMO_LAST for char in text)
@@ -0,0 +1,162 @@
+"""
+콘텐츠 제목 n-gram 역색인
+
+UPPER(c.Title) LIKE '%term%' 는 앞쪽 와일드카드 때문에 인덱스를 못 타고
+CONTENT 전체를 훑는다. 이 색인은 제목의 2-gram(1글자 검색용 1-gram 포함)별로
+ContentID 집합을 들고 있다가, 검색어의 n-gram 교집합으로 후보를 좁힌 뒤
+정규화된 제목에 검색어가 실제로 들어 있는지 확인한다 (LIKE 와 같은 결과).
+"""
+import threading
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from app.search import bitmap
+from app.search.text import NGRAM_SIZE, ngrams, normalize
+
+
+class TitleIndex:
+    """
+    제목 n-gram 역색인 (스레드 안전)
+
+    문서마다 (정규화 제목, 출시일) 을 함께 보관해서
+    검색 결과를 DB 없이 목록 순서(출시일 DESC, ContentID DESC)로 정렬할 수 있다.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._docs: Dict[int, Tuple[str, datetime]] = {}
+        self._grams: Dict[str, Set[int]] = {}
+        self._chars: Dict[str, Set[int]] = {}
+        # 색인된 전체 ContentID 비트맵 (NOT 검색의 기준)
+        self._all = bitmap.EMPTY
+
+    def __len__(self):
+        return len(self._docs)
+
+    def __contains__(self, content_id):
+        return content_id in self._docs
+
+    # ----------------------------------------------------
+    # 색인 갱신
+    # ----------------------------------------------------
+    def build(self, rows: Iterable[Tuple[int, str, datetime]]) -> None:
+        """
+        전체 재구축 (새 색인을 만든 뒤 한 번에 교체)
+
+        Args:
+            rows: (ContentID, Title, ReleaseDate) 목록
+        """
+        fresh = TitleIndex()
+        for content_id, title, release_date in rows:
+            fresh._add(int(content_id), title, release_date)
+        with self._lock:
+            self._docs, self._grams, self._chars = fresh._docs, fresh._grams, fresh._chars
+            self._all = fresh._all
+
+    def _add(self, content_id: int, title: str, release_date: datetime) -> None:
+        text = normalize(title)
+        self._docs[content_id] = (text, release_date)
+        self._all |= 1 << content_id
+        for gram in ngrams(text):
+            self._grams.setdefault(gram, set()).add(content_id)
+        for char in set(text):
+            self._chars.setdefault(char, set()).add(content_id)
+
+    def _remove(self, content_id: int) -> None:
+        doc = self._docs.pop(content_id, None)
+        if doc is None:
+            return
+        self._all &= ~(1 << content_id)
+        text = doc[0]
+        for postings, keys in ((self._grams, ngrams(text)), (self._chars, set(text))):
+            for key in keys:
+                ids = postings.get(key)
+                if ids is not None:
+                    ids.discard(content_id)
+                    if not ids:
+                        del postings[key]
+
+    def upsert(self, content_id: int, title: str, release_date: datetime) -> None:
+        """콘텐츠 등록/수정 반영"""
+        with self._lock:
+            self._remove(int(content_id))
+            self._add(int(content_id), title, release_date)
+
+    def remove(self, content_id: int) -> None:
+        """콘텐츠 삭제 반영"""
+        with self._lock:
+            self._remove(int(content_id))
+
+    # ----------------------------------------------------
+    # 조회
+    # ----------------------------------------------------
+    def search(self, term: str) -> Set[int]:
+        """
+        제목에 term 이 포함된 ContentID 집합 (대소문자 무시)
+        """
+        query = normalize(term)
+        if not query:
+            return set()
+
+        with self._lock:
+            if len(query) == 1:
+                return set(self._chars.get(query, ()))
+
+            postings = []
+            for gram in ngrams(query, NGRAM_SIZE):
+                ids = self._grams.get(gram)
+                if not ids:
+                    return set()
+                postings.append(ids)
+
+            # 가장 작은 집합부터 교집합
+            postings.sort(key=len)
+            candidates = set(postings[0])
+            for ids in postings[1:]:
+                candidates &= ids
+                if not candidates:
+                    return set()
+
+            if len(query) == NGRAM_SIZE:
+                return candidates
+            return {cid for cid in candidates if query in self._docs[cid][0]}
+
+    def match_quality(self, content_id: int, query: str) -> float:
+        """
+        제목 일치 정도 (검색 순위용)
+
+        Args:
+            query: 정규화된 검색어
+
+        Returns:
+            1.0 제목 전체 일치 / 0.8 제목이 검색어로 시작 / 0.6 단어가 검색어로 시작 /
+            0.4 그 밖의 부분 일치 / 0.0 불일치 (색인에 없으면 0.0)
+        """
+        doc = self._docs.get(content_id)
+        if doc is None or not query:
+            return 0.0
+        text = doc[0]
+        if text == query:
+            return 1.0
+        if text.startswith(query):
+            return 0.8
+        if (" " + query) in text:
+            return 0.6
+        return 0.4 if query in text else 0.0
+
+    def universe(self) -> int:
+        """색인된 전체 콘텐츠 비트맵"""
+        return self._all
+
+    def sort_key(self, content_id: int) -> Optional[Tuple[datetime, int]]:
+        """목록 정렬 키 (출시일, ContentID). 색인에 없으면 None"""
+        doc = self._docs.get(content_id)
+        return (doc[1], content_id) if doc else None
+
+    def ordered(self, content_ids: Iterable[int]) -> List[Tuple[datetime, int]]:
+        """
+        ContentID 들을 목록 순서(출시일 DESC, ContentID DESC)의 정렬 키 목록으로
+        """
+        with self._lock:
+            keys = [self.sort_key(cid) for cid in content_ids]
+        return sorted((key for key in keys if key is not None), reverse=True)
@@ -0,0 +1,49 @@
+"""
+접두어 트라이 (노드마다 상위 k 개 미리 계산)
+
+항목을 가중치(리뷰 수 등) 내림차순으로 넣으면 각 노드에는 그 접두어로
+시작하는 항목 중 가중치가 큰 순서대로 최대 k 개가 쌓인다.
+조회는 접두어 길이만큼 내려가서 그 노드의 목록을 읽기만 하면 된다 (O(접두어 길이)).
+"""
+from typing import Dict, List, Optional
+
+# 노드마다 보관하는 상위 항목 수
+DEFAULT_TOP_K = 10
+# 키 최대 길이 (그보다 긴 검색어는 이 길이까지만 트라이로 찾고 나머지는 호출자가 거른다)
+MAX_KEY_LENGTH = 24
+
+
+class _Node:
+    __slots__ = ("children", "top")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.top: List[int] = []
+
+
+class PrefixTrie:
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        self.top_k = top_k
+        self._root = _Node()
+
+    def insert(self, key: str, entry_id: int) -> None:
+        """
+        키 등록. 같은 트라이에는 항목을 가중치 내림차순으로 넣어야 한다.
+        """
+        node = self._root
+        for char in key[:MAX_KEY_LENGTH]:
+            child = node.children.get(char)
+            if child is None:
+                child = node.children[char] = _Node()
+            node = child
+            if len(node.top) < self.top_k and entry_id not in node.top:
+                node.top.append(entry_id)
+
+    def top(self, prefix: str, limit: Optional[int] = None) -> List[int]:
+        """접두어로 시작하는 항목 id (가중치 내림차순)"""
+        node = self._root
+        for char in prefix[:MAX_KEY_LENGTH]:
+            node = node.children.get(char)
+            if node is None:
+                return []
+        return node.top[:limit] if limit else list(node.top)
@@ -1,54 +1,582 @@
 # app/services/content_service.py
 # 콘텐츠 검색 관련 Service 함수들
+import math
+import time
 from typing import List, Dict, Any, Optional
+from flask import current_app
+from app.cache import cache, cached
 from app.db import db
-from app.models import content_dao
+from app.models import content_dao, content_stats_dao, review_dao
+from app.search import (
+    CONTENTS_TAG, TAGS_TAG, bitmap, canonical_query, normalize, parse_query, search_index,
+    suggester,
+)
+from app.search.query import positive_terms, replace_terms, terms as query_terms, to_text as query_text
+from app.services import reference_service
+from app.services.like_buffer import like_buffer
+from app.utils.pagination import Page, DEFAULT_PER_PAGE, paginate_keys, paginate_top
 
+# 상세 페이지 리뷰 목록 한 번에 보여줄 개수
+REVIEW_PER_PAGE = 10
 
-def search_content(search_term: Optional[str] = None, tag: Optional[str] = None) -> List[Dict[str, Any]]:
+# 검색 결과(정렬된 ID 목록) 캐시 네임스페이스 - 관리자 대시보드 통계에 표시
+SEARCH_CACHE_NAMESPACE = "search"
+
+# 검색 결과 정렬: relevance(관련도순), latest(최신순)
+SEARCH_SORTS = ("relevance", "latest")
+DEFAULT_SEARCH_SORT = "relevance"
+# 관련도순 keyset: (점수, ContentID) 내림차순
+RANK_ORDER = [("Score", "DESC", "float"), ("ContentID", "DESC", "int")]
+# 관련도 점수 = 제목 일치 정도 x 3 + 태그 겹침 x 2 + 인기도 x 1 (각 항목 0 ~ 1)
+RANK_WEIGHTS = {"match": 3.0, "tags": 2.0, "popularity": 1.0}
+# 평균 평점 보정용 가상 리뷰 수 (리뷰 한두 개짜리 5점이 위로 튀지 않게 전체 평균 쪽으로 당긴다)
+RANK_RATING_PRIOR = 5
+
+# 패싯 (URL 파라미터 이름, 표시 이름) - 표시 순서
+FACETS = [
+    ("media", "미디어"),
+    ("category", "태그 분류"),
+    ("tag_code", "태그"),
+    ("producer", "제작사"),
+    ("year", "출시 연도"),
+]
+# 미디어 타입 표시 이름 (content_dao.MEDIA_TYPES 의 이름 기준)
+MEDIA_LABELS = {"Movie": "영화", "Video Game": "게임", "Book": "도서"}
+# 건수가 많은 순으로 보여줄 최대 개수
+FACET_TAG_LIMIT = 15
+FACET_PRODUCER_LIMIT = 10
+
+# 자동완성 종류별 기본/최대 후보 수, 검색어 최대 길이
+SUGGEST_LIMIT = 5
+SUGGEST_MAX_LIMIT = 10
+SUGGEST_MAX_QUERY = 50
+
+
+@cached("theme_stats", tags=(CONTENTS_TAG,))
+def get_theme_stats() -> Dict[str, int]:
+    """
+    메인 페이지 테마별 통계 (캐시)
+
+    관리자 콘텐츠 등록/삭제가 검색 색인을 갱신하면서 CONTENTS_TAG 를 무효화한다.
+    CACHE_BACKEND=lru 면 다른 워커에는 CACHE_DEFAULT_TTL 초 안에 반영된다.
+
+    Returns:
+        {'Movie': n, 'Video Game': n, 'Book': n}
+    """
+    return content_dao.count_by_media_type(db.get_db())
+
+
+def get_content_detail(
+    content_id: int,
+    user_id: Optional[str] = None,
+    review_sort: str = review_dao.DEFAULT_REVIEW_SORT,
+    review_after: Optional[str] = None,
+    review_per_page: int = REVIEW_PER_PAGE,
+) -> Optional[Dict[str, Any]]:
+    """
+    콘텐츠 상세 페이지 데이터 조회 서비스
+
+    Returns:
+        {'content', 'tags_by_category', 'shops', 'stats', 'reviews', 'user_review'} 또는 None
+    """
+    conn = db.get_db()
+
+    detail = content_dao.get_content_detail(
+        conn, content_id, user_id, review_sort, review_per_page, review_after
+    )
+    if detail is None:
+        return None
+
+    # 제작사/시리즈 이름과 태그 그룹은 기준 정보 캐시에서 채운다
+    reference_service.attach_names(detail["content"])
+    detail["tags_by_category"] = reference_service.group_tag_names(detail.pop("tag_codes"))
+
+    # 이 워커에서 아직 DB 에 반영하지 않은 좋아요 (LIKE_WRITE_BEHIND)
+    like_buffer.apply_pending(detail["reviews"].items, content_id)
+    if detail.get("user_review"):
+        like_buffer.apply_pending([detail["user_review"]], content_id)
+    return detail
+
+
+def get_content_reviews(
+    content_id: int,
+    sort: str = review_dao.DEFAULT_REVIEW_SORT,
+    after: Optional[str] = None,
+    per_page: int = REVIEW_PER_PAGE,
+) -> Page:
+    """
+    상세 페이지 리뷰 목록 "더 보기" 서비스
+    """
+    conn = db.get_db()
+
+    page = review_dao.get_content_review_page(conn, content_id, sort, per_page, after)
+    like_buffer.apply_pending(page.items, content_id)
+    return page
+
+
+def list_contents(
+    min_id: Optional[int] = None,
+    max_id: Optional[int] = None,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Page:
+    """
+    콘텐츠 목록 한 페이지 조회 서비스
+
+    Args:
+        min_id: ContentID 최소값 (테마별 목록일 때)
+        max_id: ContentID 최대값 (테마별 목록일 때)
+        page: 페이지 번호
+        per_page: 페이지당 개수
+        after: keyset 커서
+        filters: 패싯 필터 (parse_facet_filters). 검색 색인을 쓸 수 없으면 무시된다
+
+    Returns:
+        Page 객체 (items: 콘텐츠 dict 리스트)
+    """
+    conn = db.get_db()
+
+    if filters and search_index.ensure_fresh():
+        # 필터가 있으면 색인 비트맵으로 후보를 고르고 현재 페이지만 DB 에서 읽는다
+        bits = _range_bitmap(min_id, max_id) & _filter_bitmap(filters)
+        keys = search_index.ordered(bitmap.iter_ids(bits))
+        return _page_of_keys(conn, keys, page, per_page, after)
+
+    return content_dao.list_contents(conn, min_id, max_id, page, per_page, after)
+
+
+# ----------------------------------------------------
+# 패싯
+# ----------------------------------------------------
+def parse_facet_filters(values) -> Dict[str, Any]:
+    """
+    요청 파라미터에서 패싯 필터만 골라 검증한다 (잘못된 값은 버림)
+
+    Args:
+        values: request.values 같은 MultiDict
+
+    Returns:
+        {'media': str, 'category': str, 'tag_code': int, 'producer': int, 'year': int} 중 지정된 것
+    """
+    filters: Dict[str, Any] = {}
+    media = values.get("media")
+    if media in MEDIA_LABELS:
+        filters["media"] = media
+    category = (values.get("category") or "").strip()
+    if category:
+        filters["category"] = category
+    for name in ("tag_code", "producer", "year"):
+        value = values.get(name, type=int)
+        if value is not None:
+            filters[name] = value
+    return filters
+
+
+def _range_bitmap(min_id: Optional[int], max_id: Optional[int]) -> int:
+    """ContentID 범위(테마)에 드는 색인된 콘텐츠 비트맵 (범위가 없으면 전체)"""
+    universe = search_index.titles.universe()
+    if min_id is None or max_id is None:
+        return universe
+    return universe & bitmap.range_mask(min_id, max_id)
+
+
+def _media_bitmap(media_type: str) -> int:
+    for name, min_id, max_id in content_dao.MEDIA_TYPES:
+        if name == media_type:
+            return bitmap.range_mask(min_id, max_id)
+    return bitmap.EMPTY
+
+
+def _category_codes(category: str) -> List[int]:
+    return [tag["code"] for tag in reference_service.get_tags_by_category().get(category, [])]
+
+
+def _filter_bitmap(filters: Dict[str, Any]) -> int:
+    """
+    패싯 필터들의 교집합 비트맵 (필터가 없으면 모든 비트가 켜진 값 -1)
+    """
+    bits = -1
+    if filters.get("media"):
+        bits &= _media_bitmap(filters["media"])
+    if filters.get("category"):
+        bits &= search_index.tag_bitmap(_category_codes(filters["category"]))
+    if filters.get("tag_code") is not None:
+        bits &= search_index.tag_bitmap([filters["tag_code"]])
+    if filters.get("producer") is not None:
+        bits &= search_index.facets.producer_bitmap(filters["producer"])
+    if filters.get("year") is not None:
+        bits &= search_index.facets.year_bitmap(filters["year"])
+    return bits
+
+
+def _keep_filtered(keys: List[tuple], filters: Optional[Dict[str, Any]]) -> List[tuple]:
+    """(정렬 키 .., ContentID) 목록에서 필터에 맞는 것만 (순서 유지)"""
+    if not filters:
+        return keys
+    bits = _filter_bitmap(filters)
+    return [key for key in keys if bits >> key[-1] & 1]
+
+
+def _facet_counts(bits: int, filters: Dict[str, Any], with_media: bool) -> List[Dict[str, Any]]:
+    """
+    후보 비트맵의 패싯별 건수
+
+    값마다 posting 비트맵과 & 한 번, bit_count 한 번으로 센다 (COUNT 쿼리 없음).
+    """
+    groups: Dict[str, List[Dict[str, Any]]] = {}
+
+    if with_media:
+        groups["media"] = [
+            {"value": name, "label": MEDIA_LABELS.get(name, name),
+             "count": bitmap.count(bits & bitmap.range_mask(min_id, max_id))}
+            for name, min_id, max_id in content_dao.MEDIA_TYPES
+        ]
+
+    tags_by_category = reference_service.get_tags_by_category()
+    groups["category"] = [
+        {"value": category, "label": category,
+         "count": bitmap.count(bits & search_index.tag_bitmap(tag["code"] for tag in tags))}
+        for category, tags in sorted(tags_by_category.items())
+    ]
+
+    tag_counts = search_index.tags.counts(bits)
+    tag_rows = reference_service.resolve_tags(tag_counts)
+    groups["tag_code"] = [
+        {"value": row["tagcode"], "label": row["tag"], "count": tag_counts[row["tagcode"]]}
+        for row in sorted(tag_rows, key=lambda row: -tag_counts[row["tagcode"]])[:FACET_TAG_LIMIT]
+    ]
+
+    producer_counts = search_index.facets.producer_counts(bits)
+    top_producers = sorted(producer_counts.items(), key=lambda item: -item[1])[:FACET_PRODUCER_LIMIT]
+    groups["producer"] = []
+    for producer_id, count in top_producers:
+        producer = reference_service.get_producer(producer_id)
+        label = producer["prodname"] if producer else str(producer_id)
+        groups["producer"].append({"value": producer_id, "label": label, "count": count})
+
+    groups["year"] = [
+        {"value": year, "label": str(year), "count": count}
+        for year, count in sorted(search_index.facets.year_counts(bits).items(), reverse=True)
+    ]
+
+    facets = []
+    for name, label in FACETS:
+        options = [opt for opt in groups.get(name, []) if opt["count"] or filters.get(name) == opt["value"]]
+        for opt in options:
+            opt["active"] = filters.get(name) == opt["value"]
+        if options:
+            facets.append({"name": name, "label": label, "options": options})
+    return facets
+
+
+def get_facets(
+    search_term: Optional[str] = None,
+    tag: Optional[str] = None,
+    min_id: Optional[int] = None,
+    max_id: Optional[int] = None,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    검색 결과 / 테마 목록의 패싯 (필터를 적용한 결과 기준 건수)
+
+    Args:
+        search_term, tag: 검색 조건 (둘 다 없으면 min_id ~ max_id 범위의 전체 콘텐츠)
+        min_id, max_id: 테마 ContentID 범위 (있으면 미디어 패싯은 뺀다)
+        filters: 현재 적용된 패싯 필터
+
+    Returns:
+        [{'name', 'label', 'options': [{'value', 'label', 'count', 'active'}]}]
+        (검색 색인을 쓸 수 없으면 None)
+
+    Raises:
+        QuerySyntaxError: 태그 검색식 문법 오류
+    """
+    filters = filters or {}
+    search_term = search_term.strip() if search_term else None
+    tag_query = parse_query(tag) if tag and tag.strip() else None
+    if not search_index.ensure_fresh():
+        return None
+
+    try:
+        if search_term or tag_query:
+            bits = _search_bitmap(search_term, tag_query)
+        else:
+            bits = _range_bitmap(min_id, max_id)
+        bits &= _filter_bitmap(filters)
+        return _facet_counts(bits, filters, with_media=min_id is None)
+    except Exception as e:
+        print(f"패싯 계산 중 오류 발생: {str(e)}")
+        return None
+
+
+def _tag_term_bitmap(term: str) -> int:
+    """태그 항 하나: 태그 사전(메모리)에서 이름이 맞는 태그 코드를 찾아 비트맵 합집합"""
+    return search_index.tag_bitmap(reference_service.find_tag_codes(term))
+
+
+def _search_bitmap(search_term: Optional[str], tag_query) -> int:
+    """
+    검색 결과 ContentID 비트맵
+
+    - 제목: n-gram 색인
+    - 태그: 검색식의 각 항을 태그 비트맵으로 바꿔 AND/OR/NOT 비트 연산
+    - 둘 다: 교집합
+    """
+    bits = None
+    if search_term:
+        bits = search_index.title_bitmap(search_term)
+    if tag_query:
+        tag_bits = search_index.query_bitmap(tag_query, _tag_term_bitmap)
+        bits = tag_bits if bits is None else bits & tag_bits
+    return bits or bitmap.EMPTY
+
+
+def _search_keys(search_term: Optional[str], tag_query) -> List[tuple]:
+    """
+    검색 결과를 목록 순서로 정렬한 (출시일, ContentID) 목록 (캐시)
+
+    키는 정규화한 (제목, 태그 검색식) 이다. 관리자 콘텐츠/태그 변경 시 태그로 무효화된다.
+    평점/리뷰 수는 페이지를 읽을 때 CONTENT_STATS 에서 가져오므로 리뷰 작성은
+    이 캐시를 무효화하지 않는다.
+    """
+    key = "{}:{}|{}".format(
+        SEARCH_CACHE_NAMESPACE,
+        normalize(search_term or ""),
+        canonical_query(tag_query) if tag_query else "",
+    )
+    return cache.get_or_load(
+        key,
+        lambda: search_index.ordered(bitmap.iter_ids(_search_bitmap(search_term, tag_query))),
+        ttl=current_app.config.get("SEARCH_CACHE_TTL", 300) or None,
+        tags=[CONTENTS_TAG, TAGS_TAG],
+    )
+
+
+def _popularity_scores() -> Dict[int, float]:
+    """
+    콘텐츠별 인기도 점수 0 ~ 1 (캐시, SEARCH_POPULARITY_TTL 초)
+
+    리뷰 수(로그 스케일, 최다 리뷰 콘텐츠 = 1)와 보정 평균 평점(5점 = 1)을 7:3 으로 섞는다.
+    리뷰가 없는 콘텐츠는 빠진다 (0 점).
+    """
+    def load():
+        popularity = content_stats_dao.get_popularity(db.get_db())
+        if not popularity:
+            return {}
+        total_reviews = sum(count for count, _ in popularity.values())
+        mean_rating = sum(count * avg for count, avg in popularity.values()) / total_reviews
+        max_count = math.log1p(max(count for count, _ in popularity.values()))
+        scores = {}
+        for content_id, (count, avg) in popularity.items():
+            rating = (count * avg + RANK_RATING_PRIOR * mean_rating) / (count + RANK_RATING_PRIOR)
+            scores[content_id] = 0.7 * math.log1p(count) / max_count + 0.3 * rating / 5
+        return scores
+
+    return cache.get_or_load(
+        f"{SEARCH_CACHE_NAMESPACE}:popularity",
+        load,
+        ttl=current_app.config.get("SEARCH_POPULARITY_TTL", 300) or None,
+        tags=[CONTENTS_TAG],
+    )
+
+
+def _rank_scores(search_term: Optional[str], tag_query) -> List[tuple]:
+    """
+    검색 결과의 (관련도 점수, ContentID) 목록 (정렬하지 않음, 캐시)
+
+    - 제목 일치: 전체 일치 > 제목 시작 > 단어 시작 > 부분 일치
+    - 태그 겹침: 검색식의 (NOT 이 아닌) 태그 항 중 콘텐츠에 달린 비율
+    - 인기도: _popularity_scores
+    """
+    def load():
+        content_ids = list(bitmap.iter_ids(_search_bitmap(search_term, tag_query)))
+        try:
+            popularity = _popularity_scores()
+        except Exception as e:
+            # 인기도를 못 읽어도 검색은 되도록 (일치 정도/태그만으로 순위)
+            print(f"인기도 조회 실패: {e}")
+            popularity = {}
+        query = normalize(search_term or "")
+        tag_terms = [reference_service.find_tag_codes(term) for term in positive_terms(tag_query)] if tag_query else []
+
+        scored = []
+        for content_id in content_ids:
+            score = RANK_WEIGHTS["popularity"] * popularity.get(content_id, 0.0)
+            if query:
+                score += RANK_WEIGHTS["match"] * search_index.titles.match_quality(content_id, query)
+            if tag_terms:
+                tags = search_index.tags.tags_of(content_id)
+                matched = sum(1 for codes in tag_terms if tags.intersection(codes))
+                score += RANK_WEIGHTS["tags"] * matched / len(tag_terms)
+            scored.append((round(score, 6), content_id))
+        return scored
+
+    key = "{}:rank:{}|{}".format(
+        SEARCH_CACHE_NAMESPACE,
+        normalize(search_term or ""),
+        canonical_query(tag_query) if tag_query else "",
+    )
+    return cache.get_or_load(
+        key,
+        load,
+        ttl=current_app.config.get("SEARCH_CACHE_TTL", 300) or None,
+        tags=[CONTENTS_TAG, TAGS_TAG],
+    )
+
+
+def _ranked_page(conn, scored: List[tuple], page: int, per_page: int, after: Optional[str]) -> Page:
+    """
+    (점수, ContentID) 목록에서 상위 k 개만 힙으로 골라 현재 페이지를 만든다.
+    """
+    keys, total, next_cursor = paginate_top(
+        scored, order_by=RANK_ORDER, page=page, per_page=per_page, after=after,
+    )
+    items = content_dao.get_contents_by_ids(conn, [cid for _, cid in keys])
+    return Page(items, page, per_page, total, next_cursor)
+
+
+def _page_of_keys(conn, sorted_keys: List[tuple], page: int, per_page: int, after: Optional[str]) -> Page:
+    """
+    정렬된 검색 결과 키 목록에서 현재 페이지만 잘라 해당 행을 DB 에서 읽는다.
+    """
+    keys, total, next_cursor = paginate_keys(
+        sorted_keys, order_by=content_dao.LIST_ORDER,
+        page=page, per_page=per_page, after=after,
+    )
+    items = content_dao.get_contents_by_ids(conn, [cid for _, cid in keys])
+    return Page(items, page, per_page, total, next_cursor)
+
+
+def search_content(
+    search_term: Optional[str] = None,
+    tag: Optional[str] = None,
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+    sort: str = DEFAULT_SEARCH_SORT,
+    filters: Optional[Dict[str, Any]] = None,
+) -> Page:
     """
     콘텐츠 검색 서비스
     
     Args:
         search_term: 검색어 (콘텐츠 제목의 일부, 선택사항)
-        tag: 태그명 (선택사항)
+        tag: 태그명 또는 태그 검색식 (선택사항, 예: action AND (rpg OR strategy) NOT horror)
+        page: 페이지 번호
+        per_page: 페이지당 개수
+        after: keyset 커서
+        sort: relevance(관련도순, 기본) / latest(최신순).
+            검색 색인을 쓸 수 없을 때는 항상 최신순
+        filters: 패싯 필터 (parse_facet_filters). 검색 색인을 쓸 수 없으면 무시된다
     
     Returns:
-        검색된 콘텐츠 리스트
+        검색된 콘텐츠 Page
+    
+    Raises:
+        QuerySyntaxError: 태그 검색식 문법 오류
     
     검색 로직:
     - search_term만 있으면: 제목 검색
     - tag만 있으면: 태그 검색
     - 둘 다 있으면: 제목 + 태그 검색
-    - 둘 다 없으면: 빈 리스트 반환
+    - 둘 다 없으면: 빈 페이지 반환
     """
     conn = db.get_db()
-    if conn is None:
-        return []
     
-    # 둘 다 없으면 빈 리스트 반환
+    # 둘 다 없으면 빈 페이지 반환
     if not search_term and not tag:
-        return []
+        return Page.empty(page, per_page)
     
     # 검색어와 태그 전처리 (공백 제거)
     search_term = search_term.strip() if search_term else None
     tag = tag.strip() if tag else None
     
-    # 둘 다 비어있으면 빈 리스트 반환
+    # 둘 다 비어있으면 빈 페이지 반환
     if not search_term and not tag:
-        return []
+        return Page.empty(page, per_page)
+    
+    # 태그 검색식 해석 (문법 오류는 호출자에게 그대로 전달)
+    tag_query = parse_query(tag) if tag else None
     
     try:
-        if search_term and tag:
-            # 제목 + 태그 검색
-            return content_dao.search_by_title_and_tag(conn, search_term, tag)
-        elif tag:
-            # 태그만 검색
-            return content_dao.search_by_tag(conn, tag)
+        # 메모리 색인으로 결과 ID 집합을 구하고 현재 페이지만 DB 에서 읽는다
+        if search_index.ensure_fresh():
+            if sort == "latest":
+                keys = _keep_filtered(_search_keys(search_term, tag_query), filters)
+                return _page_of_keys(conn, keys, page, per_page, after)
+            scored = _keep_filtered(_rank_scores(search_term, tag_query), filters)
+            return _ranked_page(conn, scored, page, per_page, after)
+
+        # 색인을 쓸 수 없으면 SQL LIKE 검색
+        if tag_query:
+            # 태그 (+ 제목) 검색
+            return content_dao.search_by_tag_query(conn, tag_query, search_term, page, per_page, after)
         else:
             # 제목만 검색
-            return content_dao.search_by_title(conn, search_term)
+            return content_dao.search_by_title(conn, search_term, page, per_page, after)
     except Exception as e:
-        # 에러 발생 시 빈 리스트 반환
+        # 에러 발생 시 빈 페이지 반환
         print(f"검색 중 오류 발생: {str(e)}")
-        return []
+        return Page.empty(page, per_page)
+
+
+def suggest(query: str, limit: int = SUGGEST_LIMIT) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    검색창 자동완성 후보 (메모리 트라이만 사용, DB 조회 없음)
+
+    Args:
+        query: 입력 중인 문자열 (한글 초성 가능, 예: 'ㅈㄷ')
+        limit: 종류별 최대 개수 (1 ~ SUGGEST_MAX_LIMIT)
+
+    Returns:
+        {'title': [...], 'tag': [...], 'producer': [...], 'series': [...]}
+    """
+    query = (query or "").strip()[:SUGGEST_MAX_QUERY]
+    limit = min(max(int(limit), 1), SUGGEST_MAX_LIMIT)
+    return suggester.suggest(query, limit)
+
+
+def suggest_correction(search_term: Optional[str], tag: Optional[str]) -> Optional[Dict[str, Optional[str]]]:
+    """
+    결과가 없는 검색어의 오타 교정안 (메모리 사전만 사용, SEARCH_SPELLING_BUDGET_MS 안에서)
+
+    - 제목: 제목 단어 사전 기준으로 단어별 교정
+    - 태그: 어떤 태그에도 걸리지 않는 항만 태그 이름 사전 기준으로 교정
+
+    Args:
+        search_term: 검색어 (제목)
+        tag: 태그명 또는 태그 검색식
+
+    Returns:
+        {'search_term': ..., 'tag': ...} (바뀐 것이 없거나 색인을 쓸 수 없으면 None)
+
+    Raises:
+        QuerySyntaxError: 태그 검색식 문법 오류
+    """
+    search_term = search_term.strip() if search_term else None
+    tag = tag.strip() if tag else None
+    if (not search_term and not tag) or not search_index.ensure_fresh():
+        return None
+
+    budget = current_app.config.get("SEARCH_SPELLING_BUDGET_MS", 20)
+    deadline = time.perf_counter() + budget / 1000
+
+    corrected_term = search_index.correct_title(search_term, deadline) if search_term else None
+
+    corrected_tag = None
+    if tag:
+        node = parse_query(tag)
+        mapping = {}
+        for term in query_terms(node):
+            if not reference_service.find_tag_codes(term):
+                fixed = reference_service.correct_tag(term, deadline)
+                if fixed:
+                    mapping[term] = fixed
+        if mapping:
+            corrected_tag = query_text(replace_terms(node, mapping))
+
+    if not corrected_term and not corrected_tag:
+        return None
+    return {"search_term": corrected_term or search_term, "tag": corrected_tag or tag}
@@ -0,0 +1,210 @@
+# app/services/like_buffer.py
+# 리뷰 좋아요 쓰기 지연(write-behind) 버퍼
+#
+# - 인기 리뷰에 좋아요가 몰리면 요청마다 같은 RATING 행을 잠그고 커밋하게 된다.
+#   LIKE_WRITE_BEHIND=True 면 요청은 (누른 회원, MID, CID) 좋아요를 메모리에 모으기만 하고,
+#   백그라운드 스레드가 LIKE_FLUSH_INTERVAL 초마다 모아 둔 좋아요를
+#   배열 DML 한 번(review_dao.record_likes: 원장 INSERT + Likes 증가)으로 반영한다.
+# - 가장 오래된 좋아요가 LIKE_MAX_STALENESS 초를 넘기면 (스레드가 밀린 경우)
+#   좋아요를 누른 요청이 직접 비운다.
+# - 반영에 실패한 좋아요는 버퍼로 되돌려 다음 주기에 다시 시도한다.
+#   원장 PK 에 걸린 중복(다른 워커에서 이미 누름)과 그 사이 삭제된 리뷰의 좋아요는 버린다.
+# - 중복은 원장이 거르므로 워커마다 따로 버퍼를 가져도 합계는 맞다.
+#   다만 프로세스가 비정상 종료되면 아직 반영하지 않은 좋아요는 잃는다.
+import atexit
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from app.db import DURABILITY_ASYNC, db
+from app.models import review_dao
+from app.services.like_filter import like_filter
+
+ReviewKey = Tuple[str, int]
+# (누른 회원 ID, MID, CID)
+LikeKey = Tuple[str, str, int]
+
+DEFAULT_FLUSH_INTERVAL = 2.0
+DEFAULT_MAX_STALENESS = 10.0
+
+
+class LikeBuffer:
+    def __init__(self):
+        self.enabled = False
+        self.flush_interval = DEFAULT_FLUSH_INTERVAL
+        self.max_staleness = DEFAULT_MAX_STALENESS
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # 순서를 지키는 집합으로 dict 를 쓴다 (값은 None)
+        self._pending: Dict[LikeKey, None] = {}
+        # 리뷰별 좋아요 수 (반영 중인 것 포함, 커밋 전까지는 pending() 에 포함)
+        self._counts: Counter = Counter()
+        self._oldest: Optional[float] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._atexit_registered = False
+        self._stats = {"added": 0, "flushes": 0, "rows": 0, "duplicates": 0, "dropped": 0, "errors": 0}
+
+    def init_app(self, app):
+        """Flask 앱 초기화 시 설정을 읽고, 켜져 있으면 반영 스레드를 시작합니다."""
+        self.enabled = bool(app.config.get("LIKE_WRITE_BEHIND", False))
+        self.flush_interval = float(app.config.get("LIKE_FLUSH_INTERVAL", DEFAULT_FLUSH_INTERVAL))
+        self.max_staleness = float(app.config.get("LIKE_MAX_STALENESS", DEFAULT_MAX_STALENESS))
+        app.extensions["like_buffer"] = self
+
+        if self.enabled:
+            self.start()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="like-flush", daemon=True)
+        self._thread.start()
+        if not self._atexit_registered:
+            # 정상 종료 시 남은 증가분 반영
+            atexit.register(self.stop)
+            self._atexit_registered = True
+
+    def stop(self) -> None:
+        """반영 스레드를 멈추고 남은 증가분을 반영"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval + 1)
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def add(self, actor_member_id: str, member_id: str, content_id: int) -> bool:
+        """
+        좋아요 기록
+
+        Args:
+            actor_member_id: 좋아요를 누른 회원 ID
+            member_id: 리뷰 작성자 ID (MID)
+            content_id: 콘텐츠 ID (CID)
+
+        Returns:
+            버퍼에 이미 같은 좋아요가 있으면 False
+        """
+        key = (actor_member_id, member_id, int(content_id))
+        now = time.monotonic()
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending[key] = None
+            self._counts[key[1:]] += 1
+            self._stats["added"] += 1
+            if self._oldest is None:
+                self._oldest = now
+            overdue = now - self._oldest >= self.max_staleness
+
+        if overdue:
+            # 반영 스레드가 밀렸다 - 이미 누가 비우는 중이면 기다리지 않는다
+            self.flush(blocking=False)
+        return True
+
+    def pending(self, member_id: str, content_id: int) -> int:
+        """아직 DB 에 반영되지 않은 이 리뷰의 좋아요 수"""
+        with self._lock:
+            return self._counts.get((member_id, int(content_id)), 0)
+
+    def apply_pending(self, reviews: List[dict], content_id: Optional[int] = None) -> List[dict]:
+        """
+        리뷰 행들의 likes 에 아직 반영되지 않은 좋아요 수를 더한다 (이 워커의 것만).
+
+        Args:
+            reviews: 'mid', 'cid', 'likes' 를 가진 리뷰 dict 목록
+            content_id: 행에 'cid' 가 없을 때 쓸 콘텐츠 ID
+        """
+        if not self.enabled:
+            return reviews
+        with self._lock:
+            if not self._counts:
+                return reviews
+            for review in reviews:
+                cid = review.get("cid", content_id)
+                if cid is None or review.get("mid") is None:
+                    continue
+                extra = self._counts.get((review["mid"], int(cid)), 0)
+                if extra:
+                    review["likes"] = (review.get("likes") or 0) + extra
+        return reviews
+
+    def flush(self, conn=None, blocking: bool = True) -> int:
+        """
+        모아 둔 좋아요를 배열 DML 한 번으로 반영하고 커밋 (COMMIT WRITE BATCH NOWAIT)
+
+        Args:
+            conn: 사용할 연결 (없으면 풀에서 잠시 빌린다)
+            blocking: False 면 다른 스레드가 반영 중일 때 바로 돌아온다
+
+        Returns:
+            반영한 좋아요 수 (중복/삭제된 리뷰로 버린 것 제외)
+        """
+        if not self._flush_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                batch, self._pending = list(self._pending), {}
+                oldest, self._oldest = self._oldest, None
+
+            try:
+                if conn is not None:
+                    results = review_dao.record_likes(conn, batch)
+                    db.commit(conn, DURABILITY_ASYNC)
+                else:
+                    if db.pool is None:
+                        raise RuntimeError("DB pool is not initialized.")
+                    with db.pool.acquire() as own_conn:
+                        results = review_dao.record_likes(own_conn, batch)
+                        db.commit(own_conn, DURABILITY_ASYNC)
+            except Exception as e:
+                # 되돌려 놓고 다음 주기에 다시 시도 (리뷰별 수는 그대로 두었다)
+                with self._lock:
+                    restored = dict.fromkeys(batch)
+                    restored.update(self._pending)
+                    self._pending = restored
+                    if oldest is not None and (self._oldest is None or oldest < self._oldest):
+                        self._oldest = oldest
+                    self._stats["errors"] += 1
+                print(f"좋아요 반영 실패 ({len(batch)}건, 다음 주기에 재시도): {e}")
+                return 0
+
+            recorded = results.count(review_dao.LIKE_RECORDED)
+            duplicates = results.count(review_dao.LIKE_DUPLICATE)
+            dropped = [batch[i][1:] for i, result in enumerate(results) if result == review_dao.LIKE_MISSING]
+            with self._lock:
+                for key in batch:
+                    review_key = key[1:]
+                    self._counts[review_key] -= 1
+                    if self._counts[review_key] <= 0:
+                        del self._counts[review_key]
+                self._stats["flushes"] += 1
+                self._stats["rows"] += recorded
+                self._stats["duplicates"] += duplicates
+                self._stats["dropped"] += len(dropped)
+            # 원장에 들어간(또는 이미 있던) 좋아요만 중복 필터에 넣는다
+            for key, result in zip(batch, results):
+                if result != review_dao.LIKE_MISSING:
+                    like_filter.add(*key)
+            if dropped:
+                print(f"삭제된 리뷰의 좋아요 {len(dropped)}건을 버렸습니다: {dropped[:5]}")
+            return recorded
+        finally:
+            self._flush_lock.release()
+
+    def stats(self) -> Dict[str, int]:
+        """누적 통계 (added, flushes, rows, duplicates, dropped, errors, pending)"""
+        with self._lock:
+            return dict(self._stats, pending=len(self._pending))
+
+
+# 싱글톤 인스턴스
+like_buffer = LikeBuffer()
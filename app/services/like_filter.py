@@ -0,0 +1,157 @@
+# app/services/like_filter.py
+# 리뷰 좋아요 중복 필터 (REVIEW_LIKE 원장 앞의 블룸 필터)
+#
+# - 회원당 리뷰 하나에 좋아요 한 번은 REVIEW_LIKE 의 PK (ActorID, MID, CID) 가 보장한다.
+#   이 필터는 처음 누르는 좋아요의 중복 확인(원장 조회)을 건너뛰는 용도.
+# - 시작할 때 원장 전체로 채우고, 이 워커에서 기록된 좋아요를 더해 간다.
+#   '확실히 안 누름' 이면 조회 없이 기록으로 보내고 (다른 워커에서 누른 건 PK 가 거절),
+#   '아마 누름' 이면 원장 PK 를 조회해 실제로 있을 때만 거절한다
+#   (블룸 필터의 오탐이나 지워진 좋아요 때문에 누를 수 없는 일은 없다).
+# - 블룸 필터는 삭제를 지원하지 않으므로 리뷰/회원/콘텐츠가 삭제되면 invalidate() 로
+#   비우고 백그라운드에서 원장으로 다시 채운다.
+import threading
+from typing import Optional
+
+from app.db import db
+from app.models import review_dao
+from app.utils.bloom import BloomFilter
+
+DEFAULT_CAPACITY = 1_000_000
+DEFAULT_ERROR_RATE = 0.001
+
+
+def _key(actor_member_id: str, review_member_id: str, content_id: int) -> str:
+    return f"{actor_member_id}\x1f{review_member_id}\x1f{int(content_id)}"
+
+
+class LikeFilter:
+    def __init__(self):
+        self.enabled = True
+        self.capacity = DEFAULT_CAPACITY
+        self.error_rate = DEFAULT_ERROR_RATE
+        self._bloom: Optional[BloomFilter] = None
+        self._lock = threading.Lock()
+        self._warned_saturated = False
+        # 삭제 후 백그라운드 재구축 (실행 중에 또 삭제되면 끝난 뒤 한 번 더)
+        self._rebuilding = False
+        self._rebuild_pending = False
+        self._stats = {"hits": 0, "confirmed": 0, "added": 0, "rebuilds": 0}
+
+    def init_app(self, app):
+        """Flask 앱 초기화 시 설정을 읽고 좋아요 원장으로 필터를 채웁니다."""
+        self.enabled = bool(app.config.get("LIKE_FILTER_ENABLED", True))
+        self.capacity = int(app.config.get("LIKE_FILTER_CAPACITY", DEFAULT_CAPACITY))
+        self.error_rate = float(app.config.get("LIKE_FILTER_ERROR_RATE", DEFAULT_ERROR_RATE))
+        app.extensions["like_filter"] = self
+
+        if not self.enabled:
+            return
+        try:
+            self.rebuild()
+            print(f"✅ Like filter built ({len(self._bloom)} likes)")
+        except Exception as e:
+            # 빈 필터로 시작 - 중복은 원장 PK 가 거절한다
+            self.reset()
+            print(f"⚠️  Like filter build skipped: {e}")
+
+    def reset(self) -> None:
+        """빈 필터로 교체"""
+        with self._lock:
+            self._bloom = BloomFilter(self.capacity, self.error_rate)
+            self._warned_saturated = False
+
+    def rebuild(self, conn=None) -> None:
+        """
+        좋아요 원장 전체로 다시 채운다
+
+        Args:
+            conn: 사용할 연결 (없으면 풀에서 잠시 빌린다)
+        """
+        if conn is not None:
+            rows = review_dao.get_like_ledger_rows(conn)
+        else:
+            if db.pool is None:
+                raise RuntimeError("DB pool is not initialized.")
+            with db.pool.acquire() as own_conn:
+                rows = review_dao.get_like_ledger_rows(own_conn)
+
+        bloom = BloomFilter(max(self.capacity, len(rows) * 2), self.error_rate)
+        bloom.update(_key(*row) for row in rows)
+        with self._lock:
+            self._bloom = bloom
+            self._warned_saturated = False
+            self._stats["rebuilds"] += 1
+
+    def invalidate(self) -> None:
+        """
+        리뷰/회원/콘텐츠 삭제를 커밋한 뒤 호출 - 지워진 좋아요가 필터에 남지 않도록
+        바로 비우고 백그라운드 스레드에서 원장으로 다시 채운다.
+        (비어 있는 동안에는 중복 좋아요를 원장 PK 가 거른다)
+        """
+        if not self.enabled:
+            return
+        self.reset()
+        with self._lock:
+            self._rebuild_pending = True
+            if self._rebuilding:
+                return
+            self._rebuilding = True
+        threading.Thread(target=self._rebuild_loop, name="like-filter-rebuild", daemon=True).start()
+
+    def _rebuild_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._rebuild_pending:
+                    self._rebuilding = False
+                    return
+                self._rebuild_pending = False
+            try:
+                self.rebuild()
+            except Exception as e:
+                print(f"⚠️  Like filter rebuild failed: {e}")
+
+    def already_liked(self, actor_member_id: str, review_member_id: str, content_id: int) -> bool:
+        """
+        이미 좋아요를 눌렀는지
+
+        필터가 '확실히 안 누름' 이면 DB 를 보지 않고 False,
+        '아마 누름' 이면 원장 PK 를 조회해 실제로 있을 때만 True.
+        """
+        if not self.enabled or self._bloom is None:
+            return False
+        if _key(actor_member_id, review_member_id, content_id) not in self._bloom:
+            return False
+        liked = review_dao.has_liked(db.get_db(), actor_member_id, review_member_id, content_id)
+        with self._lock:
+            self._stats["hits"] += 1
+            self._stats["confirmed"] += int(liked)
+        return liked
+
+    def add(self, actor_member_id: str, review_member_id: str, content_id: int) -> None:
+        """기록된(또는 원장에 이미 있던) 좋아요를 필터에 추가"""
+        if not self.enabled:
+            return
+        if self._bloom is None:
+            self.reset()
+        with self._lock:
+            self._bloom.add(_key(actor_member_id, review_member_id, content_id))
+            self._stats["added"] += 1
+            saturated = self._bloom.saturated and not self._warned_saturated
+            if saturated:
+                self._warned_saturated = True
+        if saturated:
+            print(f"⚠️  Like filter is over capacity ({self.capacity}); raise LIKE_FILTER_CAPACITY")
+
+    def reset_stats(self) -> None:
+        """누적 통계 초기화"""
+        with self._lock:
+            self._stats = {"hits": 0, "confirmed": 0, "added": 0, "rebuilds": 0}
+
+    def stats(self):
+        """누적 통계 (hits, confirmed(원장에 실제로 있던 hit), added, rebuilds, size)"""
+        with self._lock:
+            return dict(self._stats, size=len(self._bloom) if self._bloom is not None else 0)
+
+
+# 싱글톤 인스턴스
+like_filter = LikeFilter()
@@ -15,8 +15,6 @@ class InvalidLoginError(MemberServiceError):
 
 def login(user_id: str, password: str):
     conn = db.get_db()
-    if conn is None:
-        raise MemberServiceError("데이터베이스 연결에 실패했습니다. 관리자에게 문의하세요.")
 
     member = member_dao.get_member_by_id(conn, user_id)
 
@@ -38,8 +36,6 @@ def register(form):
     }
     """
     conn = db.get_db()
-    if conn is None:
-        raise MemberServiceError("데이터베이스 연결에 실패했습니다. 관리자에게 문의하세요.")
 
     user_id = form.get("id")
     password = form.get("password")
@@ -73,8 +69,6 @@ def register(form):
 
 def get_profile(user_id: str):
     conn = db.get_db()
-    if conn is None:
-        raise MemberServiceError("데이터베이스 연결에 실패했습니다. 관리자에게 문의하세요.")
 
     member = member_dao.get_member_by_id(conn, user_id)
     if member is None:
@@ -93,8 +87,6 @@ def update_profile(user_id: str, form):
     }
     """
     conn = db.get_db()
-    if conn is None:
-        raise MemberServiceError("데이터베이스 연결에 실패했습니다. 관리자에게 문의하세요.")
 
     updates = {}
     if form.get("password"):
@@ -0,0 +1,245 @@
+# app/services/reference_service.py
+# 기준 정보(제작사, 시리즈, 태그) 캐시
+#
+# - 처음 필요할 때 테이블 전체를 읽어 app.cache 에 올린다 (read-through, 'reference' 네임스페이스).
+# - 종류별 캐시 태그(cache_tag)를 달고, 관리자 등록/수정/삭제가 커밋되면 invalidate 로
+#   태그를 무효화한다. CACHE_BACKEND=shared 면 다른 워커에도 바로 반영되고,
+#   lru 면 REFERENCE_CACHE_TTL(초)이 지나면 반영된다.
+# - 한 요청 안에서는 처음 가져온 값을 g 에 두고 다시 쓴다 (행마다 캐시를 다시 읽지 않도록).
+#   FK 로 연결된 ID 를 찾지 못하면(캐시가 낡은 것) 그 자리에서 한 번 다시 읽는다.
+from typing import Any, Dict, Iterable, List, Optional
+
+from flask import current_app, g, has_app_context
+
+from app.cache import cache
+from app.db import db
+from app.models import reference_dao
+from app.search.spelling import SpellingIndex
+from app.search.text import normalize
+
+PRODUCERS = "producers"
+SERIES = "series"
+TAGS = "tags"
+
+DEFAULT_TTL = 300
+
+
+def _build_producers(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "rows": rows,
+        "by_id": {row["prodcoid"]: row for row in rows},
+        "options": sorted(
+            ({"id": row["prodcoid"], "name": row["prodname"]} for row in rows),
+            key=lambda opt: opt["name"] or "",
+        ),
+    }
+
+
+def _build_series(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    return {
+        "rows": rows,
+        "by_id": {row["seriesid"]: row for row in rows},
+        "options": [{"id": row["seriesid"], "name": row["sname"]} for row in rows],
+    }
+
+
+def _build_tags(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    by_category: Dict[str, List[Dict[str, Any]]] = {}
+    for row in rows:
+        tag = {"code": row["tagcode"], "category": row["category"], "name": row["tag"]}
+        by_category.setdefault(row["category"], []).append(tag)
+    return {
+        "rows": rows,
+        "by_id": {row["tagcode"]: row for row in rows},
+        "by_category": by_category,
+        "categories": sorted(by_category),
+        # 태그 검색용 정규화 이름 [(TagCode, 이름)]
+        "normalized": [(row["tagcode"], normalize(row["tag"])) for row in rows],
+        # 태그 이름 단어 오타 교정 사전
+        "spelling": SpellingIndex.from_texts(normalize(row["tag"]) for row in rows),
+    }
+
+
+_LOADERS: Dict[str, tuple] = {
+    PRODUCERS: (reference_dao.get_all_producers, _build_producers),
+    SERIES: (reference_dao.get_all_series, _build_series),
+    TAGS: (reference_dao.get_all_tags, _build_tags),
+}
+
+
+def _ttl() -> Optional[int]:
+    if has_app_context():
+        return int(current_app.config.get("REFERENCE_CACHE_TTL", DEFAULT_TTL)) or None
+    return DEFAULT_TTL
+
+
+def _memo() -> Dict[str, Dict[str, Any]]:
+    """이번 요청에서 이미 가져온 기준 정보 {kind: 데이터}"""
+    if not has_app_context():
+        return {}
+    if "reference_data" not in g:
+        g.reference_data = {}
+    return g.reference_data
+
+
+def _get(kind: str, refresh: bool = False) -> Dict[str, Any]:
+    """
+    캐시된 기준 정보 조회 (없거나 무효화됐으면 DB 에서 다시 읽음)
+
+    Args:
+        kind: PRODUCERS / SERIES / TAGS
+        refresh: True 면 캐시 상태와 관계없이 다시 읽는다
+    """
+    memo = _memo()
+    if not refresh and kind in memo:
+        return memo[kind]
+
+    key = f"reference:{kind}"
+    if refresh:
+        cache.delete(key)
+    load, build = _LOADERS[kind]
+    data = cache.get_or_load(key, lambda: build(load(db.get_db())), ttl=_ttl(), tags=[cache_tag(kind)])
+    memo[kind] = data
+    return data
+
+
+def _lookup(kind: str, key) -> Optional[Dict[str, Any]]:
+    """ID 로 한 행 조회. 캐시에 없으면 한 번 다시 읽어서 확인한다."""
+    if key is None:
+        return None
+    key = int(key)
+    row = _get(kind)["by_id"].get(key)
+    if row is None:
+        row = _get(kind, refresh=True)["by_id"].get(key)
+    return row
+
+
+def cache_tag(kind: str) -> str:
+    """기준 정보 종류별 캐시 태그 (이 정보로 만든 app.cache 항목/색인이 의존)"""
+    return f"reference:{kind}"
+
+
+def invalidate(*kinds: str) -> None:
+    """
+    기준 정보 캐시 무효화 (관리자 수정 커밋 후 호출)
+
+    Args:
+        kinds: 무효화할 종류. 생략하면 전체
+    """
+    kinds = kinds or tuple(_LOADERS)
+    memo = _memo()
+    for kind in kinds:
+        memo.pop(kind, None)
+    cache.invalidate_tags(*(cache_tag(kind) for kind in kinds))
+
+
+# ----------------------------------------------------
+# 제작사
+# ----------------------------------------------------
+def get_producers() -> List[Dict[str, Any]]:
+    """전체 제작사 [{'prodcoid', 'prodname', 'prodinfo'}] (최근 등록순, 읽기 전용)"""
+    return _get(PRODUCERS)["rows"]
+
+
+def get_producer_options() -> List[Dict[str, Any]]:
+    """선택 목록용 제작사 [{'id', 'name'}] (이름순)"""
+    return _get(PRODUCERS)["options"]
+
+
+def get_producer(producer_id) -> Optional[Dict[str, Any]]:
+    return _lookup(PRODUCERS, producer_id)
+
+
+# ----------------------------------------------------
+# 시리즈
+# ----------------------------------------------------
+def get_series_list() -> List[Dict[str, Any]]:
+    """전체 시리즈 [{'seriesid', 'sname'}] (이름순, 읽기 전용)"""
+    return _get(SERIES)["rows"]
+
+
+def get_series_options() -> List[Dict[str, Any]]:
+    """선택 목록용 시리즈 [{'id', 'name'}] (이름순)"""
+    return _get(SERIES)["options"]
+
+
+def get_series(series_id) -> Optional[Dict[str, Any]]:
+    return _lookup(SERIES, series_id)
+
+
+# ----------------------------------------------------
+# 태그
+# ----------------------------------------------------
+def get_tags() -> List[Dict[str, Any]]:
+    """전체 태그 [{'tagcode', 'category', 'tag'}] (카테고리, 태그명순, 읽기 전용)"""
+    return _get(TAGS)["rows"]
+
+
+def get_tags_by_category() -> Dict[str, List[Dict[str, Any]]]:
+    """카테고리별 태그 {category: [{'code', 'category', 'name'}]}"""
+    return _get(TAGS)["by_category"]
+
+
+def get_tag_categories() -> List[str]:
+    """태그 카테고리 목록 (정렬됨)"""
+    return _get(TAGS)["categories"]
+
+
+def find_tag_codes(pattern: str) -> List[int]:
+    """
+    이름에 pattern 이 들어간 태그 코드 목록 (UPPER(Tag) LIKE '%pattern%' 과 같은 의미)
+    """
+    query = normalize(pattern)
+    if not query:
+        return []
+    return [code for code, name in _get(TAGS)["normalized"] if query in name]
+
+
+def correct_tag(term: str, deadline: Optional[float] = None) -> Optional[str]:
+    """
+    태그 이름 오타 교정 (예: 'acton' -> 'action')
+
+    Args:
+        deadline: time.perf_counter() 기준 마감 시각
+
+    Returns:
+        교정한 태그 항 (바뀐 것이 없으면 None)
+    """
+    return _get(TAGS)["spelling"].correct(normalize(term), deadline)
+
+
+def resolve_tags(tag_codes: Iterable) -> List[Dict[str, Any]]:
+    """
+    태그 코드 목록을 태그 행으로 변환 (카테고리, 태그명순)
+
+    Args:
+        tag_codes: TAG_TO.TCode 값들
+    """
+    rows = [_lookup(TAGS, code) for code in tag_codes]
+    rows = [row for row in rows if row is not None]
+    return sorted(rows, key=lambda row: (row["category"] or "", row["tag"] or ""))
+
+
+def group_tag_names(tag_codes: Iterable, sep: str = ", ") -> Dict[str, str]:
+    """
+    태그 코드 목록을 상세 페이지용 카테고리별 이름 문자열로 묶는다.
+
+    Returns:
+        {category: '태그1, 태그2'}
+    """
+    grouped: Dict[str, List[str]] = {}
+    for row in resolve_tags(tag_codes):
+        grouped.setdefault(row["category"], []).append(row["tag"])
+    return {category: sep.join(names) for category, names in grouped.items()}
+
+
+def attach_names(row: Dict[str, Any], pid_key: str = "pid", sid_key: str = "sid") -> Dict[str, Any]:
+    """
+    콘텐츠 행에 제작사/시리즈 이름을 채운다 (prodname, prodinfo, sname).
+    """
+    producer = get_producer(row.get(pid_key))
+    series = get_series(row.get(sid_key))
+    row["prodname"] = producer["prodname"] if producer else None
+    row["prodinfo"] = producer["prodinfo"] if producer else None
+    row["sname"] = series["sname"] if series else None
+    return row
@@ -63,9 +63,26 @@ def like_review(member_id: str, rating_id: int) -> None:
         # with 블록을 빠져나가면 commit
 '''
 
-from app.db import db
-from app.models import review_dao
-import oracledb
+from typing import Any, Dict, List, Optional
+
+from flask import current_app
+
+from app.cache import cache
+from app.db import DURABILITY_ASYNC, db
+from app.models import content_dao, review_dao
+from app.search import REVIEWS_TAG, normalize, review_index
+from app.services.like_buffer import like_buffer
+from app.services.like_filter import like_filter
+from app.utils.pagination import DEFAULT_PER_PAGE, Page, paginate_keys
+
+# 리뷰 검색 결과(콘텐츠별 묶음) 정렬: 일치 리뷰 수, ContentID 내림차순
+REVIEW_SEARCH_ORDER = [("MatchCount", "DESC", "int"), ("ContentID", "DESC", "int")]
+# 콘텐츠 묶음마다 보여줄 일치 리뷰 수
+REVIEW_SEARCH_SNIPPETS = 3
+# 검색어 최대 길이
+REVIEW_SEARCH_MAX_QUERY = 100
+# 리뷰 검색 결과 캐시 네임스페이스
+REVIEW_SEARCH_NAMESPACE = "review_search"
 
 
 class ReviewServiceError(Exception):
@@ -83,55 +100,214 @@ class ReviewNotFoundError(ReviewServiceError):
     pass
 
 
-def create_review(member_id: str, content_id: int, rating: int, comment: str) -> None:
+class ReviewConflictError(ReviewServiceError):
+    """수정 폼을 연 뒤 다른 곳에서 리뷰가 먼저 수정되었을 때"""
+    pass
+
+
+class ReviewAlreadyLikedError(ReviewServiceError):
+    """이미 좋아요를 누른 리뷰일 때"""
+    pass
+
+
+def _stats_of(result: Dict[str, Any]) -> Dict[str, Any]:
+    return {"reviewcount": result["reviewcount"], "avgrating": result["avgrating"]}
+
+
+def create_review(member_id: str, content_id: int, rating: int, comment: str) -> Dict[str, Any]:
     """
     리뷰 작성 서비스.
 
-    - 같은 사용자가 같은 콘텐츠에 중복 리뷰 못 쓰게 막기
-    - 트랜잭션 안에서 INSERT 수행
+    - (MID, CID) PK 에 기대는 MERGE 로 중복 없이 INSERT 하고, 평점 요약(CONTENT_STATS)
+      갱신까지 PL/SQL 블록 하나로 처리한다 (사전 존재 확인 SELECT 없음, DB 왕복 1번)
+
+    Returns:
+        갱신된 평점 요약 {'reviewcount', 'avgrating'}
     """
     with db.transaction() as conn:
-        # 1) 기존 리뷰 존재 여부 검사
-        existing = review_dao.get_review_by_member_and_content(conn, member_id, content_id)
-        if existing is not None:
+        result = review_dao.write_review(conn, "create", member_id, content_id, rating, comment)
+        if result["status"] == "exists":
             raise ReviewAlreadyExistsError("이미 이 콘텐츠에 작성한 리뷰가 있습니다.")
 
-        # 2) 신규 리뷰 INSERT
-        try:
-            review_dao.insert_review(conn, member_id, content_id, rating, comment)
-        except oracledb.IntegrityError as e:
-            # UNIQUE (MID, CID) 제약 등을 걸어놨다면 여기서도 중복 잡힘
-            if "ORA-00001" in str(e):
-                raise ReviewAlreadyExistsError("이미 이 콘텐츠에 작성한 리뷰가 있습니다.")
-            raise
+    # 커밋 후 리뷰 본문 색인 반영
+    review_index.put_review(member_id, content_id, comment)
+    return _stats_of(result)
+
+
+def update_review(member_id: str, content_id: int, rating: int, comment: str,
+                  version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    리뷰 수정 서비스 (낙관적 동시성 제어).
+
+    - 폼을 열 때 읽은 Version 이 그대로일 때만 UPDATE 하고 Version 을 올린다.
+      폼을 보는 동안에는 행 잠금을 잡지 않는다.
+    - 평점 요약 갱신까지 PL/SQL 블록 하나로 처리
+
+    Args:
+        version: 수정 폼의 Version (None 이면 확인하지 않고 덮어쓴다)
+
+    Returns:
+        갱신된 평점 요약 {'reviewcount', 'avgrating'}
 
+    Raises:
+        ReviewNotFoundError: 리뷰가 없을 때
+        ReviewConflictError: 그 사이 다른 수정이 있었을 때
+    """
+    with db.transaction() as conn:
+        result = review_dao.write_review(conn, "update", member_id, content_id, rating, comment, version)
+        if result["status"] == "missing":
+            raise ReviewNotFoundError("작성한 리뷰가 없습니다.")
+        if result["status"] == "conflict":
+            raise ReviewConflictError(
+                "리뷰를 수정하는 사이에 다른 곳에서 먼저 수정되었습니다. 최신 내용을 확인한 뒤 다시 수정해주세요."
+            )
+
+    review_index.put_review(member_id, content_id, comment)
+    return _stats_of(result)
+
+
+def delete_review(member_id: str, content_id: int) -> Dict[str, Any]:
+    """
+    리뷰 삭제 서비스.
+
+    - DELETE ... RETURNING 으로 삭제된 평점을 받아 평점 요약에서 차감 (PL/SQL 블록 하나)
+
+    Returns:
+        갱신된 평점 요약 {'reviewcount', 'avgrating'}
+    """
+    with db.transaction() as conn:
+        result = review_dao.write_review(conn, "delete", member_id, content_id)
+        if result["status"] == "missing":
+            raise ReviewNotFoundError("삭제할 리뷰가 없습니다.")
+
+    review_index.remove_review(member_id, content_id)
+    # 리뷰와 함께 연쇄 삭제된 좋아요를 필터에서도 지운다
+    like_filter.invalidate()
+    return _stats_of(result)
+
+
+def get_review_form(member_id: str, content_id: int) -> Optional[Dict[str, Any]]:
+    """
+    리뷰 작성/수정 폼용 콘텐츠 제목과 내 리뷰 (한 번의 조회)
+
+    Returns:
+        {'content_id', 'title', 'rating', 'comment', 'version'} (리뷰가 없으면 rating 은 None),
+        콘텐츠가 없으면 None
+    """
+    conn = db.get_db()
+
+    return review_dao.get_review_form(conn, member_id, content_id)
+
+
+def get_my_reviews(member_id: str, page: int = 1, per_page: int = DEFAULT_PER_PAGE, after=None):
+    """
+    내가 작성한 리뷰 목록 (페이지 단위).
+    """
+    conn = db.get_db()
+
+    return review_dao.get_reviews_by_member(conn, member_id, page, per_page, after)
+
+def _review_search_groups(query: str) -> List[tuple]:
+    """
+    검색어가 들어 있는 리뷰를 콘텐츠별로 묶은 (일치 수, ContentID, MID 목록) 목록 (정렬됨, 캐시)
+    """
+    def load():
+        by_content: Dict[int, List[str]] = {}
+        for member_id, content_id in review_index.texts.search(query):
+            by_content.setdefault(content_id, []).append(member_id)
+        return sorted(
+            ((len(members), content_id, tuple(sorted(members))) for content_id, members in by_content.items()),
+            reverse=True,
+        )
+
+    return cache.get_or_load(
+        f"{REVIEW_SEARCH_NAMESPACE}:{normalize(query)}",
+        load,
+        ttl=current_app.config.get("SEARCH_CACHE_TTL", 300) or None,
+        tags=[REVIEWS_TAG],
+    )
+
+
+def search_reviews(query: str, page: int = 1, per_page: int = DEFAULT_PER_PAGE, after=None) -> Page:
+    """
+    리뷰 본문 검색 (콘텐츠별로 묶어서 페이지 단위)
+
+    Args:
+        query: 검색어 (띄어쓴 단어는 모두 들어 있어야 함)
+
+    Returns:
+        Page - items 는 콘텐츠 dict 에 'match_count'(일치 리뷰 수)와
+        'reviews'(일치 리뷰 최대 REVIEW_SEARCH_SNIPPETS 개)를 더한 것
+
+    Raises:
+        ReviewServiceError: 리뷰 색인을 쓸 수 없을 때
+    """
+    query = (query or "").strip()[:REVIEW_SEARCH_MAX_QUERY]
+    if not normalize(query):
+        return Page.empty(page, per_page)
 
-def get_my_reviews(member_id: str):
     conn = db.get_db()
-    if conn is None:
-        raise ReviewServiceError("데이터베이스 연결에 실패했습니다. 관리자에게 문의하세요.")
+    if not review_index.ensure_fresh():
+        raise ReviewServiceError("지금은 리뷰 검색을 사용할 수 없습니다. 잠시 후 다시 시도해주세요.")
+
+    groups, total, next_cursor = paginate_keys(
+        _review_search_groups(query), order_by=REVIEW_SEARCH_ORDER,
+        page=page, per_page=per_page, after=after,
+    )
+
+    # 현재 페이지의 콘텐츠와 리뷰만 DB 에서 읽는다
+    contents = content_dao.get_contents_by_ids(conn, [content_id for _, content_id, _ in groups])
+    review_keys = [
+        (member_id, content_id)
+        for _, content_id, members in groups
+        for member_id in members[:REVIEW_SEARCH_SNIPPETS]
+    ]
+    reviews_by_content: Dict[int, List[Dict[str, Any]]] = {}
+    for review in review_dao.get_reviews_by_keys(conn, review_keys):
+        reviews_by_content.setdefault(review["cid"], []).append(review)
+
+    match_counts = {content_id: count for count, content_id, _ in groups}
+    for content in contents:
+        content["match_count"] = match_counts.get(content["contentid"], 0)
+        content["reviews"] = reviews_by_content.get(content["contentid"], [])
+    return Page(contents, page, per_page, total, next_cursor)
 
-    return review_dao.get_reviews_by_member(conn, member_id)
 
 def like_review(actor_member_id: str, review_member_id: str, content_id: int) -> None:
     """
     리뷰 좋아요 서비스.
 
-    - SELECT ... FOR UPDATE 로 해당 리뷰 행을 잠그고
-    - 현재 Likes 값을 읽은 뒤 +1 해서 UPDATE
-    - 동시에 여러 사용자가 좋아요 눌러도 Likes 값이 꼬이지 않게 보장
+    - 회원당 리뷰 하나에 한 번만 누를 수 있다 (REVIEW_LIKE 원장의 PK).
+      like_filter(블룸 필터)가 '확실히 안 누름' 이면 원장 조회 없이 기록으로 보내고,
+      '아마 누름' 이면 원장 PK 를 조회해 실제로 있을 때만 거절한다.
+    - LIKE_WRITE_BEHIND 가 켜져 있으면 좋아요를 like_buffer 에 모으기만 하고
+      백그라운드에서 배열 DML 로 한꺼번에 반영한다 (LIKE_MAX_STALENESS 초 안에 반영).
+    - 꺼져 있으면 원장 INSERT 와 Likes = NVL(Likes, 0) + 1 을 PL/SQL 블록 하나로
+      처리한다 (DB 왕복 1번, 읽고-쓰기 없음, 갱신 손실 없음).
+    - 좋아요는 잃어도 되는 카운터이므로 리두 로그 기록을 기다리지 않고 커밋한다 (DURABILITY_ASYNC).
+    - 잠금 충돌(ORA-00060 등)은 db.run_transaction 이 재시도한다.
     """
-    # actor_member_id(눌러주는 사람)는 과제에서 따로 쓰지 않지만,
-    # 나중에 '자기 리뷰는 좋아요 못 누르게' 같은 검증에 활용 가능.
-    with db.transaction() as conn:
-        # 1) 대상 리뷰 행을 락 걸고 읽기
-        row = review_dao.get_review_for_update(conn, review_member_id, content_id)
-        if row is None:
-            raise ReviewNotFoundError("해당 리뷰를 찾을 수 없습니다.")
+    if actor_member_id == review_member_id:
+        raise ReviewServiceError("자신의 리뷰에는 좋아요를 누를 수 없습니다.")
+    if like_filter.already_liked(actor_member_id, review_member_id, content_id):
+        raise ReviewAlreadyLikedError("이미 좋아요를 누른 리뷰입니다.")
 
-        current_likes = row["likes"]
-        new_likes = current_likes + 1
+    if like_buffer.enabled:
+        # 버퍼 모드에서는 리뷰 존재 확인을 반영 시점으로 미룬다
+        # (다른 워커에서 이미 누른 좋아요와 그 사이 삭제된 리뷰의 좋아요는 버림,
+        #  필터에는 반영할 때 원장에 들어간 좋아요만 넣는다)
+        if not like_buffer.add(actor_member_id, review_member_id, content_id):
+            raise ReviewAlreadyLikedError("이미 좋아요를 누른 리뷰입니다.")
+        return
 
-        # 2) 좋아요 수 업데이트
-        review_dao.update_likes(conn, review_member_id, content_id, new_likes)
-        # with 블록을 빠져나가면 commit
+    # 교착 상태/잠금 대기 초과면 백오프 후 다시 실행 (사용자에게는 오류 대신 약간의 지연)
+    liked = db.run_transaction(
+        lambda conn: review_dao.record_like(conn, actor_member_id, review_member_id, content_id),
+        durability=DURABILITY_ASYNC,
+    )
+
+    if liked == review_dao.LIKE_MISSING:
+        raise ReviewNotFoundError("해당 리뷰를 찾을 수 없습니다.")
+    like_filter.add(actor_member_id, review_member_id, content_id)
+    if liked == review_dao.LIKE_DUPLICATE:
+        raise ReviewAlreadyLikedError("이미 좋아요를 누른 리뷰입니다.")
@@ -21,5 +21,106 @@ document.addEventListener('DOMContentLoaded', function() {
             form.classList.add('was-validated');
         }, false);
     });
-});
+    
+    // 리뷰 목록 "더 보기": 다음 페이지 조각을 받아서 목록 뒤에 붙인다
+    document.addEventListener('click', function(event) {
+        const link = event.target.closest('[data-review-more] a[data-fragment-url]');
+        if (!link) {
+            return;
+        }
+        event.preventDefault();
+        const wrapper = link.closest('[data-review-more]');
+        link.classList.add('disabled');
+
+        fetch(link.dataset.fragmentUrl, { headers: { 'X-Requested-With': 'fetch' } })
+            .then(function(response) {
+                if (!response.ok) {
+                    throw new Error(response.status);
+                }
+                return response.text();
+            })
+            .then(function(html) {
+                wrapper.insertAdjacentHTML('afterend', html);
+                wrapper.remove();
+            })
+            .catch(function() {
+                // 실패하면 일반 페이지 이동으로 대체
+                window.location.href = link.href;
+            });
+    });
+
+    // 검색창 자동완성: 입력이 멈추면 후보를 받아 입력칸 아래에 목록으로 보여준다
+    //  - 제목: 상세 페이지로 이동 / 태그: 태그 입력칸 채우기 / 제작사·시리즈: 제목 입력칸 채우기
+    const suggestForm = document.querySelector('form[data-suggest-url]');
+    if (suggestForm) {
+        const SUGGEST_LABELS = { title: '제목', tag: '태그', producer: '제작사', series: '시리즈' };
+        const suggestUrl = suggestForm.dataset.suggestUrl;
+        let suggestTimer = null;
+        let suggestSeq = 0;
+
+        suggestForm.querySelectorAll('input[data-suggest]').forEach(function(input) {
+            const menu = document.createElement('div');
+            menu.className = 'list-group position-absolute w-100 shadow-sm suggest-menu';
+            menu.hidden = true;
+            input.parentNode.classList.add('position-relative');
+            input.insertAdjacentElement('afterend', menu);
+            input.setAttribute('autocomplete', 'off');
 
+            function fill(target, value) {
+                const field = suggestForm.querySelector('input[name="' + target + '"]');
+                field.value = value;
+                field.focus();
+                menu.hidden = true;
+            }
+
+            function render(data) {
+                menu.innerHTML = '';
+                // 태그 입력칸에서는 태그 후보만
+                const kinds = input.dataset.suggest === 'tag' ? ['tag'] : ['title', 'tag', 'producer', 'series'];
+                kinds.forEach(function(kind) {
+                    (data[kind] || []).forEach(function(item) {
+                        const entry = document.createElement('a');
+                        entry.href = item.url || '#';
+                        entry.className = 'list-group-item list-group-item-action py-1';
+                        const badge = document.createElement('span');
+                        badge.className = 'badge bg-secondary me-2';
+                        badge.textContent = item.category || SUGGEST_LABELS[kind];
+                        entry.appendChild(badge);
+                        entry.appendChild(document.createTextNode(item.text));
+                        entry.addEventListener('mousedown', function(event) {
+                            if (kind === 'title') {
+                                return;  // 링크 이동
+                            }
+                            event.preventDefault();
+                            fill(kind === 'tag' ? 'tag' : 'search_term', item.text);
+                        });
+                        menu.appendChild(entry);
+                    });
+                });
+                menu.hidden = !menu.children.length;
+            }
+
+            input.addEventListener('input', function() {
+                clearTimeout(suggestTimer);
+                const query = input.value.trim();
+                if (!query) {
+                    menu.hidden = true;
+                    return;
+                }
+                suggestTimer = setTimeout(function() {
+                    const seq = ++suggestSeq;
+                    fetch(suggestUrl + '?q=' + encodeURIComponent(query))
+                        .then(function(response) { return response.ok ? response.json() : null; })
+                        .then(function(data) {
+                            // 늦게 도착한 이전 응답은 버린다
+                            if (data && seq === suggestSeq) {
+                                render(data);
+                            }
+                        })
+                        .catch(function() { menu.hidden = true; });
+                }, 150);
+            });
+            input.addEventListener('blur', function() { menu.hidden = true; });
+        });
+    }
+});
@@ -0,0 +1,74 @@
+"""
+블룸 필터 (bytearray 비트 배열)
+
+"이 키를 본 적이 있는가" 에 대해 '확실히 없음' 또는 '아마 있음' 으로 답한다.
+- 오탐(없는데 있다고 답함) 비율은 capacity 개를 넣었을 때 error_rate 이하
+- 미탐은 없다 (넣은 키는 항상 있다고 답한다)
+- 삭제는 지원하지 않는다 (지우려면 새로 만들어 다시 채운다)
+
+키 하나당 blake2b 해시 한 번으로 위치 k 개를 만든다 (이중 해싱: h1 + i * h2).
+"""
+import hashlib
+import math
+from typing import Iterable, Iterator
+
+
+class BloomFilter:
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Args:
+            capacity: 넣을 것으로 예상하는 키 수
+            error_rate: capacity 개를 넣었을 때의 목표 오탐 비율 (0 < error_rate < 1)
+        """
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        # m = -n ln p / (ln 2)^2, k = m / n * ln 2
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: str) -> Iterator[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str) -> bool:
+        """
+        키 추가
+
+        Returns:
+            새로 켜진 비트가 있으면 True (이전에 '확실히 없음' 이던 키)
+        """
+        added = False
+        for pos in self._positions(key):
+            byte, bit = pos >> 3, 1 << (pos & 7)
+            if not self._bits[byte] & bit:
+                self._bits[byte] |= bit
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    def update(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.add(key)
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def __len__(self) -> int:
+        """넣은 키 수 (근사값 - 이미 있다고 판단된 키는 세지 않는다)"""
+        return self._count
+
+    @property
+    def saturated(self) -> bool:
+        """capacity 를 넘겨 오탐 비율이 목표보다 커졌는지"""
+        return self._count > self.capacity
@@ -0,0 +1,345 @@
+"""
+DB 레벨 페이지네이션 유틸리티
+
+- OFFSET ... FETCH NEXT 로 현재 페이지의 행만 가져온다.
+- 전체 건수는 COUNT(*) OVER() 로 같은 쿼리에서 함께 받는다.
+- 정렬 키(예: ReleaseDate, ContentID)를 커서로 넘기면 keyset 방식으로
+  이전 페이지의 마지막 행 다음부터 바로 읽는다 (OFFSET 스캔 없음).
+"""
+import base64
+import heapq
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from flask import request
+
+DEFAULT_PER_PAGE = 20
+MAX_PER_PAGE = 100
+
+# 결과 dict 에서 제거할 내부 컬럼
+_TOTAL_COLUMN = "p_totalcount"
+
+
+class Page:
+    """
+    한 페이지 분량의 조회 결과
+
+    Attributes:
+        items: 현재 페이지 행 목록 (dict)
+        page: 현재 페이지 번호 (1부터)
+        per_page: 페이지당 행 수
+        total: 전체 행 수
+        next_cursor: 다음 페이지 keyset 커서 (없으면 None)
+    """
+
+    def __init__(self, items, page, per_page, total, next_cursor=None):
+        self.items = items
+        self.page = page
+        self.per_page = per_page
+        self.total = total
+        self.next_cursor = next_cursor
+
+    @property
+    def offset(self) -> int:
+        return (self.page - 1) * self.per_page
+
+    @property
+    def pages(self) -> int:
+        return max((self.total + self.per_page - 1) // self.per_page, 1)
+
+    @property
+    def has_prev(self) -> bool:
+        return self.page > 1
+
+    @property
+    def has_next(self) -> bool:
+        return self.offset + len(self.items) < self.total
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __len__(self):
+        return len(self.items)
+
+    @classmethod
+    def empty(cls, page=1, per_page=DEFAULT_PER_PAGE):
+        return cls([], page, per_page, 0)
+
+
+def get_page_args(default_per_page: int = DEFAULT_PER_PAGE) -> Tuple[int, int, Optional[str]]:
+    """
+    요청 파라미터에서 (page, per_page, after 커서)를 읽는다.
+    """
+    page = request.values.get("page", 1, type=int) or 1
+    per_page = request.values.get("per_page", default_per_page, type=int) or default_per_page
+    page = max(page, 1)
+    per_page = min(max(per_page, 1), MAX_PER_PAGE)
+    after = request.values.get("after") or None
+    return page, per_page, after
+
+
+# ----------------------------------------------------------
+# keyset 커서 인코딩
+# ----------------------------------------------------------
+# keyset 정의: [(컬럼명, 'ASC'|'DESC', 'date'|'int'|'float'|'str'), ...]
+# 컬럼명은 기본 쿼리의 SELECT 별칭과 같아야 한다.
+
+def _encode_value(value, kind: str) -> str:
+    if kind == "date":
+        return value.strftime("%Y%m%d%H%M%S")
+    return str(value)
+
+
+def _decode_value(raw: str, kind: str):
+    if kind == "date":
+        return datetime.strptime(raw, "%Y%m%d%H%M%S")
+    if kind == "int":
+        return int(raw)
+    if kind == "float":
+        return float(raw)
+    return raw
+
+
+def encode_cursor(row: Dict[str, Any], keyset: Sequence[Tuple[str, str, str]]) -> str:
+    """마지막 행의 정렬 키 값을 URL-safe 문자열로 만든다."""
+    parts = [_encode_value(row[col.lower()], kind) for col, _, kind in keyset]
+    raw = "\x1f".join(parts).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, keyset: Sequence[Tuple[str, str, str]]) -> Optional[List[Any]]:
+    """encode_cursor 의 역변환. 형식이 맞지 않으면 None."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("\x1f")
+        if len(parts) != len(keyset):
+            return None
+        return [_decode_value(raw, kind) for raw, (_, _, kind) in zip(parts, keyset)]
+    except (ValueError, UnicodeError):
+        return None
+
+
+def _keyset_predicate(keyset, params: Dict[str, Any], values: List[Any]) -> str:
+    """
+    (k1, k2, ...) 사전식 비교 조건 생성.
+    예) DESC, DESC  ->  (k1 < :v0) OR (k1 = :v0 AND k2 < :v1)
+    """
+    clauses = []
+    for i, (col, direction, _) in enumerate(keyset):
+        op = "<" if direction.upper() == "DESC" else ">"
+        terms = [f"q.{keyset[j][0]} = :p_k{j}" for j in range(i)]
+        terms.append(f"q.{col} {op} :p_k{i}")
+        clauses.append("(" + " AND ".join(terms) + ")")
+    for i, value in enumerate(values):
+        params[f"p_k{i}"] = value
+    return "(" + " OR ".join(clauses) + ")"
+
+
+def build_page_query(
+    sql: str,
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    order_by: Sequence[Tuple[str, str, str]],
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+    count_total: bool = True,
+) -> Tuple[str, Dict[str, Any], Optional[List[Any]]]:
+    """
+    기본 SELECT 쿼리를 한 페이지 조회용 쿼리로 감싼다.
+    (db.fetch_batch 로 다른 쿼리와 묶어 실행할 때 직접 사용)
+
+    Args:
+        count_total: True 면 COUNT(*) OVER() 로 전체 건수를 함께 받는다.
+            False 면 per_page + 1 행을 읽어 다음 페이지 존재 여부만 판단한다
+            (전체 건수를 이미 알고 있을 때 - 창 함수 없이 top-N 으로 끝남).
+
+    Returns:
+        (감싼 SQL, 바인드 변수, 디코딩된 keyset 값 또는 None)
+    """
+    bind = dict(params or {})
+    order_clause = ", ".join(f"q.{col} {direction}" for col, direction, _ in order_by)
+
+    where = ""
+    offset = (page - 1) * per_page
+    keyset_values = decode_cursor(after, order_by) if after else None
+    if keyset_values is not None:
+        where = "WHERE " + _keyset_predicate(order_by, bind, keyset_values)
+        offset = 0
+
+    total_column = f", COUNT(*) OVER () AS {_TOTAL_COLUMN}" if count_total else ""
+    wrapped = f"""
+        SELECT q.*{total_column}
+        FROM ({sql}) q
+        {where}
+        ORDER BY {order_clause}
+        OFFSET :p_offset ROWS FETCH NEXT :p_limit ROWS ONLY
+    """
+    bind["p_offset"] = offset
+    bind["p_limit"] = per_page if count_total else per_page + 1
+    return wrapped, bind, keyset_values
+
+
+def make_page(
+    rows: List[Dict[str, Any]],
+    *,
+    order_by: Sequence[Tuple[str, str, str]],
+    page: int,
+    per_page: int,
+    keyset_values: Optional[List[Any]] = None,
+    total: Optional[int] = None,
+) -> Page:
+    """
+    build_page_query 결과 행으로 Page 를 만든다.
+
+    Args:
+        total: 알려진 전체 건수 (count_total=False 로 조회했을 때)
+    """
+    start = (page - 1) * per_page
+    if total is None:
+        matched = rows[0].get(_TOTAL_COLUMN, 0) if rows else 0
+        # keyset 모드의 COUNT(*) OVER() 는 커서 이후 남은 행 수
+        total = start + matched if keyset_values is not None else matched
+        has_more = start + len(rows) < total
+    else:
+        has_more = len(rows) > per_page
+        rows = rows[:per_page]
+
+    for row in rows:
+        row.pop(_TOTAL_COLUMN, None)
+
+    next_cursor = encode_cursor(rows[-1], order_by) if rows and has_more else None
+    return Page(rows, page, per_page, total, next_cursor)
+
+
+def paginate(
+    conn,
+    sql: str,
+    params: Optional[Dict[str, Any]] = None,
+    *,
+    order_by: Sequence[Tuple[str, str, str]],
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+    total: Optional[int] = None,
+) -> Page:
+    """
+    기본 SELECT 쿼리를 감싸서 한 페이지만 조회한다.
+
+    Args:
+        conn: Oracle DB 연결 객체
+        sql: ORDER BY 없는 기본 SELECT 문
+        params: 바인드 변수
+        order_by: keyset 정의 [(컬럼, 방향, 타입), ...] - 마지막 컬럼은 유일해야 함
+        page: 페이지 번호 (표시용, after 가 없으면 OFFSET 계산에 사용)
+        per_page: 페이지당 행 수
+        after: 이전 페이지가 돌려준 next_cursor (있으면 keyset 방식)
+        total: 캐시 등으로 이미 알고 있는 전체 건수 (주면 COUNT(*) OVER() 생략)
+
+    Returns:
+        Page 객체
+    """
+    wrapped, bind, keyset_values = build_page_query(
+        sql, params, order_by=order_by, page=page, per_page=per_page,
+        after=after, count_total=total is None,
+    )
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute(wrapped, bind)
+        columns = [col[0].lower() for col in cursor.description]
+        rows = [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+        if total is None and not rows and keyset_values is None and page > 1:
+            # 범위를 벗어난 페이지: 전체 건수만 따로 확인
+            cursor.execute(f"SELECT COUNT(*) FROM ({sql})", dict(params or {}))
+            total = cursor.fetchone()[0]
+    finally:
+        cursor.close()
+
+    return make_page(rows, order_by=order_by, page=page, per_page=per_page,
+                     keyset_values=keyset_values, total=total)
+
+
+def _is_after(key: Sequence[Any], cursor_values: Sequence[Any], order_by) -> bool:
+    """정렬 키 key 가 커서 위치보다 뒤에 오는지 (keyset 조건의 파이썬 버전)."""
+    for value, cursor_value, (_, direction, _) in zip(key, cursor_values, order_by):
+        if value == cursor_value:
+            continue
+        return value < cursor_value if direction.upper() == "DESC" else value > cursor_value
+    return False
+
+
+def paginate_keys(
+    keys: Sequence[Tuple[Any, ...]],
+    *,
+    order_by: Sequence[Tuple[str, str, str]],
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Tuple[List[Tuple[Any, ...]], int, Optional[str]]:
+    """
+    메모리에서 정렬된 키 목록을 한 페이지로 자른다.
+    (검색 색인처럼 결과 ID 를 이미 알고 있을 때, 현재 페이지 ID 만 DB 에서 읽기 위해 사용)
+
+    Args:
+        keys: order_by 순서로 정렬된 정렬 키 튜플 목록 (order_by 컬럼 순서와 같은 값)
+
+    Returns:
+        (현재 페이지 키 목록, 전체 건수, 다음 페이지 커서 또는 None)
+    """
+    start = (page - 1) * per_page
+    cursor_values = decode_cursor(after, order_by) if after else None
+    if cursor_values is not None:
+        # 정렬돼 있으므로 '커서 뒤' 조건은 앞쪽 False / 뒤쪽 True 로 나뉜다
+        lo, hi = 0, len(keys)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _is_after(keys[mid], cursor_values, order_by):
+                hi = mid
+            else:
+                lo = mid + 1
+        start = lo
+
+    selected = list(keys[start:start + per_page])
+    next_cursor = None
+    if selected and start + per_page < len(keys):
+        last = {col.lower(): value for (col, _, _), value in zip(order_by, selected[-1])}
+        next_cursor = encode_cursor(last, order_by)
+    return selected, len(keys), next_cursor
+
+
+def paginate_top(
+    keys: Iterable[Tuple[Any, ...]],
+    *,
+    order_by: Sequence[Tuple[str, str, str]],
+    page: int = 1,
+    per_page: int = DEFAULT_PER_PAGE,
+    after: Optional[str] = None,
+) -> Tuple[List[Tuple[Any, ...]], int, Optional[str]]:
+    """
+    정렬되지 않은 키 목록에서 큰 순서로 한 페이지만 고른다 (점수순 검색 결과 등).
+    전체를 정렬하지 않고 heapq.nlargest 로 필요한 만큼만 뽑는다.
+
+    Args:
+        keys: 정렬 키 튜플 목록 (order_by 는 모두 DESC 여야 함)
+
+    Returns:
+        (현재 페이지 키 목록, 전체 건수, 다음 페이지 커서 또는 None)
+    """
+    keys = list(keys)
+    cursor_values = decode_cursor(after, order_by) if after else None
+    if cursor_values is not None:
+        # 커서 뒤(더 작은 키)에서 per_page + 1 개 - 하나 더 있으면 다음 페이지가 있다
+        cursor_key = tuple(cursor_values)
+        top = heapq.nlargest(per_page + 1, (key for key in keys if key < cursor_key))
+    else:
+        start = (page - 1) * per_page
+        top = heapq.nlargest(start + per_page + 1, keys)[start:]
+
+    selected = top[:per_page]
+    next_cursor = None
+    if len(top) > per_page:
+        last = {col.lower(): value for (col, _, _), value in zip(order_by, selected[-1])}
+        next_cursor = encode_cursor(last, order_by)
+    return selected, len(keys), next_cursor